@@ -68,7 +68,7 @@ class AddPointsCog(commands.Cog):
                     performed_by=transaction.performed_by,
                     command="/add"
                 )
-                await self.bot.dispatch('points_changed', event)
+                self.bot.dispatch('points_changed', event)
             except Exception as event_error:
                 # Log event error but don't fail the command
                 from utils.logger import get_logger
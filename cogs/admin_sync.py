@@ -4,15 +4,17 @@ import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
+from services.command_sync_service import get_command_sync_service
 from utils.config import GUILD_ID
 
 class AdminSync(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.sync_service = get_command_sync_service()
 
     @app_commands.command(name="sync", description="Force app-commands sync.")
     @app_commands.guild_only()
-    @app_commands.describe(scope="Where to sync: guild | global | clear")
+    @app_commands.describe(scope="Where to sync: guild | global | clear | status")
     async def sync(self, interaction: discord.Interaction, scope: str = "guild"):
         if not interaction.user.guild_permissions.administrator:
             await interaction.response.send_message("You need Administrator permission.", ephemeral=True)
@@ -27,11 +29,11 @@ class AdminSync(commands.Cog):
                 # FIX: Clear guild commands first to prevent duplicates
                 tree.clear_commands(guild=guild_obj)
                 # Do NOT use copy_global_to - it causes duplicates
-                cmds = await tree.sync(guild=guild_obj)
+                cmds = await self.sync_service.sync(tree, guild=guild_obj, force=True)
                 await interaction.followup.send(f"✅ Synced **{len(cmds)}** commands to guild.", ephemeral=True)
 
             elif scope.lower() == "global":
-                cmds = await tree.sync()
+                cmds = await self.sync_service.sync(tree, force=True)
                 await interaction.followup.send(
                     f"🌐 Submitted **{len(cmds)}** global commands (may take up to ~1h).",
                     ephemeral=True
@@ -53,12 +55,22 @@ class AdminSync(commands.Cog):
                 # Wait a bit for Discord to process
                 await asyncio.sleep(1)
                 
-                # Now sync ONLY guild commands
-                cmds = await tree.sync(guild=guild_obj)
+                # Now sync ONLY guild commands; global fingerprint no longer matches Discord
+                cmds = await self.sync_service.sync(tree, guild=guild_obj, force=True)
+                await self.sync_service.forget()
                 await interaction.followup.send(f"✅ Cleared and re-synced **{len(cmds)}** commands to guild.", ephemeral=True)
 
+            elif scope.lower() == "status":
+                lines = []
+                for label, target in (("Guild", guild_obj), ("Global", None)):
+                    current = await self.sync_service.is_current(tree, guild=target)
+                    count = len(tree.get_commands(guild=target))
+                    state = "✅ in sync" if current else "⏳ changed since last sync"
+                    lines.append(f"**{label}** ({count} commands): {state}")
+                await interaction.followup.send("\n".join(lines), ephemeral=True)
+
             else:
-                await interaction.followup.send("Use: `guild`, `global` or `clear`.", ephemeral=True)
+                await interaction.followup.send("Use: `guild`, `global`, `clear` or `status`.", ephemeral=True)
 
         except Exception as e:
             await interaction.followup.send(f"❌ Sync error: `{e}`", ephemeral=True)
@@ -12,6 +12,7 @@ from discord.ext import commands
 from discord import app_commands
 
 from services.cache_service import CacheService
+from utils.command_metrics import get_command_telemetry
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -90,6 +91,21 @@ class CacheStatsCog(commands.Cog):
                 inline=False
             )
             
+            # Per-command latency: shows where DB/HTTP time goes relative to the 3s ack deadline
+            latency = get_command_telemetry().summary()
+            if latency["slowest"]:
+                lines = [
+                    f"`/{slow['command']}` ack p95 **{slow['ack_p95']}ms** · total p95 {slow['total_p95']}ms · "
+                    f"db {slow['db_mean']}ms · http {slow['http_mean']}ms"
+                    for slow in latency["slowest"]
+                ]
+                lines.append(f"Near 3s deadline: **{latency['near_deadline']}** · Missed: **{latency['missed_deadline']}**")
+                embed.add_field(
+                    name="⚡ Slowest Commands (last hour)",
+                    value="\n".join(lines)[:1024],
+                    inline=False
+                )
+            
             embed.set_footer(text=f"Cache TTL: {stats.get('ttl_seconds', 30)} seconds")
             embed.timestamp = discord.utils.utcnow()
             
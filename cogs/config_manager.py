@@ -23,6 +23,14 @@ class ConfigManagerCog(commands.Cog):
         self.bot = bot
         self.config_service = get_config_service()
     
+    async def cog_load(self):
+        """Apply external edits to the config file live"""
+        self.config_service.start_watching()
+    
+    async def cog_unload(self):
+        """Stop watching the config file"""
+        self.config_service.stop_watching()
+    
     @app_commands.command(name="config", description="Manage role-to-rank configuration")
     @app_commands.guild_only()
     @app_commands.default_permissions(administrator=True)
@@ -52,12 +60,10 @@ class ConfigManagerCog(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         
         try:
-            success = self.config_service.add_role_mapping(discord_role, system_rank, category)
+            success = await self.config_service.add_role_mapping(discord_role, system_rank, category)
             
             if success:
-                # Reload config in role sync handler if it exists
-                await self._reload_role_sync_handler()
-                
+                # Consumers read the new config snapshot directly, no reload needed
                 await interaction.followup.send(
                     f"[OK] Role mapping added/updated:\n"
                     f"**Discord Role:** `{discord_role}`\n"
@@ -87,12 +93,10 @@ class ConfigManagerCog(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         
         try:
-            success = self.config_service.remove_role_mapping(discord_role)
+            success = await self.config_service.remove_role_mapping(discord_role)
             
             if success:
-                # Reload config in role sync handler if it exists
-                await self._reload_role_sync_handler()
-                
+                # Consumers read the new config snapshot directly, no reload needed
                 await interaction.followup.send(
                     f"[OK] Role mapping removed: `{discord_role}`",
                     ephemeral=True
@@ -155,21 +159,6 @@ class ConfigManagerCog(commands.Cog):
                 f"[ERRO] Error: {str(e)}",
                 ephemeral=True
             )
-    
-    async def _reload_role_sync_handler(self):
-        """Reload role sync handler configuration"""
-        try:
-            # Try to get role sync handler cog and reload its config
-            from events.role_sync_handler import RoleSyncHandler
-            for cog in self.bot.cogs.values():
-                if isinstance(cog, RoleSyncHandler):
-                    # Reload config in handler
-                    cog.role_to_rank_map = self.config_service.get_role_to_rank_map()
-                    cog.tracked_roles = set(cog.role_to_rank_map.keys())
-                    logger.info("Role sync handler configuration reloaded")
-                    break
-        except Exception as e:
-            logger.warning(f"Could not reload role sync handler: {e}")
 
 
 async def setup(bot: commands.Bot):
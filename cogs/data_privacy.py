@@ -10,7 +10,6 @@ Implementa comandos para exercício de direitos dos titulares de dados:
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Optional
 
@@ -18,8 +17,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from services.user_service import UserService
-from utils.database import get_pool
+from services.data_erasure_service import DataErasureService
+from services.data_export_service import DataExportService
 from utils.consent_manager import (
     has_consent,
     give_consent,
@@ -29,7 +28,6 @@ from utils.consent_manager import (
 )
 from utils.audit_log import (
     log_data_operation,
-    get_user_audit_history,
     delete_user_audit_logs
 )
 from utils.logger import get_logger, log_data_access
@@ -67,58 +65,62 @@ class DataPrivacyCog(commands.Cog):
             )
             log_data_access(user_id, "EXPORT", "user_data", user_id, "Access rights")
             
-            # Coletar dados do usuário
-            # Use Service Layer (NEW - Architecture Phase 2)
-            user_service = UserService()
-            user_data = await user_service.get_user(user_id)
-            consent_info = await get_consent_info(user_id)
-            audit_history = await get_user_audit_history(user_id, limit=50)
-            
-            # Montar dados exportáveis
-            export_data = {
-                "export_date": datetime.utcnow().isoformat(),
+            # Montar cabeçalho; as tabelas são transmitidas direto para o arquivo
+            now = datetime.utcnow()
+            header = {
+                "export_date": now.isoformat(),
                 "user_id": str(user_id),
                 "discord_username": interaction.user.name,
                 "discord_display_name": interaction.user.display_name,
                 "discord_account_created": interaction.user.created_at.isoformat() if interaction.user.created_at else None,
-                "user_data": {
-                    "points": user_data.get("points", 0) if user_data else 0,
-                    "rank": user_data.get("rank", "Civitas aspirant") if user_data else "Civitas aspirant",
-                    "progress": user_data.get("progress", 0) if user_data else 0,
-                    "created_at": user_data.get("created_at").isoformat() if user_data and user_data.get("created_at") else None,
-                    "updated_at": user_data.get("updated_at").isoformat() if user_data and user_data.get("updated_at") else None,
-                } if user_data else {},
-                "consent_info": consent_info if consent_info else None,
-                "audit_history": audit_history[:50] if audit_history else []
             }
-            
-            # Criar arquivo JSON
-            json_data = json.dumps(export_data, indent=2, ensure_ascii=False, default=str)
-            
-            # Enviar como arquivo
-            file = discord.File(
-                fp=json_data.encode('utf-8'),
-                filename=f"ignisbot_data_export_{user_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+            export_service = DataExportService()
+            path, counts = await export_service.export_user_data(
+                user_id,
+                header,
+                filename=f"ignisbot_data_export_{user_id}_{now.strftime('%Y%m%d_%H%M%S')}.json"
             )
             
-            embed = discord.Embed(
-                title="📥 Personal Data Export",
-                description="Your data has been successfully exported in accordance with LGPD Art. 18, II and V.",
-                color=discord.Color.green()
-            )
-            embed.add_field(
-                name="📋 Included Data",
-                value="• User data (points, rank, progress)\n• Consent information\n• Audit history (last 50 records)",
-                inline=False
-            )
-            embed.add_field(
-                name="📅 Export Date",
-                value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-                inline=False
-            )
-            embed.set_footer(text="This file contains sensitive personal data. Keep it secure.")
+            try:
+                size_limit = interaction.guild.filesize_limit if interaction.guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+                attachments = await export_service.prepare_attachments(path, size_limit)
+                
+                embed = discord.Embed(
+                    title="📥 Personal Data Export",
+                    description="Your data has been successfully exported in accordance with LGPD Art. 18, II and V.",
+                    color=discord.Color.green()
+                )
+                embed.add_field(
+                    name="📋 Included Data",
+                    value="\n".join(f"• {section.replace('_', ' ').capitalize()}: {count} record(s)" for section, count in counts.items()),
+                    inline=False
+                )
+                if len(attachments) > 1:
+                    embed.add_field(
+                        name="🗂️ Multiple Files",
+                        value=f"The export was compressed and split into {len(attachments)} parts. Concatenate them in order to restore the `.json.gz` file.",
+                        inline=False
+                    )
+                elif attachments[0].suffix == ".gz":
+                    embed.add_field(name="🗜️ Compressed", value="The export was gzip-compressed to fit the upload limit.", inline=False)
+                embed.add_field(
+                    name="📅 Export Date",
+                    value=f"<t:{int(now.timestamp())}:F>",
+                    inline=False
+                )
+                embed.set_footer(text="This file contains sensitive personal data. Keep it secure.")
+                
+                # Discord allows up to 10 attachments per message
+                batches = [attachments[i:i + 10] for i in range(0, len(attachments), 10)]
+                for i, batch in enumerate(batches):
+                    files = [discord.File(str(part), filename=part.name) for part in batch]
+                    if i == 0:
+                        await interaction.followup.send(embed=embed, files=files, ephemeral=True)
+                    else:
+                        await interaction.followup.send(files=files, ephemeral=True)
+            finally:
+                export_service.cleanup(path)
             
-            await interaction.followup.send(embed=embed, file=file, ephemeral=True)
             logger.info(f"User {user_id} exported their data")
             
         except Exception as e:
@@ -150,6 +152,7 @@ class DataPrivacyCog(commands.Cog):
                 "You are about to exercise your **right to be forgotten** (LGPD Art. 18, VI).\n\n"
                 "**This action is IRREVERSIBLE and will:**\n"
                 "• Delete all your personal data (points, rank, progress)\n"
+                "• Delete XP history, progression and daily limits\n"
                 "• Delete consent information\n"
                 "• Delete audit history\n\n"
                 "**Are you sure?**"
@@ -163,31 +166,27 @@ class DataPrivacyCog(commands.Cog):
     async def execute_delete(self, user_id: int, interaction: discord.Interaction):
         """Executa a exclusão de dados após confirmação"""
         try:
-            pool = get_pool()
+            # Exclui todas as tabelas do registro em uma transação e limpa os caches
+            counts = await DataErasureService().erase_user(user_id)
             
-            # Registrar operação ANTES de deletar
+            # Registrar operação DEPOIS de deletar, para que o registro da exclusão permaneça
             await log_data_operation(
                 user_id=user_id,
                 action_type="DELETE",
                 data_type="all_user_data",
                 performed_by=user_id,
-                purpose="Exercise of right to be forgotten (LGPD Art. 18, VI)"
+                purpose="Exercise of right to be forgotten (LGPD Art. 18, VI)",
+                details={"deleted_rows": counts}
             )
             
-            async with pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    # Delete user data (CASCADE will delete consent and audit_log)
-                    await cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
-                    
-                    deleted_rows = cursor.rowcount
-            
             log_data_access(user_id, "DELETE", "all_user_data", user_id, "Right to be forgotten")
             
+            breakdown = "\n".join(f"• `{table}`: {count}" for table, count in counts.items())
             embed = discord.Embed(
                 title="✅ Data Deleted",
                 description=(
                     f"All your personal data has been successfully deleted.\n\n"
-                    f"**Records deleted:** {deleted_rows}\n\n"
+                    f"**Records deleted:** {sum(counts.values())}\n{breakdown}\n\n"
                     "Your right to be forgotten has been exercised in accordance with LGPD Art. 18, VI."
                 ),
                 color=discord.Color.green()
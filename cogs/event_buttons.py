@@ -10,6 +10,7 @@ from discord.ext import commands
 from discord import app_commands
 from utils.event_presets import EVENT_PRESETS
 from utils.event_announcement import post_event_announcement
+from repositories.state_repository import StateRepository
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +21,9 @@ EVENT_PANEL_CHANNEL_ID = 1435795622077923371
 # Channel ID where events are posted
 EVENT_ANNOUNCEMENT_CHANNEL_ID = 1375941286078709790
 
+# bot_state key for panel message ID and active event (restored after restarts)
+EVENT_PANEL_STATE_KEY = "event_panel"
+
 # Banner image URL (High quality ArtStation image)
 SALAMANDERS_BANNER_URL = "https://cdna.artstation.com/p/assets/images/images/036/435/864/large/jacob-loren-salamander-web.jpg?1617683294"
 
@@ -440,7 +444,7 @@ class EventEndView(discord.ui.View):
         from cogs.event_buttons import get_event_panel_cog
         event_panel_cog = get_event_panel_cog(self.bot)
         if event_panel_cog:
-            event_panel_cog.clear_active_event()
+            await event_panel_cog.clear_active_event()
         
         # Delete the End message from event-publishing channel
         end_channel = self.bot.get_channel(EVENT_PANEL_CHANNEL_ID)
@@ -557,7 +561,7 @@ async def _post_custom_event(
         
         # Mark event as active IMMEDIATELY after posting
         if event_panel_cog and event_message_id and end_message_id:
-            event_panel_cog.set_active_event(
+            await event_panel_cog.set_active_event(
                 event_message_id=event_message_id,
                 end_message_id=end_message_id,
                 host_user=host_user,
@@ -677,7 +681,7 @@ async def _post_event_with_description(
         
         # Mark event as active IMMEDIATELY after posting
         if event_panel_cog and event_message_id and end_message_id:
-            event_panel_cog.set_active_event(
+            await event_panel_cog.set_active_event(
                 event_message_id=event_message_id,
                 end_message_id=end_message_id,
                 host_user=host_user,
@@ -1051,9 +1055,43 @@ class SalamandersEventPanel(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.state_repo = StateRepository()
         self.panel_message_id: int | None = None
         # Track active event to prevent multiple events at once
-        self.active_event: dict | None = None  # {event_message_id, end_message_id, host_user, event_title}
+        # {event_message_id, end_message_id, host_user_id, event_title, host_user (runtime only)}
+        self.active_event: dict | None = None
+        # Saves snapshot the state under this lock, so the last write is always the latest state
+        self._save_lock = asyncio.Lock()
+    
+    async def cog_load(self):
+        """Load persisted panel and active-event state so checks work right after a restart."""
+        try:
+            state = await self.state_repo.get(EVENT_PANEL_STATE_KEY, default={}) or {}
+        except Exception as e:
+            logger.warning(f"Could not load event panel state: {e}")
+            return
+        
+        self.panel_message_id = state.get("panel_message_id")
+        self.active_event = state.get("active_event")
+        if self.active_event:
+            logger.info(f"Restored active event: {self.active_event.get('event_title', 'Unknown')}")
+    
+    async def _save_state(self):
+        """Persist panel message ID and active event (host stored by ID only)."""
+        async with self._save_lock:
+            active_event = None
+            if self.active_event:
+                active_event = {
+                    key: self.active_event.get(key)
+                    for key in ("event_message_id", "end_message_id", "host_user_id", "event_title")
+                }
+            try:
+                await self.state_repo.set(
+                    EVENT_PANEL_STATE_KEY,
+                    {"panel_message_id": self.panel_message_id, "active_event": active_event}
+                )
+            except Exception as e:
+                logger.warning(f"Could not persist event panel state: {e}")
     
     def is_event_active(self) -> bool:
         """Check if there is currently an active event."""
@@ -1064,29 +1102,87 @@ class SalamandersEventPanel(commands.Cog):
             logger.debug("Event active check: FALSE - No active event")
         return is_active
     
-    def set_active_event(self, event_message_id: int, end_message_id: int, host_user: discord.Member, event_title: str):
+    async def set_active_event(self, event_message_id: int, end_message_id: int, host_user: discord.Member, event_title: str):
         """Mark an event as active."""
         self.active_event = {
             "event_message_id": event_message_id,
             "end_message_id": end_message_id,
+            "host_user_id": host_user.id,
             "host_user": host_user,
             "event_title": event_title
         }
         logger.info(f"Active event set: {event_title} by {host_user.id}")
+        await self._save_state()
     
-    def clear_active_event(self):
+    async def clear_active_event(self):
         """Clear the active event."""
         if self.active_event:
             logger.info(f"Active event cleared: {self.active_event.get('event_title', 'Unknown')}")
         self.active_event = None
+        await self._save_state()
     
     def get_active_event_info(self) -> str | None:
         """Get information about the active event for error messages."""
         if not self.active_event:
             return None
-        host = self.active_event["host_user"]
+        host_id = self.active_event["host_user_id"]
         title = self.active_event["event_title"]
-        return f"**{title}** hosted by {host.mention}"
+        return f"**{title}** hosted by <@{host_id}>"
+    
+    async def _resolve_host(self, host_user_id: int) -> discord.abc.User | None:
+        """Resolve a persisted host ID to a member (or user, if they left the guild)."""
+        channel = self.bot.get_channel(EVENT_PANEL_CHANNEL_ID)
+        if isinstance(channel, discord.TextChannel):
+            member = channel.guild.get_member(host_user_id)
+            if member:
+                return member
+        try:
+            return await self.bot.fetch_user(host_user_id)
+        except discord.HTTPException:
+            return None
+    
+    async def _restore_end_view(self, channel: discord.TextChannel) -> None:
+        """
+        Re-register the End button of an event that was active before a restart.
+        
+        The End button is the only way to clear an active event, so if its
+        message is gone or the button can't be re-registered, the event is
+        cleared here instead of blocking new events forever.
+        """
+        if not self.active_event or self.active_event.get("host_user"):
+            return
+        
+        end_message_id = self.active_event.get("end_message_id")
+        if not end_message_id:
+            logger.warning("Active event has no End message, clearing it")
+            await self.clear_active_event()
+            return
+        
+        try:
+            end_message = await channel.fetch_message(end_message_id)
+        except discord.NotFound:
+            logger.warning(f"End message {end_message_id} of active event no longer exists, clearing it")
+            await self.clear_active_event()
+            return
+        except discord.HTTPException as e:
+            # Transient failure: keep the event, the End button is still registered below
+            logger.warning(f"Could not fetch End message {end_message_id}: {e}")
+            end_message = None
+        
+        host = await self._resolve_host(self.active_event["host_user_id"])
+        if host is None:
+            logger.warning("Host of active event could not be resolved, clearing it and its End message")
+            if end_message is not None:
+                try:
+                    await end_message.delete()
+                except discord.HTTPException as e:
+                    logger.warning(f"Could not delete End message {end_message_id}: {e}")
+            await self.clear_active_event()
+            return
+        
+        self.active_event["host_user"] = host
+        self.bot.add_view(EventEndView(self.bot, end_message_id, host), message_id=end_message_id)
+        logger.info(f"Re-registered End button for active event (message ID: {end_message_id})")
     
     async def _create_panel_embed(self) -> discord.Embed:
         """Create the main event hosting panel embed."""
@@ -1111,10 +1207,32 @@ class SalamandersEventPanel(commands.Cog):
         
         return embed
     
+    async def _update_known_panel(self, channel: discord.TextChannel) -> bool:
+        """
+        Edit the persisted panel message in place and re-register its view.
+        
+        Returns:
+            True if the known panel was updated, False if it no longer exists
+        """
+        view = SalamandersEventView(self.bot)
+        try:
+            message = channel.get_partial_message(self.panel_message_id)
+            await message.edit(embed=await self._create_panel_embed(), view=view)
+        except discord.NotFound:
+            logger.info(f"Known event panel message {self.panel_message_id} not found, reposting")
+            return False
+        
+        self.bot.add_view(view, message_id=self.panel_message_id)
+        logger.info(f"✅ Event panel updated in place (message ID: {self.panel_message_id})")
+        return True
+    
     async def post_or_update_panel(self) -> None:
         """
         Post or update the event panel in the designated channel.
-        Deletes ALL messages in the channel and posts new panel.
+        
+        Fast path: edit the persisted panel message directly. Only when there is
+        no known panel (first run, or it was deleted) is the channel purged and
+        a new panel posted.
         """
         channel = self.bot.get_channel(EVENT_PANEL_CHANNEL_ID)
         if not isinstance(channel, discord.TextChannel):
@@ -1122,6 +1240,11 @@ class SalamandersEventPanel(commands.Cog):
             return
         
         try:
+            await self._restore_end_view(channel)
+            
+            if self.panel_message_id and await self._update_known_panel(channel):
+                return
+            
             # Check bot permissions
             bot_member = channel.guild.get_member(self.bot.user.id)
             if bot_member:
@@ -1131,43 +1254,27 @@ class SalamandersEventPanel(commands.Cog):
                     logger.error("   Please grant the bot 'Manage Messages' permission in the event panel channel")
                     return
             
-            # Delete ALL messages in the channel using purge (more efficient)
-            # First, try to purge all messages (bulk delete is faster)
-            deleted_count = 0
-            iteration = 0
-            
-            # Use purge to delete all messages (including bot's own)
+            # Delete ALL messages in the channel using purge (bulk delete is faster)
             # Purge has a limit of 100 messages per call, so we need to loop
-            # Pass a lambda that always returns True to delete all messages
+            # The active event's End message is kept so it stays usable
+            end_message_id = self.active_event.get("end_message_id") if self.active_event else None
+            deleted_count = 0
             logger.info(f"Starting channel cleanup for {EVENT_PANEL_CHANNEL_ID}...")
             while True:
-                iteration += 1
-                purged = await channel.purge(limit=100, check=lambda m: True)
+                purged = await channel.purge(limit=100, check=lambda m: m.id != end_message_id)
                 deleted_count += len(purged)
-                
-                if len(purged) > 0:
-                    logger.debug(f"Purge iteration {iteration}: deleted {len(purged)} messages")
-                
                 if len(purged) < 100:
-                    # No more messages to delete
                     break
-                
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.5)
             
             if deleted_count > 0:
                 logger.info(f"✅ Deleted {deleted_count} messages from event panel channel")
-            else:
-                logger.info("Channel was already empty")
-            
-            # Small delay before posting new message
-            await asyncio.sleep(1)
             
             # Post new panel
             embed = await self._create_panel_embed()
             view = SalamandersEventView(self.bot)
             message = await channel.send(embed=embed, view=view)
             self.panel_message_id = message.id
+            await self._save_state()
             
             logger.info(f"✅ Event panel posted in channel {EVENT_PANEL_CHANNEL_ID} (message ID: {message.id})")
         
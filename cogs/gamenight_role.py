@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import discord
 from discord.ext import commands
+from repositories.state_repository import StateRepository
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,6 +17,9 @@ GAMENIGHT_ROLE_CHANNEL_ID = 1375941286267326533
 # Role ID to assign/remove
 GAMENIGHT_ROLE_ID = 1375941284161912833
 
+# bot_state key for the panel message ID (restored after restarts)
+GAMENIGHT_PANEL_STATE_KEY = "gamenight_panel"
+
 
 class GamenightRoleView(discord.ui.View):
     """View with button to toggle Gamenight role."""
@@ -95,45 +99,79 @@ class GamenightRoleCog(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.state_repo = StateRepository()
         self.panel_message_id: int | None = None
     
+    async def cog_load(self):
+        """Load the persisted panel message ID."""
+        try:
+            state = await self.state_repo.get(GAMENIGHT_PANEL_STATE_KEY, default={}) or {}
+            self.panel_message_id = state.get("panel_message_id")
+        except Exception as e:
+            logger.warning(f"Could not load Gamenight panel state: {e}")
+    
+    def _create_panel_embed(self) -> discord.Embed:
+        """Create the role assignment panel embed."""
+        return discord.Embed(
+            title="++ Gamenight Role Assignment ++",
+            description=(
+                "Click the button to add or remove the Gamenight role from yourself.\n\n"
+                "Receive or remove roles by selecting them below:"
+            ),
+            color=discord.Color.blue()
+        )
+    
+    async def _update_known_panel(self, channel: discord.TextChannel) -> bool:
+        """
+        Edit the persisted panel message in place and re-register its view.
+        
+        Returns:
+            True if the known panel was updated, False if it no longer exists
+        """
+        view = GamenightRoleView(self.bot)
+        try:
+            message = channel.get_partial_message(self.panel_message_id)
+            await message.edit(embed=self._create_panel_embed(), view=view)
+        except discord.NotFound:
+            logger.info(f"Known Gamenight panel message {self.panel_message_id} not found, reposting")
+            return False
+        except Exception as e:
+            logger.warning(f"Error updating Gamenight panel in place: {e}")
+            return False
+        
+        self.bot.add_view(view, message_id=self.panel_message_id)
+        logger.info(f"Gamenight role panel updated in place (Message ID: {self.panel_message_id})")
+        return True
+    
     async def post_or_update_panel(self):
-        """Post or update the Gamenight role assignment panel."""
+        """
+        Post or update the Gamenight role assignment panel.
+        
+        Edits the persisted panel message directly; the channel is only
+        cleaned and a new panel posted when there is no known panel.
+        """
         channel = self.bot.get_channel(GAMENIGHT_ROLE_CHANNEL_ID)
         if not isinstance(channel, discord.TextChannel):
             logger.error(f"Channel {GAMENIGHT_ROLE_CHANNEL_ID} not found or is not a text channel")
             return
         
+        if self.panel_message_id and await self._update_known_panel(channel):
+            return
+        
         # Delete all existing messages in the channel
         try:
-            async for message in channel.history(limit=100):
-                try:
-                    await message.delete()
-                    logger.debug(f"Deleted message {message.id} from Gamenight role channel")
-                except discord.NotFound:
-                    pass  # Message already deleted
-                except discord.Forbidden:
-                    logger.warning(f"No permission to delete message {message.id}")
-                except Exception as e:
-                    logger.warning(f"Error deleting message {message.id}: {e}")
+            await channel.purge(limit=100)
+        except discord.Forbidden:
+            logger.warning(f"No permission to clean Gamenight role channel {GAMENIGHT_ROLE_CHANNEL_ID}")
         except Exception as e:
             logger.error(f"Error cleaning Gamenight role channel: {e}")
         
-        # Create embed
-        embed = discord.Embed(
-            title="++ Gamenight Role Assignment ++",
-            description=(
-                "Click the button to add or remove the Gamenight role from yourself.\n\n"
-                "Receive or remove roles by selecting them below:"
-            ),
-            color=discord.Color.blue()
-        )
-        
         # Post the panel
         try:
             view = GamenightRoleView(self.bot)
-            message = await channel.send(embed=embed, view=view)
+            message = await channel.send(embed=self._create_panel_embed(), view=view)
             self.panel_message_id = message.id
+            await self.state_repo.set(GAMENIGHT_PANEL_STATE_KEY, {"panel_message_id": message.id})
             logger.info(f"Posted Gamenight role assignment panel (Message ID: {self.panel_message_id})")
         except Exception as e:
             logger.error(f"Error posting Gamenight role assignment panel: {e}", exc_info=True)
@@ -141,14 +179,10 @@ class GamenightRoleCog(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         """Post panel when bot is ready."""
-        # Wait a bit to ensure all cogs are loaded
-        import asyncio
-        await asyncio.sleep(3)
-        
         # Only post on first ready (not on reconnects)
         if not hasattr(self.bot, 'gamenight_role_posted'):
             self.bot.gamenight_role_posted = True
-            logger.info("Posting Gamenight role assignment panel...")
+            logger.info("Updating Gamenight role assignment panel...")
             await self.post_or_update_panel()
 
 
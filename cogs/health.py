@@ -115,6 +115,15 @@ class HealthCog(commands.Cog):
             latency_info = f"{latency_emoji} **Status:** {latency_status.upper()}\n"
             if "average_latency_ms" in latency:
                 latency_info += f"⏱️ **Average:** {latency['average_latency_ms']}ms\n"
+            total = latency.get("total", {})
+            ack = latency.get("ack", {})
+            if total.get("count"):
+                latency_info += f"📊 **Total p50/p95/p99:** {total['p50']} / {total['p95']} / {total['p99']}ms ({total['count']} runs)\n"
+            if ack.get("count"):
+                latency_info += f"📨 **Ack p50/p95:** {ack['p50']} / {ack['p95']}ms\n"
+                latency_info += f"⏳ **Near 3s deadline:** {latency.get('near_deadline', 0)} | **Missed:** {latency.get('missed_deadline', 0)}\n"
+            for slow in latency.get("slowest", [])[:3]:
+                latency_info += f"   `/{slow['command']}` ack p95 {slow['ack_p95']}ms, total p95 {slow['total_p95']}ms\n"
             if "note" in latency:
                 latency_info += f"ℹ️ {latency['note']}\n"
             embed.add_field(name="⚡ Command Latency", value=latency_info, inline=False)
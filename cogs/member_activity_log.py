@@ -7,31 +7,50 @@ This cog monitors:
 - Member join/leave guild (with full Discord and Roblox profile information)
 
 IMPORTANT: All voice channels are monitored without exception. No channel filtering is applied.
+
+Log embeds go through a BufferedLogSink, so bursts (mass joins/leaves at the
+start or end of an event) are sent as a few batched/digest messages.
 """
 
 from __future__ import annotations
 
+import asyncio
 import discord
 from discord.ext import commands
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Awaitable, Optional, Dict, Any
 from utils.logger import get_logger
-from services.bloxlink_service import BloxlinkService
+from services.member_profile_service import get_member_profile_service
+from utils.log_sink import BufferedLogSink
 
 logger = get_logger(__name__)
 
 # Channel ID for activity logs
 ACTIVITY_LOG_CHANNEL_ID = 1375941287357710362
 
+# Max seconds a log event waits before being sent
+ACTIVITY_LOG_WINDOW_SECONDS = 3.0
+
 
 class MemberActivityLogCog(commands.Cog):
     """Monitor and log member activity events"""
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.bloxlink_service = BloxlinkService()
+        self.profile_service = get_member_profile_service()
         # Track voice join times: {user_id: datetime}
         self._voice_join_times: Dict[int, datetime] = {}
+        self.log_sink = BufferedLogSink(
+            self._get_log_channel,
+            window=ACTIVITY_LOG_WINDOW_SECONDS,
+            digest_title="🎧 Voice Activity Digest",
+            footer="Vulkan Activity Log",
+            name="ACTIVITY_LOG"
+        )
+    
+    async def cog_unload(self):
+        """Flush buffered log embeds on unload/shutdown"""
+        await self.log_sink.close()
     
     async def _get_log_channel(self) -> Optional[discord.TextChannel]:
         """Get the activity log channel"""
@@ -43,7 +62,8 @@ class MemberActivityLogCog(commands.Cog):
     async def _create_roblox_embed_section(
         self,
         member: discord.Member,
-        embed: discord.Embed
+        embed: discord.Embed,
+        roblox_lookup: Awaitable[Optional[Dict[str, Any]]]
     ) -> None:
         """
         Add Roblox profile information to embed.
@@ -51,19 +71,26 @@ class MemberActivityLogCog(commands.Cog):
         Args:
             member: Discord member
             embed: Embed to add information to
+            roblox_lookup: Pending profile lookup (started before the Discord section was built)
         """
         try:
-            # Get Roblox data via Bloxlink
-            roblox_data = await self.bloxlink_service.get_roblox_user(
-                discord_id=member.id,
-                guild_id=member.guild.id if member.guild else None
-            )
+            roblox_data = await roblox_lookup
             
-            if roblox_data:
+            if roblox_data and not roblox_data.get("id"):
+                # Deadline passed before the Bloxlink link was known
+                embed.add_field(
+                    name="**Roblox Profile**",
+                    value="⏳ Lookup timed out",
+                    inline=False
+                )
+            elif roblox_data:
+                username = roblox_data.get('username', 'N/A')
+                if roblox_data.get("partial"):
+                    username += " *(lookup timed out)*"
                 embed.add_field(
                     name="**Roblox Profile**",
                     value=(
-                        f"**Username:** {roblox_data.get('username', 'N/A')}\n"
+                        f"**Username:** {username}\n"
                         f"**User ID:** `{roblox_data.get('id', 'N/A')}`\n"
                         f"**Verified:** ✅ Yes\n"
                         f"**Avatar:** [View Profile](https://www.roblox.com/users/{roblox_data.get('id', '')}/profile)"
@@ -108,6 +135,12 @@ class MemberActivityLogCog(commands.Cog):
         Returns:
             Discord embed with full profile information
         """
+        # Resolve the Roblox side (cached, deadline-bounded) while the Discord side is built
+        roblox_lookup = asyncio.create_task(self.profile_service.get_profile(
+            discord_id=member.id,
+            guild_id=member.guild.id if member.guild else None
+        ))
+        
         embed = discord.Embed(
             title=title,
             description=description or "",
@@ -142,7 +175,7 @@ class MemberActivityLogCog(commands.Cog):
             )
         
         # Add Roblox profile information
-        await self._create_roblox_embed_section(member, embed)
+        await self._create_roblox_embed_section(member, embed, roblox_lookup)
         
         # Set Discord avatar as main image
         if member.avatar:
@@ -220,6 +253,23 @@ class MemberActivityLogCog(commands.Cog):
         
         return embed
     
+    @staticmethod
+    def _voice_digest_line(
+        member: discord.Member,
+        action: str,
+        channel: discord.VoiceChannel | discord.StageChannel,
+        previous_channel: Optional[discord.VoiceChannel | discord.StageChannel] = None
+    ) -> str:
+        """One-line summary of a voice event for digest embeds"""
+        timestamp = f"<t:{int(datetime.now(timezone.utc).timestamp())}:T>"
+        if action == "joined":
+            return f"{timestamp} 🎤 {member.mention} joined 🔊 {channel.mention}"
+        if action == "left":
+            return f"{timestamp} 🔇 {member.mention} left 🔊 {channel.mention}"
+        if action == "moved" and previous_channel:
+            return f"{timestamp} 🔄 {member.mention} moved 🔊 {previous_channel.mention} → 🔊 {channel.mention}"
+        return f"{timestamp} {member.mention} - {action}"
+    
     @commands.Cog.listener()
     async def on_voice_state_update(
         self,
@@ -260,7 +310,7 @@ class MemberActivityLogCog(commands.Cog):
                     channel=after.channel
                 )
                 
-                await log_channel.send(embed=embed)
+                self.log_sink.add(embed, self._voice_digest_line(member, "joined", after.channel))
                 logger.debug(f"Logged voice join: {member.id} -> {after.channel.name}")
             
             # Member left a voice channel
@@ -278,7 +328,7 @@ class MemberActivityLogCog(commands.Cog):
                     duration=duration
                 )
                 
-                await log_channel.send(embed=embed)
+                self.log_sink.add(embed, self._voice_digest_line(member, "left", before.channel))
                 logger.debug(f"Logged voice leave: {member.id} from {before.channel.name}")
             
             # Member switched voice channels
@@ -296,7 +346,10 @@ class MemberActivityLogCog(commands.Cog):
                     previous_channel=before.channel
                 )
                 
-                await log_channel.send(embed=embed)
+                self.log_sink.add(
+                    embed,
+                    self._voice_digest_line(member, "moved", after.channel, before.channel)
+                )
                 logger.debug(f"Logged voice switch: {member.id} {before.channel.name} -> {after.channel.name}")
         
         except Exception as e:
@@ -326,7 +379,7 @@ class MemberActivityLogCog(commands.Cog):
                 description=f"{member.mention} has joined the server."
             )
             
-            await log_channel.send(embed=embed)
+            self.log_sink.add(embed)
             logger.info(f"Logged member join: {member.id} ({member.name})")
         
         except Exception as e:
@@ -356,7 +409,7 @@ class MemberActivityLogCog(commands.Cog):
                 description=f"{member.mention} has left the server."
             )
             
-            await log_channel.send(embed=embed)
+            self.log_sink.add(embed)
             logger.info(f"Logged member leave: {member.id} ({member.name})")
         
         except Exception as e:
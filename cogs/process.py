@@ -10,18 +10,20 @@ from __future__ import annotations
 import asyncio
 import aiohttp
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from io import BytesIO
 
 from services.bloxlink_service import BloxlinkService
 from services.roblox_groups_service import get_roblox_groups_service, AOW_GROUP_IDS
-from services.roblox_outfits_service import get_roblox_outfits_service
 from services.audit_service import AuditService
 from services.progression_service import ProgressionService
+from repositories.state_repository import StateRepository
 from utils.checks import appcmd_channel_only, appcmd_moderator_or_owner
 from utils.config import GUILD_ID, ROBLOX_COOKIE
+from utils.deadline_scheduler import DeadlineScheduler
+from utils.command_metrics import upstream_trace_configs
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,6 +42,9 @@ SALAMANDERS_RED = 0xE74C3C
 # Channel ID for verify command mention
 VERIFY_CHANNEL_ID = 1375941286267326532
 
+# bot_state key for open process channels (restored after restarts)
+PROCESS_CHANNELS_STATE_KEY = "process_channels"
+
 
 class InductionConfirmationView(discord.ui.View):
     """View with Confirm and Cancel buttons for induction process"""
@@ -595,7 +600,8 @@ class ProcessButtonsView(discord.ui.View):
             await self._clear_previous_button_messages(interaction.channel, interaction.client.user)
         
         try:
-            # Get Roblox Outfits service
+            # Get Roblox Outfits service (imported on first outfit check)
+            from services.roblox_outfits_service import get_roblox_outfits_service
             outfits_service = get_roblox_outfits_service()
             
             logger.info(f"[OUTFIT CHECK HARD TEST] Checking outfits for user {self.roblox_username} (ID: {self.roblox_id})")
@@ -627,7 +633,7 @@ class ProcessButtonsView(discord.ui.View):
             
             # Use a single HTTP session for all requests (more efficient)
             # Optimized: Send all images in rapid sequence - MAXIMUM SPEED
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 for idx, outfit in enumerate(outfits):
                     # No delay - maximum speed, send all images as fast as possible
                     # Discord API will handle rate limiting if needed
@@ -987,10 +993,15 @@ class ProcessCog(commands.Cog):
         self.bot = bot
         self.bloxlink_service = BloxlinkService()
         self.audit_service = AuditService()
-        # Track process channels and their last activity
-        self.process_channels: dict[int, datetime] = {}  # channel_id -> last_activity
+        self.state_repo = StateRepository()
         self.inactivity_timeout = timedelta(minutes=5)  # 5 minutes of inactivity
-        self.check_inactivity.start()  # Start the background task
+        # Process channels tracked by inactivity deadline (wakes exactly at the next close)
+        self.inactivity_scheduler = DeadlineScheduler(self._close_inactive_channel, name="INACTIVITY")
+    
+    async def cog_load(self):
+        """Start the inactivity scheduler and restore channels open before a restart"""
+        self.inactivity_scheduler.start()
+        self._restore_task = asyncio.create_task(self._restore_process_channels())
     
     @app_commands.command(name="process", description="Start process for a player")
     @app_commands.describe(
@@ -1071,7 +1082,7 @@ class ProcessCog(commands.Cog):
                     thumbnail_url = f"https://thumbnails.roblox.com/v1/users/avatar-3d?userIds={roblox_id}&size=420x420&format=Png&isCircular=false"
                     logger.info(f"[AVATAR TEST] Strategy 1: Trying avatar-3d endpoint: {thumbnail_url}")
                     
-                    async with aiohttp.ClientSession() as session:
+                    async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                         async with session.get(thumbnail_url, timeout=aiohttp.ClientTimeout(total=15)) as response:
                             if response.status == 200:
                                 data = await response.json()
@@ -1102,7 +1113,7 @@ class ProcessCog(commands.Cog):
                         logger.info(f"[AVATAR TEST] Strategy 2: Trying regular avatar endpoint...")
                         thumbnail_url = f"https://thumbnails.roblox.com/v1/users/avatar?userIds={roblox_id}&size=420x420&format=Png&isCircular=false"
                         
-                        async with aiohttp.ClientSession() as session:
+                        async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                             async with session.get(thumbnail_url, timeout=aiohttp.ClientTimeout(total=15)) as response:
                                 if response.status == 200:
                                     data = await response.json()
@@ -1319,7 +1330,7 @@ class ProcessCog(commands.Cog):
             await interaction.followup.send(embed=response_embed, ephemeral=True)
             
             # Register channel for inactivity monitoring
-            self.process_channels[process_channel.id] = datetime.now(timezone.utc)
+            await self._track_process_channel(process_channel.id)
             logger.info(f"[INACTIVITY] Registered channel {process_channel.id} for inactivity monitoring (5 min timeout)")
             
             # Audit log
@@ -1350,83 +1361,107 @@ class ProcessCog(commands.Cog):
                 ephemeral=True
             )
     
-    @tasks.loop(minutes=1)  # Check every minute
-    async def check_inactivity(self):
-        """Check for inactive process channels and close them after 5 minutes"""
-        if not self.bot.is_ready():
-            return
+    async def _persist_process_channels(self):
+        """Save the open process channel IDs so they survive a restart"""
+        try:
+            await self.state_repo.set(
+                PROCESS_CHANNELS_STATE_KEY,
+                sorted(self.inactivity_scheduler.keys())
+            )
+        except Exception as e:
+            logger.warning(f"[INACTIVITY] Could not persist process channels: {e}")
+    
+    async def _track_process_channel(self, channel_id: int):
+        """Start the inactivity countdown for a process channel"""
+        self.inactivity_scheduler.schedule(channel_id, self.inactivity_timeout.total_seconds())
+        await self._persist_process_channels()
+    
+    async def _untrack_process_channel(self, channel_id: int):
+        """Stop tracking a process channel"""
+        if self.inactivity_scheduler.cancel(channel_id):
+            await self._persist_process_channels()
+    
+    async def _restore_process_channels(self):
+        """
+        Re-arm process channels that were open before a restart.
         
-        current_time = datetime.now(timezone.utc)
-        channels_to_close = []
+        Restored channels get a fresh full timeout; channels that no longer
+        exist are dropped from the persisted state.
+        """
+        await self.bot.wait_until_ready()
+        try:
+            channel_ids = await self.state_repo.get(PROCESS_CHANNELS_STATE_KEY, default=[])
+        except Exception as e:
+            logger.warning(f"[INACTIVITY] Could not load persisted process channels: {e}")
+            return
         
-        for channel_id, last_activity in list(self.process_channels.items()):
-            # Check if channel still exists
-            channel = self.bot.get_channel(channel_id)
-            if not channel:
-                # Channel was deleted manually, remove from tracking
-                logger.info(f"[INACTIVITY] Channel {channel_id} no longer exists, removing from tracking")
-                self.process_channels.pop(channel_id, None)
+        restored = 0
+        for channel_id in channel_ids or []:
+            if self.bot.get_channel(int(channel_id)) is None:
+                logger.info(f"[INACTIVITY] Channel {channel_id} no longer exists, dropping from tracking")
                 continue
-            
-            # Calculate inactivity duration
-            inactivity_duration = current_time - last_activity
-            
-            if inactivity_duration >= self.inactivity_timeout:
-                channels_to_close.append((channel, inactivity_duration))
-            else:
-                # Log remaining time for debugging
-                remaining = self.inactivity_timeout - inactivity_duration
-                logger.debug(f"[INACTIVITY] Channel {channel_id} still active, {remaining.total_seconds():.0f}s remaining")
+            self.inactivity_scheduler.schedule(int(channel_id), self.inactivity_timeout.total_seconds())
+            restored += 1
         
-        # Close inactive channels
-        for channel, duration in channels_to_close:
+        await self._persist_process_channels()
+        if restored:
+            logger.info(f"[INACTIVITY] Restored {restored} process channel(s) after restart")
+    
+    async def _close_inactive_channel(self, channel_id: int):
+        """Close a process channel whose inactivity deadline expired"""
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            # Channel was deleted manually, remove from tracking
+            logger.info(f"[INACTIVITY] Channel {channel_id} no longer exists, removing from tracking")
+            await self._persist_process_channels()
+            return
+        
+        try:
+            logger.info(f"[INACTIVITY] Closing channel {channel.id} after {self.inactivity_timeout.total_seconds():.0f}s of inactivity")
+            
+            # Send a final message before closing
             try:
-                logger.info(f"[INACTIVITY] Closing channel {channel.id} after {duration.total_seconds():.0f}s of inactivity")
-                
-                # Send a final message before closing
-                try:
-                    closing_embed = discord.Embed(
-                        title="⚠️ Channel Closing",
-                        description=(
-                            "This channel has been inactive for **5 minutes**.\n"
-                            "The channel will now be automatically closed."
-                        ),
-                        color=discord.Color.orange(),
-                        timestamp=discord.utils.utcnow()
-                    )
-                    closing_embed.set_footer(
-                        text="Age of Warfare • Auto-Close System",
-                        icon_url="https://wa-cdn.nyc3.digitaloceanspaces.com/user-data/production/970c868b-efa5-4aa1-a4c6-8385fcc8e8f9/uploads/images/f77af3977263219d0bb678d720da6e6c.png"
-                    )
-                    await channel.send(embed=closing_embed)
-                    await asyncio.sleep(2)  # Give time for message to send
-                except Exception as e:
-                    logger.warning(f"[INACTIVITY] Could not send closing message: {e}")
-                
-                # Delete the channel
-                await channel.delete(reason="Auto-closed after 5 minutes of inactivity")
-                logger.info(f"[INACTIVITY] ✅ Successfully closed channel {channel.id}")
-                
-                # Remove from tracking
-                self.process_channels.pop(channel.id, None)
-                
-            except discord.Forbidden:
-                logger.error(f"[INACTIVITY] ❌ No permission to delete channel {channel.id}")
-                self.process_channels.pop(channel.id, None)
-            except discord.NotFound:
-                logger.warning(f"[INACTIVITY] Channel {channel.id} already deleted")
-                self.process_channels.pop(channel.id, None)
+                closing_embed = discord.Embed(
+                    title="⚠️ Channel Closing",
+                    description=(
+                        "This channel has been inactive for **5 minutes**.\n"
+                        "The channel will now be automatically closed."
+                    ),
+                    color=discord.Color.orange(),
+                    timestamp=discord.utils.utcnow()
+                )
+                closing_embed.set_footer(
+                    text="Age of Warfare • Auto-Close System",
+                    icon_url="https://wa-cdn.nyc3.digitaloceanspaces.com/user-data/production/970c868b-efa5-4aa1-a4c6-8385fcc8e8f9/uploads/images/f77af3977263219d0bb678d720da6e6c.png"
+                )
+                await channel.send(embed=closing_embed)
+                await asyncio.sleep(2)  # Give time for message to send
             except Exception as e:
-                logger.error(f"[INACTIVITY] ❌ Error closing channel {channel.id}: {e}", exc_info=True)
-    
-    @check_inactivity.before_loop
-    async def before_check_inactivity(self):
-        """Wait until bot is ready before starting the task"""
-        await self.bot.wait_until_ready()
+                logger.warning(f"[INACTIVITY] Could not send closing message: {e}")
+            
+            # Delete the channel
+            await channel.delete(reason="Auto-closed after 5 minutes of inactivity")
+            logger.info(f"[INACTIVITY] ✅ Successfully closed channel {channel.id}")
+            
+        except discord.Forbidden:
+            logger.error(f"[INACTIVITY] ❌ No permission to delete channel {channel.id}")
+        except discord.NotFound:
+            logger.warning(f"[INACTIVITY] Channel {channel.id} already deleted")
+        except Exception as e:
+            logger.error(f"[INACTIVITY] ❌ Error closing channel {channel.id}: {e}", exc_info=True)
+        
+        # Deadline already fired (no longer scheduled), just persist the removal
+        await self._persist_process_channels()
     
     def cog_unload(self):
         """Clean up when cog is unloaded"""
-        self.check_inactivity.cancel()
+        self.inactivity_scheduler.stop()
+    
+    def _refresh_activity(self, channel_id: int):
+        """Push back the inactivity deadline of a tracked process channel"""
+        if channel_id in self.inactivity_scheduler:
+            self.inactivity_scheduler.schedule(channel_id, self.inactivity_timeout.total_seconds())
+            logger.debug(f"[INACTIVITY] Updated activity for channel {channel_id}")
     
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -1434,19 +1469,20 @@ class ProcessCog(commands.Cog):
         if message.author.bot:
             return
         
-        if message.channel.id in self.process_channels:
-            self.process_channels[message.channel.id] = datetime.now(timezone.utc)
-            logger.debug(f"[INACTIVITY] Updated activity for channel {message.channel.id}")
+        self._refresh_activity(message.channel.id)
     
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
         """Update last activity when an interaction occurs in a process channel"""
-        if not hasattr(interaction, 'channel') or not interaction.channel:
+        if interaction.channel_id is None:
             return
         
-        if interaction.channel.id in self.process_channels:
-            self.process_channels[interaction.channel.id] = datetime.now(timezone.utc)
-            logger.debug(f"[INACTIVITY] Updated activity for channel {interaction.channel.id} (interaction)")
+        self._refresh_activity(interaction.channel_id)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Stop tracking process channels deleted manually"""
+        await self._untrack_process_channel(channel.id)
 
 
 async def setup(bot: commands.Bot):
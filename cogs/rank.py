@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, FrozenSet, List, Mapping, Tuple
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
-from utils.database import get_pool
+from utils.database import get_dialect, get_pool
+from services.config_service import get_config_service
 
 # -----------------------------
 # RANKS & PRIORITY (highest wins)
@@ -63,9 +64,9 @@ MORTALS = [
     "Civitas Aspirant",
 ]
 
-# Final priority list (lowest -> highest). We'll pick the HIGHEST present.
-# This can be overridden by config service
-ROLE_PRIORITY: List[str] = (
+# Default priority list (lowest -> highest). We'll pick the HIGHEST present.
+# The config snapshot's role_priority overrides it (read at call time so reloads apply)
+DEFAULT_ROLE_PRIORITY: Tuple[str, ...] = tuple(
     MORTALS
     + LEGIONARIES
     + SPECIALIST
@@ -73,20 +74,8 @@ ROLE_PRIORITY: List[str] = (
     + GREAT_COMPANY
     + HIGH_COMMAND
 )
-
-# Try to load priority from config service
-try:
-    from services.config_service import get_config_service
-    config_service = get_config_service()
-    config_priority = config_service.get_role_priority()
-    if config_priority:
-        ROLE_PRIORITY = config_priority
-except Exception:
-    # Use default if config service fails
-    pass
-
-# fast membership set
-ALL_RANKS_SET = set(ROLE_PRIORITY)
+_DEFAULT_PRIORITY_INDEX: Dict[str, int] = {role: i for i, role in enumerate(DEFAULT_ROLE_PRIORITY)}
+_DEFAULT_RANKS: FrozenSet[str] = frozenset(DEFAULT_ROLE_PRIORITY)
 
 # Nickname prefix pattern like "6. "
 PREFIX_RE = re.compile(r"^\d+\.\s*")
@@ -131,21 +120,26 @@ class RankCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.config_service = get_config_service()
+
+    @property
+    def role_priority(self) -> Tuple[str, ...]:
+        """Rank roles lowest -> highest (config snapshot, or default if empty)"""
+        return self.config_service.snapshot.role_priority or DEFAULT_ROLE_PRIORITY
+
+    @property
+    def priority_index(self) -> Mapping[str, int]:
+        """Rank role -> position in role_priority"""
+        return self.config_service.snapshot.priority_index or _DEFAULT_PRIORITY_INDEX
+
+    @property
+    def tracked_roles(self) -> FrozenSet[str]:
+        """Known rank roles (config snapshot, or default if empty)"""
+        return self.config_service.snapshot.tracked_roles or _DEFAULT_RANKS
 
     # -----------------------------
-    # DB Pool & Schema
+    # DB access (table created by migrations/001_core_schema.sql)
     # -----------------------------
-    async def _ensure_table(self):
-        pool = get_pool()
-        async with pool.acquire() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute("""
-                    CREATE TABLE IF NOT EXISTS role_company_map (
-                        role_name VARCHAR(100) PRIMARY KEY,
-                        company INT NOT NULL
-                    )
-                """)
-
     async def _get_company_for_role(self, role_name: str) -> Optional[int]:
         pool = get_pool()
         async with pool.acquire() as conn:
@@ -159,13 +153,14 @@ class RankCog(commands.Cog):
 
     async def _set_company_for_role(self, role_name: str, company: int):
         pool = get_pool()
+        dialect = get_dialect()
         async with pool.acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
-                    """
+                    f"""
                     INSERT INTO role_company_map (role_name, company)
                     VALUES (%s, %s)
-                    ON DUPLICATE KEY UPDATE company = VALUES(company)
+                    {dialect.upsert_clause(["role_name"], {"company": dialect.excluded("company")})}
                     """,
                     (role_name, company)
                 )
@@ -192,16 +187,16 @@ class RankCog(commands.Cog):
     # -----------------------------
     def _find_top_rank(self, member: discord.Member) -> Optional[str]:
         """
-        Return the highest-priority rank the member has (based on ROLE_PRIORITY),
+        Return the highest-priority rank the member has (based on role_priority),
         or None if none of the known ranks are present.
         """
-        names = [r.name for r in member.roles if r.name != "@everyone"]
-        present = [n for n in names if n in ALL_RANKS_SET]
+        tracked = self.tracked_roles
+        present = [r.name for r in member.roles if r.name != "@everyone" and r.name in tracked]
         if not present:
             return None
-        # sort present by ROLE_PRIORITY index, highest wins
-        present.sort(key=lambda n: ROLE_PRIORITY.index(n))
-        return present[-1]
+        # highest priority index wins
+        priority_index = self.priority_index
+        return max(present, key=lambda n: priority_index.get(n, -1))
 
     async def _apply_nickname(self, member: discord.Member):
         """
@@ -222,7 +217,6 @@ class RankCog(commands.Cog):
         if not top_rank:
             return
 
-        await self._ensure_table()
         company = await self._get_company_for_role(top_rank)
         if company is None:
             # No mapping yet for this rank; skip silently
@@ -277,11 +271,10 @@ class RankCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def company_set(self, interaction: discord.Interaction, role: str, company: int):
         await interaction.response.defer(ephemeral=True)
-        if role not in ALL_RANKS_SET:
+        if role not in self.tracked_roles:
             await interaction.followup.send("❌ Unknown rank. Make sure you typed the exact role name.", ephemeral=True)
             return
 
-        await self._ensure_table()
         await self._set_company_for_role(role, company)
         await interaction.followup.send(f"✅ Set **{role}** → Company **{company}**.", ephemeral=True)
 
@@ -290,10 +283,9 @@ class RankCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def company_get(self, interaction: discord.Interaction, role: str):
         await interaction.response.defer(ephemeral=True)
-        if role not in ALL_RANKS_SET:
+        if role not in self.tracked_roles:
             await interaction.followup.send("❌ Unknown rank.", ephemeral=True)
             return
-        await self._ensure_table()
         company = await self._get_company_for_role(role)
         if company is None:
             await interaction.followup.send(f"ℹ️ No company set for **{role}**.", ephemeral=True)
@@ -304,7 +296,6 @@ class RankCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def company_list(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-        await self._ensure_table()
         mapping = await self._list_company_map()
         if not mapping:
             await interaction.followup.send("No mappings set yet.", ephemeral=True)
@@ -312,7 +303,7 @@ class RankCog(commands.Cog):
 
         # Build a sorted, readable list by role priority
         lines = []
-        for role in ROLE_PRIORITY:
+        for role in self.role_priority:
             if role in mapping:
                 lines.append(f"**{mapping[role]}** — {role}")
         text = "\n".join(lines) if lines else "No mappings set yet."
@@ -324,10 +315,9 @@ class RankCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def company_remove(self, interaction: discord.Interaction, role: str):
         await interaction.response.defer(ephemeral=True)
-        if role not in ALL_RANKS_SET:
+        if role not in self.tracked_roles:
             await interaction.followup.send("❌ Unknown rank.", ephemeral=True)
             return
-        await self._ensure_table()
         await self._remove_company_for_role(role)
         await interaction.followup.send(f"🗑️ Removed mapping for **{role}**.", ephemeral=True)
 
@@ -63,7 +63,7 @@ class RemovePointsCog(commands.Cog):
                     performed_by=transaction.performed_by,
                     command="/remove"
                 )
-                await self.bot.dispatch('points_changed', event)
+                self.bot.dispatch('points_changed', event)
             except Exception as event_error:
                 # Log event error but don't fail the command
                 from utils.logger import get_logger
@@ -0,0 +1,44 @@
+"""
+Retention Cog - Scheduled purge of expired rows.
+
+Runs the retention policies once a day (LGPD Art. 15 for audit logs, bounded
+size for XP history and daily limits).
+"""
+
+from __future__ import annotations
+
+from datetime import time, timezone
+from discord.ext import commands, tasks
+
+from services.retention_service import get_retention_service
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Daily run, off-peak
+RETENTION_RUN_TIME = time(hour=4, minute=0, tzinfo=timezone.utc)
+
+
+class RetentionCog(commands.Cog):
+    """Cog running the daily retention purge"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.retention_service = get_retention_service()
+        self.retention_purge.start()
+
+    @tasks.loop(time=RETENTION_RUN_TIME)
+    async def retention_purge(self):
+        """Purge rows past their retention period."""
+        logger.info("[RETENTION] Starting scheduled purge")
+        results = await self.retention_service.run()
+        logger.info(f"[RETENTION] Scheduled purge finished: {results}")
+
+    @retention_purge.before_loop
+    async def before_retention_purge(self):
+        """Wait until bot is ready before starting the task."""
+        await self.bot.wait_until_ready()
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded."""
+        self.retention_purge.cancel()
@@ -18,7 +18,6 @@ import re
 
 from utils.checks import appcmd_moderator_or_owner
 from utils.logger import get_logger
-from utils.roadmap_parser import get_latest_roadmap_data, format_roadmap_items
 
 logger = get_logger(__name__)
 
@@ -225,8 +224,11 @@ class RoadmapCog(commands.Cog):
         Internal method to post roadmap - called with lock held.
         """
         try:
-            # Get roadmap data from documentation
-            roadmap_data = get_latest_roadmap_data()
+            # Parser is imported on first use (the cog only posts a few times a day)
+            from utils.roadmap_parser import format_roadmap_items, get_latest_roadmap_data_async, translate_to_english
+            
+            # Get roadmap data from documentation (cached, parsed off the event loop)
+            roadmap_data = await get_latest_roadmap_data_async()
             
             # Use the comprehensive hash from parser
             current_hash = roadmap_data.get('content_hash', '')
@@ -236,6 +238,12 @@ class RoadmapCog(commands.Cog):
                 data_string = f"{roadmap_data['title']}{roadmap_data['description']}{len(roadmap_data['features'])}{len(roadmap_data['fixes'])}{len(roadmap_data['upcoming'])}"
                 current_hash = hashlib.md5(data_string.encode()).hexdigest()
             
+            # Check if roadmap has changed since last post (unless forced)
+            # Done before the channel history scan so unchanged checks cost nothing
+            if not force_post and current_hash == self.last_roadmap_hash:
+                logger.debug(f"[ROADMAP] No changes detected (hash: {current_hash[:8]}...), skipping auto-post")
+                return False
+            
             # Get the roadmap channel first to check for duplicates
             roadmap_channel = self.bot.get_channel(ROADMAP_CHANNEL_ID)
             if not isinstance(roadmap_channel, discord.TextChannel):
@@ -276,11 +284,6 @@ class RoadmapCog(commands.Cog):
                         logger.info(f"[ROADMAP] Posted recently ({time_since_last.total_seconds():.0f}s ago), skipping to avoid duplicate")
                         return False
             
-            # Check if roadmap has changed since last post (unless forced)
-            if not force_post and current_hash == self.last_roadmap_hash:
-                logger.debug(f"[ROADMAP] No changes detected (hash: {current_hash[:8]}...), skipping auto-post")
-                return False
-            
             # If forced post but content is same, use original title (don't add timestamp)
             # The duplicate check above will prevent multiple posts
             if force_post and current_hash == self.last_roadmap_hash:
@@ -302,8 +305,6 @@ class RoadmapCog(commands.Cog):
             title = roadmap_data['title']
             description = roadmap_data['description']
             
-            # Import translate function to ensure English
-            from utils.roadmap_parser import translate_to_english
             title = translate_to_english(title)
             description = translate_to_english(description)
             
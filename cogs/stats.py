@@ -0,0 +1,102 @@
+"""
+Stats Cog - XP activity summaries and the rollup compactor.
+
+/stats reads the daily XP rollups (7/30/90-day activity, top sources,
+streaks); a background task folds new raw XP events into them every few
+minutes.
+"""
+
+from __future__ import annotations
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+
+from services.xp_analytics_service import ROLLUP_INTERVAL_MINUTES, get_xp_analytics_service
+from utils.checks import cmd_channel_only, appcmd_channel_only
+from utils.config import USERINFO_CHANNEL_ID
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StatsCog(commands.Cog):
+    """Cog for /stats and the XP rollup compactor"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.analytics_service = get_xp_analytics_service()
+        self.rollup_compactor.start()
+
+    @tasks.loop(minutes=ROLLUP_INTERVAL_MINUTES)
+    async def rollup_compactor(self):
+        """Fold new XP events into the daily rollups."""
+        try:
+            await self.analytics_service.compact()
+        except Exception as e:
+            logger.error(f"[XP ROLLUP] Compaction failed: {e}", exc_info=True)
+
+    @rollup_compactor.before_loop
+    async def before_rollup_compactor(self):
+        """Wait until bot is ready before starting the task."""
+        await self.bot.wait_until_ready()
+
+    def cog_unload(self):
+        """Clean up when cog is unloaded."""
+        self.rollup_compactor.cancel()
+
+    @commands.hybrid_command(name="stats", description="Displays XP activity over the last 7, 30 and 90 days.")
+    @app_commands.describe(member="User to inspect (defaults to you)")
+    @cmd_channel_only(USERINFO_CHANNEL_ID)  # prefix/hybrid guard
+    @appcmd_channel_only(USERINFO_CHANNEL_ID)  # slash guard
+    async def stats(self, ctx: commands.Context, member: discord.Member | None = None):
+        """Display XP activity from the daily rollups."""
+        if ctx.guild is None:
+            await ctx.reply("This command must be used in a server.", mention_author=False)
+            return
+
+        member = member or ctx.author
+
+        try:
+            stats = await self.analytics_service.get_user_stats(member.id)
+
+            embed = discord.Embed(
+                title=f"— ACTIVITY: {member.display_name.upper()} —",
+                color=discord.Color.from_rgb(0, 255, 0)
+            )
+            avatar_url = getattr(member.display_avatar, "url", None)
+            if avatar_url:
+                embed.set_thumbnail(url=avatar_url)
+
+            for days, window in stats["windows"].items():
+                embed.add_field(
+                    name=f"[{days}D]",
+                    value=f"> {window['xp']} XP\n> {window['active_days']} active days",
+                    inline=True
+                )
+
+            top_sources = "\n".join(f"> {source}: {xp} XP" for source, xp in stats["top_sources"]) or "> None"
+            embed.add_field(name="[TOP_SOURCES]", value=top_sources, inline=True)
+            embed.add_field(
+                name="[STREAK]",
+                value=f"> Current: {stats['current_streak']} days\n> Longest: {stats['longest_streak']} days",
+                inline=True
+            )
+            last_active = stats["last_active"]
+            embed.add_field(
+                name="[LAST_ACTIVE]",
+                value=f"> {last_active.isoformat() if last_active else 'Never'}",
+                inline=True
+            )
+
+            embed.set_footer(text=f"Updated every {ROLLUP_INTERVAL_MINUTES} minutes ─ days in UTC")
+
+            await ctx.reply(embed=embed, mention_author=False)
+
+        except Exception as e:
+            logger.error(f"Error in stats command: {e}", exc_info=True)
+            await ctx.reply("❌ Error retrieving activity stats.", mention_author=False)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(StatsCog(bot))
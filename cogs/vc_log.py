@@ -197,7 +197,7 @@ class VCLogCog(commands.Cog):
                         performed_by=transaction.performed_by,
                         command="/vc_log"
                     )
-                    await self.bot.dispatch('points_changed', event_obj)
+                    self.bot.dispatch('points_changed', event_obj)
                 except Exception as event_error:
                     logger.warning(f"Error dispatching points_changed event: {event_error}", exc_info=True)
                 
@@ -14,7 +14,7 @@ Benefits:
 
 from __future__ import annotations
 
-from typing import Protocol, Optional, Dict, Any, List
+from typing import Protocol, Optional, Dict, Any, List, Iterable, Set
 from datetime import date
 
 
@@ -77,6 +77,10 @@ class ConsentRepositoryProtocol(Protocol):
     async def revoke(self, user_id: int) -> bool:
         """Revoke consent"""
         ...
+    
+    async def get_consented_users(self, user_ids: Iterable[int]) -> Set[int]:
+        """Filter user IDs down to those with consent"""
+        ...
 
 
 # ============================================
@@ -169,6 +173,25 @@ class XPRepositoryProtocol(Protocol):
     ) -> int:
         """Get daily XP limit for source"""
         ...
+    
+    async def get_daily_xp_limits(
+        self,
+        user_ids: Iterable[int],
+        source: str,
+        target_date: Optional[date] = None
+    ) -> Dict[int, int]:
+        """Get daily XP gained for many users"""
+        ...
+    
+    async def add_xp_batch(
+        self,
+        awards: Dict[int, int],
+        source: str,
+        details: Optional[Dict[int, Dict[str, Any]]] = None,
+        target_date: Optional[date] = None
+    ) -> Dict[int, int]:
+        """Add XP to many users and return new totals"""
+        ...
 
 
 class ProgressionRepositoryProtocol(Protocol):
@@ -3,24 +3,36 @@ Bloxlink Command Detector - Detects when Bloxlink /verify or /update is used.
 
 This event handler listens for Bloxlink commands and triggers Ignis
 to send rank and company information to Bloxlink.
+
+Role updates are filtered locally before any HTTP work: only changes to
+rank-relevant roles (ConfigService tracked roles) that look like they came
+from Bloxlink are queued, and the queue keeps one pending entry per member.
 """
 
 from __future__ import annotations
 
+import time
 import discord
 from discord.ext import commands
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 from utils.logger import get_logger
-from services.bloxlink_service import BloxlinkService
-from services.roblox_groups_service import get_roblox_groups_service
+from services.member_profile_service import get_member_profile_service
 from services.company_mapping_service import get_company_mapping_service
 from services.progression_service import ProgressionService
+from services.config_service import get_config_service
+from utils.keyed_work_queue import KeyedWorkQueue
 
 logger = get_logger(__name__)
 
 # Bloxlink bot ID (common ID for Bloxlink)
 BLOXLINK_BOT_ID = 426537812993638401  # Bloxlink's bot ID
 
+# Max wait for a complete member profile (Bloxlink retries can be slow)
+PROFILE_FULL_DEADLINE_SECONDS = 30.0
+
+# Role changes and Bloxlink command replies within this window are correlated
+BLOXLINK_ACTIVITY_WINDOW_SECONDS = 60.0
+
 
 class BloxlinkCommandDetector(commands.Cog):
     """
@@ -30,10 +42,73 @@ class BloxlinkCommandDetector(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.bloxlink_service = BloxlinkService()
-        self.groups_service = get_roblox_groups_service()
+        self.profile_service = get_member_profile_service()
         self.company_service = get_company_mapping_service()
         self.progression_service = ProgressionService()
+        self.config_service = get_config_service()
+        self.work_queue = KeyedWorkQueue(self._process_member, name="BLOXLINK_DETECTOR")
+        # member_id -> monotonic time of the last Bloxlink command reply for them
+        self._recent_bloxlink_replies: Dict[int, float] = {}
+        # member_id -> (monotonic time, member) for rank changes waiting for a Bloxlink signal
+        self._unconfirmed_changes: Dict[int, Tuple[float, discord.Member]] = {}
+    
+    async def cog_load(self):
+        """Start the lookup worker"""
+        self.work_queue.start()
+    
+    async def cog_unload(self):
+        """Stop the lookup worker"""
+        self.work_queue.stop()
+    
+    def _rank_roles_changed(self, before: discord.Member, after: discord.Member) -> Tuple[Set[str], Set[str]]:
+        """
+        Get names of added/removed roles that map to a rank.
+        
+        Args:
+            before: Member before update
+            after: Member after update
+        
+        Returns:
+            Tuple of (added, removed) rank-relevant role names (both empty if none)
+        """
+        before_roles = set(before.roles)
+        after_roles = set(after.roles)
+        if before_roles == after_roles:
+            return set(), set()
+        tracked = self.config_service.snapshot.tracked_roles
+        added = {role.name for role in after_roles - before_roles if role.name in tracked}
+        removed = {role.name for role in before_roles - after_roles if role.name in tracked}
+        return added, removed
+    
+    def _prune_signals(self, now: float) -> None:
+        """Drop correlation entries older than the activity window"""
+        cutoff = now - BLOXLINK_ACTIVITY_WINDOW_SECONDS
+        for member_id in [m for m, t in self._recent_bloxlink_replies.items() if t < cutoff]:
+            del self._recent_bloxlink_replies[member_id]
+        for member_id in [m for m, (t, _) in self._unconfirmed_changes.items() if t < cutoff]:
+            del self._unconfirmed_changes[member_id]
+    
+    def _is_likely_bloxlink(
+        self,
+        before: discord.Member,
+        after: discord.Member,
+        added: Set[str],
+        removed: Set[str],
+        now: float
+    ) -> bool:
+        """
+        Heuristics (no audit log access) for "this role change came from Bloxlink".
+        
+        - Bloxlink swaps rank roles in one edit (manual edits add/remove one at a time)
+        - Bloxlink sets the nickname together with the roles on /verify and /update
+        - Bloxlink replied to a command for this member moments ago
+        """
+        if added and removed:
+            return True
+        if before.nick != after.nick:
+            return True
+        replied_at = self._recent_bloxlink_replies.get(after.id)
+        return replied_at is not None and now - replied_at <= BLOXLINK_ACTIVITY_WINDOW_SECONDS
     
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
@@ -42,20 +117,73 @@ class BloxlinkCommandDetector(commands.Cog):
         
         This is triggered when Bloxlink uses /verify or /update and
         updates the member's Discord roles based on their Roblox rank.
+        Only local checks run here; lookups happen on the work queue.
         """
         try:
-            # Only process if roles changed
-            if before.roles == after.roles:
+            # Only rank-relevant role changes matter (gamenight toggles etc. are ignored)
+            added, removed = self._rank_roles_changed(before, after)
+            if not added and not removed:
                 return
             
-            # Check if this is likely a Bloxlink update
-            # (roles changed, member is verified)
-            roblox_data = await self.bloxlink_service.get_roblox_user(
+            now = time.monotonic()
+            self._prune_signals(now)
+            
+            if self._is_likely_bloxlink(before, after, added, removed, now):
+                self._unconfirmed_changes.pop(after.id, None)
+                self.work_queue.put(after.id, (now, after))
+            else:
+                # The Bloxlink reply may arrive after the role update
+                self._unconfirmed_changes[after.id] = (now, after)
+        except Exception as e:
+            logger.error(
+                f"Error in Bloxlink command detector for {after.id}: {e}",
+                exc_info=True
+            )
+    
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        """Record Bloxlink command replies to correlate them with role updates"""
+        if message.author.id != BLOXLINK_BOT_ID:
+            return
+        
+        # interaction_metadata is discord.py 2.4+; 2.3 only has the (since deprecated) interaction
+        if hasattr(message, "interaction_metadata"):
+            metadata = message.interaction_metadata
+        else:
+            metadata = getattr(message, "interaction", None)
+        if metadata is None or metadata.user is None:
+            return
+        
+        member_id = metadata.user.id
+        now = time.monotonic()
+        self._prune_signals(now)
+        self._recent_bloxlink_replies[member_id] = now
+        
+        pending = self._unconfirmed_changes.pop(member_id, None)
+        if pending is not None:
+            self.work_queue.put(member_id, pending)
+    
+    async def _process_member(self, member_id: int, change: Tuple[float, discord.Member]):
+        """
+        Resolve Roblox rank/company for a member after a Bloxlink update.
+        
+        Args:
+            member_id: Discord user ID
+            change: (monotonic time the role change was seen, latest member snapshot)
+        """
+        changed_at, after = change
+        try:
+            # Only data fetched after the role change: the link/rank it reflects may be
+            # newer than the cache. That lookup is shared with role sync for the same change.
+            roblox_data = await self.profile_service.get_profile(
                 discord_id=after.id,
-                guild_id=after.guild.id
+                guild_id=after.guild.id,
+                include_rank=True,
+                deadline=PROFILE_FULL_DEADLINE_SECONDS,
+                min_fetched_at=changed_at
             )
             
-            if not roblox_data:
+            if not roblox_data or roblox_data.get("partial"):
                 # User not verified, skip
                 return
             
@@ -66,10 +194,7 @@ class BloxlinkCommandDetector(commands.Cog):
                 return
             
             # Get rank in main group
-            rank_info = await self.groups_service.get_user_rank_in_group(
-                roblox_id,
-                6340169  # Main group ID
-            )
+            rank_info = roblox_data.get("rank_info")
             
             if not rank_info:
                 logger.debug(
@@ -4,12 +4,11 @@ Gamification Event Handlers - Automatic XP gain from user activities.
 
 from __future__ import annotations
 
-from typing import Optional
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from services.xp_service import XPService
-from services.level_service import LevelService
+from services.level_service import LevelService, level_from_xp
 from services.consent_service import ConsentService
 from utils.logger import get_logger
 
@@ -22,8 +21,8 @@ XP_RATES = {
     "reaction": 0.5,  # +0.5 XP per reaction (rounded down)
 }
 
-# Tracking voice channel time
-_voice_join_times: dict[int, datetime] = {}  # user_id -> join_time
+# Voice XP is accrued on a fixed tick for everyone in voice (not on leave)
+VOICE_XP_TICK_MINUTES = 5
 
 
 class GamificationHandlers(commands.Cog):
@@ -34,6 +33,7 @@ class GamificationHandlers(commands.Cog):
         self.xp_service = XPService()
         self.level_service = LevelService()
         self.consent_service = ConsentService()
+        self.voice_xp_tick.start()
     
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -94,7 +94,7 @@ class GamificationHandlers(commands.Cog):
                         f"via message XP"
                     )
                     # Dispatch level up event (for future notifications)
-                    await self.bot.dispatch(
+                    self.bot.dispatch(
                         'level_up',
                         {
                             "user_id": message.author.id,
@@ -108,140 +108,120 @@ class GamificationHandlers(commands.Cog):
             logger.error(f"Error awarding message XP to {message.author.id}: {e}", exc_info=True)
             # Fail silently to not break message handling
     
-    @commands.Cog.listener()
-    async def on_voice_state_update(
-        self,
-        member: discord.Member,
-        before: discord.VoiceState,
-        after: discord.VoiceState
-    ):
+    def cog_unload(self):
+        """Stop the voice XP tick when the cog is unloaded"""
+        self.voice_xp_tick.cancel()
+    
+    @staticmethod
+    def _is_voice_xp_eligible(member: discord.Member) -> bool:
+        """Whether a member in voice should accrue XP this tick"""
+        if member.bot or member.voice is None:
+            return False
+        voice = member.voice
+        return not (voice.afk or voice.self_mute or voice.self_deaf)
+    
+    def _collect_voice_awards(self) -> Dict[int, Dict[str, Any]]:
         """
-        Track voice channel time and award XP.
+        Snapshot members currently earning voice XP.
         
-        Awards XP when user leaves voice channel based on time spent.
+        Skips the AFK channel, self-muted/deafened members and channels
+        where fewer than two eligible members are present (solo users).
+        
+        Returns:
+            Dict of user_id -> details for the XP event
         """
-        # Ignore bots
-        if member.bot:
-            return
+        awards: Dict[int, Dict[str, Any]] = {}
+        for guild in self.bot.guilds:
+            afk_channel_id = guild.afk_channel.id if guild.afk_channel else None
+            for channel in guild.voice_channels:
+                if channel.id == afk_channel_id:
+                    continue
+                
+                eligible = [m for m in channel.members if self._is_voice_xp_eligible(m)]
+                if len(eligible) < 2:
+                    continue
+                
+                for member in eligible:
+                    awards[member.id] = {
+                        "channel_id": channel.id,
+                        "channel_name": channel.name,
+                        "minutes_spent": VOICE_XP_TICK_MINUTES,
+                        "guild_id": guild.id
+                    }
+        return awards
+    
+    @tasks.loop(minutes=VOICE_XP_TICK_MINUTES)
+    async def voice_xp_tick(self):
+        """
+        Award voice XP to everyone currently in voice, in one batched write.
         
-        # User joined a voice channel
-        if before.channel is None and after.channel is not None:
-            _voice_join_times[member.id] = datetime.utcnow()
-            logger.debug(f"User {member.id} joined voice channel {after.channel.id}")
+        Replaces the old award-on-leave approach: XP accrues evenly every
+        tick, so long sessions and mass leaves no longer spike the database.
+        """
+        if not self.bot.is_ready():
+            return
         
-        # User left a voice channel
-        elif before.channel is not None and after.channel is None:
-            if member.id in _voice_join_times:
-                join_time = _voice_join_times.pop(member.id)
-                time_spent = datetime.utcnow() - join_time
-                minutes_spent = int(time_spent.total_seconds() / 60)
+        try:
+            awards = self._collect_voice_awards()
+            if not awards:
+                return
+            
+            # Check consent (LGPD compliance) for the whole batch
+            consented = await self.consent_service.filter_consented(awards)
+            if not consented:
+                return
+            
+            xp_per_tick = VOICE_XP_TICK_MINUTES * XP_RATES["voice_per_minute"]
+            results = await self.xp_service.add_xp_batch(
+                {user_id: xp_per_tick for user_id in consented},
+                source="voice",
+                details={user_id: awards[user_id] for user_id in consented}
+            )
+            
+            awarded = 0
+            for user_id, result in results.items():
+                if result["added"] <= 0 or result["total"] is None:
+                    continue
+                awarded += 1
                 
-                if minutes_spent > 0:
-                    # Check consent
-                    try:
-                        has_consent = await self.consent_service.has_consent(member.id)
-                        if not has_consent:
-                            return  # Silently skip
-                    except Exception as e:
-                        logger.warning(f"Error checking consent for user {member.id}: {e}")
-                        return
-                    
-                    # Award XP (with daily limit)
-                    xp_to_award = minutes_spent * XP_RATES["voice_per_minute"]
-                    
-                    try:
-                        result = await self.xp_service.add_xp(
-                            user_id=member.id,
-                            xp_amount=xp_to_award,
-                            source="voice",
-                            details={
-                                "channel_id": before.channel.id if before.channel else None,
-                                "channel_name": before.channel.name if before.channel else None,
-                                "minutes_spent": minutes_spent,
-                                "guild_id": member.guild.id if member.guild else None
-                            }
-                        )
-                        
-                        logger.debug(
-                            f"User {member.id} gained {result['added']} XP "
-                            f"({minutes_spent} min in VC)"
-                        )
-                        
-                        # Check if level up
-                        if result["added"] > 0:
-                            level_result = await self.level_service.update_level_if_needed(
-                                member.id,
-                                result["total"]
-                            )
-                            
-                            if level_result["level_changed"]:
-                                logger.info(
-                                    f"User {member.id} leveled up from "
-                                    f"{level_result['old_level']} to {level_result['new_level']} "
-                                    f"via voice XP"
-                                )
-                                await self.bot.dispatch(
-                                    'level_up',
-                                    {
-                                        "user_id": member.id,
-                                        "old_level": level_result["old_level"],
-                                        "new_level": level_result["new_level"],
-                                        "source": "voice"
-                                    }
-                                )
-                    
-                    except Exception as e:
-                        logger.error(f"Error awarding voice XP to {member.id}: {e}", exc_info=True)
-        
-        # User switched voice channels
-        elif before.channel is not None and after.channel is not None and before.channel != after.channel:
-            # Calculate XP for time in old channel
-            if member.id in _voice_join_times:
-                join_time = _voice_join_times.pop(member.id)
-                time_spent = datetime.utcnow() - join_time
-                minutes_spent = int(time_spent.total_seconds() / 60)
+                # Only touch progression when this tick crossed a level boundary
+                previous_level = level_from_xp(result["total"] - result["added"])[0]
+                if level_from_xp(result["total"])[0] == previous_level:
+                    continue
                 
-                if minutes_spent > 0:
-                    # Award XP for old channel
-                    try:
-                        has_consent = await self.consent_service.has_consent(member.id)
-                        if not has_consent:
-                            return
-                    except Exception:
-                        return
-                    
-                    xp_to_award = minutes_spent * XP_RATES["voice_per_minute"]
-                    
-                    try:
-                        result = await self.xp_service.add_xp(
-                            user_id=member.id,
-                            xp_amount=xp_to_award,
-                            source="voice",
-                            details={
-                                "channel_id": before.channel.id,
-                                "channel_name": before.channel.name,
-                                "minutes_spent": minutes_spent,
-                                "guild_id": member.guild.id if member.guild else None
-                            }
-                        )
-                        
-                        if result["added"] > 0:
-                            await self.level_service.update_level_if_needed(
-                                member.id,
-                                result["total"]
-                            )
-                    except Exception as e:
-                        logger.error(f"Error awarding voice XP on switch: {e}")
+                level_result = await self.level_service.update_level_if_needed(
+                    user_id,
+                    result["total"]
+                )
+                if level_result["level_changed"]:
+                    logger.info(
+                        f"User {user_id} leveled up from "
+                        f"{level_result['old_level']} to {level_result['new_level']} "
+                        f"via voice XP"
+                    )
+                    self.bot.dispatch(
+                        'level_up',
+                        {
+                            "user_id": user_id,
+                            "old_level": level_result["old_level"],
+                            "new_level": level_result["new_level"],
+                            "source": "voice"
+                        }
+                    )
             
-            # Start tracking new channel
-            _voice_join_times[member.id] = datetime.utcnow()
-            logger.debug(f"User {member.id} switched to voice channel {after.channel.id}")
+            logger.debug(f"Voice XP tick: {awarded}/{len(awards)} members awarded {xp_per_tick} XP")
+        
+        except Exception as e:
+            logger.error(f"Error in voice XP tick: {e}", exc_info=True)
+    
+    @voice_xp_tick.before_loop
+    async def before_voice_xp_tick(self):
+        """Wait until bot is ready before starting the tick"""
+        await self.bot.wait_until_ready()
 
 
 async def setup(bot: commands.Bot):
     """Load the gamification handlers cog"""
-    # Remove existing on_voice_state_update handler if it conflicts
-    # Our handler will work alongside the existing voice_logs handler
     await bot.add_cog(GamificationHandlers(bot))
     logger.info("✅ Gamification handlers loaded (XP system active)")
 
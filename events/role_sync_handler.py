@@ -7,6 +7,7 @@ and automatically syncs the rank to the database.
 
 from __future__ import annotations
 
+import time
 import discord
 from discord.ext import commands
 from typing import Optional
@@ -14,8 +15,8 @@ from typing import Optional
 from services.progression_service import ProgressionService
 from services.audit_service import AuditService
 from services.config_service import get_config_service
-from services.bloxlink_service import BloxlinkService
-from services.roblox_groups_service import get_roblox_groups_service, AOW_GROUP_IDS
+from services.member_profile_service import get_member_profile_service
+from services.roblox_groups_service import AOW_GROUP_IDS
 from utils.rank_paths import ALL_PATHS, DEFAULT_PATH
 from utils.logger import get_logger
 from utils.config import GUILD_ID
@@ -25,6 +26,9 @@ logger = get_logger(__name__)
 # Main group ID for checking rank
 MAIN_GROUP_ID = 6340169
 
+# Max wait for a complete member profile (Bloxlink retries can be slow)
+PROFILE_FULL_DEADLINE_SECONDS = 30.0
+
 # Rank to nickname prefix mapping
 RANK_NICKNAME_PREFIX = {
     # Mortals (Pre-Induction)
@@ -88,17 +92,15 @@ class RoleSyncHandler(commands.Cog):
         self.progression_service = ProgressionService()
         self.audit_service = AuditService()
         self.config_service = get_config_service()
-        self.bloxlink_service = BloxlinkService()
-        self.groups_service = get_roblox_groups_service()
+        self.profile_service = get_member_profile_service()
         
-        # Load role-to-rank mapping from configuration service
-        # This allows easy editing without code changes
-        self.role_to_rank_map = self.config_service.get_role_to_rank_map()
+        # Role-to-rank mapping is read live from the configuration service snapshot
+        # (see role_to_rank_map), so config edits apply without reloading this cog.
+        if not self.config_service.snapshot.role_to_rank:
+            logger.warning("Config service returned empty map, using fallback")
         
         # Fallback to hardcoded map if config is empty (backward compatibility)
-        if not self.role_to_rank_map:
-            logger.warning("Config service returned empty map, using fallback")
-            self.role_to_rank_map = {
+        self._fallback_role_to_rank_map = {
             # High Command
             "Emperor Of Mankind": "Emperor Of Mankind",
             "Primarch": "Primarch",
@@ -149,9 +151,17 @@ class RoleSyncHandler(commands.Cog):
             "Emberbound Initiate": "Emberbound Initiate",
             "Civitas Aspirant": "Civitas Aspirant",
         }
-        
-        # List of roles that should trigger rank updates
-        self.tracked_roles = set(self.role_to_rank_map.keys())
+        self._fallback_tracked_roles = frozenset(self._fallback_role_to_rank_map)
+    
+    @property
+    def role_to_rank_map(self):
+        """Current role-to-rank mapping (config snapshot, or fallback if empty)"""
+        return self.config_service.snapshot.role_to_rank or self._fallback_role_to_rank_map
+    
+    @property
+    def tracked_roles(self):
+        """Roles that should trigger rank updates"""
+        return self.config_service.snapshot.tracked_roles or self._fallback_tracked_roles
     
     def _find_highest_rank_role(self, member: discord.Member) -> Optional[str]:
         """
@@ -174,13 +184,14 @@ class RoleSyncHandler(commands.Cog):
         if not tracked_present:
             return None
         
-        # Use priority from cogs/rank.py
-        from cogs.rank import ROLE_PRIORITY
+        # Use priority index from the config snapshot (falls back to cogs/rank.py order)
+        priority_index = self.config_service.snapshot.priority_index
+        if not priority_index:
+            from cogs.rank import DEFAULT_ROLE_PRIORITY
+            priority_index = {role: i for i, role in enumerate(DEFAULT_ROLE_PRIORITY)}
         
-        # Sort by priority (highest wins)
-        tracked_present.sort(key=lambda r: ROLE_PRIORITY.index(r) if r in ROLE_PRIORITY else -1, reverse=True)
-        
-        return tracked_present[0] if tracked_present else None
+        # Highest priority wins
+        return max(tracked_present, key=lambda r: priority_index.get(r, -1))
     
     def _map_role_to_rank(self, role_name: str) -> Optional[str]:
         """
@@ -225,6 +236,7 @@ class RoleSyncHandler(commands.Cog):
         # Only process if roles actually changed (compare role IDs, not objects)
         if {r.id for r in before.roles} == {r.id for r in after.roles}:
             return
+        changed_at = time.monotonic()
         
         # Get guild
         if not after.guild:
@@ -291,11 +303,9 @@ class RoleSyncHandler(commands.Cog):
                 f"{current_rank} -> {new_rank} (from Discord role: {after_role})"
             )
             
-            # Get company number based on Roblox rank
-            company_number = await self._get_company_for_user(after)
-            
             # Update nickname with format: {Prefix} {group-rank} {roblox-name}
-            await self._update_nickname(after, new_rank, company_number)
+            # (company ranks fall back to the RankCog role -> company mapping)
+            await self._update_nickname(after, new_rank, changed_at=changed_at)
             
         except Exception as e:
             logger.error(
@@ -303,7 +313,13 @@ class RoleSyncHandler(commands.Cog):
                 exc_info=True
             )
     
-    async def _update_nickname(self, member: discord.Member, system_rank: str):
+    async def _update_nickname(
+        self,
+        member: discord.Member,
+        system_rank: str,
+        company_number: Optional[int] = None,
+        changed_at: Optional[float] = None
+    ):
         """
         Update member's nickname to format: {Prefix} {group-rank} {roblox-name}
         
@@ -314,6 +330,9 @@ class RoleSyncHandler(commands.Cog):
         Args:
             member: Discord member
             system_rank: System rank name (from database)
+            company_number: Company prefix, if already known (default: look up by role)
+            changed_at: time.monotonic() of the triggering role change; only
+                Roblox data fetched after it is used
         """
         try:
             # Check bot permissions
@@ -342,7 +361,6 @@ class RoleSyncHandler(commands.Cog):
                     from cogs.rank import RankCog
                     rank_cog = self.bot.get_cog("RankCog")
                     if rank_cog:
-                        await rank_cog._ensure_table()
                         company = await rank_cog._get_company_for_role(after_role)
                         if company is not None:
                             prefix = str(company)
@@ -353,13 +371,19 @@ class RoleSyncHandler(commands.Cog):
                         logger.debug(f"No RankCog found and no prefix for {system_rank}, skipping nickname update")
                         return
             
-            # Get Roblox user data via Bloxlink
-            roblox_data = await self.bloxlink_service.get_roblox_user(
+            # Get Roblox user data via Bloxlink, fetched after the role change: it may follow
+            # a /verify or promotion the cached link/rank doesn't know about yet. The Bloxlink
+            # detector's lookup for the same change is reused.
+            # Wait for the full profile: a partial one has no real username for the nickname
+            roblox_data = await self.profile_service.get_profile(
                 discord_id=member.id,
-                guild_id=guild.id
+                guild_id=guild.id,
+                include_rank=True,
+                deadline=PROFILE_FULL_DEADLINE_SECONDS,
+                min_fetched_at=changed_at
             )
             
-            if not roblox_data:
+            if not roblox_data or roblox_data.get("partial"):
                 logger.debug(f"User {member.id} not verified by Bloxlink, skipping nickname update")
                 return
             
@@ -371,7 +395,7 @@ class RoleSyncHandler(commands.Cog):
                 return
             
             # Get rank from Roblox group (main group: 6340169)
-            roblox_rank_info = await self.groups_service.get_user_rank_in_group(roblox_id, MAIN_GROUP_ID)
+            roblox_rank_info = roblox_data.get("rank_info")
             
             if not roblox_rank_info:
                 logger.debug(f"User {roblox_username} (ID: {roblox_id}) not in main group {MAIN_GROUP_ID}")
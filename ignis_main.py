@@ -1,69 +1,72 @@
 # ignis_main.py
 from __future__ import annotations
 
-import asyncio
+import importlib
+import math
 import sys
 import os
 
-# Debug: Print Python path and directory contents
-print("=== DEBUG: Python Path Setup ===")
-print(f"Current working directory: {os.getcwd()}")
-print(f"Script location: {os.path.dirname(os.path.abspath(__file__))}")
-print(f"Python path before: {sys.path}")
-
-# Ensure /app is in Python path (for Docker/Railway deployment)
-if '/app' not in sys.path:
-    sys.path.insert(0, '/app')
-    print("Added /app to sys.path")
-
-# Also ensure current directory is in path
+# Ensure /app (Docker/Railway) and the script directory are importable
 current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-    print(f"Added {current_dir} to sys.path")
-
-print(f"Python path after: {sys.path}")
-
-# Debug: Check if utils directory exists
-utils_path = '/app/utils'
-if os.path.exists(utils_path):
-    print(f"✓ {utils_path} exists")
-    print(f"Contents of {utils_path}: {os.listdir(utils_path)}")
-    if os.path.exists(f'{utils_path}/config.py'):
-        print(f"✓ {utils_path}/config.py exists")
-    else:
-        print(f"✗ {utils_path}/config.py MISSING")
-else:
-    print(f"✗ {utils_path} does NOT exist")
-    print(f"Contents of /app: {os.listdir('/app') if os.path.exists('/app') else 'N/A'}")
-
-print("=== End DEBUG ===")
-
-import discord
-from discord.ext import commands
-from discord import app_commands
-
-from utils.config import TOKEN, GUILD_ID
-from utils.database import initialize_db, ensure_user_exists
-from utils.logger import get_logger
+for path in ('/app', current_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from utils.startup import get_startup_profiler
+
+startup_profiler = get_startup_profiler()
+
+with startup_profiler.phase("import:discord"):
+    import discord
+    from discord.ext import commands
+    from discord import app_commands
+
+with startup_profiler.phase("import:core"):
+    from utils.config import TOKEN, GUILD_ID, METRICS_ENABLED, METRICS_HOST, METRICS_PORT
+    from utils.database import close_db, initialize_db, ensure_user_exists, load_known_users
+    from utils.command_metrics import (
+        InstrumentedCommandTree,
+        install_app_command_hooks,
+        install_prefix_command_hooks,
+        interaction_ack_trace_config,
+    )
+    from utils.health_check import get_system_sampler
+    from utils.metrics import get_metrics_registry
+    from utils.logger import get_logger
+    from services.roblox_auth_client import close_roblox_auth_client
 
 logger = get_logger(__name__)
 
-# COGs
-from cogs.userinfo import UserInfoCog
-from cogs.vc_log import VCLogCog
-from cogs.add import AddPointsCog
-from cogs.remove import RemovePointsCog
-from cogs.leaderboard import LeaderboardCog
-from cogs.data_privacy import DataPrivacyCog
-from cogs.legal import LegalCog
-from cogs.cache_stats import CacheStatsCog
-# Process command replaces old induction command
-# from cogs.induction import InductionCog  # Replaced by ProcessCog
-from cogs.rank import RankCog
-from cogs.health import HealthCog
-from cogs.admin_sync import AdminSync
-# If you have event_buttons.py as an extension with setup(bot), you can load it via load_extension
+# COGs and listeners loaded at startup, as (module, attribute). The attribute is
+# either a Cog class or a setup(bot) coroutine. Modules are imported in
+# setup_hook (after the DB is up) and the cogs are added concurrently, so they
+# must not depend on each other's load order.
+# Process command replaces old induction command (cogs.induction).
+# Gamification handlers (events.gamification_handlers) are DISABLED - using
+# manual progression system.
+STARTUP_COGS = (
+    ("cogs.userinfo", "UserInfoCog"),  # Corrected userinfo with progression system
+    ("cogs.vc_log", "VCLogCog"),
+    ("cogs.add", "AddPointsCog"),
+    ("cogs.remove", "RemovePointsCog"),
+    ("cogs.leaderboard", "LeaderboardCog"),
+    ("cogs.data_privacy", "DataPrivacyCog"),
+    ("cogs.legal", "LegalCog"),
+    ("cogs.cache_stats", "CacheStatsCog"),
+    ("cogs.process", "ProcessCog"),  # Process command (replaces old induction command)
+    ("cogs.roadmap", "RoadmapCog"),  # Roadmap announcements
+    ("cogs.rank", "RankCog"),  # Rank management (nickname formatting, company mapping)
+    ("cogs.health", "HealthCog"),  # Health check system
+    ("cogs.admin_sync", "AdminSync"),  # Admin sync command for troubleshooting
+    ("cogs.retention", "RetentionCog"),  # Daily retention purge (audit log, XP history, daily limits)
+    ("cogs.stats", "StatsCog"),  # /stats and the XP rollup compactor
+    ("events.role_sync_handler", "setup"),  # Automatic rank sync from Discord roles (Bloxlink /update)
+    ("events.bloxlink_command_detector", "setup"),  # Detect /verify and /update commands
+    ("cogs.member_activity_log", "setup"),  # Voice channels and member join/leave
+    ("cogs.event_buttons", "setup"),  # Salamanders event panel (auto-posted)
+    ("cogs.gamenight_role", "setup"),  # Gamenight role assignment
+    ("cogs.config_manager", "setup"),  # Role-to-rank configuration management
+)
 
 intents = discord.Intents.default()
 intents.members = True
@@ -73,77 +76,83 @@ intents.message_content = True
 class IgnisBot(commands.Bot):
     def __init__(self):
         # Use a TEXT prefix different from "/" to avoid conflicts with slash commands
-        super().__init__(command_prefix="!", intents=intents)
+        # InstrumentedCommandTree times every slash command (see utils/command_metrics.py)
+        super().__init__(
+            command_prefix="!",
+            intents=intents,
+            tree_cls=InstrumentedCommandTree,
+            http_trace=interaction_ack_trace_config()
+        )
         # Remove default help (we'll keep the hybrid /help)
         self.remove_command("help")
+        install_app_command_hooks(self)
+        install_prefix_command_hooks(self)
         
         # Note: CommandTree is created automatically by commands.Bot
         # We'll sync commands only to guild to prevent duplicates
 
     async def setup_hook(self):
         # 1) Database first
-        await initialize_db()
+        with startup_profiler.phase("db:initialize"):
+            await initialize_db()
 
         # 2) Setup event handlers (NEW - Architecture Phase 3)
-        from events.handlers import setup_audit_handler, setup_cache_handler
-        setup_audit_handler(self)
-        setup_cache_handler(self)
-
-        # 3) Load COGs (classes already imported)
-        # Use corrected userinfo with progression system
-        await self.add_cog(UserInfoCog(self))
-        await self.add_cog(VCLogCog(self))
-        await self.add_cog(AddPointsCog(self))
-        await self.add_cog(RemovePointsCog(self))
-        await self.add_cog(LeaderboardCog(self))
-        await self.add_cog(DataPrivacyCog(self))
-        await self.add_cog(LegalCog(self))
-        await self.add_cog(CacheStatsCog(self))
-        # Process command (replaces old induction command)
-        from cogs.process import ProcessCog
-        await self.add_cog(ProcessCog(self))
-        # Roadmap announcements
-        from cogs.roadmap import RoadmapCog
-        await self.add_cog(RoadmapCog(self))
-        await self.add_cog(RankCog(self))  # Rank management (nickname formatting, company mapping)
-        await self.add_cog(HealthCog(self))  # Health check system
-        await self.add_cog(AdminSync(self))  # Admin sync command for troubleshooting
-
-        # 4) Gamification Handlers DISABLED - Using manual progression system
-        # from events.gamification_handlers import setup
-        # await setup(self)
-
-        # 5) Role Sync Handler - Automatic rank sync from Discord roles (Bloxlink /update)
-        from events.role_sync_handler import setup as setup_role_sync
-        await setup_role_sync(self)
-        
-        # 5.1) Bloxlink Command Detector - Detect /verify and /update commands
-        from events.bloxlink_command_detector import setup as setup_bloxlink_detector
-        await setup_bloxlink_detector(self)
-        
-        # 6) Member Activity Log - Monitor voice channels and member join/leave
-        from cogs.member_activity_log import setup as setup_member_activity_log
-        await setup_member_activity_log(self)
-        
-        # 7) Salamanders Event Panel - Auto-post event hosting panel
-        from cogs.event_buttons import setup as setup_event_panel
-        await setup_event_panel(self)
-        
-        # 8) Gamenight Role Assignment - Auto-role system
-        from cogs.gamenight_role import setup as setup_gamenight_role
-        await setup_gamenight_role(self)
-        
-        # 9) Config Manager - Role-to-rank configuration management
-        from cogs.config_manager import setup as setup_config_manager
-        await setup_config_manager(self)
-        
-        # 10) Self-Repair Service - Start monitoring (will start after on_ready)
+        with startup_profiler.phase("listeners:event_bus"):
+            from events.handlers import setup_audit_handler, setup_cache_handler
+            setup_audit_handler(self)
+            setup_cache_handler(self)
+
+        # 3) Import COG modules (sequential - imports hold the import lock anyway)
+        loaders = {}
+        for module_name, attribute in STARTUP_COGS:
+            with startup_profiler.phase(f"import:{module_name}"):
+                target = getattr(importlib.import_module(module_name), attribute)
+            if attribute == "setup":
+                loaders[f"setup:{module_name}"] = lambda target=target: target(self)
+            else:
+                loaders[f"cog:{attribute}"] = lambda target=target: self.add_cog(target(self))
+
+        # 4) Add COGs concurrently (cog_load hooks hit the DB), alongside the known-users preload
+        loaders["db:load_known_users"] = self._load_known_users
+        await startup_profiler.run_concurrently(loaders)
+
+        # 5) Self-Repair Service - Start monitoring (will start after on_ready)
         from services.self_repair_service import SelfRepairService
         self.self_repair = SelfRepairService(self)
         
-        # 11) (Optional) Load other extensions
+        # 6) Metrics - background system sampling, optional local /metrics endpoint
+        get_system_sampler().start()
+        get_metrics_registry().gauge(
+            "ignis_gateway_latency_seconds", "Discord gateway heartbeat latency"
+        ).set_function(lambda: 0.0 if math.isnan(self.latency) else self.latency)  # NaN before first heartbeat
+        self.metrics_server = None
+        if METRICS_ENABLED:
+            from utils.metrics_server import MetricsServer
+            self.metrics_server = MetricsServer(METRICS_HOST, METRICS_PORT)
+            try:
+                await self.metrics_server.start()
+            except OSError as e:
+                logger.error(f"Could not start metrics endpoint on {METRICS_HOST}:{METRICS_PORT}: {e}")
+                self.metrics_server = None
+        
+        # 7) (Optional) Load other extensions
         # await self.load_extension("cogs.other")
 
+    async def _load_known_users(self):
+        try:
+            await load_known_users()
+        except Exception as e:
+            # ensure_user_exists falls back to per-call lookups
+            logger.warning(f"Could not load known users: {e}")
+
+    async def close(self):
+        get_system_sampler().stop()
+        if getattr(self, "metrics_server", None) is not None:
+            await self.metrics_server.stop()
+        await super().close()
+        await close_roblox_auth_client()
+        await close_db()
+
 
 bot = IgnisBot()
 
@@ -162,6 +171,9 @@ async def on_ready():
     )
     logger.info(f"Logged in as {bot.user} (id={bot.user.id})")
     
+    if startup_profiler.mark_ready() is not None:
+        startup_profiler.log_report()
+    
     if not hasattr(bot, 'ready_count'):
         bot.ready_count = 0
     bot.ready_count += 1
@@ -170,77 +182,46 @@ async def on_ready():
         logger.warning("Bot reconnected (ready_count > 1). Skipping initialization.")
         return
     
-    # Sync slash commands after bot is ready
-    await asyncio.sleep(2)  # Increased delay to ensure all cogs are fully loaded
-    
+    # Sync slash commands only if the command tree changed since the last sync
+    # (cogs are all added in setup_hook, before READY)
+    from services.command_sync_service import get_command_sync_service
+    sync_service = get_command_sync_service()
     guild = discord.Object(id=GUILD_ID)
     try:
-        # List registered commands for debug
         all_commands = list(bot.tree.walk_commands(guild=None))
         logger.info(f"📋 Found {len(all_commands)} commands in tree")
         
-        if all_commands:
-            cmd_list = [f"{c.name} ({type(c).__name__})" for c in all_commands[:10]]
-            logger.info(f"   Sample commands: {', '.join(cmd_list)}")
-        
-        # FIX: Sync commands properly
-        # Strategy: Try guild sync first, if it returns 0, commands are likely global
+        # Commands registered for the guild sync there; otherwise they're global
         # Do NOT clear commands on startup - it removes working commands
-        try:
-            # First, try to sync guild commands
-            synced = await bot.tree.sync(guild=guild)
-            logger.info(f"Synced {len(synced)} commands for guild {GUILD_ID}")
-            
-            if synced:
-                cmd_names = [c.name for c in synced]
-                logger.info(f"→ Guild commands synced: {', '.join(cmd_names[:10])}{'...' if len(cmd_names) > 10 else ''}")
-                
-                # Check for duplicates
-                unique_names = set(cmd_names)
-                if len(unique_names) < len(cmd_names):
-                    duplicates = [name for name in cmd_names if cmd_names.count(name) > 1]
-                    logger.warning(f"Found duplicate commands: {set(duplicates)}")
-                    logger.warning("   If duplicates persist, use /sync clear to force a clean sync")
-                else:
-                    logger.info("No duplicate commands detected")
-            else:
-                # If guild sync returns 0, commands are likely registered globally
-                # This is OK - global commands work too, just sync them
-                logger.info("Guild sync returned 0 commands. Commands may be registered globally.")
-                logger.info("   Attempting global sync to ensure commands are available...")
-                
-                try:
-                    synced_global = await bot.tree.sync()
-                    logger.info(f"Synced {len(synced_global)} commands globally")
-                    if synced_global:
-                        cmd_names = [c.name for c in synced_global]
-                        logger.info(f"→ Global commands synced: {', '.join(cmd_names[:10])}{'...' if len(cmd_names) > 10 else ''}")
-                        logger.info("   Note: Global commands work in all servers but may take up to 1 hour to propagate.")
-                except Exception as global_err:
-                    logger.warning(f"Global sync failed: {global_err}")
-                    logger.warning("   Commands may already be synced. If issues persist, use /sync clear.")
-        except discord.HTTPException as http_err:
-            logger.error(f"HTTP error during sync: {http_err}")
-            logger.error(f"   Status: {http_err.status}, Response: {http_err.text}")
-        except discord.Forbidden as e:
-            logger.warning(f"Missing access to sync guild commands: {e}")
-            logger.warning("   Make sure the bot has 'applications.commands' scope and proper permissions.")
-            logger.warning("   Check: https://discord.com/api/oauth2/authorize?client_id=YOUR_CLIENT_ID&permissions=0&scope=bot%20applications.commands")
+        scope = guild if bot.tree.get_commands(guild=guild) else None
+        synced = await sync_service.sync(bot.tree, guild=scope)
+        if synced:
+            cmd_names = [c.name for c in synced]
+            where = f"guild {GUILD_ID}" if scope else "global"
+            logger.info(f"→ Synced to {where}: {', '.join(cmd_names[:10])}{'...' if len(cmd_names) > 10 else ''}")
+            duplicates = {name for name in cmd_names if cmd_names.count(name) > 1}
+            if duplicates:
+                logger.warning(f"Found duplicate commands: {duplicates}")
+                logger.warning("   If duplicates persist, use /sync clear to force a clean sync")
+            if scope is None:
+                logger.info("   Note: Global commands work in all servers but may take up to 1 hour to propagate.")
+    except discord.Forbidden as e:
+        logger.warning(f"Missing access to sync commands: {e}")
+        logger.warning("   Make sure the bot has 'applications.commands' scope and proper permissions.")
+        logger.warning("   Check: https://discord.com/api/oauth2/authorize?client_id=YOUR_CLIENT_ID&permissions=0&scope=bot%20applications.commands")
+    except discord.HTTPException as http_err:
+        logger.error(f"HTTP error during sync: {http_err}")
+        logger.error(f"   Status: {http_err.status}, Response: {http_err.text}")
     except Exception as e:
         logger.error(f"Unexpected sync error: {e}", exc_info=True)
     
-    # Auto-post/update event panel after a short delay to ensure everything is loaded
-    async def post_event_panel_delayed():
-        await asyncio.sleep(3)  # Wait 3 seconds for all cogs to be ready
-        from cogs.event_buttons import get_event_panel_cog
-        event_panel_cog = get_event_panel_cog(bot)
-        if event_panel_cog:
-            await event_panel_cog.post_or_update_panel()
-        else:
-            logger.warning("Event panel cog not found, skipping auto-post")
-    
-    # Schedule panel posting
-    bot.loop.create_task(post_event_panel_delayed())
+    # Update the event panel (edits the persisted panel message in place)
+    from cogs.event_buttons import get_event_panel_cog
+    event_panel_cog = get_event_panel_cog(bot)
+    if event_panel_cog:
+        bot.loop.create_task(event_panel_cog.post_or_update_panel())
+    else:
+        logger.warning("Event panel cog not found, skipping auto-post")
     
     # Enable cache warming for active users
     from utils.cache import enable_cache_warming
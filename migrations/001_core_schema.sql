@@ -0,0 +1,68 @@
+-- =====================================================
+-- Migration 001: Core Schema
+-- Date: 2026-10-19
+-- Description: Users, LGPD consent/audit, rank->company map and runtime state
+-- =====================================================
+
+-- =====================================================
+-- 1. USERS TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS users (
+    user_id BIGINT PRIMARY KEY,
+    points INT DEFAULT 0,
+    exp INT DEFAULT 0,
+    `rank` VARCHAR(50) DEFAULT 'Civitas Aspirant',
+    path VARCHAR(50) DEFAULT 'pre_induction',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_exp (exp DESC),
+    INDEX idx_rank (`rank`)
+);
+
+-- =====================================================
+-- 2. LGPD CONSENT TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS user_consent (
+    user_id BIGINT PRIMARY KEY,
+    consent_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+    consent_version VARCHAR(20) DEFAULT '1.0',
+    base_legal VARCHAR(50) DEFAULT 'consentimento',
+    consent_given BOOLEAN DEFAULT FALSE,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- 3. PERSONAL DATA AUDIT TABLE (LGPD Art. 10)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS data_audit_log (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    action_type VARCHAR(50) NOT NULL,
+    data_type VARCHAR(100) NOT NULL,
+    performed_by BIGINT,
+    purpose TEXT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    details JSON,
+    INDEX idx_user_id (user_id),
+    INDEX idx_timestamp (timestamp),
+    INDEX idx_action_type (action_type)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- 4. RANK -> COMPANY MAP (cogs/rank.py)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS role_company_map (
+    role_name VARCHAR(100) PRIMARY KEY,
+    company INT NOT NULL
+);
+
+-- =====================================================
+-- 5. PERSISTED RUNTIME STATE
+-- =====================================================
+-- Open process channels, panel message IDs, ...
+CREATE TABLE IF NOT EXISTS bot_state (
+    state_key VARCHAR(100) PRIMARY KEY,
+    state_value JSON NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -1,11 +1,9 @@
 -- =====================================================
--- Migration 001: Core Gamification System (XP & Levels)
+-- Migration 002: Core Gamification System (XP & Levels)
 -- Date: 2025-10-31
 -- Description: Creates tables for XP system, levels, and progression tracking
 -- =====================================================
 
-USE ignis;
-
 -- =====================================================
 -- 1. USER PROGRESSION TABLE
 -- =====================================================
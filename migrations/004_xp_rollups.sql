@@ -0,0 +1,48 @@
+-- =====================================================
+-- Migration 004: XP Rollups
+-- Date: 2026-10-19
+-- Description: Daily XP aggregates per user/source and per guild/source,
+--              filled incrementally from xp_events by the rollup compactor
+--              (services/xp_analytics_service.py). Analytics read these
+--              instead of scanning raw events.
+-- =====================================================
+
+-- =====================================================
+-- 1. DAILY XP PER USER AND SOURCE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS xp_daily_user_stats (
+    user_id BIGINT NOT NULL,
+    day DATE NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    xp_total BIGINT NOT NULL DEFAULT 0,
+    event_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, day, source),
+    INDEX idx_day (day),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- 2. DAILY XP PER GUILD AND SOURCE
+-- =====================================================
+-- guild_id 0 = events without a guild in their details (manual awards, etc.)
+CREATE TABLE IF NOT EXISTS xp_daily_guild_stats (
+    guild_id BIGINT NOT NULL,
+    day DATE NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    xp_total BIGINT NOT NULL DEFAULT 0,
+    event_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, day, source),
+    INDEX idx_day (day)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- 3. COMPACTOR HIGH-WATER MARK
+-- =====================================================
+-- Last xp_events.event_id folded into the rollups
+CREATE TABLE IF NOT EXISTS xp_rollup_state (
+    name VARCHAR(50) PRIMARY KEY,
+    last_event_id BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+INSERT IGNORE INTO xp_rollup_state (name, last_event_id) VALUES ('xp_daily', 0);
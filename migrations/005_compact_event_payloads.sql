@@ -0,0 +1,80 @@
+-- =====================================================
+-- Migration 005: Compact XP event and audit payloads
+-- Date: 2026-10-19
+-- Description: Source/action/data type strings move to a lookup table
+--              (small int IDs); the common detail fields get typed
+--              columns and the JSON column only keeps rare extras.
+--              Field mapping lives in utils/event_details.py.
+--              The string columns are dropped by 006/007, only after this
+--              backfill has been recorded as applied.
+-- =====================================================
+
+-- =====================================================
+-- 1. LABEL LOOKUP TABLE
+-- =====================================================
+-- kind: xp_source, audit_action, audit_data_type
+CREATE TABLE IF NOT EXISTS event_labels (
+    label_id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    kind VARCHAR(20) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    UNIQUE KEY uq_kind_name (kind, name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- 2. NEW COLUMNS
+-- =====================================================
+ALTER TABLE xp_events
+    ADD COLUMN source_id SMALLINT UNSIGNED NULL AFTER xp_amount,
+    ADD COLUMN channel_id BIGINT NULL AFTER source_id,
+    ADD COLUMN guild_id BIGINT NULL AFTER channel_id,
+    ADD COLUMN minutes SMALLINT UNSIGNED NULL AFTER guild_id,
+    ADD COLUMN message_length SMALLINT UNSIGNED NULL AFTER minutes;
+
+ALTER TABLE data_audit_log
+    ADD COLUMN action_id SMALLINT UNSIGNED NULL AFTER user_id,
+    ADD COLUMN data_type_id SMALLINT UNSIGNED NULL AFTER action_id,
+    ADD COLUMN before_value INT NULL AFTER purpose,
+    ADD COLUMN after_value INT NULL AFTER before_value,
+    ADD COLUMN delta INT NULL AFTER after_value,
+    ADD COLUMN channel_id BIGINT NULL AFTER delta;
+
+-- =====================================================
+-- 3. BACKFILL
+-- =====================================================
+-- Single-table UPDATEs assign left to right, so details is stripped only
+-- after the typed values were read from it. MySQL commits each statement on
+-- its own, so a failure part-way leaves this migration unrecorded and it runs
+-- again on the next start: the ADD COLUMNs are skipped as already existing,
+-- INSERT IGNORE keeps the labels, and rows already converted (source_id /
+-- action_id set) are left alone. The string columns still exist at that
+-- point, since 006/007 only run once this file is recorded.
+INSERT IGNORE INTO event_labels (kind, name)
+SELECT DISTINCT 'xp_source', source FROM xp_events;
+
+UPDATE xp_events SET
+    source_id = (SELECT label_id FROM event_labels WHERE kind = 'xp_source' AND name = xp_events.source),
+    channel_id = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.channel_id')) AS SIGNED),
+    guild_id = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.guild_id')) AS SIGNED),
+    minutes = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.minutes_spent')) AS UNSIGNED),
+    message_length = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.message_length')) AS UNSIGNED),
+    details = NULLIF(
+        JSON_REMOVE(details, '$.channel_id', '$.channel_name', '$.guild_id', '$.minutes_spent', '$.message_length'),
+        JSON_OBJECT()
+    )
+WHERE source_id IS NULL;
+
+INSERT IGNORE INTO event_labels (kind, name)
+SELECT DISTINCT 'audit_action', action_type FROM data_audit_log;
+
+INSERT IGNORE INTO event_labels (kind, name)
+SELECT DISTINCT 'audit_data_type', data_type FROM data_audit_log;
+
+UPDATE data_audit_log SET
+    action_id = (SELECT label_id FROM event_labels WHERE kind = 'audit_action' AND name = data_audit_log.action_type),
+    data_type_id = (SELECT label_id FROM event_labels WHERE kind = 'audit_data_type' AND name = data_audit_log.data_type),
+    before_value = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.before')) AS SIGNED),
+    after_value = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.after')) AS SIGNED),
+    delta = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.delta')) AS SIGNED),
+    channel_id = CAST(JSON_UNQUOTE(JSON_EXTRACT(details, '$.channel_id')) AS SIGNED),
+    details = NULLIF(JSON_REMOVE(details, '$.before', '$.after', '$.delta', '$.channel_id'), JSON_OBJECT())
+WHERE action_id IS NULL;
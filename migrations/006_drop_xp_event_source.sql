@@ -0,0 +1,13 @@
+-- =====================================================
+-- Migration 006: Drop the xp_events source string
+-- Date: 2026-10-19
+-- Description: source is replaced by source_id (backfilled by 005).
+--              One ALTER TABLE, so it either fully applies or not at all
+--              and a failed run is safe to retry on the next start.
+-- =====================================================
+
+ALTER TABLE xp_events
+    MODIFY source_id SMALLINT UNSIGNED NOT NULL,
+    DROP INDEX idx_source,
+    DROP COLUMN source,
+    ADD INDEX idx_source_id (source_id);
@@ -0,0 +1,15 @@
+-- =====================================================
+-- Migration 007: Drop the data_audit_log type strings
+-- Date: 2026-10-19
+-- Description: action_type/data_type are replaced by action_id/data_type_id
+--              (backfilled by 005). One ALTER TABLE, so it either fully
+--              applies or not at all and a failed run is safe to retry.
+-- =====================================================
+
+ALTER TABLE data_audit_log
+    MODIFY action_id SMALLINT UNSIGNED NOT NULL,
+    MODIFY data_type_id SMALLINT UNSIGNED NOT NULL,
+    DROP INDEX idx_action_type,
+    DROP COLUMN action_type,
+    DROP COLUMN data_type,
+    ADD INDEX idx_action_id (action_id);
@@ -0,0 +1,72 @@
+-- =====================================================
+-- Migration 001 (SQLite): Core Schema
+-- Date: 2026-10-19
+-- Description: SQLite version of ../001_core_schema.sql
+-- =====================================================
+-- Same tables, columns and keys as the MySQL schema. Differences:
+--   * indexes are created separately and named per table (SQLite index
+--     names are database-wide)
+--   * JSON columns are TEXT; ON UPDATE CURRENT_TIMESTAMP has no equivalent,
+--     updated_at changes only where the code sets it
+
+-- =====================================================
+-- 1. USERS TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    points INTEGER DEFAULT 0,
+    exp INTEGER DEFAULT 0,
+    `rank` VARCHAR(50) DEFAULT 'Civitas Aspirant',
+    path VARCHAR(50) DEFAULT 'pre_induction',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_users_exp ON users (exp DESC);
+CREATE INDEX IF NOT EXISTS idx_users_rank ON users (`rank`);
+
+-- =====================================================
+-- 2. LGPD CONSENT TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS user_consent (
+    user_id INTEGER PRIMARY KEY,
+    consent_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+    consent_version VARCHAR(20) DEFAULT '1.0',
+    base_legal VARCHAR(50) DEFAULT 'consentimento',
+    consent_given BOOLEAN DEFAULT FALSE,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+
+-- =====================================================
+-- 3. PERSONAL DATA AUDIT TABLE (LGPD Art. 10)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS data_audit_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    action_type VARCHAR(50) NOT NULL,
+    data_type VARCHAR(100) NOT NULL,
+    performed_by INTEGER,
+    purpose TEXT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_data_audit_log_user_id ON data_audit_log (user_id);
+CREATE INDEX IF NOT EXISTS idx_data_audit_log_timestamp ON data_audit_log (timestamp);
+CREATE INDEX IF NOT EXISTS idx_data_audit_log_action_type ON data_audit_log (action_type);
+
+-- =====================================================
+-- 4. RANK -> COMPANY MAP (cogs/rank.py)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS role_company_map (
+    role_name VARCHAR(100) PRIMARY KEY,
+    company INTEGER NOT NULL
+);
+
+-- =====================================================
+-- 5. PERSISTED RUNTIME STATE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS bot_state (
+    state_key VARCHAR(100) PRIMARY KEY,
+    state_value TEXT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,75 @@
+-- =====================================================
+-- Migration 002 (SQLite): Core Gamification System (XP & Levels)
+-- Date: 2026-10-19
+-- Description: SQLite version of ../002_gamification_core.sql
+-- =====================================================
+
+-- =====================================================
+-- 1. USER PROGRESSION TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS user_progression (
+    user_id INTEGER PRIMARY KEY,
+    total_xp INTEGER DEFAULT 0,
+    current_level INTEGER DEFAULT 1,
+    prestige_level INTEGER DEFAULT 0,
+    last_xp_gain TIMESTAMP NULL,
+    last_level_up TIMESTAMP NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_user_progression_level ON user_progression (current_level);
+CREATE INDEX IF NOT EXISTS idx_user_progression_total_xp ON user_progression (total_xp);
+CREATE INDEX IF NOT EXISTS idx_user_progression_prestige ON user_progression (prestige_level);
+
+-- =====================================================
+-- 2. XP EVENTS TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS xp_events (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    xp_amount INTEGER NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    details TEXT NULL,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_xp_events_timestamp ON xp_events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_xp_events_source ON xp_events (source);
+CREATE INDEX IF NOT EXISTS idx_xp_events_user_timestamp ON xp_events (user_id, timestamp);
+
+-- =====================================================
+-- 3. DAILY XP LIMITS TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS daily_xp_limits (
+    user_id INTEGER NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    date DATE NOT NULL,
+    xp_gained INTEGER DEFAULT 0,
+    last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, source, date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_daily_xp_limits_date ON daily_xp_limits (date);
+
+-- =====================================================
+-- 4. LEVEL REWARDS TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS level_rewards (
+    level INTEGER PRIMARY KEY,
+    xp_bonus INTEGER DEFAULT 0,
+    points_bonus INTEGER DEFAULT 0,
+    reward_type VARCHAR(50) NULL,
+    reward_value VARCHAR(255) NULL,
+    description TEXT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO level_rewards (level, xp_bonus, points_bonus, description) VALUES
+(1, 0, 0, 'Starting level'),
+(5, 50, 25, 'First milestone'),
+(10, 100, 50, 'Double digits!'),
+(25, 250, 125, 'Quarter century'),
+(50, 500, 250, 'Half century milestone'),
+(100, 1000, 500, 'Century achievement')
+ON CONFLICT (level) DO UPDATE SET description = excluded.description;
@@ -0,0 +1,7 @@
+-- =====================================================
+-- Migration 003 (SQLite): Leaderboard index
+-- Date: 2026-10-19
+-- Description: Optimizes leaderboard queries (ORDER BY points DESC)
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_users_points ON users (points DESC);
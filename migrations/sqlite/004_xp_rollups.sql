@@ -0,0 +1,43 @@
+-- =====================================================
+-- Migration 004 (SQLite): XP Rollups
+-- Date: 2026-10-19
+-- Description: SQLite version of ../004_xp_rollups.sql
+-- =====================================================
+
+-- =====================================================
+-- 1. DAILY XP PER USER AND SOURCE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS xp_daily_user_stats (
+    user_id INTEGER NOT NULL,
+    day DATE NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    xp_total INTEGER NOT NULL DEFAULT 0,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, day, source),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_xp_daily_user_stats_day ON xp_daily_user_stats (day);
+
+-- =====================================================
+-- 2. DAILY XP PER GUILD AND SOURCE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS xp_daily_guild_stats (
+    guild_id INTEGER NOT NULL,
+    day DATE NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    xp_total INTEGER NOT NULL DEFAULT 0,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, day, source)
+);
+CREATE INDEX IF NOT EXISTS idx_xp_daily_guild_stats_day ON xp_daily_guild_stats (day);
+
+-- =====================================================
+-- 3. COMPACTOR HIGH-WATER MARK
+-- =====================================================
+CREATE TABLE IF NOT EXISTS xp_rollup_state (
+    name VARCHAR(50) PRIMARY KEY,
+    last_event_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO xp_rollup_state (name, last_event_id) VALUES ('xp_daily', 0);
@@ -0,0 +1,65 @@
+-- =====================================================
+-- Migration 005 (SQLite): Compact XP event and audit payloads
+-- Date: 2026-10-19
+-- Description: SQLite version of ../005_compact_event_payloads.sql
+-- =====================================================
+
+-- =====================================================
+-- 1. LABEL LOOKUP TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS event_labels (
+    label_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind VARCHAR(20) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    UNIQUE (kind, name)
+);
+
+-- =====================================================
+-- 2. NEW COLUMNS
+-- =====================================================
+ALTER TABLE xp_events ADD COLUMN source_id INTEGER NULL;
+ALTER TABLE xp_events ADD COLUMN channel_id INTEGER NULL;
+ALTER TABLE xp_events ADD COLUMN guild_id INTEGER NULL;
+ALTER TABLE xp_events ADD COLUMN minutes INTEGER NULL;
+ALTER TABLE xp_events ADD COLUMN message_length INTEGER NULL;
+
+ALTER TABLE data_audit_log ADD COLUMN action_id INTEGER NULL;
+ALTER TABLE data_audit_log ADD COLUMN data_type_id INTEGER NULL;
+ALTER TABLE data_audit_log ADD COLUMN before_value INTEGER NULL;
+ALTER TABLE data_audit_log ADD COLUMN after_value INTEGER NULL;
+ALTER TABLE data_audit_log ADD COLUMN delta INTEGER NULL;
+ALTER TABLE data_audit_log ADD COLUMN channel_id INTEGER NULL;
+
+-- =====================================================
+-- 3. BACKFILL
+-- =====================================================
+INSERT OR IGNORE INTO event_labels (kind, name)
+SELECT DISTINCT 'xp_source', source FROM xp_events;
+
+UPDATE xp_events SET
+    source_id = (SELECT label_id FROM event_labels WHERE kind = 'xp_source' AND name = xp_events.source),
+    channel_id = json_extract(details, '$.channel_id'),
+    guild_id = json_extract(details, '$.guild_id'),
+    minutes = json_extract(details, '$.minutes_spent'),
+    message_length = json_extract(details, '$.message_length'),
+    details = NULLIF(
+        json_remove(details, '$.channel_id', '$.channel_name', '$.guild_id', '$.minutes_spent', '$.message_length'),
+        '{}'
+    )
+WHERE source_id IS NULL;
+
+INSERT OR IGNORE INTO event_labels (kind, name)
+SELECT DISTINCT 'audit_action', action_type FROM data_audit_log;
+
+INSERT OR IGNORE INTO event_labels (kind, name)
+SELECT DISTINCT 'audit_data_type', data_type FROM data_audit_log;
+
+UPDATE data_audit_log SET
+    action_id = (SELECT label_id FROM event_labels WHERE kind = 'audit_action' AND name = data_audit_log.action_type),
+    data_type_id = (SELECT label_id FROM event_labels WHERE kind = 'audit_data_type' AND name = data_audit_log.data_type),
+    before_value = json_extract(details, '$.before'),
+    after_value = json_extract(details, '$.after'),
+    delta = json_extract(details, '$.delta'),
+    channel_id = json_extract(details, '$.channel_id'),
+    details = NULLIF(json_remove(details, '$.before', '$.after', '$.delta', '$.channel_id'), '{}')
+WHERE action_id IS NULL;
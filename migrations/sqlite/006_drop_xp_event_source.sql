@@ -0,0 +1,10 @@
+-- =====================================================
+-- Migration 006 (SQLite): Drop the xp_events source string
+-- Date: 2026-10-19
+-- Description: SQLite version of ../006_drop_xp_event_source.sql
+--              (DROP COLUMN needs SQLite 3.35+)
+-- =====================================================
+
+DROP INDEX IF EXISTS idx_xp_events_source;
+ALTER TABLE xp_events DROP COLUMN source;
+CREATE INDEX IF NOT EXISTS idx_xp_events_source_id ON xp_events (source_id);
@@ -0,0 +1,11 @@
+-- =====================================================
+-- Migration 007 (SQLite): Drop the data_audit_log type strings
+-- Date: 2026-10-19
+-- Description: SQLite version of ../007_drop_audit_type_strings.sql
+--              (DROP COLUMN needs SQLite 3.35+)
+-- =====================================================
+
+DROP INDEX IF EXISTS idx_data_audit_log_action_type;
+ALTER TABLE data_audit_log DROP COLUMN action_type;
+ALTER TABLE data_audit_log DROP COLUMN data_type;
+CREATE INDEX IF NOT EXISTS idx_data_audit_log_action_id ON data_audit_log (action_id);
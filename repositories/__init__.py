@@ -9,7 +9,13 @@ from .user_repository import UserRepository
 from .audit_repository import AuditRepository
 from .consent_repository import ConsentRepository
 from .xp_repository import XPRepository
+from .xp_rollup_repository import XPRollupRepository
 from .progression_repository import ProgressionRepository
+from .state_repository import StateRepository
+from .retention_repository import RetentionRepository
+from .export_repository import ExportRepository
+from .erasure_repository import ErasureRepository
+from .label_repository import LabelRepository
 
 __all__ = [
     'BaseRepository',
@@ -17,5 +23,11 @@ __all__ = [
     'AuditRepository',
     'ConsentRepository',
     'XPRepository',
+    'XPRollupRepository',
     'ProgressionRepository',
+    'StateRepository',
+    'RetentionRepository',
+    'ExportRepository',
+    'ErasureRepository',
+    'LabelRepository',
 ]
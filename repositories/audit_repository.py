@@ -1,12 +1,16 @@
 """
 Audit Repository - Data access for audit log operations.
+
+Action and data types are stored as event_labels IDs and the common details
+fields in typed columns (see utils/event_details.py).
 """
 
 from __future__ import annotations
 
 from typing import Optional, Dict, Any, List
-import json
 from repositories.base_repository import BaseRepository
+from repositories.label_repository import AUDIT_ACTION, AUDIT_DATA_TYPE, LabelRepository
+from utils.event_details import AUDIT_DETAIL_COLUMNS, merge_details, split_details
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,6 +19,10 @@ logger = get_logger(__name__)
 class AuditRepository(BaseRepository):
     """Repository for audit log data access"""
     
+    def __init__(self):
+        super().__init__()
+        self.labels = LabelRepository()
+    
     async def create(
         self,
         user_id: int,
@@ -33,17 +41,20 @@ class AuditRepository(BaseRepository):
             data_type: Data type (user_data, points, rank, etc.)
             performed_by: ID of user who performed action (None = user themselves)
             purpose: Purpose of the operation
-            details: Additional details as dict (will be serialized as JSON)
+            details: Additional details as dict (common fields go to typed columns)
         """
-        details_json = json.dumps(details) if details else None
+        action_id = await self.labels.get_id(AUDIT_ACTION, action_type)
+        data_type_id = await self.labels.get_id(AUDIT_DATA_TYPE, data_type)
+        typed, extras = split_details(details, AUDIT_DETAIL_COLUMNS)
         
         await self.execute_query(
-            """
+            f"""
             INSERT INTO data_audit_log 
-            (user_id, action_type, data_type, performed_by, purpose, details, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, NOW())
+            (user_id, action_id, data_type_id, performed_by, purpose,
+             before_value, after_value, delta, channel_id, details, timestamp)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, {self.dialect.now})
             """,
-            (user_id, action_type, data_type, performed_by, purpose, details_json)
+            (user_id, action_id, data_type_id, performed_by, purpose, *typed, extras)
         )
     
     async def get_history(
@@ -64,17 +75,23 @@ class AuditRepository(BaseRepository):
         results = await self.execute_query(
             """
             SELECT 
-                id,
-                user_id,
-                action_type,
-                data_type,
-                performed_by,
-                purpose,
-                timestamp,
-                details
-            FROM data_audit_log
-            WHERE user_id = %s
-            ORDER BY timestamp DESC
+                a.id,
+                a.user_id,
+                action.name AS action_type,
+                data_type.name AS data_type,
+                a.performed_by,
+                a.purpose,
+                a.timestamp,
+                a.before_value,
+                a.after_value,
+                a.delta,
+                a.channel_id,
+                a.details
+            FROM data_audit_log a
+            JOIN event_labels action ON action.label_id = a.action_id
+            JOIN event_labels data_type ON data_type.label_id = a.data_type_id
+            WHERE a.user_id = %s
+            ORDER BY a.timestamp DESC
             LIMIT %s
             """,
             (user_id, limit),
@@ -82,16 +99,8 @@ class AuditRepository(BaseRepository):
             as_dict=True
         )
         
-        # Parse JSON details
-        if results:
-            for record in results:
-                if record.get("details"):
-                    try:
-                        record["details"] = json.loads(record["details"])
-                    except (json.JSONDecodeError, TypeError):
-                        record["details"] = {}
-        
-        return results or []
+        # Rebuild details from the typed columns (JSON only parsed for extras)
+        return [merge_details(record, AUDIT_DETAIL_COLUMNS) for record in results or []]
     
     async def delete_user_logs(self, user_id: int) -> int:
         """
@@ -4,9 +4,11 @@ Base Repository with common functionality for all repositories.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, AsyncIterator, List, Optional
 import aiomysql
-from utils.database import get_pool
+from utils.command_metrics import track_db_time
+from utils.database import get_dialect, get_pool
+from utils.db_dialect import Dialect
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +27,11 @@ class BaseRepository:
             self._pool = get_pool()
         return self._pool
     
+    @property
+    def dialect(self) -> Dialect:
+        """SQL dialect of the configured backend (upserts, INSERT IGNORE, NOW())"""
+        return get_dialect()
+    
     async def execute_query(
         self,
         query: str,
@@ -49,13 +56,50 @@ class BaseRepository:
         pool = self.pool
         cursor_type = aiomysql.DictCursor if as_dict else aiomysql.Cursor
         
-        async with pool.acquire() as conn:
+        with track_db_time():
+            async with pool.acquire() as conn:
+                async with conn.cursor(cursor_type) as cursor:
+                    await cursor.execute(query, params or ())
+                    
+                    if fetch_one:
+                        return await cursor.fetchone()
+                    elif fetch_all:
+                        return await cursor.fetchall()
+                    else:
+                        return cursor.rowcount
+    
+    async def stream_query(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        batch_size: int = 500,
+        as_dict: bool = False
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Stream query results in batches through a server-side cursor.
+        
+        Rows are fetched from the server as they are consumed, so memory stays
+        bounded by batch_size regardless of the result size. The connection is
+        held until the iteration finishes.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Rows per batch
+            as_dict: Use SSDictCursor for dict results
+        
+        Yields:
+            Lists of at most batch_size rows
+        """
+        cursor_type = aiomysql.SSDictCursor if as_dict else aiomysql.SSCursor
+        
+        async with self.pool.acquire() as conn:
             async with conn.cursor(cursor_type) as cursor:
-                await cursor.execute(query, params or ())
-                
-                if fetch_one:
-                    return await cursor.fetchone()
-                elif fetch_all:
-                    return await cursor.fetchall()
-                else:
-                    return cursor.rowcount
+                with track_db_time():
+                    await cursor.execute(query, params or ())
+                while True:
+                    with track_db_time():
+                        rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield list(rows)
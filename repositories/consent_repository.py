@@ -4,7 +4,7 @@ Consent Repository - Data access for consent operations.
 
 from __future__ import annotations
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Set
 from repositories.base_repository import BaseRepository
 from utils.logger import get_logger
 
@@ -59,6 +59,32 @@ class ConsentRepository(BaseRepository):
         
         return result and result[0] if result else False
     
+    async def get_consented_users(self, user_ids: Iterable[int]) -> Set[int]:
+        """
+        Filter a group of users down to those who have given consent.
+        
+        Args:
+            user_ids: User IDs to check
+        
+        Returns:
+            Set of user IDs with active consent
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return set()
+        
+        placeholders = ", ".join(["%s"] * len(user_ids))
+        rows = await self.execute_query(
+            f"""
+            SELECT user_id FROM user_consent
+            WHERE consent_given = TRUE AND user_id IN ({placeholders})
+            """,
+            tuple(user_ids),
+            fetch_all=True
+        ) or []
+        
+        return {int(row[0]) for row in rows}
+    
     async def give_consent(
         self,
         user_id: int,
@@ -73,19 +99,22 @@ class ConsentRepository(BaseRepository):
             base_legal: Legal basis (default: "consentimento")
             version: Privacy policy version
         """
+        dialect = self.dialect
+        upsert = dialect.upsert_clause(["user_id"], {
+            "consent_date": dialect.now,
+            "consent_version": dialect.excluded("consent_version"),
+            "base_legal": dialect.excluded("base_legal"),
+            "consent_given": "TRUE",
+            "updated_at": dialect.now,
+        })
         await self.execute_query(
-            """
+            f"""
             INSERT INTO user_consent 
             (user_id, consent_date, consent_version, base_legal, consent_given)
-            VALUES (%s, NOW(), %s, %s, TRUE)
-            ON DUPLICATE KEY UPDATE
-                consent_date = NOW(),
-                consent_version = %s,
-                base_legal = %s,
-                consent_given = TRUE,
-                updated_at = NOW()
+            VALUES (%s, {dialect.now}, %s, %s, TRUE)
+            {upsert}
             """,
-            (user_id, version, base_legal, version, base_legal)
+            (user_id, version, base_legal)
         )
     
     async def revoke_consent(self, user_id: int) -> bool:
@@ -99,10 +128,10 @@ class ConsentRepository(BaseRepository):
             True if consent was revoked successfully
         """
         rowcount = await self.execute_query(
-            """
+            f"""
             UPDATE user_consent
             SET consent_given = FALSE,
-                updated_at = NOW()
+                updated_at = {self.dialect.now}
             WHERE user_id = %s
             """,
             (user_id,)
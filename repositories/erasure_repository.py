@@ -0,0 +1,63 @@
+"""
+Erasure Repository - Data access for right-to-be-forgotten deletions (LGPD Art. 18, VI).
+
+Table and column names come from the erasure registry defined in code,
+never from user input.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Tuple
+from repositories.base_repository import BaseRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ErasureRepository(BaseRepository):
+    """Repository for deleting all of a user's rows"""
+
+    async def delete_user_rows(
+        self,
+        user_id: int,
+        tables: Iterable[Tuple[str, str]],
+        chunk_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        Delete a user's rows from every table in one transaction.
+
+        Each table is deleted in chunks keyed by the user column, so no single
+        statement touches an unbounded number of rows; either every table is
+        cleared or nothing is.
+
+        Args:
+            user_id: Discord user ID
+            tables: (table, user column) pairs, children before parents
+            chunk_size: Max rows per DELETE statement
+
+        Returns:
+            Dict table -> rows deleted
+        """
+        counts: Dict[str, int] = {}
+
+        async with self.pool.acquire() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    for table, column in tables:
+                        deleted = 0
+                        while True:
+                            await cursor.execute(
+                                self.dialect.delete_limited(table, f"`{column}` = %s"),
+                                (user_id, chunk_size)
+                            )
+                            deleted += cursor.rowcount
+                            if cursor.rowcount < chunk_size:
+                                break
+                        counts[table] = deleted
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+
+        return counts
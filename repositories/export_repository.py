@@ -0,0 +1,62 @@
+"""
+Export Repository - Streaming reads of user-scoped data (LGPD Art. 18, II and V).
+
+Table and column names come from the export sections defined in code, never
+from user input. Label ID columns (see repositories/label_repository.py) are
+exported as their names, as they were stored before the lookup table existed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from repositories.base_repository import BaseRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# table -> (label ID column, exported name column) pairs resolved through event_labels
+EXPORT_LABEL_COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "xp_events": (("source_id", "source"),),
+    "data_audit_log": (("action_id", "action_type"), ("data_type_id", "data_type")),
+}
+
+
+class ExportRepository(BaseRepository):
+    """Repository for personal data exports"""
+
+    async def stream_user_rows(
+        self,
+        table: str,
+        order_column: str,
+        user_id: int,
+        batch_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream every row of a table belonging to a user.
+
+        Args:
+            table: Table name
+            order_column: Column rows are ordered by
+            user_id: Discord user ID
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of row dicts
+        """
+        labels = EXPORT_LABEL_COLUMNS.get(table, ())
+        names = "".join(f", l{i}.name AS `{name}`" for i, (_, name) in enumerate(labels))
+        joins = "".join(
+            f" JOIN event_labels l{i} ON l{i}.label_id = t.`{id_column}`"
+            for i, (id_column, _) in enumerate(labels)
+        )
+
+        async for rows in self.stream_query(
+            f"SELECT t.*{names} FROM `{table}` t{joins} WHERE t.user_id = %s ORDER BY t.`{order_column}`",
+            (user_id,),
+            batch_size=batch_size,
+            as_dict=True
+        ):
+            for row in rows:
+                for id_column, _ in labels:
+                    row.pop(id_column, None)
+            yield rows
@@ -0,0 +1,58 @@
+"""
+Label Repository - Small integer IDs for repeated strings.
+
+XP sources and audit action/data types are stored as event_labels IDs
+instead of strings on every row. The label set is tiny and append-only, so
+IDs are cached per connection pool after the first lookup; writes then
+cost no extra queries.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, Dict, MutableMapping, Tuple
+from repositories.base_repository import BaseRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Label kinds
+XP_SOURCE = "xp_source"
+AUDIT_ACTION = "audit_action"
+AUDIT_DATA_TYPE = "audit_data_type"
+
+# pool -> {(kind, name): label_id}; keyed by pool so a new database never sees stale IDs
+_LABEL_IDS: MutableMapping[Any, Dict[Tuple[str, str], int]] = weakref.WeakKeyDictionary()
+
+
+class LabelRepository(BaseRepository):
+    """Repository for the event_labels lookup table"""
+
+    async def get_id(self, kind: str, name: str) -> int:
+        """
+        Get the ID of a label, creating it on first use.
+
+        Args:
+            kind: Label kind (XP_SOURCE, AUDIT_ACTION, AUDIT_DATA_TYPE)
+            name: Label string
+
+        Returns:
+            Label ID
+        """
+        cache = _LABEL_IDS.setdefault(self.pool, {})
+        label_id = cache.get((kind, name))
+        if label_id is not None:
+            return label_id
+
+        await self.execute_query(
+            f"{self.dialect.insert_ignore} INTO event_labels (kind, name) VALUES (%s, %s)",
+            (kind, name)
+        )
+        result = await self.execute_query(
+            "SELECT label_id FROM event_labels WHERE kind = %s AND name = %s",
+            (kind, name),
+            fetch_one=True
+        )
+        label_id = int(result[0])
+        cache[(kind, name)] = label_id
+        return label_id
@@ -82,9 +82,9 @@ class ProgressionRepository(BaseRepository):
             new_level: New level value
         """
         await self.execute_query(
-            """
+            f"""
             UPDATE user_progression
-            SET current_level = %s, last_level_up = NOW()
+            SET current_level = %s, last_level_up = {self.dialect.now}
             WHERE user_id = %s
             """,
             (new_level, user_id)
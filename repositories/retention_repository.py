@@ -0,0 +1,99 @@
+"""
+Retention Repository - Data access for purging expired rows.
+
+Table and column names come from the retention policies defined in code,
+never from user input.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List
+from repositories.base_repository import BaseRepository
+from utils.config import DB_NAME
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RetentionRepository(BaseRepository):
+    """Repository for retention purges"""
+
+    async def delete_expired_chunk(
+        self,
+        table: str,
+        time_column: str,
+        order_column: str,
+        cutoff: datetime,
+        limit: int
+    ) -> int:
+        """
+        Delete up to `limit` expired rows, oldest first.
+
+        Each call is its own short transaction, so locks are held only for
+        one chunk.
+
+        Args:
+            table: Table name
+            time_column: Column compared against the cutoff
+            order_column: Column the chunk is ordered by (primary key or indexed time column)
+            cutoff: Rows older than this are deleted
+            limit: Max rows per chunk
+
+        Returns:
+            Number of rows deleted
+        """
+        return await self.execute_query(
+            self.dialect.delete_limited(table, f"`{time_column}` < %s", order_column),
+            (cutoff, limit)
+        )
+
+    async def get_partition_names(self, table: str) -> List[str]:
+        """
+        Get RANGE partition names of a table (empty if not partitioned).
+
+        Args:
+            table: Table name
+
+        Returns:
+            Partition names in ordinal order
+        """
+        if not self.dialect.supports_partitions:
+            return []
+        rows = await self.execute_query(
+            """
+            SELECT PARTITION_NAME FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+              AND PARTITION_NAME IS NOT NULL AND PARTITION_METHOD LIKE 'RANGE%%'
+            ORDER BY PARTITION_ORDINAL_POSITION
+            """,
+            (DB_NAME, table),
+            fetch_all=True
+        )
+        return [row[0] for row in rows or []]
+
+    async def drop_partitions(self, table: str, partitions: List[str]) -> None:
+        """
+        Drop whole partitions (metadata operation, no row-by-row delete).
+
+        Args:
+            table: Table name
+            partitions: Partition names to drop
+        """
+        names = ", ".join(f"`{name}`" for name in partitions)
+        await self.execute_query(f"ALTER TABLE `{table}` DROP PARTITION {names}")
+
+    async def split_max_partition(self, table: str, partition: str, less_than: str) -> None:
+        """
+        Add a partition by splitting it off the catch-all `pmax` partition.
+
+        Args:
+            table: Table name
+            partition: New partition name
+            less_than: Upper bound expression, e.g. "TO_DAYS('2025-02-01')"
+        """
+        await self.execute_query(
+            f"ALTER TABLE `{table}` REORGANIZE PARTITION `pmax` INTO ("
+            f"PARTITION `{partition}` VALUES LESS THAN ({less_than}), "
+            f"PARTITION `pmax` VALUES LESS THAN MAXVALUE)"
+        )
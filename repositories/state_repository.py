@@ -0,0 +1,71 @@
+"""
+State Repository - Data access for small persisted bot runtime state.
+
+Stores JSON values by key (open process channels, panel message IDs, etc.)
+so they survive restarts.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+from repositories.base_repository import BaseRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StateRepository(BaseRepository):
+    """Repository for key/value bot state"""
+
+    async def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """
+        Get a state value.
+
+        Args:
+            key: State key
+            default: Value returned if key is not set
+
+        Returns:
+            Decoded JSON value or default
+        """
+        result = await self.execute_query(
+            "SELECT state_value FROM bot_state WHERE state_key = %s",
+            (key,),
+            fetch_one=True
+        )
+        if not result or result[0] is None:
+            return default
+
+        value = result[0]
+        return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Set a state value (insert or replace).
+
+        Args:
+            key: State key
+            value: JSON-serializable value
+        """
+        upsert = self.dialect.upsert_clause(["state_key"], {"state_value": self.dialect.excluded("state_value")})
+        await self.execute_query(
+            f"""
+            INSERT INTO bot_state (state_key, state_value)
+            VALUES (%s, %s)
+            {upsert}
+            """,
+            (key, json.dumps(value, default=str))
+        )
+
+    async def delete(self, key: str) -> None:
+        """
+        Delete a state value.
+
+        Args:
+            key: State key
+        """
+        await self.execute_query(
+            "DELETE FROM bot_state WHERE state_key = %s",
+            (key,)
+        )
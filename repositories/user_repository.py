@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Optional
 from repositories.base_repository import BaseRepository
+from utils.database import mark_user_known
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -95,11 +96,34 @@ class UserRepository(BaseRepository):
             "INSERT INTO users (user_id, points, exp, `rank`, path) VALUES (%s, 0, 0, 'Civitas Aspirant', 'pre_induction')",
             (user_id,)
         )
+        mark_user_known(user_id)
         
         # Invalidate cache
         cache = self._get_cache()
         await cache.invalidate_user(user_id)
     
+    async def create_if_missing(self, user_id: int) -> bool:
+        """
+        Create a user record unless it already exists (single INSERT IGNORE / INSERT OR IGNORE).
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            True if the user was created
+        """
+        created = await self.execute_query(
+            f"{self.dialect.insert_ignore} INTO users (user_id, points, exp, `rank`, path) "
+            "VALUES (%s, 0, 0, 'Civitas Aspirant', 'pre_induction')",
+            (user_id,)
+        )
+        mark_user_known(user_id)
+        
+        if created:
+            cache = self._get_cache()
+            await cache.invalidate_user(user_id)
+        return bool(created)
+    
     async def update_points(
         self,
         user_id: int,
@@ -141,6 +165,7 @@ class UserRepository(BaseRepository):
                             (user_id, initial_points, initial_points)
                         )
                         new_points = initial_points
+                        mark_user_known(user_id)
                     else:
                         # Update points and exp (keep them in sync)
                         current_points = int(existing[0]) if existing[0] is not None else 0
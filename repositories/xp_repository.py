@@ -1,20 +1,57 @@
 """
 XP Repository - Data access for XP operations.
+
+XP events store their source as an event_labels ID and the common details
+fields in typed columns (see utils/event_details.py).
 """
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable
 from datetime import datetime, date
 from repositories.base_repository import BaseRepository
+from repositories.label_repository import XP_SOURCE, LabelRepository
+from utils.event_details import XP_DETAIL_COLUMNS, XP_DROPPED_DETAILS, merge_details, split_details
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# xp_events columns written per event
+XP_EVENT_INSERT = (
+    "INSERT INTO xp_events (user_id, xp_amount, source_id, channel_id, guild_id, minutes, message_length, details) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+)
+
+
 class XPRepository(BaseRepository):
     """Repository for XP data access"""
     
+    def __init__(self):
+        super().__init__()
+        self.labels = LabelRepository()
+    
+    @staticmethod
+    def _event_row(user_id: int, xp_amount: int, source_id: int, details: Optional[Dict[str, Any]]) -> tuple:
+        """xp_events row values for XP_EVENT_INSERT"""
+        typed, extras = split_details(details, XP_DETAIL_COLUMNS, XP_DROPPED_DETAILS)
+        return (user_id, xp_amount, source_id, *typed, extras)
+    
+    def _progression_upsert(self) -> str:
+        """Conflict clause adding the inserted XP to an existing user_progression row"""
+        dialect = self.dialect
+        return dialect.upsert_clause(["user_id"], {
+            "total_xp": f"total_xp + {dialect.excluded('total_xp')}",
+            "last_xp_gain": dialect.now,
+        })
+    
+    def _daily_limit_upsert(self) -> str:
+        """Conflict clause adding the inserted XP to an existing daily_xp_limits row"""
+        return self.dialect.upsert_clause(
+            ["user_id", "source", "date"],
+            {"xp_gained": f"xp_gained + {self.dialect.excluded('xp_gained')}"}
+        )
+    
     async def add_xp(
         self,
         user_id: int,
@@ -34,17 +71,9 @@ class XPRepository(BaseRepository):
         Returns:
             New total XP value
         """
-        import json
-        
         # 1. Insert XP event log
-        details_json = json.dumps(details) if details else None
-        await self.execute_query(
-            """
-            INSERT INTO xp_events (user_id, xp_amount, source, details)
-            VALUES (%s, %s, %s, %s)
-            """,
-            (user_id, xp_amount, source, details_json)
-        )
+        source_id = await self.labels.get_id(XP_SOURCE, source)
+        await self.execute_query(XP_EVENT_INSERT, self._event_row(user_id, xp_amount, source_id, details))
         
         # 2. Update user progression
         pool = self.pool
@@ -52,12 +81,10 @@ class XPRepository(BaseRepository):
             async with conn.cursor() as cursor:
                 # Get or create progression entry
                 await cursor.execute(
-                    """
+                    f"""
                     INSERT INTO user_progression (user_id, total_xp, last_xp_gain)
-                    VALUES (%s, %s, NOW())
-                    ON DUPLICATE KEY UPDATE
-                        total_xp = total_xp + VALUES(total_xp),
-                        last_xp_gain = NOW()
+                    VALUES (%s, %s, {self.dialect.now})
+                    {self._progression_upsert()}
                     """,
                     (user_id, xp_amount)
                 )
@@ -72,6 +99,122 @@ class XPRepository(BaseRepository):
         
         return new_total_xp
     
+    async def add_xp_batch(
+        self,
+        awards: Dict[int, int],
+        source: str,
+        details: Optional[Dict[int, Dict[str, Any]]] = None,
+        target_date: Optional[date] = None
+    ) -> Dict[int, int]:
+        """
+        Add XP to many users in a single transaction.
+        
+        Writes the XP events, progression totals and daily limit counters
+        with one ``executemany`` per table instead of one round trip per user.
+        
+        Args:
+            awards: Mapping of user_id -> XP amount (zero amounts are skipped)
+            source: Source of XP (voice, message, quest, etc.)
+            details: Optional per-user context, keyed by user_id
+            target_date: Date for daily limit tracking (defaults to today)
+        
+        Returns:
+            Mapping of user_id -> new total XP
+        """
+        awards = {user_id: amount for user_id, amount in awards.items() if amount > 0}
+        if not awards:
+            return {}
+        
+        if target_date is None:
+            target_date = date.today()
+        details = details or {}
+        
+        source_id = await self.labels.get_id(XP_SOURCE, source)
+        event_rows = [
+            self._event_row(user_id, amount, source_id, details.get(user_id))
+            for user_id, amount in awards.items()
+        ]
+        progression_rows = [(user_id, amount) for user_id, amount in awards.items()]
+        limit_rows = [
+            (user_id, source, target_date, amount)
+            for user_id, amount in awards.items()
+        ]
+        user_ids = list(awards)
+        placeholders = ", ".join(["%s"] * len(user_ids))
+        
+        pool = self.pool
+        async with pool.acquire() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(XP_EVENT_INSERT, event_rows)
+                    await cursor.executemany(
+                        f"""
+                        INSERT INTO user_progression (user_id, total_xp, last_xp_gain)
+                        VALUES (%s, %s, {self.dialect.now})
+                        {self._progression_upsert()}
+                        """,
+                        progression_rows
+                    )
+                    await cursor.executemany(
+                        f"""
+                        INSERT INTO daily_xp_limits (user_id, source, date, xp_gained)
+                        VALUES (%s, %s, %s, %s)
+                        {self._daily_limit_upsert()}
+                        """,
+                        limit_rows
+                    )
+                    await cursor.execute(
+                        f"SELECT user_id, total_xp FROM user_progression WHERE user_id IN ({placeholders})",
+                        tuple(user_ids)
+                    )
+                    rows = await cursor.fetchall()
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        
+        return {int(row[0]): int(row[1]) for row in rows}
+    
+    async def get_daily_xp_limits(
+        self,
+        user_ids: Iterable[int],
+        source: str,
+        target_date: Optional[date] = None
+    ) -> Dict[int, int]:
+        """
+        Get daily XP already gained for many users in one query.
+        
+        Args:
+            user_ids: User IDs to look up
+            source: XP source type
+            target_date: Target date (defaults to today)
+        
+        Returns:
+            Mapping of user_id -> XP gained today (users without a row are 0)
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        
+        if target_date is None:
+            target_date = date.today()
+        
+        placeholders = ", ".join(["%s"] * len(user_ids))
+        rows = await self.execute_query(
+            f"""
+            SELECT user_id, xp_gained FROM daily_xp_limits
+            WHERE source = %s AND date = %s AND user_id IN ({placeholders})
+            """,
+            (source, target_date, *user_ids),
+            fetch_all=True
+        ) or []
+        
+        totals = {user_id: 0 for user_id in user_ids}
+        for row in rows:
+            totals[int(row[0])] = int(row[1])
+        return totals
+    
     async def get_daily_xp_limit(
         self,
         user_id: int,
@@ -123,11 +266,10 @@ class XPRepository(BaseRepository):
             target_date = date.today()
         
         await self.execute_query(
-            """
+            f"""
             INSERT INTO daily_xp_limits (user_id, source, date, xp_gained)
             VALUES (%s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                xp_gained = xp_gained + VALUES(xp_gained)
+            {self._daily_limit_upsert()}
             """,
             (user_id, source, target_date, xp_amount)
         )
@@ -145,20 +287,23 @@ class XPRepository(BaseRepository):
             limit: Maximum number of records
         
         Returns:
-            List of XP events
+            List of XP events (event_id, xp_amount, source, details, timestamp)
         """
-        return await self.execute_query(
+        rows = await self.execute_query(
             """
-            SELECT event_id, xp_amount, source, details, timestamp
-            FROM xp_events
-            WHERE user_id = %s
-            ORDER BY timestamp DESC
+            SELECT e.event_id, e.xp_amount, l.name AS source,
+                   e.channel_id, e.guild_id, e.minutes, e.message_length, e.details, e.timestamp
+            FROM xp_events e
+            JOIN event_labels l ON l.label_id = e.source_id
+            WHERE e.user_id = %s
+            ORDER BY e.timestamp DESC
             LIMIT %s
             """,
             (user_id, limit),
             fetch_all=True,
             as_dict=True
         ) or []
+        return [merge_details(row, XP_DETAIL_COLUMNS) for row in rows]
     
     async def get_total_xp(
         self,
@@ -0,0 +1,207 @@
+"""
+XP Rollup Repository - Data access for the daily XP aggregates.
+
+xp_daily_user_stats and xp_daily_guild_stats hold one row per key, day and
+source; xp_rollup_state holds the high-water mark (last xp_events.event_id
+folded into them). Reads touch at most one row per day and source, however
+many raw events there were.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Tuple
+from repositories.base_repository import BaseRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Name of the xp_events -> daily rollups watermark row
+XP_DAILY_ROLLUP = "xp_daily"
+
+# (key, day, source, xp_total, event_count)
+RollupRow = Tuple[int, date, str, int, int]
+
+
+class XPRollupRepository(BaseRepository):
+    """Repository for XP rollups and their compactor state"""
+
+    async def get_watermark(self, name: str = XP_DAILY_ROLLUP) -> int:
+        """
+        Get the last event ID folded into a rollup.
+
+        Args:
+            name: Rollup name
+
+        Returns:
+            Event ID (0 if nothing was compacted yet)
+        """
+        result = await self.execute_query(
+            "SELECT last_event_id FROM xp_rollup_state WHERE name = %s",
+            (name,),
+            fetch_one=True
+        )
+        return int(result[0]) if result else 0
+
+    async def get_max_event_id(self) -> int:
+        """Get the highest xp_events ID (0 if the table is empty)"""
+        result = await self.execute_query("SELECT MAX(event_id) FROM xp_events", fetch_one=True)
+        return int(result[0]) if result and result[0] is not None else 0
+
+    async def get_events_after(self, after_event_id: int, up_to_event_id: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get raw events past the watermark, oldest first (primary key range scan).
+
+        Args:
+            after_event_id: Exclusive lower bound
+            up_to_event_id: Inclusive upper bound
+            limit: Max events
+
+        Returns:
+            Events with event_id, user_id, xp_amount, source, guild_id, timestamp
+        """
+        return await self.execute_query(
+            """
+            SELECT e.event_id, e.user_id, e.xp_amount, l.name AS source, e.guild_id, e.timestamp
+            FROM xp_events e
+            JOIN event_labels l ON l.label_id = e.source_id
+            WHERE e.event_id > %s AND e.event_id <= %s
+            ORDER BY e.event_id
+            LIMIT %s
+            """,
+            (after_event_id, up_to_event_id, limit),
+            fetch_all=True,
+            as_dict=True
+        ) or []
+
+    async def apply_batch(
+        self,
+        user_rows: List[RollupRow],
+        guild_rows: List[RollupRow],
+        from_event_id: int,
+        to_event_id: int,
+        name: str = XP_DAILY_ROLLUP
+    ) -> bool:
+        """
+        Add a batch of aggregates and advance the watermark in one transaction.
+
+        The watermark only moves if it still equals ``from_event_id``, so two
+        compactors can never fold the same events twice.
+
+        Args:
+            user_rows: (user_id, day, source, xp, events) increments
+            guild_rows: (guild_id, day, source, xp, events) increments
+            from_event_id: Watermark the batch was read after
+            to_event_id: Last event ID in the batch
+            name: Rollup name
+
+        Returns:
+            True if applied, False if another compactor moved the watermark first
+        """
+        dialect = self.dialect
+        increments = {
+            "xp_total": f"xp_total + {dialect.excluded('xp_total')}",
+            "event_count": f"event_count + {dialect.excluded('event_count')}",
+        }
+
+        pool = self.pool
+        async with pool.acquire() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        f"""
+                        UPDATE xp_rollup_state SET last_event_id = %s, updated_at = {dialect.now}
+                        WHERE name = %s AND last_event_id = %s
+                        """,
+                        (to_event_id, name, from_event_id)
+                    )
+                    if cursor.rowcount != 1:
+                        await conn.rollback()
+                        return False
+                    for table, key, rows in (
+                        ("xp_daily_user_stats", "user_id", user_rows),
+                        ("xp_daily_guild_stats", "guild_id", guild_rows),
+                    ):
+                        if rows:
+                            await cursor.executemany(
+                                f"""
+                                INSERT INTO {table} ({key}, day, source, xp_total, event_count)
+                                VALUES (%s, %s, %s, %s, %s)
+                                {dialect.upsert_clause([key, "day", "source"], increments)}
+                                """,
+                                rows
+                            )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return True
+
+    async def get_user_daily_by_source(self, user_id: int, since: date) -> List[Dict[str, Any]]:
+        """
+        Get a user's daily XP per source.
+
+        Args:
+            user_id: User ID
+            since: First day included
+
+        Returns:
+            Rows with day, source, xp_total, event_count (oldest first)
+        """
+        return await self.execute_query(
+            """
+            SELECT day, source, xp_total, event_count
+            FROM xp_daily_user_stats
+            WHERE user_id = %s AND day >= %s
+            ORDER BY day
+            """,
+            (user_id, since),
+            fetch_all=True,
+            as_dict=True
+        ) or []
+
+    async def get_user_active_days(self, user_id: int, since: date) -> List[Any]:
+        """
+        Get the days a user gained XP.
+
+        Args:
+            user_id: User ID
+            since: First day included
+
+        Returns:
+            Days (as returned by the driver), oldest first
+        """
+        rows = await self.execute_query(
+            """
+            SELECT DISTINCT day FROM xp_daily_user_stats
+            WHERE user_id = %s AND day >= %s AND xp_total > 0
+            ORDER BY day
+            """,
+            (user_id, since),
+            fetch_all=True
+        )
+        return [row[0] for row in rows or []]
+
+    async def get_guild_daily(self, guild_id: int, since: date) -> List[Dict[str, Any]]:
+        """
+        Get a guild's daily XP per source.
+
+        Args:
+            guild_id: Guild ID (0 for events without a guild)
+            since: First day included
+
+        Returns:
+            Rows with day, source, xp_total, event_count (oldest first)
+        """
+        return await self.execute_query(
+            """
+            SELECT day, source, xp_total, event_count
+            FROM xp_daily_guild_stats
+            WHERE guild_id = %s AND day >= %s
+            ORDER BY day
+            """,
+            (guild_id, since),
+            fetch_all=True,
+            as_dict=True
+        ) or []
@@ -5,10 +5,12 @@ Cleanup Script for Audit Logs - LGPD Compliance
 Automatically removes audit logs older than 6 months as per LGPD Art. 15
 (Data Retention Policy).
 
-This script should be run periodically (e.g., daily via cron).
+The bot runs the same purge daily (cogs/retention.py); this script is for
+manual runs.
 
 Usage:
-    python scripts/cleanup_audit_logs.py
+    python scripts/cleanup_audit_logs.py          # audit logs only
+    python scripts/cleanup_audit_logs.py --all    # every retention policy
 """
 
 from __future__ import annotations
@@ -16,67 +18,47 @@ from __future__ import annotations
 import asyncio
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.database import get_pool, initialize_db
+from utils.database import initialize_db
 from utils.logger import get_logger
-from utils.config import DB_NAME
+from services.retention_service import RETENTION_POLICIES, RetentionService
 
 logger = get_logger(__name__)
 
 # Retention period: 6 months
-RETENTION_DAYS = 180
-RETENTION_PERIOD = timedelta(days=RETENTION_DAYS)
+RETENTION_DAYS = next(p.retention_days for p in RETENTION_POLICIES if p.table == "data_audit_log")
 
 
 async def cleanup_old_audit_logs():
     """
     Remove audit logs older than retention period (6 months).
-    
+
+    Deletes in chunks via RetentionService, so the table is never locked by
+    one large DELETE.
+
     Returns:
         Number of deleted records
     """
-    pool = get_pool()
-    cutoff_date = datetime.utcnow() - RETENTION_PERIOD
-    
-    async with pool.acquire() as conn:
-        async with conn.cursor() as cursor:
-            # Count records to be deleted
-            await cursor.execute(
-                """
-                SELECT COUNT(*) 
-                FROM data_audit_log 
-                WHERE timestamp < %s
-                """,
-                (cutoff_date,)
-            )
-            count_result = await cursor.fetchone()
-            records_to_delete = count_result[0] if count_result else 0
-            
-            if records_to_delete == 0:
-                logger.info("No audit logs to clean up")
-                return 0
-            
-            # Delete old records
-            await cursor.execute(
-                """
-                DELETE FROM data_audit_log 
-                WHERE timestamp < %s
-                """,
-                (cutoff_date,)
-            )
-            
-            deleted_count = cursor.rowcount
-            
-            logger.info(
-                f"Cleaned up {deleted_count} audit log records older than {RETENTION_DAYS} days "
-                f"(cutoff: {cutoff_date.isoformat()})"
-            )
-            
-            return deleted_count
+    policies = tuple(p for p in RETENTION_POLICIES if p.table == "data_audit_log")
+    results = await RetentionService().run(policies)
+    deleted_count = results.get("data_audit_log", 0)
+
+    if deleted_count == 0:
+        logger.info("No audit logs to clean up")
+    return deleted_count
+
+
+async def cleanup_all():
+    """
+    Apply every retention policy (audit log, XP history, daily limits).
+
+    Returns:
+        Dict table -> number of deleted records
+    """
+    return await RetentionService().run()
 
 
 async def main():
@@ -84,17 +66,23 @@ async def main():
     try:
         # Initialize database connection
         await initialize_db()
-        
+
+        if "--all" in sys.argv[1:]:
+            results = await cleanup_all()
+            for table, deleted in results.items():
+                print(f"✅ {table}: deleted {deleted} old records")
+            return 0
+
         # Clean up old logs
         deleted = await cleanup_old_audit_logs()
-        
+
         if deleted > 0:
             print(f"✅ Successfully deleted {deleted} old audit log records")
         else:
             print("✅ No old audit logs to clean up")
-        
+
         return 0
-        
+
     except Exception as e:
         logger.error(f"Error during audit log cleanup: {e}", exc_info=True)
         print(f"❌ Error: {e}")
@@ -104,4 +92,3 @@ async def main():
 if __name__ == "__main__":
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
-
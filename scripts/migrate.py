@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Schema Migration Tool
+
+The bot applies pending migrations on startup (utils/migrator.py); this
+script shows migration status or applies them ahead of a deploy.
+
+Usage:
+    python scripts/migrate.py status    # list migrations and whether they're applied
+    python scripts/migrate.py up        # apply pending migrations
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.database import close_db, get_dialect, get_pool, initialize_db
+from utils.logger import get_logger
+from utils.migrator import MigrationRunner
+
+logger = get_logger(__name__)
+
+
+async def show_status() -> int:
+    """Print each migration and whether it has been applied"""
+    await initialize_db(run_migrations=False)
+    rows = await MigrationRunner(get_pool(), dialect=get_dialect()).status()
+    for row in rows:
+        if not row["applied"]:
+            mark = "⏳ pending"
+        elif row["checksum_ok"]:
+            mark = "✅ applied"
+        else:
+            mark = "❌ applied, file changed since"
+        print(f"{row['version']:>4}  {row['name']:<40} {mark}")
+    return 0 if all(row["checksum_ok"] for row in rows) else 1
+
+
+async def apply_pending() -> int:
+    """Apply pending migrations"""
+    await initialize_db(run_migrations=False)
+    applied = await MigrationRunner(get_pool(), dialect=get_dialect()).run()
+    if applied:
+        print(f"✅ Applied migrations: {', '.join(str(v) for v in applied)}")
+    else:
+        print("✅ Schema is up to date")
+    return 0
+
+
+async def main() -> int:
+    """Main entry point"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    handlers = {"status": show_status, "up": apply_pending}
+    if command not in handlers:
+        print(__doc__)
+        return 2
+
+    try:
+        return await handlers[command]()
+    except Exception as e:
+        logger.error(f"Migration command '{command}' failed: {e}", exc_info=True)
+        print(f"❌ Error: {e}")
+        return 1
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
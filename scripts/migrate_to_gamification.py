@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import aiomysql
+from repositories.label_repository import XP_SOURCE, LabelRepository
 from utils.database import get_pool
 from services.level_service import level_from_xp
 from utils.logger import get_logger
@@ -32,6 +33,8 @@ async def migrate_user_data():
         logger.error("Database pool not initialized")
         return
     
+    source_id = await LabelRepository().get_id(XP_SOURCE, "migration")
+    
     async with pool.acquire() as conn:
         async with conn.cursor(aiomysql.DictCursor) as cursor:
             # Get all users
@@ -72,12 +75,13 @@ async def migrate_user_data():
                     # Create initial XP event (legacy migration)
                     await cursor.execute(
                         """
-                        INSERT INTO xp_events (user_id, xp_amount, source, details)
-                        VALUES (%s, %s, 'migration', %s)
+                        INSERT INTO xp_events (user_id, xp_amount, source_id, details)
+                        VALUES (%s, %s, %s, %s)
                         """,
                         (
                             user_id,
                             initial_xp,
+                            source_id,
                             f'{{"legacy_points": {current_points}, "migrated_at": NOW()}}'
                         )
                     )
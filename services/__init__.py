@@ -13,6 +13,9 @@ from .xp_service import XPService
 from .level_service import LevelService
 from .progression_service import ProgressionService
 from .bloxlink_service import BloxlinkService
+from .member_profile_service import MemberProfileService
+from .data_export_service import DataExportService
+from .data_erasure_service import DataErasureService
 
 __all__ = [
     'CacheService',
@@ -24,4 +27,7 @@ __all__ = [
     'LevelService',
     'ProgressionService',
     'BloxlinkService',
+    'MemberProfileService',
+    'DataExportService',
+    'DataErasureService',
 ]
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import aiohttp
 from typing import Optional, Dict, Any
+from utils.command_metrics import upstream_trace_configs
 from utils.logger import get_logger
 from utils.config import GUILD_ID
 import os
@@ -92,7 +93,7 @@ class BloxlinkIntegrationService:
                 "Content-Type": "application/json"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 async with session.post(
                     url,
                     json=payload,
@@ -164,7 +165,7 @@ class BloxlinkIntegrationService:
             if roblox_id:
                 payload["roblox_id"] = roblox_id
             
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 async with session.post(
                     url,
                     json=payload if payload else None,
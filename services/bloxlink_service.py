@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import aiohttp
 from typing import Optional, Dict, Any
+from utils.command_metrics import upstream_trace_configs
 from utils.logger import get_logger
 from utils.retry import retry_with_backoff, CircuitBreaker, CircuitBreakerOpenError
 import os
@@ -36,26 +37,21 @@ class BloxlinkService:
         # Get API key from environment if available
         self.api_key = os.getenv("BLOXLINK_API_KEY", "")
     
-    async def get_roblox_user(
+    async def get_roblox_link(
         self,
         discord_id: int,
         guild_id: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Get Roblox user data from Bloxlink API.
+        Get the raw Bloxlink Discord-to-Roblox link for a user.
         
         Args:
             discord_id: Discord user ID
             guild_id: Discord guild ID (optional, for guild-specific verification)
         
         Returns:
-            Dict with:
-            - username: Roblox username (not display name)
-            - id: Roblox user ID
-            - avatar_url: Roblox avatar URL
-            - verified: Boolean indicating verification status
-            - verified_at: Timestamp of verification (if available)
-            Or None if user not found or not verified
+            Bloxlink response dict (robloxId, verifiedAt, ...) or None if
+            user not found, not verified or the API is unavailable
         """
         try:
             # Build API URL
@@ -70,7 +66,7 @@ class BloxlinkService:
             
             # Use retry with circuit breaker
             async def _fetch():
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                     async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status == 404:
                             # User not found or not verified
@@ -106,33 +102,61 @@ class BloxlinkService:
                 return None
             
             # Bloxlink API response structure
-            roblox_user_id = data.get("robloxId")
-            if not roblox_user_id:
+            if not data.get("robloxId"):
                 logger.debug(f"User {discord_id} has no Roblox ID in Bloxlink")
                 return None
             
-            # Get username from Roblox API
-            username = await self._get_roblox_username(roblox_user_id)
-            
-            # Build avatar URL
-            avatar_url = f"https://www.roblox.com/headshot-thumbnail/image?userId={roblox_user_id}&width=420&height=420&format=png"
-            
-            return {
-                "username": username or f"User_{roblox_user_id}",
-                "id": roblox_user_id,
-                "avatar_url": avatar_url,
-                "verified": True,
-                "verified_at": data.get("verifiedAt")
-            }
+            return data
                     
         except aiohttp.ClientError as e:
             logger.error(f"Error fetching Bloxlink data for user {discord_id}: {e}", exc_info=True)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error in get_roblox_user for {discord_id}: {e}", exc_info=True)
+            logger.error(f"Unexpected error in get_roblox_link for {discord_id}: {e}", exc_info=True)
+            return None
+    
+    async def get_roblox_user(
+        self,
+        discord_id: int,
+        guild_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get Roblox user data from Bloxlink API.
+        
+        Args:
+            discord_id: Discord user ID
+            guild_id: Discord guild ID (optional, for guild-specific verification)
+        
+        Returns:
+            Dict with:
+            - username: Roblox username (not display name)
+            - id: Roblox user ID
+            - avatar_url: Roblox avatar URL
+            - verified: Boolean indicating verification status
+            - verified_at: Timestamp of verification (if available)
+            Or None if user not found or not verified
+        """
+        data = await self.get_roblox_link(discord_id, guild_id)
+        if data is None:
             return None
+        
+        roblox_user_id = data["robloxId"]
+        
+        # Get username from Roblox API
+        username = await self.get_roblox_username(roblox_user_id)
+        
+        # Build avatar URL
+        avatar_url = f"https://www.roblox.com/headshot-thumbnail/image?userId={roblox_user_id}&width=420&height=420&format=png"
+        
+        return {
+            "username": username or f"User_{roblox_user_id}",
+            "id": roblox_user_id,
+            "avatar_url": avatar_url,
+            "verified": True,
+            "verified_at": data.get("verifiedAt")
+        }
     
-    async def _get_roblox_username(self, roblox_id: int) -> Optional[str]:
+    async def get_roblox_username(self, roblox_id: int) -> Optional[str]:
         """
         Get Roblox username from Roblox API.
         This ensures we get the actual username, not the display name.
@@ -145,7 +169,7 @@ class BloxlinkService:
         """
         try:
             url = f"https://users.roblox.com/v1/users/{roblox_id}"
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -285,7 +309,7 @@ class BloxlinkService:
             headers = {"Content-Type": "application/json"}
             payload = {"usernames": [username], "excludeBannedUsers": False}
             
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 async with session.post(
                     url,
                     json=payload,
@@ -325,7 +349,7 @@ class BloxlinkService:
         """
         try:
             url = f"https://users.roblox.com/v1/users/{user_id}"
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -352,7 +376,7 @@ class BloxlinkService:
             # Note: limit must be one of: 10, 25, 50, 100
             params = {"keyword": username, "limit": 10}
             
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                 async with session.get(
                     url,
                     params=params,
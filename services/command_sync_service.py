@@ -0,0 +1,143 @@
+"""
+Command Sync Service - Fingerprint-gated application command sync.
+
+tree.sync() re-uploads the whole command tree and is rate limited. The
+payload Discord would receive (names, descriptions, options, choices,
+permissions, ...) is hashed per scope and stored in bot_state, so startup
+only syncs a scope whose commands actually changed. /sync forces a sync and
+records the new fingerprint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import discord
+from discord import app_commands
+from repositories.state_repository import StateRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COMMAND_SYNC_STATE_PREFIX = "command_sync:"
+
+
+def _scope_key(guild: Optional[discord.abc.Snowflake]) -> str:
+    return f"{COMMAND_SYNC_STATE_PREFIX}{'global' if guild is None else f'guild:{guild.id}'}"
+
+
+def _command_payload(command: Any, tree: app_commands.CommandTree) -> Dict[str, Any]:
+    """Upload payload of one command (to_dict() takes the tree from discord.py 2.4 on)"""
+    if inspect.signature(command.to_dict).parameters:
+        return command.to_dict(tree)
+    return command.to_dict()
+
+
+def tree_fingerprint(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """
+    Stable hash of the commands tree.sync() would upload for a scope.
+
+    Args:
+        tree: Command tree
+        guild: Guild scope (None = global commands)
+
+    Returns:
+        SHA-256 hex digest (independent of registration order)
+    """
+    payload = sorted(
+        (_command_payload(command, tree) for command in tree.get_commands(guild=guild)),
+        key=lambda entry: (entry.get("type", 1), entry["name"])
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CommandSyncService:
+    """Syncs application commands only when their fingerprint changed"""
+
+    def __init__(self, state_repo: Optional[StateRepository] = None):
+        """
+        Initialize command sync service.
+
+        Args:
+            state_repo: State repository (default: new instance)
+        """
+        self.state_repo = state_repo or StateRepository()
+
+    async def _stored(self, key: str) -> Dict[str, Any]:
+        try:
+            return await self.state_repo.get(key, default={}) or {}
+        except Exception as e:
+            # Fail open: an unknown fingerprint just means we sync
+            logger.warning(f"Could not read command sync state {key}: {e}")
+            return {}
+
+    async def is_current(
+        self,
+        tree: app_commands.CommandTree,
+        guild: Optional[discord.abc.Snowflake] = None
+    ) -> bool:
+        """Whether the stored fingerprint matches the local tree for this application"""
+        stored = await self._stored(_scope_key(guild))
+        return (
+            stored.get("hash") == tree_fingerprint(tree, guild)
+            and stored.get("application_id") == tree.client.application_id
+        )
+
+    async def sync(
+        self,
+        tree: app_commands.CommandTree,
+        guild: Optional[discord.abc.Snowflake] = None,
+        force: bool = False
+    ) -> Optional[List[app_commands.AppCommand]]:
+        """
+        Sync a scope if its commands changed since the last recorded sync.
+
+        Args:
+            tree: Command tree
+            guild: Guild scope (None = global commands)
+            force: Sync even when the fingerprint matches
+
+        Returns:
+            Synced commands, or None if the sync was skipped
+        """
+        key = _scope_key(guild)
+        fingerprint = tree_fingerprint(tree, guild)
+        application_id = tree.client.application_id
+        if not force:
+            stored = await self._stored(key)
+            if stored.get("hash") == fingerprint and stored.get("application_id") == application_id:
+                logger.info(f"Command tree unchanged for {key} ({fingerprint[:12]}), skipping sync")
+                return None
+
+        synced = await tree.sync(guild=guild)
+        try:
+            await self.state_repo.set(key, {
+                "hash": fingerprint,
+                "application_id": application_id,
+                "count": len(synced),
+                "synced_at": datetime.now(timezone.utc).isoformat()
+            })
+        except Exception as e:
+            logger.warning(f"Synced commands but could not store fingerprint for {key}: {e}")
+        logger.info(f"Synced {len(synced)} commands for {key} ({fingerprint[:12]})")
+        return synced
+
+    async def forget(self, guild: Optional[discord.abc.Snowflake] = None) -> None:
+        """Drop the stored fingerprint so the next startup syncs this scope"""
+        await self.state_repo.delete(_scope_key(guild))
+
+
+# Singleton instance
+_command_sync_service: Optional[CommandSyncService] = None
+
+
+def get_command_sync_service() -> CommandSyncService:
+    """Get singleton CommandSyncService instance"""
+    global _command_sync_service
+    if _command_sync_service is None:
+        _command_sync_service = CommandSyncService()
+    return _command_sync_service
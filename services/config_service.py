@@ -3,13 +3,26 @@ Configuration Service - Manages editable role-to-rank mappings and system config
 
 This service provides an easy way to edit Discord role to rank mappings
 without modifying code. All configuration is stored in JSON files.
+
+The parsed configuration is published as an immutable ConfigSnapshot
+(frozen mappings, priority index, tracked role set) that is swapped
+atomically on every change. Consumers read `config_service.snapshot` and can
+compare `snapshot.version` to detect changes. Edits are written atomically
+off the event loop, and external edits to the JSON file are picked up by
+mtime polling (start_watching) without a restart.
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +31,78 @@ logger = get_logger(__name__)
 CONFIG_DIR = Path(__file__).parent.parent / "config"
 ROLES_RANKS_CONFIG = CONFIG_DIR / "roles_ranks.json"
 
+# Seconds between mtime checks when watching the config file
+CONFIG_POLL_INTERVAL_SECONDS = 5.0
+
+FileSignature = Optional[Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable, precompiled view of the configuration"""
+    version: int
+    role_to_rank: Mapping[str, str]
+    categories: Mapping[str, Mapping[str, str]]
+    role_priority: Tuple[str, ...]
+    priority_index: Mapping[str, int]
+    tracked_roles: FrozenSet[str]
+    
+    @classmethod
+    def build(cls, config: Dict, version: int) -> "ConfigSnapshot":
+        """
+        Precompile a raw configuration dict.
+        
+        Args:
+            config: Parsed JSON configuration
+            version: Snapshot version
+        
+        Returns:
+            New snapshot
+        """
+        categories = {}
+        role_to_rank = {}
+        # Flatten nested structure
+        for category, roles in config.get("role_to_rank_mapping", {}).items():
+            if isinstance(roles, dict):
+                categories[category] = MappingProxyType(dict(roles))
+                role_to_rank.update(roles)
+        
+        role_priority = tuple(config.get("role_priority", {}).get("order", []))
+        return cls(
+            version=version,
+            role_to_rank=MappingProxyType(role_to_rank),
+            categories=MappingProxyType(categories),
+            role_priority=role_priority,
+            priority_index=MappingProxyType({role: i for i, role in enumerate(role_priority)}),
+            tracked_roles=frozenset(role_to_rank)
+        )
+
+
+def _file_signature(path: Path) -> FileSignature:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _atomic_write_json(path: Path, data: Dict) -> None:
+    """Write JSON to a temp file in the same directory, then rename over the target"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class ConfigService:
     """Service for managing editable configuration"""
@@ -30,13 +115,28 @@ class ConfigService:
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
         
-        # Load configuration
+        # Initial load is synchronous: module-level consumers need it at import time
+        self._signature: FileSignature = None
         self._config = self._load_config()
+        self._snapshot = ConfigSnapshot.build(self._config, version=1)
+        self._write_lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+    
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current configuration snapshot (replaced, never mutated)"""
+        return self._snapshot
+    
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot, incremented on every change"""
+        return self._snapshot.version
     
     def _load_config(self) -> Dict:
         """Load configuration from JSON file"""
         try:
             if self.config_file.exists():
+                self._signature = _file_signature(self.config_file)
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     logger.info(f"Configuration loaded from {self.config_file}")
@@ -53,16 +153,22 @@ class ConfigService:
             return self._get_default_config()
     
     def _save_config(self, config: Dict) -> bool:
-        """Save configuration to JSON file"""
+        """Save configuration to JSON file (atomic)"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _atomic_write_json(self.config_file, config)
+            self._signature = _file_signature(self.config_file)
             logger.info(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
             logger.error(f"Error saving configuration: {e}", exc_info=True)
             return False
     
+    def _publish(self, config: Dict) -> ConfigSnapshot:
+        """Swap in a new config and snapshot (single reference assignment)"""
+        self._config = config
+        self._snapshot = ConfigSnapshot.build(config, version=self._snapshot.version + 1)
+        return self._snapshot
+    
     def _get_default_config(self) -> Dict:
         """Get default configuration"""
         return {
@@ -157,22 +263,23 @@ class ConfigService:
             }
         }
     
-    def get_role_to_rank_map(self) -> Dict[str, str]:
+    def get_role_to_rank_map(self) -> Mapping[str, str]:
         """
-        Get flat dictionary mapping Discord role names to system rank names.
+        Get flat mapping of Discord role names to system rank names.
         
         Returns:
-            Dict mapping role_name -> rank_name
+            Read-only mapping role_name -> rank_name
         """
-        mapping = {}
-        role_mapping = self._config.get("role_to_rank_mapping", {})
-        
-        # Flatten nested structure
-        for category, roles in role_mapping.items():
-            if isinstance(roles, dict):
-                mapping.update(roles)
+        return self._snapshot.role_to_rank
+    
+    def get_tracked_roles(self) -> FrozenSet[str]:
+        """
+        Get the set of Discord role names that map to a rank.
         
-        return mapping
+        Returns:
+            Frozen set of tracked role names
+        """
+        return self._snapshot.tracked_roles
     
     def get_role_priority(self) -> List[str]:
         """
@@ -181,10 +288,9 @@ class ConfigService:
         Returns:
             List of role names in priority order
         """
-        priority_config = self._config.get("role_priority", {})
-        return priority_config.get("order", [])
+        return list(self._snapshot.role_priority)
     
-    def add_role_mapping(self, discord_role: str, system_rank: str, category: str = "Custom") -> bool:
+    async def add_role_mapping(self, discord_role: str, system_rank: str, category: str = "Custom") -> bool:
         """
         Add or update a role-to-rank mapping.
         
@@ -196,20 +302,13 @@ class ConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if "role_to_rank_mapping" not in self._config:
-            self._config["role_to_rank_mapping"] = {}
-        
-        if category not in self._config["role_to_rank_mapping"]:
-            self._config["role_to_rank_mapping"][category] = {}
-        
-        self._config["role_to_rank_mapping"][category][discord_role] = system_rank
-        
-        # Reload config
-        self._config = self._load_config()
-        
-        return self._save_config(self._config)
+        async with self._write_lock:
+            # Copy-on-write: readers keep using the current snapshot until the swap
+            config = copy.deepcopy(self._config)
+            config.setdefault("role_to_rank_mapping", {}).setdefault(category, {})[discord_role] = system_rank
+            return await self._commit(config)
     
-    def remove_role_mapping(self, discord_role: str) -> bool:
+    async def remove_role_mapping(self, discord_role: str) -> bool:
         """
         Remove a role-to-rank mapping.
         
@@ -219,16 +318,24 @@ class ConfigService:
         Returns:
             True if successful, False otherwise
         """
-        role_mapping = self._config.get("role_to_rank_mapping", {})
-        
-        for category, roles in role_mapping.items():
-            if isinstance(roles, dict) and discord_role in roles:
-                del roles[discord_role]
-                return self._save_config(self._config)
+        async with self._write_lock:
+            config = copy.deepcopy(self._config)
+            for category, roles in config.get("role_to_rank_mapping", {}).items():
+                if isinstance(roles, dict) and discord_role in roles:
+                    del roles[discord_role]
+                    return await self._commit(config)
         
         logger.warning(f"Role mapping '{discord_role}' not found")
         return False
     
+    async def _commit(self, config: Dict) -> bool:
+        """Write config off the event loop, then publish it (caller holds the write lock)"""
+        if not await asyncio.to_thread(self._save_config, config):
+            return False
+        snapshot = self._publish(config)
+        logger.info(f"Configuration updated to version {snapshot.version}")
+        return True
+    
     def list_all_mappings(self) -> Dict[str, Dict[str, str]]:
         """
         List all role-to-rank mappings organized by category.
@@ -236,12 +343,67 @@ class ConfigService:
         Returns:
             Dict with category -> {role: rank} mappings
         """
-        return self._config.get("role_to_rank_mapping", {})
+        return {category: dict(roles) for category, roles in self._snapshot.categories.items()}
     
-    def reload_config(self) -> bool:
-        """Reload configuration from file"""
-        self._config = self._load_config()
+    async def reload_if_changed(self) -> bool:
+        """
+        Reload the config file if its mtime/size changed since the last load or save.
+        
+        Returns:
+            True if a new snapshot was published
+        """
+        signature = await asyncio.to_thread(_file_signature, self.config_file)
+        if signature is None or signature == self._signature:
+            return False
+        
+        async with self._write_lock:
+            try:
+                config = await asyncio.to_thread(self._read_config_file)
+            except Exception as e:
+                # Keep serving the last good snapshot (e.g. half-edited file)
+                logger.error(f"Error reloading configuration, keeping version {self.version}: {e}")
+                self._signature = signature
+                return False
+            self._signature = signature
+            snapshot = self._publish(config)
+        
+        logger.info(f"Configuration reloaded from {self.config_file} (version {snapshot.version})")
         return True
+    
+    def _read_config_file(self) -> Dict:
+        """Read and parse the config file (runs in a worker thread)"""
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    async def reload_config(self) -> bool:
+        """Reload configuration from file"""
+        self._signature = None  # Force reload
+        return await self.reload_if_changed()
+    
+    def start_watching(self, interval: float = CONFIG_POLL_INTERVAL_SECONDS) -> None:
+        """
+        Poll the config file for changes and apply them live (idempotent).
+        
+        Args:
+            interval: Seconds between mtime checks
+        """
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch(interval))
+    
+    def stop_watching(self) -> None:
+        """Stop polling the config file"""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+    
+    async def _watch(self, interval: float) -> None:
+        """mtime polling loop"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload_if_changed()
+            except Exception as e:
+                logger.error(f"Error watching configuration: {e}", exc_info=True)
 
 
 # Singleton instance
@@ -254,4 +416,3 @@ def get_config_service() -> ConfigService:
     if _config_service is None:
         _config_service = ConfigService()
     return _config_service
-
@@ -4,7 +4,7 @@ Consent Service - Business logic for consent operations.
 
 from __future__ import annotations
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Set
 from repositories.consent_repository import ConsentRepository
 from domain.protocols import ConsentRepositoryProtocol
 from utils.consent_manager import CURRENT_CONSENT_VERSION, DEFAULT_BASE_LEGAL
@@ -38,6 +38,18 @@ class ConsentService:
         """
         return await self.consent_repo.has_consent(user_id)
     
+    async def filter_consented(self, user_ids: Iterable[int]) -> Set[int]:
+        """
+        Return the subset of users who have given consent.
+        
+        Args:
+            user_ids: User IDs to check
+        
+        Returns:
+            Set of user IDs with consent
+        """
+        return await self.consent_repo.get_consented_users(user_ids)
+    
     async def give_consent(
         self,
         user_id: int,
@@ -0,0 +1,80 @@
+"""
+Data Erasure Service - Right to be forgotten (LGPD Art. 18, VI).
+
+Deleting a user explicitly clears every user-scoped table listed in
+USER_ERASURE_TABLES, in chunks and inside one transaction, instead of
+relying on FK cascades (data_audit_log has no FK to users). In-memory
+caches holding the user's data are purged afterwards.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+from repositories.erasure_repository import ErasureRepository
+from services.cache_service import CacheService
+from services.member_profile_service import get_member_profile_service
+from services.xp_service import forget_daily_xp
+from utils.cache import invalidate_user_cache, remove_active_user
+from utils.database import forget_known_user
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Every table holding rows keyed by a user: (table, user column).
+# Children come before users so the FKs never cascade.
+USER_ERASURE_TABLES: Tuple[Tuple[str, str], ...] = (
+    ("data_audit_log", "user_id"),
+    ("xp_events", "user_id"),
+    ("daily_xp_limits", "user_id"),
+    ("xp_daily_user_stats", "user_id"),
+    ("user_progression", "user_id"),
+    ("user_consent", "user_id"),
+    ("users", "user_id"),
+)
+
+ERASURE_CHUNK_SIZE = 1000
+
+
+class DataErasureService:
+    """Service deleting all data held about a user"""
+
+    def __init__(self, erasure_repo: Optional[ErasureRepository] = None, chunk_size: int = ERASURE_CHUNK_SIZE):
+        """
+        Initialize data erasure service.
+
+        Args:
+            erasure_repo: Erasure repository (default: new instance)
+            chunk_size: Max rows per DELETE statement
+        """
+        self.erasure_repo = erasure_repo or ErasureRepository()
+        self.chunk_size = chunk_size
+
+    async def erase_user(self, user_id: int) -> Dict[str, int]:
+        """
+        Delete every row and cached entry for a user.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Dict table -> rows deleted
+        """
+        counts = await self.erasure_repo.delete_user_rows(user_id, USER_ERASURE_TABLES, self.chunk_size)
+        await self.purge_caches(user_id)
+        logger.info(f"Erased data for user {user_id}: {counts}")
+        return counts
+
+    @staticmethod
+    async def purge_caches(user_id: int) -> None:
+        """
+        Drop a user from every in-memory cache.
+
+        Args:
+            user_id: Discord user ID
+        """
+        invalidate_user_cache(user_id)
+        remove_active_user(user_id)
+        await CacheService().invalidate_user(user_id)
+        forget_known_user(user_id)
+        forget_daily_xp(user_id)
+        get_member_profile_service().invalidate(user_id)
@@ -0,0 +1,208 @@
+"""
+Data Export Service - Streaming personal data exports (LGPD Art. 18, II and V).
+
+Every user-scoped table is read through a server-side cursor and written
+batch by batch into a JSON document in a temp file, so memory stays constant
+regardless of how much history a user has. Exports larger than Discord's
+attachment limit are gzip-compressed and, if still too large, split into
+numbered parts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional, Tuple
+from repositories.export_repository import ExportRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (section name in the export, table, order column) for every user-scoped table
+USER_EXPORT_SECTIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("user_data", "users", "user_id"),
+    ("consent_info", "user_consent", "user_id"),
+    ("progression", "user_progression", "user_id"),
+    ("xp_events", "xp_events", "event_id"),
+    ("daily_xp_limits", "daily_xp_limits", "date"),
+    ("xp_daily_stats", "xp_daily_user_stats", "day"),
+    ("audit_history", "data_audit_log", "id"),
+)
+
+EXPORT_BATCH_SIZE = 500
+
+
+class JsonExportWriter:
+    """
+    Incremental writer for one JSON object whose values are scalars or row arrays.
+
+    Usage: write_field() for header values, then begin_section() /
+    write_rows() / end_section() per table, then close().
+    """
+
+    def __init__(self, fp: IO[str]):
+        self._fp = fp
+        self._fields = 0
+        self._rows_in_section: Optional[int] = None
+        self._fp.write("{")
+
+    def _write_key(self, key: str) -> None:
+        self._fp.write(",\n  " if self._fields else "\n  ")
+        self._fp.write(json.dumps(key) + ": ")
+        self._fields += 1
+
+    def write_field(self, key: str, value: Any) -> None:
+        """Write a complete top-level field"""
+        self._write_key(key)
+        self._fp.write(json.dumps(value, ensure_ascii=False, default=str))
+
+    def begin_section(self, key: str) -> None:
+        """Open a top-level array field"""
+        self._write_key(key)
+        self._fp.write("[")
+        self._rows_in_section = 0
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Append rows to the open section"""
+        for row in rows:
+            self._fp.write(",\n    " if self._rows_in_section else "\n    ")
+            self._fp.write(json.dumps(row, ensure_ascii=False, default=str))
+            self._rows_in_section += 1
+
+    def end_section(self) -> int:
+        """
+        Close the open section.
+
+        Returns:
+            Number of rows written to it
+        """
+        count = self._rows_in_section or 0
+        self._fp.write("\n  ]" if count else "]")
+        self._rows_in_section = None
+        return count
+
+    def close(self) -> None:
+        """Close the top-level object"""
+        self._fp.write("\n}\n")
+
+
+def _gzip_file(path: Path) -> Path:
+    """Compress a file next to itself and remove the original"""
+    gz_path = path.with_name(path.name + ".gz")
+    with open(path, "rb") as src, gzip.open(gz_path, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    path.unlink()
+    return gz_path
+
+
+def split_file(path: Path, part_size: int) -> List[Path]:
+    """
+    Split a file into numbered parts of at most part_size bytes.
+
+    Parts are byte ranges: concatenating them in order restores the file.
+
+    Args:
+        path: File to split (removed when split)
+        part_size: Max bytes per part
+
+    Returns:
+        The original path if it fits, otherwise the part paths in order
+    """
+    if path.stat().st_size <= part_size:
+        return [path]
+
+    parts = []
+    with open(path, "rb") as src:
+        while True:
+            data = src.read(part_size)
+            if not data:
+                break
+            part = path.with_name(f"{path.name}.part{len(parts) + 1:03d}")
+            part.write_bytes(data)
+            parts.append(part)
+    path.unlink()
+    return parts
+
+
+class DataExportService:
+    """Service building personal data exports"""
+
+    def __init__(self, export_repo: Optional[ExportRepository] = None, batch_size: int = EXPORT_BATCH_SIZE):
+        """
+        Initialize data export service.
+
+        Args:
+            export_repo: Export repository (default: new instance)
+            batch_size: Rows fetched per batch
+        """
+        self.export_repo = export_repo or ExportRepository()
+        self.batch_size = batch_size
+
+    async def export_user_data(
+        self,
+        user_id: int,
+        header: Dict[str, Any],
+        filename: str
+    ) -> Tuple[Path, Dict[str, int]]:
+        """
+        Write a user's complete data export to a temp file.
+
+        Args:
+            user_id: Discord user ID
+            header: Top-level fields written before the table sections
+            filename: Name of the export file
+
+        Returns:
+            Tuple (file path, row count per section). The caller removes the
+            file's directory with cleanup() when done.
+        """
+        directory = Path(tempfile.mkdtemp(prefix="ignis_export_"))
+        path = directory / filename
+        counts: Dict[str, int] = {}
+
+        try:
+            with open(path, "w", encoding="utf-8") as fp:
+                writer = JsonExportWriter(fp)
+                for key, value in header.items():
+                    writer.write_field(key, value)
+
+                for section, table, order_column in USER_EXPORT_SECTIONS:
+                    writer.begin_section(section)
+                    async for rows in self.export_repo.stream_user_rows(
+                        table, order_column, user_id, batch_size=self.batch_size
+                    ):
+                        writer.write_rows(rows)
+                    counts[section] = writer.end_section()
+
+                writer.close()
+        except BaseException:
+            self.cleanup(path)
+            raise
+
+        logger.info(f"Exported data for user {user_id}: {counts} ({path.stat().st_size} bytes)")
+        return path, counts
+
+    async def prepare_attachments(self, path: Path, size_limit: int) -> List[Path]:
+        """
+        Make an export fit Discord's attachment limit.
+
+        Args:
+            path: Export file
+            size_limit: Max bytes per attachment
+
+        Returns:
+            Files to attach (the export, its .gz, or .gz parts)
+        """
+        if path.stat().st_size <= size_limit:
+            return [path]
+        path = await asyncio.to_thread(_gzip_file, path)
+        return await asyncio.to_thread(split_file, path, size_limit)
+
+    @staticmethod
+    def cleanup(path: Path) -> None:
+        """Remove an export's temp directory and everything in it"""
+        shutil.rmtree(path.parent, ignore_errors=True)
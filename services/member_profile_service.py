@@ -0,0 +1,247 @@
+"""
+Member Profile Service - Cached, deadline-bounded Roblox profile enrichment.
+
+Join/leave logs, the Bloxlink command detector and role sync all resolve the
+same member's Bloxlink link, Roblox username and group rank within seconds
+of each other. This service resolves them once per member:
+
+- concurrent callers for the same member share one in-flight lookup;
+- the username and group rank are fetched concurrently once the link is known;
+- callers wait at most a deadline and get partial data on timeout, while the
+  lookup keeps running in the background to fill the cache;
+- verified profiles are memoized for a short window; a missing link is not,
+  since Bloxlink answers "not verified" and API errors the same way;
+- callers reacting to a role change pass the change time as min_fetched_at:
+  only data fetched after it is used, so a fresh /verify or promotion is
+  never hidden, and one post-change lookup serves every handler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+from services.bloxlink_service import BloxlinkService
+from services.roblox_groups_service import get_roblox_groups_service
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Main Roblox group used for rank lookups
+MAIN_GROUP_ID = 6340169
+
+# Memoization window for merged profiles
+PROFILE_TTL_SECONDS = 60.0
+
+# Default max wait for callers before partial data is returned
+PROFILE_DEADLINE_SECONDS = 3.0
+
+# Returned when the deadline passed before even the link was known (no "id")
+TIMED_OUT_PROFILE: Dict[str, Any] = {"partial": True}
+
+ProfileKey = Tuple[int, Optional[int]]
+
+
+class _Lookup:
+    """One in-flight lookup: its task, how fresh its data is and what it knows so far"""
+
+    __slots__ = ("task", "fetched_at", "partial")
+
+    def __init__(self, fetched_at: float):
+        self.task: Optional[asyncio.Task] = None
+        self.fetched_at = fetched_at
+        self.partial: Optional[Dict[str, Any]] = None
+
+
+class MemberProfileService:
+    """Resolve and memoize Roblox profiles for Discord members"""
+
+    def __init__(
+        self,
+        bloxlink_service: Optional[BloxlinkService] = None,
+        groups_service=None,
+        ttl_seconds: float = PROFILE_TTL_SECONDS,
+        deadline_seconds: float = PROFILE_DEADLINE_SECONDS
+    ):
+        """
+        Initialize member profile service.
+
+        Args:
+            bloxlink_service: Bloxlink service (default: new instance)
+            groups_service: Roblox groups service (default: singleton)
+            ttl_seconds: How long merged profiles are reused
+            deadline_seconds: Default max wait before returning partial data
+        """
+        self.bloxlink_service = bloxlink_service or BloxlinkService()
+        self.groups_service = groups_service or get_roblox_groups_service()
+        self.ttl_seconds = ttl_seconds
+        self.deadline_seconds = deadline_seconds
+        # key -> (expires_at, fetched_at, verified profile); times are time.monotonic()
+        self._cache: Dict[ProfileKey, Tuple[float, float, Dict[str, Any]]] = {}
+        # (key, include_rank) -> newest lookup
+        self._inflight: Dict[Tuple[ProfileKey, bool], _Lookup] = {}
+
+    async def get_profile(
+        self,
+        discord_id: int,
+        guild_id: Optional[int] = None,
+        include_rank: bool = False,
+        deadline: Optional[float] = None,
+        min_fetched_at: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a member's Roblox profile.
+
+        Args:
+            discord_id: Discord user ID
+            guild_id: Discord guild ID (optional)
+            include_rank: Also resolve the rank in the main group ("rank_info")
+            deadline: Max seconds to wait (default: service deadline)
+            min_fetched_at: Only use data fetched at or after this
+                time.monotonic() value (e.g. when the triggering role change
+                was seen); cached or in-flight lookups newer than it are shared
+
+        Returns:
+            Dict with the same keys as BloxlinkService.get_roblox_user plus
+            "partial" (True if returned before all lookups finished) and
+            "rank_info" when requested. TIMED_OUT_PROFILE (partial, no "id")
+            if the deadline passed before the link was known. None only if
+            the lookup found no link (not verified, or Bloxlink unavailable).
+        """
+        key = (discord_id, guild_id)
+        bound = float("-inf") if min_fetched_at is None else min_fetched_at
+
+        cached = self._get_cached(key, bound)
+        if cached is not None and (not include_rank or "rank_info" in cached[1]):
+            return dict(cached[1])
+
+        flight = (key, include_rank)
+        lookup = self._inflight.get(flight)
+        if lookup is None or lookup.fetched_at < bound:
+            # Link/username of a fresh enough cached profile are reused; only the rank is fetched
+            lookup = _Lookup(cached[0] if cached is not None else time.monotonic())
+            lookup.task = asyncio.create_task(self._resolve(key, include_rank, lookup, cached))
+            self._inflight[flight] = lookup
+            lookup.task.add_done_callback(lambda _: self._finish_lookup(flight, lookup))
+
+        # Don't cancel the lookup on timeout - it keeps filling the cache
+        done, _ = await asyncio.wait({lookup.task}, timeout=self.deadline_seconds if deadline is None else deadline)
+        if done:
+            try:
+                profile = lookup.task.result()
+            except Exception as e:
+                logger.warning(f"Profile lookup failed for {discord_id}: {e}")
+                return None
+            return dict(profile) if profile is not None else None
+
+        partial = lookup.partial
+        logger.debug(f"Profile lookup for {discord_id} exceeded deadline, returning {'partial' if partial else 'no'} data")
+        return dict(partial) if partial is not None else dict(TIMED_OUT_PROFILE)
+
+    def invalidate(self, discord_id: int) -> None:
+        """
+        Drop cached profiles for a user (e.g. after re-verification).
+
+        Args:
+            discord_id: Discord user ID
+        """
+        for key in [key for key in self._cache if key[0] == discord_id]:
+            del self._cache[key]
+
+    def _finish_lookup(self, flight: Tuple[ProfileKey, bool], lookup: _Lookup) -> None:
+        """Forget a finished lookup unless a newer one replaced it"""
+        if self._inflight.get(flight) is lookup:
+            del self._inflight[flight]
+
+    def _get_cached(self, key: ProfileKey, min_fetched_at: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Get (fetched_at, profile) if memoized, not expired and fresh enough"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, fetched_at, profile = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        if fetched_at < min_fetched_at:
+            return None
+        return fetched_at, profile
+
+    def _store(self, key: ProfileKey, fetched_at: float, profile: Dict[str, Any]) -> None:
+        """Memoize a merged profile (unless newer data is cached) and prune expired entries"""
+        now = time.monotonic()
+        if len(self._cache) > 1000:
+            for stale in [k for k, (expires_at, _, _) in self._cache.items() if expires_at <= now]:
+                del self._cache[stale]
+        current = self._cache.get(key)
+        if current is not None and current[1] > fetched_at and current[0] > now:
+            return
+        self._cache[key] = (now + self.ttl_seconds, fetched_at, profile)
+
+    async def _resolve(
+        self,
+        key: ProfileKey,
+        include_rank: bool,
+        lookup: _Lookup,
+        cached: Optional[Tuple[float, Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Run the upstream lookups for one member"""
+        discord_id, guild_id = key
+        if cached is not None:
+            profile = dict(cached[1])
+            roblox_id = profile["id"]
+            need_username = False
+        else:
+            link = await self.bloxlink_service.get_roblox_link(discord_id, guild_id)
+            if link is None:
+                # Not verified or Bloxlink unavailable - indistinguishable, so not memoized
+                current = self._cache.get(key)
+                if current is not None and current[1] <= lookup.fetched_at:
+                    del self._cache[key]
+                return None
+
+            roblox_id = link["robloxId"]
+            profile = {
+                "username": f"User_{roblox_id}",
+                "id": roblox_id,
+                "avatar_url": f"https://www.roblox.com/headshot-thumbnail/image?userId={roblox_id}&width=420&height=420&format=png",
+                "verified": True,
+                "verified_at": link.get("verifiedAt"),
+            }
+            need_username = True
+
+        lookup.partial = {**profile, "partial": True}
+
+        # Username and rank only depend on the Roblox ID - fetch them together
+        lookups = {}
+        if need_username:
+            lookups["username"] = self.bloxlink_service.get_roblox_username(roblox_id)
+        if include_rank:
+            lookups["rank_info"] = self.groups_service.get_user_rank_in_group(roblox_id, MAIN_GROUP_ID)
+        results = dict(zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)))
+
+        username = results.get("username")
+        if isinstance(username, str) and username:
+            profile["username"] = username
+        rank_failed = False
+        if include_rank:
+            rank_info = results["rank_info"]
+            rank_failed = isinstance(rank_info, BaseException)
+            profile["rank_info"] = None if rank_failed else rank_info
+        profile["partial"] = False
+
+        # A failed rank lookup is not memoized; the next caller retries it
+        stored = {k: v for k, v in profile.items() if k != "rank_info"} if rank_failed else profile
+        self._store(key, lookup.fetched_at, stored)
+        return profile
+
+
+# Singleton instance
+_member_profile_service: Optional[MemberProfileService] = None
+
+
+def get_member_profile_service() -> MemberProfileService:
+    """Get singleton MemberProfileService instance"""
+    global _member_profile_service
+    if _member_profile_service is None:
+        _member_profile_service = MemberProfileService()
+    return _member_profile_service
@@ -60,9 +60,9 @@ class ProgressionService:
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    """
+                    f"""
                     UPDATE users 
-                    SET exp = %s, points = %s, updated_at = NOW()
+                    SET exp = %s, points = %s, updated_at = {self.user_repo.dialect.now}
                     WHERE user_id = %s
                     """,
                     (new_exp, new_exp, user_id)
@@ -223,7 +223,7 @@ class ProgressionService:
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    "UPDATE users SET `rank` = %s, updated_at = NOW() WHERE user_id = %s",
+                    f"UPDATE users SET `rank` = %s, updated_at = {self.user_repo.dialect.now} WHERE user_id = %s",
                     (rank, user_id)
                 )
     
@@ -233,7 +233,7 @@ class ProgressionService:
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(
-                    "UPDATE users SET path = %s, updated_at = NOW() WHERE user_id = %s",
+                    f"UPDATE users SET path = %s, updated_at = {self.user_repo.dialect.now} WHERE user_id = %s",
                     (path, user_id)
                 )
     
@@ -0,0 +1,265 @@
+"""
+Retention Service - Bounded purging of append-only tables.
+
+Expired rows are deleted in small ordered chunks with a pause between them,
+so a purge never holds long locks or builds a large undo log while the bot
+keeps writing. Tables that are RANGE-partitioned by month (partitions named
+pYYYYMM plus a catch-all pmax) expire whole months with DROP PARTITION and
+get future partitions created ahead of time; the chunked delete then only
+handles the partially expired month.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from repositories.retention_repository import RetentionRepository
+from utils.logger import get_logger
+from utils.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+_metrics_registry = get_metrics_registry()
+_ROWS_DELETED = _metrics_registry.counter("ignis_retention_rows_deleted_total", "Rows removed by retention chunked deletes", ("table",))
+_CHUNKS = _metrics_registry.counter("ignis_retention_chunks_total", "Retention delete statements run", ("table",))
+_PARTITIONS_DROPPED = _metrics_registry.counter("ignis_retention_partitions_dropped_total", "Monthly partitions dropped by retention", ("table",))
+_ERRORS = _metrics_registry.counter("ignis_retention_errors_total", "Retention purges that failed", ("table",))
+_LAST_SUCCESS = _metrics_registry.gauge("ignis_retention_last_success_timestamp_seconds", "Unix time of the last completed purge", ("table",))
+_LAST_DURATION = _metrics_registry.gauge("ignis_retention_last_duration_seconds", "Duration of the last completed purge", ("table",))
+_LAST_FAILED = _metrics_registry.gauge("ignis_retention_last_run_failed", "1 if the last purge of the table failed", ("table",))
+
+# Rows deleted per statement and pause between statements
+RETENTION_CHUNK_SIZE = 5000
+RETENTION_CHUNK_PAUSE_SECONDS = 0.5
+
+# Future monthly partitions kept ahead of time on partitioned tables
+PARTITIONS_AHEAD_MONTHS = 2
+
+_PARTITION_NAME_RE = re.compile(r"^p(\d{4})(\d{2})$")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long rows of an append-only table are kept"""
+    table: str
+    time_column: str
+    order_column: str
+    retention_days: int
+    partition_function: str = "TO_DAYS"  # UNIX_TIMESTAMP for TIMESTAMP columns
+
+
+# Retention per table
+RETENTION_POLICIES: Tuple[RetentionPolicy, ...] = (
+    # LGPD Art. 15 - audit logs kept for 6 months
+    RetentionPolicy("data_audit_log", "timestamp", "id", 180),
+    # Long-range activity lives in the daily XP rollups (see xp_analytics_service)
+    RetentionPolicy("xp_events", "timestamp", "event_id", 90, partition_function="UNIX_TIMESTAMP"),
+    # Only today's row is used for daily caps
+    RetentionPolicy("daily_xp_limits", "date", "date", 7),
+)
+
+
+def _month_start(value: datetime) -> datetime:
+    """First instant of the month containing value"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Month start shifted by a number of months"""
+    month_index = value.year * 12 + (value.month - 1) + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+def expired_partitions(partitions: List[str], cutoff: datetime) -> List[str]:
+    """
+    Get monthly partitions whose whole month is older than the cutoff.
+
+    Args:
+        partitions: Partition names (pYYYYMM, pmax, ...)
+        cutoff: Rows older than this are expired
+
+    Returns:
+        Names of partitions safe to drop
+    """
+    expired = []
+    for name in partitions:
+        match = _PARTITION_NAME_RE.match(name)
+        if not match:
+            continue
+        month_end = _add_months(datetime(int(match.group(1)), int(match.group(2)), 1), 1)
+        if month_end <= cutoff:
+            expired.append(name)
+    return expired
+
+
+def missing_partitions(partitions: List[str], now: datetime, ahead: int = PARTITIONS_AHEAD_MONTHS) -> List[Tuple[str, datetime]]:
+    """
+    Get monthly partitions that should exist for the coming months.
+
+    Args:
+        partitions: Existing partition names
+        now: Current time
+        ahead: Number of future months to cover
+
+    Returns:
+        List of (partition name, exclusive upper bound) in ascending order
+    """
+    existing = set(partitions)
+    missing = []
+    for offset in range(ahead + 1):
+        month = _add_months(_month_start(now), offset)
+        name = f"p{month:%Y%m}"
+        if name not in existing:
+            missing.append((name, _add_months(month, 1)))
+    return missing
+
+
+class RetentionService:
+    """Service running retention policies"""
+
+    def __init__(
+        self,
+        retention_repo: Optional[RetentionRepository] = None,
+        chunk_size: int = RETENTION_CHUNK_SIZE,
+        chunk_pause: float = RETENTION_CHUNK_PAUSE_SECONDS
+    ):
+        """
+        Initialize retention service.
+
+        Args:
+            retention_repo: Retention repository (default: new instance)
+            chunk_size: Rows deleted per statement
+            chunk_pause: Seconds to sleep between statements
+        """
+        self.retention_repo = retention_repo or RetentionRepository()
+        self.chunk_size = chunk_size
+        self.chunk_pause = chunk_pause
+        self._lock = asyncio.Lock()
+        # Progress/last-run details per table (totals are also exported as ignis_retention_* metrics)
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a purge is in progress"""
+        return self._lock.locked()
+
+    async def run(self, policies: Tuple[RetentionPolicy, ...] = RETENTION_POLICIES) -> Dict[str, int]:
+        """
+        Apply retention policies (skipped if a run is already in progress).
+
+        Args:
+            policies: Policies to apply
+
+        Returns:
+            Dict table -> rows removed (chunked deletes only; dropped partitions are counted separately in stats)
+        """
+        if self._lock.locked():
+            logger.info("[RETENTION] Purge already running, skipping")
+            return {}
+
+        async with self._lock:
+            results = {}
+            for policy in policies:
+                try:
+                    results[policy.table] = await self.purge_table(policy)
+                except Exception as e:
+                    self.stats.setdefault(policy.table, {})["last_error"] = str(e)
+                    _ERRORS.inc(table=policy.table)
+                    _LAST_FAILED.set(1, table=policy.table)
+                    logger.error(f"[RETENTION] Error purging {policy.table}: {e}", exc_info=True)
+            return results
+
+    async def purge_table(self, policy: RetentionPolicy, now: Optional[datetime] = None) -> int:
+        """
+        Purge expired rows of one table.
+
+        Args:
+            policy: Retention policy
+            now: Current time (default: utcnow)
+
+        Returns:
+            Rows removed by chunked deletes
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=policy.retention_days)
+        started = time.monotonic()
+        stats = self.stats.setdefault(policy.table, {})
+        stats.update({"running": True, "cutoff": cutoff.isoformat(), "deleted": 0, "chunks": 0, "last_error": None})
+
+        try:
+            partitions = await self.retention_repo.get_partition_names(policy.table)
+            if partitions:
+                await self._manage_partitions(policy, partitions, cutoff, now, stats)
+
+            deleted = 0
+            while True:
+                count = await self.retention_repo.delete_expired_chunk(
+                    policy.table, policy.time_column, policy.order_column, cutoff, self.chunk_size
+                )
+                deleted += count
+                stats["deleted"] = deleted
+                stats["chunks"] += 1
+                _ROWS_DELETED.inc(count, table=policy.table)
+                _CHUNKS.inc(table=policy.table)
+                if count < self.chunk_size:
+                    break
+                if stats["chunks"] % 20 == 0:
+                    logger.info(f"[RETENTION] {policy.table}: {deleted} rows purged so far")
+                # Let live writes through between chunks
+                await asyncio.sleep(self.chunk_pause)
+
+            stats["duration_seconds"] = round(time.monotonic() - started, 2)
+            stats["last_run"] = now.isoformat()
+            _LAST_DURATION.set(stats["duration_seconds"], table=policy.table)
+            _LAST_SUCCESS.set(time.time(), table=policy.table)
+            _LAST_FAILED.set(0, table=policy.table)
+            if deleted or stats.get("partitions_dropped"):
+                logger.info(
+                    f"[RETENTION] {policy.table}: purged {deleted} rows in {stats['chunks']} chunk(s), "
+                    f"{len(stats.get('partitions_dropped') or [])} partition(s) dropped, "
+                    f"older than {policy.retention_days} days ({stats['duration_seconds']}s)"
+                )
+            return deleted
+        finally:
+            stats["running"] = False
+
+    async def _manage_partitions(
+        self,
+        policy: RetentionPolicy,
+        partitions: List[str],
+        cutoff: datetime,
+        now: datetime,
+        stats: Dict[str, Any]
+    ) -> None:
+        """Drop fully expired monthly partitions and pre-create upcoming ones"""
+        expired = expired_partitions(partitions, cutoff)
+        if expired:
+            await self.retention_repo.drop_partitions(policy.table, expired)
+            _PARTITIONS_DROPPED.inc(len(expired), table=policy.table)
+        stats["partitions_dropped"] = expired
+
+        if "pmax" not in partitions:
+            return
+        for name, upper_bound in missing_partitions(partitions, now):
+            if policy.partition_function == "UNIX_TIMESTAMP":
+                less_than = f"UNIX_TIMESTAMP('{upper_bound:%Y-%m-%d %H:%M:%S}')"
+            else:
+                less_than = f"{policy.partition_function}('{upper_bound:%Y-%m-%d}')"
+            await self.retention_repo.split_max_partition(policy.table, name, less_than)
+            logger.info(f"[RETENTION] {policy.table}: created partition {name}")
+
+
+# Singleton instance
+_retention_service: Optional[RetentionService] = None
+
+
+def get_retention_service() -> RetentionService:
+    """Get singleton RetentionService instance"""
+    global _retention_service
+    if _retention_service is None:
+        _retention_service = RetentionService()
+    return _retention_service
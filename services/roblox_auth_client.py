@@ -0,0 +1,140 @@
+"""
+Roblox Auth Client - Authenticated writes to the Roblox web APIs.
+
+Roblox rejects state-changing requests without a valid X-CSRF-TOKEN and
+answers them with a 403 carrying a fresh token. This client:
+
+- keeps the last token per cookie and sends it up front, so the common
+  case is a single round trip; the token is only replaced when a 403
+  challenge hands out a new one (then the request is retried once);
+- reuses one keep-alive session instead of opening a connection per call;
+- serializes writes to the same group, so bursts of inductions or
+  promotions don't trip Roblox's per-group limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import defaultdict
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+import aiohttp
+from utils.command_metrics import upstream_trace_configs
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CSRF_HEADER = "X-CSRF-TOKEN"
+
+# Per-request timeout for writes
+ROBLOX_WRITE_TIMEOUT_SECONDS = 15
+
+
+@dataclass(frozen=True)
+class RobloxResponse:
+    """Status and body of an authenticated request"""
+    status: int
+    text: str
+
+
+class RobloxAuthClient:
+    """Authenticated Roblox client with a shared session and CSRF token cache"""
+
+    def __init__(self):
+        """Initialize client (the session is opened on first use)"""
+        self._session: Optional[aiohttp.ClientSession] = None
+        # sha256(cookie) -> last CSRF token handed out for it
+        self._csrf_tokens: Dict[str, str] = {}
+        self._group_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, opening it if needed"""
+        if self._session is None or self._session.closed:
+            # Cookies are sent explicitly per request; never mix them through a jar
+            self._session = aiohttp.ClientSession(
+                trace_configs=upstream_trace_configs(),
+                cookie_jar=aiohttp.DummyCookieJar()
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        roblox_cookie: str,
+        group_id: Optional[int] = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> RobloxResponse:
+        """
+        Send an authenticated request.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            roblox_cookie: .ROBLOSECURITY cookie
+            group_id: Group the write targets (writes to one group run one at a time)
+            json: JSON body
+
+        Returns:
+            Final response (after at most one CSRF retry)
+        """
+        cookie_key = hashlib.sha256(roblox_cookie.encode("utf-8")).hexdigest()
+        lock = self._group_locks[group_id] if group_id is not None else nullcontext()
+
+        async with lock:
+            token = self._csrf_tokens.get(cookie_key)
+            response, challenge = await self._send(method, url, roblox_cookie, token, json)
+            if response.status == 403 and challenge and challenge != token:
+                logger.debug(f"[ROBLOX AUTH] CSRF token refreshed, retrying {method} {url}")
+                self._csrf_tokens[cookie_key] = challenge
+                response, _ = await self._send(method, url, roblox_cookie, challenge, json)
+            return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        roblox_cookie: str,
+        token: Optional[str],
+        json: Optional[Dict[str, Any]]
+    ) -> Tuple[RobloxResponse, Optional[str]]:
+        """Send one request; returns the response and any CSRF token it handed out"""
+        headers = {
+            "Cookie": f".ROBLOSECURITY={roblox_cookie}",
+            "Content-Type": "application/json"
+        }
+        if token:
+            headers[CSRF_HEADER] = token
+
+        async with self._get_session().request(
+            method, url, headers=headers, json=json,
+            timeout=aiohttp.ClientTimeout(total=ROBLOX_WRITE_TIMEOUT_SECONDS)
+        ) as response:
+            text = await response.text()
+            return RobloxResponse(response.status, text), response.headers.get(CSRF_HEADER)
+
+
+# Singleton instance
+_roblox_auth_client: Optional[RobloxAuthClient] = None
+
+
+def get_roblox_auth_client() -> RobloxAuthClient:
+    """Get singleton RobloxAuthClient instance"""
+    global _roblox_auth_client
+    if _roblox_auth_client is None:
+        _roblox_auth_client = RobloxAuthClient()
+    return _roblox_auth_client
+
+
+async def close_roblox_auth_client() -> None:
+    """Close the singleton client's session (bot shutdown)"""
+    if _roblox_auth_client is not None:
+        await _roblox_auth_client.close()
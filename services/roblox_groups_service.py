@@ -9,9 +9,13 @@ This service handles all interactions with Roblox Groups API to retrieve:
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 import aiohttp
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
+from services.roblox_auth_client import RobloxResponse, get_roblox_auth_client
+from utils.command_metrics import upstream_trace_configs
 from utils.logger import get_logger
 from utils.retry import retry_with_backoff, CircuitBreaker, CircuitBreakerOpenError
 
@@ -32,6 +36,12 @@ AOW_GROUP_IDS = [int(gid.strip()) for gid in AOW_GROUP_IDS_STR.split(",") if gid
 # Legacy support for single group ID
 AOW_GROUP_ID = int(os.getenv("AOW_GROUP_ID", "0"))  # Set via environment variable or config
 
+# Pending join requests: how long a group's requester index is trusted,
+# page size (max allowed by the API) and scan bound
+JOIN_REQUEST_INDEX_TTL_SECONDS = 60.0
+JOIN_REQUESTS_PAGE_SIZE = 100
+JOIN_REQUESTS_MAX_PAGES = 50
+
 
 class RobloxGroupsService:
     """Service for Roblox Groups API integration"""
@@ -42,6 +52,11 @@ class RobloxGroupsService:
         self.api_base = "https://groups.roblox.com/v1"
         # Roblox API for user groups
         self.users_api_base = "https://users.roblox.com/v1"
+        # group_id -> (monotonic time of last full scan, pending requester IDs)
+        self._join_request_index: Dict[int, Tuple[float, Set[int]]] = {}
+        self._join_request_refreshes: Dict[int, asyncio.Task] = {}
+        # Privileged writes (accept, rank changes): shared session and CSRF token cache
+        self.auth_client = get_roblox_auth_client()
     
     async def get_user_groups(self, roblox_user_id: int) -> List[Dict[str, Any]]:
         """
@@ -62,7 +77,7 @@ class RobloxGroupsService:
             url = f"{self.api_base}/users/{roblox_user_id}/groups/roles"
             
             async def _fetch():
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status == 404:
                             logger.debug(f"User {roblox_user_id} not found or has no groups")
@@ -186,7 +201,7 @@ class RobloxGroupsService:
             url = f"{self.api_base}/groups/{group_id}"
             
             async def _fetch():
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status == 404:
                             logger.debug(f"Group {group_id} not found")
@@ -274,6 +289,12 @@ class RobloxGroupsService:
         """
         Check if user has a pending join request for a group.
         
+        Requesters seen in the group's last full scan (kept for
+        JOIN_REQUEST_INDEX_TTL_SECONDS and shared by every /process session)
+        are answered from memory. Anyone else is looked up directly, since
+        their request may be newer than the scan; a stale index is rebuilt
+        in the background.
+        
         Args:
             group_id: Group ID
             roblox_user_id: Roblox user ID
@@ -290,59 +311,53 @@ class RobloxGroupsService:
                 "message": "Roblox cookie is required"
             }
         
+        index = self._join_request_index.get(group_id)
+        if index is not None and roblox_user_id in index[1]:
+            logger.info(f"[CHECK_REQUEST] Found pending request for user {roblox_user_id} (cached index of group {group_id})")
+            return {
+                "has_request": True,
+                "message": "User has a pending join request"
+            }
+        if index is None or time.monotonic() - index[0] >= JOIN_REQUEST_INDEX_TTL_SECONDS:
+            self._refresh_join_request_index(group_id, roblox_cookie)
+        
         try:
-            # Check pending requests for the group
-            url = f"{self.api_base}/groups/{group_id}/join-requests"
+            headers = self._auth_headers(roblox_cookie)
+            async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
+                status, has_request = await self._get_user_join_request(session, group_id, roblox_user_id, headers)
+                if has_request is None:
+                    # Single-user endpoint unavailable: scan the list, stopping at the user
+                    status, requester_ids, _ = await self._scan_join_requests(
+                        session, group_id, headers, stop_at=roblox_user_id
+                    )
+                    has_request = None if requester_ids is None else roblox_user_id in requester_ids
             
-            headers = {
-                "Cookie": f".ROBLOSECURITY={roblox_cookie}",
-                "Content-Type": "application/json"
+            if has_request is True:
+                logger.info(f"[CHECK_REQUEST] Found pending request for user {roblox_user_id} in group {group_id}")
+                index = self._join_request_index.get(group_id)
+                if index is not None:
+                    index[1].add(roblox_user_id)
+                return {
+                    "has_request": True,
+                    "message": "User has a pending join request"
+                }
+            if has_request is False:
+                logger.info(f"[CHECK_REQUEST] No pending request for user {roblox_user_id} in group {group_id}")
+                return {
+                    "has_request": False,
+                    "message": "User does not have a pending join request"
+                }
+            if status == 403:
+                # Might need CSRF token or no permission
+                return {
+                    "has_request": False,
+                    "message": "Could not check requests (no permission or authentication required)"
+                }
+            logger.warning(f"[CHECK_REQUEST] API returned status {status} for group {group_id}")
+            return {
+                "has_request": False,
+                "message": f"Could not check requests (status {status})"
             }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        requests = data.get("data", [])
-                        
-                        # Log for debugging
-                        logger.info(f"[CHECK_REQUEST] Found {len(requests)} pending requests for group {group_id}")
-                        logger.info(f"[CHECK_REQUEST] Looking for user ID: {roblox_user_id}")
-                        
-                        # Check if user ID is in the requests
-                        # The structure might be: requester.userId or just userId
-                        for req in requests:
-                            requester = req.get("requester", {})
-                            req_user_id = requester.get("userId") if requester else req.get("userId")
-                            
-                            # Log each request for debugging
-                            logger.debug(f"[CHECK_REQUEST] Checking request: user_id={req_user_id}, full_req={req}")
-                            
-                            if req_user_id == roblox_user_id:
-                                logger.info(f"[CHECK_REQUEST] Found pending request for user {roblox_user_id}")
-                                return {
-                                    "has_request": True,
-                                    "message": "User has a pending join request"
-                                }
-                        
-                        logger.warning(f"[CHECK_REQUEST] No pending request found for user {roblox_user_id} in {len(requests)} requests")
-                        return {
-                            "has_request": False,
-                            "message": "User does not have a pending join request"
-                        }
-                    elif response.status == 403:
-                        # Might need CSRF token or no permission
-                        return {
-                            "has_request": False,
-                            "message": "Could not check requests (no permission or authentication required)"
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.warning(f"[CHECK_REQUEST] API returned status {response.status}: {error_text[:200]}")
-                        return {
-                            "has_request": False,
-                            "message": f"Could not check requests (status {response.status})"
-                        }
         except Exception as e:
             logger.error(f"Error checking pending request: {e}", exc_info=True)
             return {
@@ -350,6 +365,127 @@ class RobloxGroupsService:
                 "message": f"Error checking request: {str(e)}"
             }
     
+    @staticmethod
+    def _auth_headers(roblox_cookie: str) -> Dict[str, str]:
+        """Headers for authenticated Groups API calls"""
+        return {
+            "Cookie": f".ROBLOSECURITY={roblox_cookie}",
+            "Content-Type": "application/json"
+        }
+    
+    async def _get_user_join_request(
+        self,
+        session: aiohttp.ClientSession,
+        group_id: int,
+        roblox_user_id: int,
+        headers: Dict[str, str]
+    ) -> Tuple[int, Optional[bool]]:
+        """
+        Ask the single-user join-request endpoint about one user.
+        
+        Returns:
+            (HTTP status, True/False, or None if the endpoint gave no answer)
+        """
+        url = f"{self.api_base}/groups/{group_id}/join-requests/users/{roblox_user_id}"
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                logger.debug(f"[CHECK_REQUEST] Single-user lookup returned status {response.status}")
+                return response.status, None
+            # No request is answered with an empty (null) body
+            data = await response.json(content_type=None)
+        
+        if not data:
+            return 200, False
+        requester = data.get("requester") or {}
+        return 200, (requester.get("userId") or data.get("userId")) == roblox_user_id
+    
+    async def _scan_join_requests(
+        self,
+        session: aiohttp.ClientSession,
+        group_id: int,
+        headers: Dict[str, str],
+        stop_at: Optional[int] = None
+    ) -> Tuple[int, Optional[Set[int]], bool]:
+        """
+        Collect pending requester IDs, following nextPageCursor.
+        
+        Pages are read newest first, so a recent request is found early.
+        
+        Args:
+            session: HTTP session
+            group_id: Group ID
+            headers: Authenticated headers
+            stop_at: Stop as soon as this user ID is seen
+        
+        Returns:
+            (last HTTP status, requester IDs or None on error, True if every page was read)
+        """
+        url = f"{self.api_base}/groups/{group_id}/join-requests"
+        requester_ids: Set[int] = set()
+        cursor: Optional[str] = None
+        
+        for _ in range(JOIN_REQUESTS_MAX_PAGES):
+            params = {"limit": JOIN_REQUESTS_PAGE_SIZE, "sortOrder": "Desc"}
+            if cursor:
+                params["cursor"] = cursor
+            async with session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.warning(f"[CHECK_REQUEST] Join requests of group {group_id} returned status {response.status}: {error_text[:200]}")
+                    return response.status, None, False
+                data = await response.json()
+            
+            for req in data.get("data", []):
+                # The structure might be: requester.userId or just userId
+                requester = req.get("requester") or {}
+                req_user_id = requester.get("userId") or req.get("userId")
+                if req_user_id is not None:
+                    requester_ids.add(int(req_user_id))
+            if stop_at is not None and stop_at in requester_ids:
+                return 200, requester_ids, False
+            
+            cursor = data.get("nextPageCursor")
+            if not cursor:
+                return 200, requester_ids, True
+        
+        logger.warning(f"[CHECK_REQUEST] Stopped scanning group {group_id} after {JOIN_REQUESTS_MAX_PAGES} pages")
+        return 200, requester_ids, False
+    
+    def _refresh_join_request_index(self, group_id: int, roblox_cookie: str) -> asyncio.Task:
+        """
+        Rebuild a group's pending-requester index in the background.
+        
+        Concurrent callers share the refresh already running for the group.
+        
+        Args:
+            group_id: Group ID
+            roblox_cookie: Roblox authentication cookie
+        
+        Returns:
+            The refresh task
+        """
+        task = self._join_request_refreshes.get(group_id)
+        if task is not None:
+            return task
+        
+        async def _refresh():
+            try:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
+                    _, requester_ids, complete = await self._scan_join_requests(
+                        session, group_id, self._auth_headers(roblox_cookie)
+                    )
+            except Exception as e:
+                logger.warning(f"[CHECK_REQUEST] Could not refresh join requests of group {group_id}: {e}")
+                return
+            if requester_ids is not None and complete:
+                self._join_request_index[group_id] = (time.monotonic(), requester_ids)
+                logger.debug(f"[CHECK_REQUEST] Indexed {len(requester_ids)} pending requests for group {group_id}")
+        
+        task = asyncio.create_task(_refresh())
+        self._join_request_refreshes[group_id] = task
+        task.add_done_callback(lambda _: self._join_request_refreshes.pop(group_id, None))
+        return task
+    
     async def accept_user_to_group(
         self,
         group_id: int,
@@ -381,94 +517,25 @@ class RobloxGroupsService:
             # Accept user's join request to the group
             # Correct endpoint: POST /v1/groups/{groupId}/join-requests/users/{userId}
             url = f"{self.api_base}/groups/{group_id}/join-requests/users/{roblox_user_id}"
+            response = await self.auth_client.request("POST", url, roblox_cookie, group_id=group_id)
+            logger.info(f"[ACCEPT] Response status: {response.status}, URL: {url}")
+            logger.debug(f"[ACCEPT] Response body: {response.text[:300]}")
             
-            headers = {
-                "Cookie": f".ROBLOSECURITY={roblox_cookie}",
-                "Content-Type": "application/json",
-                "X-CSRF-TOKEN": ""  # Will be fetched if needed
-            }
-            
-            async def _accept():
-                async with aiohttp.ClientSession() as session:
-                    # Get CSRF token first by making a POST request to any endpoint
-                    # Roblox requires a POST request to get CSRF token
-                    try:
-                        # Make a dummy POST request to get CSRF token
-                        csrf_url = f"{self.api_base}/groups/{group_id}"
-                        async with session.post(csrf_url, headers={"Cookie": f".ROBLOSECURITY={roblox_cookie}"}, timeout=aiohttp.ClientTimeout(total=10)) as csrf_response:
-                            csrf_token = csrf_response.headers.get("X-CSRF-TOKEN")
-                            if csrf_token:
-                                headers["X-CSRF-TOKEN"] = csrf_token
-                                logger.info(f"[ACCEPT] Got CSRF token: {csrf_token[:20]}...")
-                            else:
-                                logger.warning(f"[ACCEPT] No CSRF token in response headers")
-                    except Exception as e:
-                        logger.warning(f"[ACCEPT] Could not get CSRF token: {e}")
-                    
-                    # Now try to accept with the correct endpoint
-                    async with session.post(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                        response_text = await response.text()
-                        logger.info(f"[ACCEPT] Response status: {response.status}, URL: {url}")
-                        logger.debug(f"[ACCEPT] Response body: {response_text[:300]}")
-                        logger.debug(f"[ACCEPT] Response headers: {dict(response.headers)}")
-                        
-                        if response.status == 403:
-                            # Need CSRF token - try to get it from response
-                            csrf_token = response.headers.get("X-CSRF-TOKEN")
-                            if csrf_token:
-                                headers["X-CSRF-TOKEN"] = csrf_token
-                                logger.info(f"[ACCEPT] Got CSRF token from 403 response: {csrf_token[:20]}..., retrying...")
-                                # Retry with CSRF token
-                                async with session.post(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as retry_response:
-                                    retry_text = await retry_response.text()
-                                    logger.info(f"[ACCEPT] Retry response status: {retry_response.status}")
-                                    logger.debug(f"[ACCEPT] Retry response body: {retry_text[:300]}")
-                                    if retry_response.status == 200:
-                                        return {"success": True, "message": "User accepted to group"}
-                                    elif retry_response.status == 403:
-                                        # Still 403 after CSRF token - likely permission issue
-                                        return {"success": False, "message": "Insufficient permissions to accept members. The Roblox account used does not have permission to accept join requests in this group.", "error": "Permission denied (403)"}
-                                    else:
-                                        return {"success": False, "message": f"Failed to accept user (status {retry_response.status})", "error": retry_text[:200]}
-                            else:
-                                # 403 without CSRF token in response - likely permission issue
-                                return {"success": False, "message": "Insufficient permissions to accept members. The Roblox account used does not have permission to accept join requests in this group. Please ensure the account has admin permissions.", "error": "Permission denied (403 - no CSRF token)"}
-                        
-                        if response.status == 200:
-                            return {"success": True, "message": "User accepted to group"}
-                        elif response.status == 400:
-                            # User might already be in group or no pending request
-                            if "already" in response_text.lower() or "member" in response_text.lower():
-                                return {"success": True, "message": "User is already a member of the group"}
-                            # Check if it's a "no pending request" error
-                            if "request" in response_text.lower() or "pending" in response_text.lower() or "not found" in response_text.lower():
-                                return {"success": False, "message": "User does not have a pending join request. Please ask the user to request to join the group first.", "error": "No pending request (400)"}
-                            return {"success": False, "message": "Invalid request", "error": response_text[:200]}
-                        elif response.status == 404:
-                            # 404 might mean wrong endpoint - try alternative format
-                            logger.warning(f"[ACCEPT] 404 with endpoint {url}, trying alternative...")
-                            alt_url = f"{self.api_base}/groups/{group_id}/requests/{roblox_user_id}/accept"
-                            logger.info(f"[ACCEPT] Trying alternative: {alt_url}")
-                            async with session.post(alt_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as alt_response:
-                                alt_text = await alt_response.text()
-                                logger.info(f"[ACCEPT] Alternative response: {alt_response.status}")
-                                if alt_response.status == 200:
-                                    return {"success": True, "message": "User accepted to group"}
-                                elif alt_response.status == 403:
-                                    alt_csrf = alt_response.headers.get("X-CSRF-TOKEN")
-                                    if alt_csrf:
-                                        headers["X-CSRF-TOKEN"] = alt_csrf
-                                        async with session.post(alt_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as alt_retry:
-                                            if alt_retry.status == 200:
-                                                return {"success": True, "message": "User accepted to group"}
-                            # If both endpoints fail with 404, assume no request
-                            return {"success": False, "message": "User does not have a pending join request for this group. Please ask the user to request to join the group (ID: {}) first.".format(group_id), "error": "No pending request (404)"}
-                        elif response.status == 401 or response.status == 403:
-                            return {"success": False, "message": "Authentication failed or insufficient permissions", "error": f"Invalid or expired cookie (status {response.status})"}
-                        else:
-                            return {"success": False, "message": f"API returned status {response.status}", "error": response_text[:200]}
+            if response.status == 404:
+                # 404 might mean wrong endpoint - try alternative format
+                alt_url = f"{self.api_base}/groups/{group_id}/requests/{roblox_user_id}/accept"
+                logger.warning(f"[ACCEPT] 404 with endpoint {url}, trying alternative: {alt_url}")
+                alt_response = await self.auth_client.request("POST", alt_url, roblox_cookie, group_id=group_id)
+                logger.info(f"[ACCEPT] Alternative response: {alt_response.status}")
+                if alt_response.status == 200:
+                    response = alt_response
             
-            result = await _accept()
+            result = self._accept_result(group_id, response)
+            if result.get("success"):
+                # The request is gone; don't report it as pending from the index
+                index = self._join_request_index.get(group_id)
+                if index is not None:
+                    index[1].discard(roblox_user_id)
             return result
             
         except Exception as e:
@@ -479,6 +546,31 @@ class RobloxGroupsService:
                 "error": str(e)
             }
     
+    @staticmethod
+    def _accept_result(group_id: int, response: RobloxResponse) -> Dict[str, Any]:
+        """Map the join-request accept response to a result dict"""
+        response_text = response.text
+        if response.status == 200:
+            return {"success": True, "message": "User accepted to group"}
+        elif response.status == 400:
+            # User might already be in group or no pending request
+            if "already" in response_text.lower() or "member" in response_text.lower():
+                return {"success": True, "message": "User is already a member of the group"}
+            # Check if it's a "no pending request" error
+            if "request" in response_text.lower() or "pending" in response_text.lower() or "not found" in response_text.lower():
+                return {"success": False, "message": "User does not have a pending join request. Please ask the user to request to join the group first.", "error": "No pending request (400)"}
+            return {"success": False, "message": "Invalid request", "error": response_text[:200]}
+        elif response.status == 404:
+            # If both endpoints fail with 404, assume no request
+            return {"success": False, "message": "User does not have a pending join request for this group. Please ask the user to request to join the group (ID: {}) first.".format(group_id), "error": "No pending request (404)"}
+        elif response.status == 403:
+            # Still 403 with a valid CSRF token - permission issue
+            return {"success": False, "message": "Insufficient permissions to accept members. The Roblox account used does not have permission to accept join requests in this group. Please ensure the account has admin permissions.", "error": "Permission denied (403)"}
+        elif response.status == 401:
+            return {"success": False, "message": "Authentication failed or insufficient permissions", "error": f"Invalid or expired cookie (status {response.status})"}
+        else:
+            return {"success": False, "message": f"API returned status {response.status}", "error": response_text[:200]}
+    
     async def set_user_rank(
         self,
         group_id: int,
@@ -510,49 +602,18 @@ class RobloxGroupsService:
         
         try:
             url = f"{self.api_base}/groups/{group_id}/users/{roblox_user_id}"
+            response = await self.auth_client.request(
+                "PATCH", url, roblox_cookie, group_id=group_id, json={"roleId": role_id}
+            )
             
-            headers = {
-                "Cookie": f".ROBLOSECURITY={roblox_cookie}",
-                "Content-Type": "application/json",
-                "X-CSRF-TOKEN": ""
-            }
-            
-            payload = {
-                "roleId": role_id
-            }
-            
-            async def _set_rank():
-                async with aiohttp.ClientSession() as session:
-                    # First request to get CSRF token
-                    async with session.patch(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                        if response.status == 403:
-                            # Need CSRF token
-                            csrf_token = response.headers.get("X-CSRF-TOKEN")
-                            if csrf_token:
-                                headers["X-CSRF-TOKEN"] = csrf_token
-                                # Retry with CSRF token
-                                async with session.patch(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as retry_response:
-                                    if retry_response.status == 200:
-                                        return {"success": True, "message": "User rank updated successfully"}
-                                    else:
-                                        error_text = await retry_response.text()
-                                        return {"success": False, "message": f"Failed to set rank", "error": error_text[:200]}
-                            else:
-                                return {"success": False, "message": "CSRF token not available", "error": "Authentication failed"}
-                        
-                        if response.status == 200:
-                            return {"success": True, "message": "User rank updated successfully"}
-                        elif response.status == 400:
-                            error_text = await response.text()
-                            return {"success": False, "message": "Invalid request", "error": error_text[:200]}
-                        elif response.status == 401 or response.status == 403:
-                            return {"success": False, "message": "Authentication failed or insufficient permissions", "error": "Invalid cookie or no permission"}
-                        else:
-                            error_text = await response.text()
-                            return {"success": False, "message": f"API returned status {response.status}", "error": error_text[:200]}
-            
-            result = await _set_rank()
-            return result
+            if response.status == 200:
+                return {"success": True, "message": "User rank updated successfully"}
+            elif response.status == 400:
+                return {"success": False, "message": "Invalid request", "error": response.text[:200]}
+            elif response.status == 401 or response.status == 403:
+                return {"success": False, "message": "Authentication failed or insufficient permissions", "error": "Invalid cookie or no permission"}
+            else:
+                return {"success": False, "message": f"API returned status {response.status}", "error": response.text[:200]}
             
         except Exception as e:
             logger.error(f"Error setting rank for user {roblox_user_id} in group {group_id}: {e}", exc_info=True)
@@ -579,7 +640,7 @@ class RobloxGroupsService:
             url = f"{self.api_base}/groups/{group_id}/roles"
             
             async def _fetch():
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status != 200:
                             logger.warning(f"Roblox Groups API returned status {response.status} for group {group_id} roles")
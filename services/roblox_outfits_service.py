@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import aiohttp
 from typing import Optional, Dict, Any, List
+from utils.command_metrics import upstream_trace_configs
 from utils.logger import get_logger
 from utils.retry import retry_with_backoff, CircuitBreaker, CircuitBreakerOpenError
 
@@ -59,7 +60,7 @@ class RobloxOutfitsService:
             logger.info(f"[OUTFITS HARD TEST] Fetching outfits from: {url} with params: {params}")
             
             async def _fetch():
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                     async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
                         logger.info(f"[OUTFITS HARD TEST] Response status: {response.status}")
                         
@@ -166,7 +167,7 @@ class RobloxOutfitsService:
             url = f"{self.api_base}/outfits/{outfit_id}/details"
             
             async def _fetch():
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(trace_configs=upstream_trace_configs()) as session:
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
                         if response.status == 404:
                             logger.debug(f"Outfit {outfit_id} not found")
@@ -0,0 +1,265 @@
+"""
+XP Analytics Service - Daily XP rollups and the activity stats built on them.
+
+A periodic compactor folds new xp_events rows (past a high-water mark on
+event_id) into per user/source/day and per guild/source/day totals. Stats
+and history reads only touch the rollups, so their cost depends on the
+number of days asked for, not on how many raw events there were; raw
+events can then expire well before the analytics window does.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from repositories.xp_rollup_repository import RollupRow, XPRollupRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Raw events folded per transaction
+ROLLUP_BATCH_SIZE = 5000
+
+# How often the compactor runs (also the staleness bound of /stats)
+ROLLUP_INTERVAL_MINUTES = 5
+
+# Activity windows reported by /stats, in days
+STATS_WINDOWS: Tuple[int, ...] = (7, 30, 90)
+
+# Top sources are ranked over the largest window
+TOP_SOURCES_LIMIT = 3
+
+# How far back streaks are computed
+STREAK_LOOKBACK_DAYS = 365
+
+
+def _as_date(value: Any) -> date:
+    """Date from a DATE/DATETIME value or its ISO string (SQLite)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def aggregate_events(events: Iterable[Dict[str, Any]]) -> Tuple[List[RollupRow], List[RollupRow]]:
+    """
+    Sum raw XP events per user/day/source and per guild/day/source.
+
+    Args:
+        events: xp_events rows (user_id, xp_amount, source, guild_id, timestamp)
+
+    Returns:
+        (user_rows, guild_rows) as (key, day, source, xp_total, event_count)
+    """
+    users: Dict[Tuple[int, date, str], List[int]] = defaultdict(lambda: [0, 0])
+    guilds: Dict[Tuple[int, date, str], List[int]] = defaultdict(lambda: [0, 0])
+
+    for event in events:
+        day = _as_date(event["timestamp"])
+        source = event["source"]
+        amount = int(event["xp_amount"])
+        for totals, key in (
+            (users, (int(event["user_id"]), day, source)),
+            (guilds, (int(event.get("guild_id") or 0), day, source)),
+        ):
+            totals[key][0] += amount
+            totals[key][1] += 1
+
+    def rows(totals: Dict[Tuple[int, date, str], List[int]]) -> List[RollupRow]:
+        return [(key, day, source, xp, count) for (key, day, source), (xp, count) in sorted(totals.items())]
+
+    return rows(users), rows(guilds)
+
+
+def compute_streaks(days: Iterable[Any], today: date) -> Tuple[int, int]:
+    """
+    Current and longest run of consecutive active days.
+
+    The current streak is still alive if its last day is today or yesterday
+    (today's activity may simply not have happened yet).
+
+    Args:
+        days: Active days (any order, duplicates allowed)
+        today: Reference day
+
+    Returns:
+        (current_streak, longest_streak)
+    """
+    ordered = sorted({_as_date(day) for day in days})
+    longest = run = 0
+    previous: Optional[date] = None
+    for day in ordered:
+        run = run + 1 if previous is not None and day - previous == timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+
+    current = run if previous is not None and (today - previous).days <= 1 else 0
+    return current, longest
+
+
+class XPAnalyticsService:
+    """Service maintaining and reading the daily XP rollups"""
+
+    def __init__(
+        self,
+        rollup_repo: Optional[XPRollupRepository] = None,
+        batch_size: int = ROLLUP_BATCH_SIZE
+    ):
+        """
+        Initialize XP analytics service.
+
+        Args:
+            rollup_repo: XPRollupRepository instance (creates new if None)
+            batch_size: Raw events folded per transaction
+        """
+        self.rollup_repo = rollup_repo or XPRollupRepository()
+        self.batch_size = batch_size
+        # Highest event ID seen by the previous run; see compact()
+        self._settled_event_id: Optional[int] = None
+
+    async def compact(self, up_to_event_id: Optional[int] = None) -> int:
+        """
+        Fold new raw events into the daily rollups.
+
+        Auto-increment IDs are handed out before their transaction commits,
+        so an ID below MAX(event_id) may still become visible later. Each run
+        therefore only compacts up to the maximum seen by the previous run,
+        which every writer has had a full interval to commit.
+
+        Args:
+            up_to_event_id: Compact up to this ID now (tests, backfills)
+
+        Returns:
+            Number of raw events folded
+        """
+        max_event_id = await self.rollup_repo.get_max_event_id()
+        if up_to_event_id is None:
+            up_to_event_id, self._settled_event_id = self._settled_event_id, max_event_id
+            if up_to_event_id is None:
+                return 0
+
+        watermark = await self.rollup_repo.get_watermark()
+        folded = 0
+        while watermark < up_to_event_id:
+            events = await self.rollup_repo.get_events_after(watermark, up_to_event_id, self.batch_size)
+            # Nothing left below the ceiling (e.g. purged by retention): just move the mark
+            last_event_id = int(events[-1]["event_id"]) if events else up_to_event_id
+            user_rows, guild_rows = aggregate_events(events)
+
+            if not await self.rollup_repo.apply_batch(user_rows, guild_rows, watermark, last_event_id):
+                logger.warning("[XP ROLLUP] Watermark moved by another compactor, stopping this run")
+                break
+            folded += len(events)
+            watermark = last_event_id
+
+        if folded:
+            logger.info(f"[XP ROLLUP] Folded {folded} events (watermark {watermark})")
+        return folded
+
+    async def get_user_stats(self, user_id: int, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Get a user's activity summary.
+
+        Args:
+            user_id: User ID
+            today: Reference day (defaults to today, UTC)
+
+        Returns:
+            Dict with windows ({days: {xp, events, active_days}}), top_sources
+            ([(source, xp)] over the largest window), current_streak,
+            longest_streak and last_active (date or None)
+        """
+        today = today or datetime.utcnow().date()
+        largest = max(STATS_WINDOWS)
+        rows = await self.rollup_repo.get_user_daily_by_source(user_id, today - timedelta(days=largest - 1))
+        active_days = await self.rollup_repo.get_user_active_days(
+            user_id, today - timedelta(days=STREAK_LOOKBACK_DAYS - 1)
+        )
+
+        windows: Dict[int, Dict[str, int]] = {}
+        for window in STATS_WINDOWS:
+            since = today - timedelta(days=window - 1)
+            in_window = [row for row in rows if _as_date(row["day"]) >= since]
+            windows[window] = {
+                "xp": sum(int(row["xp_total"]) for row in in_window),
+                "events": sum(int(row["event_count"]) for row in in_window),
+                "active_days": len({_as_date(row["day"]) for row in in_window if int(row["xp_total"]) > 0}),
+            }
+
+        by_source: Dict[str, int] = defaultdict(int)
+        for row in rows:
+            by_source[row["source"]] += int(row["xp_total"])
+        top_sources = sorted(by_source.items(), key=lambda item: (-item[1], item[0]))[:TOP_SOURCES_LIMIT]
+
+        current_streak, longest_streak = compute_streaks(active_days, today)
+        return {
+            "windows": windows,
+            "top_sources": top_sources,
+            "current_streak": current_streak,
+            "longest_streak": longest_streak,
+            "last_active": _as_date(active_days[-1]) if active_days else None,
+        }
+
+    async def get_user_history(self, user_id: int, days: int = 30, today: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Get a user's daily XP, one entry per day (days without XP included).
+
+        Args:
+            user_id: User ID
+            days: Number of days, ending today
+            today: Reference day (defaults to today, UTC)
+
+        Returns:
+            [{day, xp, events, sources: {source: xp}}] oldest first
+        """
+        today = today or datetime.utcnow().date()
+        since = today - timedelta(days=days - 1)
+        rows = await self.rollup_repo.get_user_daily_by_source(user_id, since)
+        return self._daily_series(rows, since, days)
+
+    async def get_guild_history(self, guild_id: int, days: int = 30, today: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Get a guild's daily XP, one entry per day (days without XP included).
+
+        Args:
+            guild_id: Guild ID
+            days: Number of days, ending today
+            today: Reference day (defaults to today, UTC)
+
+        Returns:
+            [{day, xp, events, sources: {source: xp}}] oldest first
+        """
+        today = today or datetime.utcnow().date()
+        since = today - timedelta(days=days - 1)
+        rows = await self.rollup_repo.get_guild_daily(guild_id, since)
+        return self._daily_series(rows, since, days)
+
+    @staticmethod
+    def _daily_series(rows: List[Dict[str, Any]], since: date, days: int) -> List[Dict[str, Any]]:
+        """Dense per-day series from per-day/source rollup rows"""
+        series = {
+            since + timedelta(days=offset): {"day": since + timedelta(days=offset), "xp": 0, "events": 0, "sources": {}}
+            for offset in range(days)
+        }
+        for row in rows:
+            entry = series.get(_as_date(row["day"]))
+            if entry is None:
+                continue
+            entry["xp"] += int(row["xp_total"])
+            entry["events"] += int(row["event_count"])
+            entry["sources"][row["source"]] = entry["sources"].get(row["source"], 0) + int(row["xp_total"])
+        return list(series.values())
+
+
+# Singleton instance
+_xp_analytics_service: Optional[XPAnalyticsService] = None
+
+
+def get_xp_analytics_service() -> XPAnalyticsService:
+    """Get singleton XP analytics service"""
+    global _xp_analytics_service
+    if _xp_analytics_service is None:
+        _xp_analytics_service = XPAnalyticsService()
+    return _xp_analytics_service
@@ -4,7 +4,7 @@ XP Service - Business logic for XP operations.
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterable
 from datetime import date
 from repositories.xp_repository import XPRepository
 from domain.protocols import XPRepositoryProtocol
@@ -22,6 +22,34 @@ DAILY_XP_LIMITS: Dict[str, int] = {
     "manual": 0,  # No limit (admin override)
 }
 
+# In-memory mirror of daily_xp_limits for the current day: {(user_id, source): xp_gained}
+# Seeded from the database on first use, then kept current on every write.
+_daily_xp_gained: Dict[Tuple[int, str], int] = {}
+_daily_xp_date: Optional[date] = None
+
+
+def _daily_totals_for_today() -> Dict[Tuple[int, str], int]:
+    """Return the in-memory daily totals, resetting them when the day rolls over"""
+    global _daily_xp_date
+    today = date.today()
+    if _daily_xp_date != today:
+        _daily_xp_gained.clear()
+        _daily_xp_date = today
+    return _daily_xp_gained
+
+
+def clear_daily_xp_cache() -> None:
+    """Clear in-memory daily XP totals (next access reloads from database)"""
+    global _daily_xp_date
+    _daily_xp_gained.clear()
+    _daily_xp_date = None
+
+
+def forget_daily_xp(user_id: int) -> None:
+    """Drop a user's in-memory daily XP totals (e.g. after data deletion)"""
+    for key in [key for key in _daily_xp_gained if key[0] == user_id]:
+        del _daily_xp_gained[key]
+
 
 class XPService:
     """Service for XP-related business logic"""
@@ -35,6 +63,35 @@ class XPService:
         """
         self.xp_repo = xp_repo or XPRepository()
     
+    async def _get_daily_gained(self, user_id: int, source: str) -> int:
+        """Get XP gained today for a source, loading from database on first use"""
+        totals = _daily_totals_for_today()
+        key = (user_id, source)
+        if key not in totals:
+            totals[key] = await self.xp_repo.get_daily_xp_limit(user_id, source)
+        return totals[key]
+    
+    async def _get_daily_gained_many(
+        self,
+        user_ids: Iterable[int],
+        source: str
+    ) -> Dict[int, int]:
+        """Get XP gained today for many users, loading all misses in one query"""
+        totals = _daily_totals_for_today()
+        user_ids = list(user_ids)
+        missing = [user_id for user_id in user_ids if (user_id, source) not in totals]
+        if missing:
+            loaded = await self.xp_repo.get_daily_xp_limits(missing, source)
+            for user_id in missing:
+                totals[(user_id, source)] = loaded.get(user_id, 0)
+        return {user_id: totals[(user_id, source)] for user_id in user_ids}
+    
+    def _record_daily_gained(self, user_id: int, source: str, xp_amount: int) -> None:
+        """Add newly awarded XP to the in-memory daily total"""
+        totals = _daily_totals_for_today()
+        key = (user_id, source)
+        totals[key] = totals.get(key, 0) + xp_amount
+    
     async def add_xp(
         self,
         user_id: int,
@@ -66,7 +123,7 @@ class XPService:
         if check_daily_limit and source in DAILY_XP_LIMITS:
             daily_limit = DAILY_XP_LIMITS[source]
             if daily_limit > 0:
-                current_daily = await self.xp_repo.get_daily_xp_limit(user_id, source)
+                current_daily = await self._get_daily_gained(user_id, source)
                 
                 if current_daily >= daily_limit:
                     logger.debug(
@@ -104,6 +161,7 @@ class XPService:
                 source=source,
                 xp_amount=added_xp
             )
+            self._record_daily_gained(user_id, source, added_xp)
         
         return {
             "added": added_xp,
@@ -111,6 +169,63 @@ class XPService:
             "daily_limit_reached": daily_limit_reached
         }
     
+    async def add_xp_batch(
+        self,
+        awards: Dict[int, int],
+        source: str,
+        details: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Add XP to many users at once, applying daily limits in memory.
+        
+        Daily totals are read from the in-memory mirror (one query for any
+        users not seen yet today) and all awards are written in a single
+        batched repository call.
+        
+        Args:
+            awards: Mapping of user_id -> XP amount to add
+            source: Source of XP (voice, message, quest, etc.)
+            details: Optional per-user context, keyed by user_id
+        
+        Returns:
+            Mapping of user_id -> dict with:
+                - added: Actual XP added (may be less due to limits)
+                - total: New total XP (None if nothing was added)
+                - daily_limit_reached: Whether daily limit was reached
+        """
+        if not awards:
+            return {}
+        
+        daily_limit = DAILY_XP_LIMITS.get(source, 0)
+        gained = await self._get_daily_gained_many(awards, source) if daily_limit > 0 else {}
+        
+        capped: Dict[int, int] = {}
+        limit_reached: Dict[int, bool] = {}
+        for user_id, xp_amount in awards.items():
+            added_xp = xp_amount
+            reached = False
+            if daily_limit > 0:
+                remaining = max(0, daily_limit - gained[user_id])
+                if xp_amount > remaining:
+                    added_xp = remaining
+                    reached = True
+            capped[user_id] = added_xp
+            limit_reached[user_id] = reached
+        
+        totals = await self.xp_repo.add_xp_batch(capped, source, details)
+        
+        results: Dict[int, Dict[str, Any]] = {}
+        for user_id, added_xp in capped.items():
+            if added_xp > 0:
+                self._record_daily_gained(user_id, source, added_xp)
+            results[user_id] = {
+                "added": added_xp,
+                "total": totals.get(user_id),
+                "daily_limit_reached": limit_reached[user_id]
+            }
+        
+        return results
+    
     async def get_total_xp(self, user_id: int) -> int:
         """
         Get total XP for user.
@@ -0,0 +1,3 @@
+"""
+Benchmark suite for IgnisBot hot paths (see __main__.py for usage).
+"""
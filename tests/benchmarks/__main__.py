@@ -0,0 +1,61 @@
+"""
+Run the benchmark suite.
+
+    python -m tests.benchmarks                    # compare against baseline.json
+    python -m tests.benchmarks --update-baseline  # record new baseline
+    python -m tests.benchmarks -k vc_log --scale 0.2
+
+Exits with status 1 when a benchmark regressed beyond the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from tests.benchmarks.harness import (
+    DEFAULT_ROUNDS,
+    DEFAULT_TOLERANCE,
+    BenchmarkRunner,
+    find_regressions,
+    format_results,
+    load_baseline,
+    save_baseline,
+)
+from tests.benchmarks.scenarios import run_all
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="IgnisBot hot path benchmarks")
+    parser.add_argument("-k", dest="name_filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--scale", type=float, default=1.0, help="iteration count multiplier")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="timed rounds per benchmark (best is kept)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative slowdown")
+    parser.add_argument("--update-baseline", action="store_true", help="store results as the new baseline")
+    args = parser.parse_args()
+
+    # Per-operation INFO logs would dominate the output (records below WARNING are still filtered per call)
+    logging.disable(logging.INFO)
+
+    runner = asyncio.run(run_all(BenchmarkRunner(args.scale, args.name_filter, args.rounds)))
+    baseline = load_baseline()
+    print(format_results(runner.results, baseline))
+
+    if args.update_baseline:
+        save_baseline(runner.results)
+        print(f"\nBaseline updated ({len(runner.results)} benchmarks)")
+        return 0
+
+    regressions = find_regressions(runner.results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressions (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Fake Discord objects for benchmarks.
+
+Only the attributes the cogs and listeners actually touch are implemented;
+sends are recorded instead of hitting the API.
+"""
+
+from __future__ import annotations
+
+import itertools
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import discord
+
+_ids = itertools.count(10_000_000_000)
+
+
+def next_id() -> int:
+    """Unique snowflake-like ID"""
+    return next(_ids)
+
+
+class FakeRole:
+    """Hashable role (discord.Role compares and hashes by ID)"""
+
+    def __init__(self, name: str, role_id: Optional[int] = None):
+        self.id = role_id or next_id()
+        self.name = name
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"<FakeRole {self.name}>"
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+
+class FakeMember:
+    """discord.Member stand-in"""
+
+    def __init__(
+        self,
+        name: str = "member",
+        user_id: Optional[int] = None,
+        roles: Optional[List[FakeRole]] = None,
+        guild: Optional["FakeGuild"] = None,
+        bot: bool = False
+    ):
+        self.id = user_id or next_id()
+        self.name = name
+        self.display_name = name
+        self.nick: Optional[str] = None
+        self.bot = bot
+        self.roles = list(roles or [])
+        self.guild = guild
+        self.avatar = None
+        self.display_avatar = SimpleNamespace(url=f"https://cdn.example/avatars/{self.id}.png")
+        self.guild_permissions = SimpleNamespace(administrator=False, manage_nicknames=False)
+        self.voice: Optional[FakeVoiceState] = None
+        self.created_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.joined_at: Optional[datetime] = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.edits: List[Dict[str, Any]] = []
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def with_roles(self, roles: List[FakeRole]) -> "FakeMember":
+        """Snapshot of this member with different roles (like before/after in on_member_update)"""
+        clone = type(self)(self.name, self.id, roles, self.guild, self.bot)
+        clone.nick = self.nick
+        clone.voice = self.voice
+        return clone
+
+    async def edit(self, **kwargs: Any) -> None:
+        self.edits.append(kwargs)
+        if "nick" in kwargs:
+            self.nick = kwargs["nick"]
+
+
+class FakeVoiceChannel:
+    """Voice channel with connected members"""
+
+    def __init__(self, name: str, members: Optional[List[FakeMember]] = None, guild: Optional["FakeGuild"] = None):
+        self.id = next_id()
+        self.name = name
+        self.members = list(members or [])
+        self.guild = guild
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+
+class FakeVoiceState:
+    """discord.VoiceState stand-in"""
+
+    def __init__(self, channel: Optional[FakeVoiceChannel] = None, self_mute: bool = False, self_deaf: bool = False):
+        self.channel = channel
+        self.self_mute = self_mute
+        self.self_deaf = self_deaf
+        self.mute = False
+        self.deaf = False
+        self.afk = False
+
+
+class FakeTextChannel:
+    """Text channel recording sent messages"""
+
+    def __init__(self, name: str = "log"):
+        self.id = next_id()
+        self.name = name
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.sent.append({"content": content, **kwargs})
+
+
+class FakeLogChannel(discord.TextChannel):
+    """FakeTextChannel that passes isinstance(channel, discord.TextChannel) checks"""
+
+    def __init__(self, name: str = "log", channel_id: Optional[int] = None):
+        self.id = channel_id or next_id()
+        self.name = name
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.sent.append({"content": content, **kwargs})
+
+
+class FakeMessage:
+    """discord.Message stand-in"""
+
+    def __init__(
+        self,
+        author: FakeMember,
+        content: str = "",
+        channel: Optional[FakeTextChannel] = None,
+        guild: Optional["FakeGuild"] = None,
+        interaction_metadata: Any = None
+    ):
+        self.id = next_id()
+        self.author = author
+        self.content = content
+        self.channel = channel or FakeTextChannel("general")
+        self.guild = guild
+        self.interaction_metadata = interaction_metadata
+
+
+class FakeGuild:
+    """discord.Guild stand-in"""
+
+    def __init__(self, voice_channels: Optional[List[FakeVoiceChannel]] = None):
+        self.id = next_id()
+        self.name = "Benchmark Guild"
+        self.voice_channels = list(voice_channels or [])
+        self.stage_channels: List[FakeVoiceChannel] = []
+        self.afk_channel: Optional[FakeVoiceChannel] = None
+        self.me = FakeMember("ignis", bot=True, guild=self)
+        self.members: Dict[int, FakeMember] = {}
+        self.filesize_limit = 10 * 1024 * 1024
+
+    def get_member(self, user_id: int) -> Optional[FakeMember]:
+        return self.members.get(user_id)
+
+
+class FakeResponse:
+    """discord.InteractionResponse stand-in"""
+
+    def __init__(self):
+        self._done = False
+        self.sent: List[Dict[str, Any]] = []
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs: Any) -> None:
+        self._done = True
+
+    async def send_message(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self._done = True
+        self.sent.append({"content": content, **kwargs})
+
+
+class FakeFollowup:
+    """discord.Webhook (interaction.followup) stand-in"""
+
+    def __init__(self):
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.sent.append({"content": content, **kwargs})
+
+
+class FakeInteraction:
+    """discord.Interaction stand-in for calling command callbacks directly"""
+
+    def __init__(self, user: FakeMember, guild: Optional[FakeGuild] = None):
+        self.id = next_id()
+        self.user = user
+        self.guild = guild
+        self.channel = None
+        self.channel_id: Optional[int] = None
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+class FakeBot:
+    """commands.Bot stand-in: synchronous dispatch, channel lookup"""
+
+    def __init__(self, channels: Optional[Dict[int, Any]] = None):
+        self.user = FakeMember("ignis", bot=True)
+        self.channels = channels or {}
+        self.dispatched: List[str] = []
+
+    def dispatch(self, event_name: str, *args: Any, **kwargs: Any) -> None:
+        self.dispatched.append(event_name)
+
+    def get_channel(self, channel_id: int) -> Any:
+        return self.channels.get(channel_id)
+
+    def get_cog(self, name: str) -> None:
+        return None
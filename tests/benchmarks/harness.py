@@ -0,0 +1,192 @@
+"""
+Benchmark harness: timing, reporting and baseline comparison.
+
+Each benchmark runs an operation a fixed number of times after a warmup,
+timing every call, and keeps the fastest of several rounds (like timeit)
+so scheduler noise does not read as a regression. Results report ops/sec and p50/p95 latency and can be
+compared against a stored baseline (baseline.json) to flag regressions.
+Baselines are machine-specific: regenerate them on the machine that runs
+the comparison.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+# Allowed slowdown before a result counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Timed rounds per benchmark (best round is reported)
+DEFAULT_ROUNDS = 5
+
+Operation = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary of one benchmark"""
+    name: str
+    iterations: int
+    total_seconds: float
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class BenchmarkRunner:
+    """Runs operations and collects results"""
+
+    def __init__(self, scale: float = 1.0, name_filter: Optional[str] = None, rounds: int = DEFAULT_ROUNDS):
+        """
+        Initialize benchmark runner.
+
+        Args:
+            scale: Multiplier for iteration counts (e.g. 0.01 for a smoke run)
+            name_filter: Only run benchmarks whose name contains this text
+            rounds: Timed rounds per benchmark
+        """
+        self.scale = scale
+        self.rounds = max(1, rounds)
+        self.name_filter = name_filter
+        self.results: List[BenchmarkResult] = []
+
+    def wants(self, name: str) -> bool:
+        """Whether a benchmark passes the name filter"""
+        return self.name_filter is None or self.name_filter in name
+
+    async def measure(self, name: str, operation: Operation, iterations: int, warmup: int = 10) -> Optional[BenchmarkResult]:
+        """
+        Time an operation (sync or async).
+
+        Args:
+            name: Benchmark name
+            operation: Zero-argument callable; awaited if it returns an awaitable
+            iterations: Timed calls at scale 1.0
+            warmup: Untimed calls first (scaled too)
+
+        Returns:
+            Result, or None if filtered out
+        """
+        if not self.wants(name):
+            return None
+        iterations = max(1, int(iterations * self.scale))
+        warmup = max(1, int(warmup * self.scale))
+
+        for _ in range(warmup):
+            result = operation()
+            if inspect.isawaitable(result):
+                await result
+
+        best_total, samples = float("inf"), []
+        for _ in range(self.rounds):
+            round_total, round_samples = await self._timed_round(operation, iterations)
+            if round_total < best_total:
+                best_total, samples = round_total, round_samples
+        total = best_total
+
+        samples.sort()
+        bench = BenchmarkResult(
+            name=name,
+            iterations=iterations,
+            total_seconds=total,
+            ops_per_sec=iterations / total if total > 0 else float("inf"),
+            p50_ms=_percentile(samples, 50) * 1000,
+            p95_ms=_percentile(samples, 95) * 1000,
+            max_ms=samples[-1] * 1000
+        )
+        self.results.append(bench)
+        return bench
+
+    @staticmethod
+    async def _timed_round(operation: Operation, iterations: int) -> Tuple[float, List[float]]:
+        """One timed round: (total seconds, per-call seconds)"""
+        samples: List[float] = []
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        for _ in range(iterations):
+            op_start = perf_counter()
+            result = operation()
+            if inspect.isawaitable(result):
+                await result
+            samples.append(perf_counter() - op_start)
+        return perf_counter() - start, samples
+
+
+def format_results(results: List[BenchmarkResult], baseline: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """Render results as a table, with change vs baseline ops/sec when available"""
+    lines = [f"{'benchmark':<40} {'iters':>7} {'ops/sec':>12} {'p50 ms':>9} {'p95 ms':>9} {'vs base':>8}"]
+    for result in results:
+        change = ""
+        reference = (baseline or {}).get(result.name)
+        if reference and reference.get("ops_per_sec"):
+            change = f"{(result.ops_per_sec / reference['ops_per_sec'] - 1) * 100:+.0f}%"
+        lines.append(
+            f"{result.name:<40} {result.iterations:>7} {result.ops_per_sec:>12,.1f} "
+            f"{result.p50_ms:>9.3f} {result.p95_ms:>9.3f} {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> Dict[str, Dict[str, float]]:
+    """Load stored baseline (empty if none)"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path = BASELINE_FILE) -> None:
+    """Store results as the new baseline (merged with existing entries)"""
+    baseline = load_baseline(path)
+    for result in results:
+        data = asdict(result)
+        baseline[result.name] = {key: round(data[key], 4) for key in ("ops_per_sec", "p50_ms", "p95_ms")}
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Current results
+        baseline: Stored baseline (name -> ops_per_sec/p95_ms)
+        tolerance: Allowed relative slowdown
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if not reference:
+            continue
+        if result.ops_per_sec < reference["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: {result.ops_per_sec:,.1f} ops/sec vs baseline {reference['ops_per_sec']:,.1f}"
+            )
+        if result.p95_ms > reference["p95_ms"] * (1 + tolerance) and result.p95_ms - reference["p95_ms"] > 0.05:
+            regressions.append(
+                f"{result.name}: p95 {result.p95_ms:.3f}ms vs baseline {reference['p95_ms']:.3f}ms"
+            )
+    return regressions
@@ -0,0 +1,239 @@
+"""
+Instrumentation for load replays.
+
+- CallCounter attributes DB queries, HTTP requests and Discord sends to the
+  event type being handled (through a context variable, so tasks started by
+  a handler inherit it; work started elsewhere counts as "background").
+- CountingPool wraps a connection pool to count queries, connection waits
+  and peak connections in use.
+- StubHTTPSession replaces aiohttp.ClientSession with canned responses
+  after a fixed delay.
+- LoopLagMonitor samples how late the event loop wakes a sleeping task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from utils.histogram import LatencyHistogram
+
+BACKGROUND = "background"
+
+_current_event: ContextVar[str] = ContextVar("replay_event", default=BACKGROUND)
+
+# (method, url, params) -> (status, JSON payload)
+Router = Callable[[str, str, Optional[Dict[str, Any]]], Tuple[int, Any]]
+
+
+def set_current_event(event_type: str) -> None:
+    """Attribute calls made from the current task (and tasks it starts) to an event type"""
+    _current_event.set(event_type)
+
+
+class CallCounter:
+    """Calls per event type and per target"""
+
+    def __init__(self):
+        # event type -> kind ("db", "http", "discord") -> count
+        self.by_event: Dict[str, Counter] = defaultdict(Counter)
+        # kind -> target (query verb, host, send method) -> count
+        self.by_target: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, kind: str, target: str) -> None:
+        self.by_event[_current_event.get()][kind] += 1
+        self.by_target[kind][target] += 1
+
+    def reset(self) -> None:
+        self.by_event.clear()
+        self.by_target.clear()
+
+
+class _CountingCursor:
+    """Cursor proxy counting execute/executemany calls"""
+
+    def __init__(self, cursor: Any, counter: CallCounter):
+        self._cursor = cursor
+        self._counter = counter
+
+    async def __aenter__(self) -> "_CountingCursor":
+        await self._cursor.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._cursor.__aexit__(*exc_info)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    async def execute(self, query: str, params: Any = None) -> Any:
+        self._counter.record("db", query.lstrip().split(None, 1)[0].upper())
+        return await self._cursor.execute(query, params)
+
+    async def executemany(self, query: str, rows: Any) -> Any:
+        self._counter.record("db", query.lstrip().split(None, 1)[0].upper())
+        return await self._cursor.executemany(query, rows)
+
+
+class _CountingConnection:
+    """Connection proxy handing out counting cursors"""
+
+    def __init__(self, connection: Any, counter: CallCounter):
+        self._connection = connection
+        self._counter = counter
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def cursor(self, *args: Any) -> _CountingCursor:
+        return _CountingCursor(self._connection.cursor(*args), self._counter)
+
+
+class CountingPool:
+    """Pool proxy recording queries, acquire waits and peak connections in use"""
+
+    def __init__(self, pool: Any, counter: CallCounter):
+        self._pool = pool
+        self._counter = counter
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquire_wait_ms = LatencyHistogram()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    def reset_stats(self) -> None:
+        self.peak_in_use = self.in_use
+        self.acquire_wait_ms.reset()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[_CountingConnection]:
+        started = time.perf_counter()
+        async with self._pool.acquire() as connection:
+            self.acquire_wait_ms.record((time.perf_counter() - started) * 1000)
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            try:
+                yield _CountingConnection(connection, self._counter)
+            finally:
+                self.in_use -= 1
+
+
+class StubHTTPResponse:
+    """aiohttp.ClientResponse stand-in with a canned JSON payload"""
+
+    def __init__(self, status: int, payload: Any):
+        self.status = status
+        self._payload = payload
+        self.headers: Dict[str, str] = {}
+
+    async def json(self, **kwargs: Any) -> Any:
+        return self._payload
+
+    async def text(self, **kwargs: Any) -> str:
+        return "" if self._payload is None else str(self._payload)
+
+    def release(self) -> None:
+        pass
+
+
+class _StubRequest:
+    """Awaitable / async context manager returned by session.get() and friends"""
+
+    def __init__(self, session: "StubHTTPSession", method: str, url: str, params: Optional[Dict[str, Any]]):
+        self._session = session
+        self._method = method
+        self._url = url
+        self._params = params
+
+    async def _send(self) -> StubHTTPResponse:
+        session = self._session
+        session.counter.record("http", urlsplit(self._url).netloc or self._url)
+        if session.latency:
+            await asyncio.sleep(session.latency)
+        return StubHTTPResponse(*session.router(self._method, self._url, self._params))
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def __aenter__(self) -> StubHTTPResponse:
+        return await self._send()
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+class StubHTTPSession:
+    """
+    aiohttp.ClientSession replacement.
+
+    Patch it in with ``functools.partial(StubHTTPSession, router=..., counter=...)``;
+    the services' own constructor arguments (trace configs, timeouts) are ignored.
+    """
+
+    def __init__(self, *args: Any, router: Router, counter: CallCounter, latency: float = 0.0, **kwargs: Any):
+        self.router = router
+        self.counter = counter
+        self.latency = latency
+        self.closed = False
+
+    async def __aenter__(self) -> "StubHTTPSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> _StubRequest:
+        return _StubRequest(self, method.upper(), str(url), params)
+
+    def get(self, url: str, **kwargs: Any) -> _StubRequest:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _StubRequest:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> _StubRequest:
+        return self.request("PATCH", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> _StubRequest:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> _StubRequest:
+        return self.request("DELETE", url, **kwargs)
+
+
+class LoopLagMonitor:
+    """Record how late a periodic sleeper is woken (event loop lag)"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        # Microseconds: the histogram lumps everything below 1 unit together
+        self.lag_us = LatencyHistogram()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lag_us.record((time.perf_counter() - started - self.interval) * 1_000_000)
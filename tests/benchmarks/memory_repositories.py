@@ -0,0 +1,235 @@
+"""
+In-memory implementations of the domain/protocols.py repositories.
+
+Drop-in replacements for the MySQL repositories so services and cogs can be
+exercised without a database. An optional per-call latency simulates a DB
+round trip; with the default of 0 every call still yields to the event loop
+once, like a real awaited query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class _InMemoryRepository:
+    """Shared latency handling"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def _round_trip(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+
+class InMemoryUserRepository(_InMemoryRepository):
+    """UserRepositoryProtocol backed by a dict"""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        self.users: Dict[int, Dict[str, Any]] = {}
+
+    def _new_row(self, user_id: int) -> Dict[str, Any]:
+        return {
+            "user_id": user_id, "points": 0, "exp": 0,
+            "rank": "Civitas Aspirant", "path": "pre_induction",
+            "created_at": datetime.utcnow(), "updated_at": datetime.utcnow()
+        }
+
+    async def get(self, user_id: int, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        await self._round_trip()
+        row = self.users.get(user_id)
+        return dict(row) if row else None
+
+    async def create(self, user_id: int) -> None:
+        await self._round_trip()
+        self.users.setdefault(user_id, self._new_row(user_id))
+
+    async def create_if_missing(self, user_id: int) -> bool:
+        await self._round_trip()
+        if user_id in self.users:
+            return False
+        self.users[user_id] = self._new_row(user_id)
+        return True
+
+    async def get_or_create(self, user_id: int) -> Dict[str, Any]:
+        user = await self.get(user_id, use_cache=False)
+        if user is None:
+            await self.create(user_id)
+            user = await self.get(user_id, use_cache=False)
+        return user
+
+    async def update_points(self, user_id: int, points: int) -> int:
+        await self._round_trip()
+        row = self.users.setdefault(user_id, self._new_row(user_id))
+        row["points"] = max(0, row["points"] + points)
+        row["exp"] = row["points"]
+        return row["points"]
+
+    async def update_rank(self, user_id: int, rank: str, path: Optional[str] = None) -> None:
+        await self._round_trip()
+        row = self.users.setdefault(user_id, self._new_row(user_id))
+        row["rank"] = rank
+        if path:
+            row["path"] = path
+
+    async def exists(self, user_id: int) -> bool:
+        await self._round_trip()
+        return user_id in self.users
+
+
+class InMemoryConsentRepository(_InMemoryRepository):
+    """ConsentRepositoryProtocol backed by a set"""
+
+    def __init__(self, consented: Iterable[int] = (), latency: float = 0.0):
+        super().__init__(latency)
+        self.consented: Set[int] = set(consented)
+
+    async def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        await self._round_trip()
+        if user_id not in self.consented:
+            return None
+        return {"user_id": user_id, "consent_given": True, "base_legal": "consentimento", "consent_version": "1.0"}
+
+    async def has_consent(self, user_id: int) -> bool:
+        await self._round_trip()
+        return user_id in self.consented
+
+    async def get_consented_users(self, user_ids: Iterable[int]) -> Set[int]:
+        await self._round_trip()
+        return {user_id for user_id in user_ids if user_id in self.consented}
+
+    async def create_or_update(self, user_id: int, base_legal: str = "consentimento", version: str = "1.0") -> bool:
+        await self._round_trip()
+        self.consented.add(user_id)
+        return True
+
+    async def give_consent(self, user_id: int, base_legal: str = "consentimento", version: str = "1.0") -> None:
+        await self.create_or_update(user_id, base_legal, version)
+
+    async def revoke(self, user_id: int) -> bool:
+        await self._round_trip()
+        had = user_id in self.consented
+        self.consented.discard(user_id)
+        return had
+
+    revoke_consent = revoke
+
+
+class InMemoryAuditRepository(_InMemoryRepository):
+    """AuditRepositoryProtocol backed by a list"""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        self.entries: List[Dict[str, Any]] = []
+
+    async def create(
+        self,
+        user_id: int,
+        action_type: str,
+        data_type: str,
+        performed_by: Optional[int] = None,
+        purpose: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        await self._round_trip()
+        self.entries.append({
+            "user_id": user_id, "action_type": action_type, "data_type": data_type,
+            "performed_by": performed_by, "purpose": purpose, "details": details
+        })
+
+    async def get_history(self, user_id: int, limit: int = 100) -> List[Dict[str, Any]]:
+        await self._round_trip()
+        return [entry for entry in self.entries if entry["user_id"] == user_id][-limit:]
+
+
+class InMemoryXPRepository(_InMemoryRepository):
+    """XPRepositoryProtocol backed by dicts"""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        self.totals: Dict[int, int] = {}
+        self.events: List[Tuple[int, int, str]] = []
+        self.daily: Dict[Tuple[int, str, date], int] = {}
+
+    async def add_xp(
+        self,
+        user_id: int,
+        xp_amount: int,
+        source: str,
+        details: Optional[Dict[str, Any]] = None
+    ) -> int:
+        await self._round_trip()
+        self.events.append((user_id, xp_amount, source))
+        self.totals[user_id] = self.totals.get(user_id, 0) + xp_amount
+        return self.totals[user_id]
+
+    async def add_xp_batch(
+        self,
+        awards: Dict[int, int],
+        source: str,
+        details: Optional[Dict[int, Dict[str, Any]]] = None,
+        target_date: Optional[date] = None
+    ) -> Dict[int, int]:
+        await self._round_trip()
+        target_date = target_date or date.today()
+        for user_id, amount in awards.items():
+            self.events.append((user_id, amount, source))
+            self.totals[user_id] = self.totals.get(user_id, 0) + amount
+            key = (user_id, source, target_date)
+            self.daily[key] = self.daily.get(key, 0) + amount
+        return {user_id: self.totals[user_id] for user_id in awards}
+
+    async def get_total_xp(self, user_id: int) -> int:
+        await self._round_trip()
+        return self.totals.get(user_id, 0)
+
+    async def get_daily_xp_limit(self, user_id: int, source: str, target_date: Optional[date] = None) -> int:
+        await self._round_trip()
+        return self.daily.get((user_id, source, target_date or date.today()), 0)
+
+    async def get_daily_xp_limits(
+        self,
+        user_ids: Iterable[int],
+        source: str,
+        target_date: Optional[date] = None
+    ) -> Dict[int, int]:
+        await self._round_trip()
+        target_date = target_date or date.today()
+        return {user_id: self.daily.get((user_id, source, target_date), 0) for user_id in user_ids}
+
+    async def update_daily_xp_limit(
+        self,
+        user_id: int,
+        source: str,
+        xp_amount: int,
+        target_date: Optional[date] = None
+    ) -> None:
+        await self._round_trip()
+        key = (user_id, source, target_date or date.today())
+        self.daily[key] = self.daily.get(key, 0) + xp_amount
+
+
+class InMemoryCacheService:
+    """CacheServiceProtocol backed by a dict (no TTL)"""
+
+    def __init__(self):
+        self.users: Dict[int, Dict[str, Any]] = {}
+
+    async def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
+        return self.users.get(user_id)
+
+    async def set_user(self, user_id: int, data: Dict[str, Any]) -> None:
+        self.users[user_id] = data
+
+    async def invalidate_user(self, user_id: int) -> None:
+        self.users.pop(user_id, None)
+
+    invalidate_user_cache = invalidate_user
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"size": len(self.users)}
@@ -0,0 +1,652 @@
+"""
+Synthetic gateway event replayer.
+
+Feeds a stream of gateway events (voice state updates, member updates and
+joins, messages, interactions) through the real listeners of
+MemberActivityLogCog, RankCog, RoleSyncHandler, BloxlinkCommandDetector,
+GamificationHandlers and ProcessCog, the way discord.py dispatches them:
+every listener of an event runs as its own task. Storage is the SQLite
+backend on a temporary file, upstream HTTP (Bloxlink, Roblox) is stubbed
+with canned responses after a configurable delay, and Discord sends are
+recorded by the fakes.
+
+Reported per event type: handler latency per listener, DB queries, HTTP
+requests and Discord sends per event; overall: event loop lag, DB pool
+peak usage and acquire waits.
+
+    python -m tests.benchmarks.replay                          # synthetic stream, as fast as possible
+    python -m tests.benchmarks.replay --generate events.jsonl --members 500 --events 10000
+    python -m tests.benchmarks.replay --input events.jsonl --speed 1 --pool-size 4
+
+Streams are JSON lines ordered by "at" (seconds from the start):
+
+    {"at": 0.5, "event": "member_join", "member": 17}
+    {"at": 0.9, "event": "voice_state_update", "member": 17, "channel": "Vox-Link Alpha", "self_mute": false}
+    {"at": 1.2, "event": "member_update", "member": 17, "roles": ["@everyone", "Verified"], "nick": null}
+    {"at": 1.3, "event": "message", "member": 17, "channel": "general", "content": "o7"}
+    {"at": 1.3, "event": "message", "member": 17, "bloxlink_reply": true, "channel": "verify"}
+    {"at": 2.0, "event": "interaction", "member": 17, "channel": "process-17"}
+
+Members not seen in a member_join are created on first use.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from tests.benchmarks.fakes import (
+    FakeBot,
+    FakeGuild,
+    FakeInteraction,
+    FakeLogChannel,
+    FakeMember,
+    FakeMessage,
+    FakeRole,
+    FakeTextChannel,
+    FakeVoiceChannel,
+    FakeVoiceState,
+)
+from tests.benchmarks.instrumentation import (
+    BACKGROUND,
+    CallCounter,
+    CountingPool,
+    LoopLagMonitor,
+    Router,
+    StubHTTPSession,
+    set_current_event,
+)
+from utils.histogram import LatencyHistogram
+
+EVENT_TYPES = ("voice_state_update", "member_update", "member_join", "message", "interaction")
+
+# Default simulated upstream (Bloxlink / Roblox) response time
+DEFAULT_HTTP_LATENCY_MS = 50.0
+
+# Share of replayed members that gave LGPD consent (the rest earn no XP)
+DEFAULT_CONSENT_RATIO = 0.8
+
+# Max seconds to wait for queued background work after the last handler
+DRAIN_TIMEOUT_SECONDS = 30.0
+
+VOICE_CHANNELS = ("Vox-Link Alpha", "Vox-Link Beta", "Recruitment Hall", "Training Grounds")
+TEXT_CHANNELS = ("general", "recruitment", "off-topic")
+# Lowest pre-induction ranks, present in both the config and the fallback map
+RANK_ROLES = ("Civitas Aspirant", "Emberbound Initiate", "Obsidian Trialborn")
+TOGGLE_ROLES = ("Gamenight", "Event Ping")
+
+# Relative weights of generated events for members already in the guild
+_EVENT_WEIGHTS = {
+    "message": 45,
+    "voice_state_update": 25,
+    "interaction": 12,
+    "bloxlink_update": 10,
+    "role_toggle": 8,
+}
+
+
+def generate_stream(
+    members: int = 200,
+    events: int = 2000,
+    duration: float = 60.0,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Generate a recruitment-event shaped stream.
+
+    Members join the guild, hop between voice channels, chat, click buttons
+    in their process channel, run Bloxlink /update (a Bloxlink reply and a
+    rank role swap with a new nickname) and get ping roles toggled.
+
+    Args:
+        members: Distinct members
+        events: Approximate number of records
+        duration: Seconds the stream spans
+        seed: Random seed (same arguments give the same stream)
+
+    Returns:
+        Records ordered by "at"
+    """
+    rng = random.Random(seed)
+    timestamps = sorted(rng.uniform(0, duration) for _ in range(events))
+    joined: Dict[int, Dict[str, Any]] = {}
+    kinds, weights = list(_EVENT_WEIGHTS), list(_EVENT_WEIGHTS.values())
+    records: List[Dict[str, Any]] = []
+
+    for at in timestamps:
+        at = round(at, 4)
+        member = rng.randint(1, members)
+        state = joined.get(member)
+        if state is None:
+            joined[member] = {"voice": None, "rank": 0, "toggles": set()}
+            records.append({"at": at, "event": "member_join", "member": member})
+            continue
+
+        kind = rng.choices(kinds, weights)[0]
+        if kind == "message":
+            records.append({
+                "at": at, "event": "message", "member": member,
+                "channel": rng.choice(TEXT_CHANNELS), "content": "o7 " * rng.randint(1, 20)
+            })
+        elif kind == "voice_state_update":
+            if state["voice"] is not None and rng.random() < 0.4:
+                channel = None
+            else:
+                channel = rng.choice([c for c in VOICE_CHANNELS if c != state["voice"]])
+            state["voice"] = channel
+            records.append({
+                "at": at, "event": "voice_state_update", "member": member,
+                "channel": channel, "self_mute": rng.random() < 0.1
+            })
+        elif kind == "interaction":
+            records.append({"at": at, "event": "interaction", "member": member, "channel": f"process-{member}"})
+        elif kind == "bloxlink_update":
+            state["rank"] = min(state["rank"] + 1, len(RANK_ROLES) - 1)
+            records.append({"at": at, "event": "message", "member": member, "bloxlink_reply": True, "channel": "verify"})
+            records.append({
+                "at": at, "event": "member_update", "member": member,
+                "roles": _roles_for(state), "nick": f"{RANK_ROLES[state['rank']]} Roblox{member}"
+            })
+        else:
+            state["toggles"] ^= {rng.choice(TOGGLE_ROLES)}
+            records.append({"at": at, "event": "member_update", "member": member, "roles": _roles_for(state)})
+
+    return records
+
+
+def _roles_for(state: Dict[str, Any]) -> List[str]:
+    return ["@everyone", "Verified", RANK_ROLES[state["rank"]], *sorted(state["toggles"])]
+
+
+def save_stream(records: Iterable[Dict[str, Any]], path: Path) -> int:
+    """Write records as JSON lines, returns the number written"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+            count += 1
+    return count
+
+
+def load_stream(path: Path) -> List[Dict[str, Any]]:
+    """Read a JSON lines stream (blank lines are skipped)"""
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return sorted(records, key=lambda record: record.get("at", 0.0))
+
+
+def roblox_router(method: str, url: str, params: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+    """
+    Canned Bloxlink / Roblox API responses.
+
+    Every tenth Discord ID is not verified with Bloxlink; verified members
+    hold the lowest rank in the main group.
+    """
+    from services.member_profile_service import MAIN_GROUP_ID
+
+    parts = urlsplit(url)
+    host, segments = parts.netloc, [s for s in parts.path.split("/") if s]
+
+    if host == "api.blox.link" and segments:
+        discord_id = int(segments[-1])
+        if discord_id % 10 == 0:
+            return 404, {"error": "User not found"}
+        return 200, {"robloxId": str(1_000_000 + discord_id), "verifiedAt": "2024-01-01T00:00:00Z"}
+    if host == "users.roblox.com" and segments[-1:] == ["search"]:
+        return 200, {"data": []}
+    if host == "users.roblox.com" and segments and segments[-1].isdigit():
+        roblox_id = int(segments[-1])
+        return 200, {"id": roblox_id, "name": f"Roblox{roblox_id}", "displayName": f"Roblox{roblox_id}"}
+    if host == "groups.roblox.com" and segments[-2:] == ["groups", "roles"]:
+        return 200, {"data": [{
+            "group": {"id": MAIN_GROUP_ID, "name": "Main Group", "memberCount": 10_000},
+            "role": {"id": 1, "rank": 1, "name": RANK_ROLES[0]},
+        }]}
+    if host == "thumbnails.roblox.com":
+        return 200, {"data": []}
+    return 200, {}
+
+
+class _ReplayGuild(FakeGuild):
+    """Guild carrying the call counter for the fakes created in it"""
+
+    def __init__(self, counter: CallCounter):
+        super().__init__()
+        self.counter = counter
+        self.me.guild_permissions.manage_nicknames = True
+
+
+class _ReplayMember(FakeMember):
+    """Member whose nickname edits count as Discord sends"""
+
+    async def edit(self, **kwargs: Any) -> None:
+        self.guild.counter.record("discord", "member.edit")
+        await super().edit(**kwargs)
+
+
+class _ReplayLogChannel(FakeLogChannel):
+    """Log channel whose messages count as Discord sends"""
+
+    def __init__(self, counter: CallCounter, name: str, channel_id: int):
+        super().__init__(name, channel_id)
+        self.counter = counter
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.counter.record("discord", "channel.send")
+        await super().send(content, **kwargs)
+
+
+class _ReplayBot(FakeBot):
+    """FakeBot that is already ready and lists its guild"""
+
+    def __init__(self, guild: FakeGuild, channels: Dict[int, Any]):
+        super().__init__(channels)
+        self.command_prefix = "!"
+        self.guilds = [guild]
+        self._cogs: Dict[str, Any] = {}
+
+    def is_ready(self) -> bool:
+        return True
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    def get_cog(self, name: str) -> Any:
+        return self._cogs.get(name)
+
+
+@dataclass
+class ReplayReport:
+    """Results of one replay"""
+    elapsed_seconds: float
+    events: Dict[str, int]
+    handler_ms: Dict[str, LatencyHistogram]  # "event_type listener" -> latency
+    handler_errors: Dict[str, int]
+    calls: Dict[str, Dict[str, int]]  # event type (or "background") -> kind -> count
+    targets: Dict[str, Dict[str, int]]  # kind -> target -> count
+    loop_lag_us: LatencyHistogram
+    pool_size: int
+    pool_peak_in_use: int
+    pool_acquire_wait_ms: LatencyHistogram
+    discord_sends: int = 0
+    notes: List[str] = field(default_factory=list)
+
+    def calls_per_event(self, event_type: str, kind: str) -> float:
+        count = self.events.get(event_type, 0)
+        return self.calls.get(event_type, {}).get(kind, 0) / count if count else 0.0
+
+
+class ReplayEnvironment:
+    """
+    The six cogs wired to fakes, a temporary SQLite database and stubbed HTTP.
+
+        async with ReplayEnvironment(http_latency=0.05) as env:
+            report = await env.replay(generate_stream())
+    """
+
+    def __init__(
+        self,
+        http_latency: float = DEFAULT_HTTP_LATENCY_MS / 1000,
+        pool_size: int = 4,
+        consent_ratio: float = DEFAULT_CONSENT_RATIO,
+        router: Router = roblox_router
+    ):
+        """
+        Initialize environment (entered with ``async with``).
+
+        Args:
+            http_latency: Seconds each stubbed HTTP request takes
+            pool_size: SQLite connections in the pool
+            consent_ratio: Share of members seeded with consent
+            router: Canned HTTP responses
+        """
+        self.http_latency = http_latency
+        self.pool_size = pool_size
+        self.consent_ratio = consent_ratio
+        self.router = router
+        self.counter = CallCounter()
+        self.guild = _ReplayGuild(self.counter)
+        self.members: Dict[int, _ReplayMember] = {}
+        self.roles: Dict[str, FakeRole] = {}
+        self.voice_channels: Dict[str, FakeVoiceChannel] = {}
+        self.text_channels: Dict[str, FakeTextChannel] = {}
+        self.cogs: List[Any] = []
+        self.listeners: Dict[str, List[Tuple[str, Callable]]] = {}
+        self.pool: Optional[CountingPool] = None
+        self._stack = AsyncExitStack()
+
+    async def __aenter__(self) -> "ReplayEnvironment":
+        from cogs.member_activity_log import ACTIVITY_LOG_CHANNEL_ID
+        from events.bloxlink_command_detector import BLOXLINK_BOT_ID
+        from services import member_profile_service
+        from services.xp_service import clear_daily_xp_cache
+        from utils import database
+        from utils.db_dialect import SQLITE
+        from utils.migrator import MigrationRunner
+        from utils.sqlite_backend import create_sqlite_pool
+
+        directory = self._stack.enter_context(tempfile.TemporaryDirectory())
+        raw_pool = await create_sqlite_pool(str(Path(directory) / "replay.db"), size=self.pool_size)
+        self._stack.push_async_callback(raw_pool.close)
+        await MigrationRunner(raw_pool, dialect=SQLITE).run()
+        self.pool = CountingPool(raw_pool, self.counter)
+
+        patches = self._stack.enter_context(ExitStack())
+        patches.enter_context(patch.object(database, "_POOL", self.pool))
+        patches.enter_context(patch.object(database, "_DIALECT", SQLITE))
+        patches.enter_context(patch.object(aiohttp, "ClientSession", functools.partial(
+            StubHTTPSession, router=self.router, counter=self.counter, latency=self.http_latency
+        )))
+        # Fresh profile cache, so earlier runs in the same process don't hide lookups
+        patches.enter_context(patch.object(member_profile_service, "_member_profile_service", None))
+        clear_daily_xp_cache()
+
+        log_channel = _ReplayLogChannel(self.counter, "activity-log", ACTIVITY_LOG_CHANNEL_ID)
+        self.bot = _ReplayBot(self.guild, {log_channel.id: log_channel})
+        self.bloxlink_bot = _ReplayMember("Bloxlink", BLOXLINK_BOT_ID, guild=self.guild, bot=True)
+        await self._load_cogs()
+        self._stack.push_async_callback(self._unload_cogs)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._stack.aclose()
+
+    async def _load_cogs(self) -> None:
+        from cogs.member_activity_log import MemberActivityLogCog
+        from cogs.process import ProcessCog
+        from cogs.rank import RankCog
+        from events.bloxlink_command_detector import BloxlinkCommandDetector
+        from events.gamification_handlers import GamificationHandlers
+        from events.role_sync_handler import RoleSyncHandler
+
+        for cog_class in (
+            MemberActivityLogCog, RankCog, RoleSyncHandler,
+            BloxlinkCommandDetector, GamificationHandlers, ProcessCog
+        ):
+            cog = cog_class(self.bot)
+            if hasattr(cog, "cog_load"):
+                await cog.cog_load()
+            self.cogs.append(cog)
+            self.bot._cogs[cog_class.__name__] = cog
+            for name, listener in cog.get_listeners():
+                label = f"{cog_class.__name__}.{listener.__name__}"
+                self.listeners.setdefault(name.removeprefix("on_"), []).append((label, listener))
+
+    async def _unload_cogs(self) -> None:
+        for cog in reversed(self.cogs):
+            result = cog.cog_unload()
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def seed(self, member_ids: Iterable[int]) -> None:
+        """
+        Create user rows, consent for a share of members and a company per rank.
+
+        Seeding queries (and anything else run so far) are not counted.
+        """
+        from repositories.consent_repository import ConsentRepository
+        from repositories.user_repository import UserRepository
+
+        users, consent = UserRepository(), ConsentRepository()
+        rank_cog = self.bot.get_cog("RankCog")
+        for company, rank in enumerate(RANK_ROLES, start=1):
+            await rank_cog._set_company_for_role(rank, company)
+        for member_id in sorted(set(member_ids)):
+            await users.create_if_missing(member_id)
+            if (member_id * 7919) % 100 < self.consent_ratio * 100:
+                await consent.give_consent(member_id)
+        self.counter.reset()
+        self.pool.reset_stats()
+
+    def _role(self, name: str) -> FakeRole:
+        role = self.roles.get(name)
+        if role is None:
+            role = self.roles[name] = FakeRole(name)
+        return role
+
+    def _member(self, member_id: int) -> _ReplayMember:
+        member = self.members.get(member_id)
+        if member is None:
+            member = _ReplayMember(f"member{member_id}", member_id, [self._role("@everyone")], self.guild)
+            self.members[member_id] = self.guild.members[member_id] = member
+        return member
+
+    def _voice_channel(self, name: Optional[str]) -> Optional[FakeVoiceChannel]:
+        if name is None:
+            return None
+        channel = self.voice_channels.get(name)
+        if channel is None:
+            channel = self.voice_channels[name] = FakeVoiceChannel(name, guild=self.guild)
+            self.guild.voice_channels.append(channel)
+        return channel
+
+    def _text_channel(self, name: str) -> FakeTextChannel:
+        channel = self.text_channels.get(name)
+        if channel is None:
+            channel = self.text_channels[name] = FakeTextChannel(name)
+        return channel
+
+    async def _build_event(self, record: Dict[str, Any]) -> Optional[Tuple[str, tuple]]:
+        """Apply a record to the fake guild and get the listener arguments"""
+        event_type = record["event"]
+        member = self._member(int(record["member"]))
+
+        if event_type == "member_join":
+            return event_type, (member,)
+
+        if event_type == "voice_state_update":
+            before = member.voice or FakeVoiceState()
+            channel = self._voice_channel(record.get("channel"))
+            if before.channel is not None and member in before.channel.members:
+                before.channel.members.remove(member)
+            if channel is not None:
+                channel.members.append(member)
+            member.voice = after = FakeVoiceState(channel, self_mute=bool(record.get("self_mute")))
+            return event_type, (member, before, after)
+
+        if event_type == "member_update":
+            before = member.with_roles(list(member.roles))
+            member.roles = [self._role(name) for name in record.get("roles", [])]
+            if "nick" in record:
+                member.nick = record["nick"]
+            return event_type, (before, member)
+
+        if event_type == "message":
+            channel = self._text_channel(record.get("channel", TEXT_CHANNELS[0]))
+            if record.get("bloxlink_reply"):
+                metadata = SimpleNamespace(user=member)
+                return event_type, (FakeMessage(self.bloxlink_bot, "", channel, self.guild, metadata),)
+            return event_type, (FakeMessage(member, record.get("content", ""), channel, self.guild),)
+
+        if event_type == "interaction":
+            channel = self._text_channel(record.get("channel", f"process-{member.id}"))
+            process_cog = self.bot.get_cog("ProcessCog")
+            if channel.name.startswith("process-") and channel.id not in process_cog.inactivity_scheduler:
+                await process_cog._track_process_channel(channel.id)
+            interaction = FakeInteraction(member, self.guild)
+            interaction.channel, interaction.channel_id = channel, channel.id
+            return event_type, (interaction,)
+
+        return None
+
+    async def replay(self, records: List[Dict[str, Any]], speed: float = 0.0) -> ReplayReport:
+        """
+        Dispatch every record to the listeners and wait for them to finish.
+
+        Args:
+            records: Stream ordered by "at"
+            speed: Playback speed (1.0 = recorded pace, 0 = as fast as possible)
+
+        Returns:
+            Replay report
+        """
+        await self.seed(int(record["member"]) for record in records)
+        set_current_event(BACKGROUND)
+
+        events: Dict[str, int] = {}
+        handler_ms: Dict[str, LatencyHistogram] = {}
+        handler_errors: Dict[str, int] = {}
+        pending: set = set()
+
+        async def run_listener(event_type: str, label: str, listener: Callable, args: tuple) -> None:
+            set_current_event(event_type)
+            started = time.perf_counter()
+            try:
+                await listener(*args)
+            except Exception:
+                handler_errors[label] = handler_errors.get(label, 0) + 1
+            finally:
+                key = f"{event_type} {label}"
+                histogram = handler_ms.get(key)
+                if histogram is None:
+                    histogram = handler_ms[key] = LatencyHistogram()
+                histogram.record((time.perf_counter() - started) * 1000)
+
+        monitor = LoopLagMonitor()
+        monitor.start()
+        started = time.perf_counter()
+        for record in records:
+            if speed > 0:
+                delay = started + record.get("at", 0.0) / speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(0)  # the gateway reader yields between frames
+
+            built = await self._build_event(record)
+            if built is None:
+                continue
+            event_type, args = built
+            events[event_type] = events.get(event_type, 0) + 1
+            for label, listener in self.listeners.get(event_type, ()):
+                task = asyncio.create_task(run_listener(event_type, label, listener, args))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        while pending:
+            await asyncio.gather(*list(pending))
+        await self._drain()
+        elapsed = time.perf_counter() - started
+        await monitor.stop()
+
+        return ReplayReport(
+            elapsed_seconds=elapsed,
+            events=events,
+            handler_ms=handler_ms,
+            handler_errors=handler_errors,
+            calls={event: dict(kinds) for event, kinds in self.counter.by_event.items()},
+            targets={kind: dict(targets) for kind, targets in self.counter.by_target.items()},
+            loop_lag_us=monitor.lag_us,
+            pool_size=self.pool.size,
+            pool_peak_in_use=self.pool.peak_in_use,
+            pool_acquire_wait_ms=self.pool.acquire_wait_ms,
+            discord_sends=sum(self.counter.by_target.get("discord", {}).values()),
+        )
+
+    async def _drain(self) -> None:
+        """Wait for queued Bloxlink lookups, then flush the buffered activity log"""
+        detector = self.bot.get_cog("BloxlinkCommandDetector")
+        deadline = time.monotonic() + DRAIN_TIMEOUT_SECONDS
+        while len(detector.work_queue) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        # The last dequeued member may still be resolving
+        await asyncio.sleep(self.http_latency * 4)
+        await self.bot.get_cog("MemberActivityLogCog").log_sink.flush()
+
+
+def format_report(report: ReplayReport) -> str:
+    """Render a report as plain-text tables"""
+    total_events = sum(report.events.values())
+    lines = [
+        f"Replayed {total_events} events in {report.elapsed_seconds:.2f}s "
+        f"({total_events / report.elapsed_seconds if report.elapsed_seconds else 0:,.0f} events/s)",
+        "",
+        f"{'event':<20} {'count':>7} {'db/ev':>7} {'http/ev':>8} {'discord/ev':>11}",
+        "-" * 57,
+    ]
+    for event_type in [*EVENT_TYPES, BACKGROUND]:
+        count = report.events.get(event_type, 0)
+        calls = report.calls.get(event_type, {})
+        if event_type == BACKGROUND:
+            lines.append(
+                f"{event_type:<20} {'-':>7} {calls.get('db', 0):>7} "
+                f"{calls.get('http', 0):>8} {calls.get('discord', 0):>11}   (totals)"
+            )
+        elif count:
+            lines.append(
+                f"{event_type:<20} {count:>7} {report.calls_per_event(event_type, 'db'):>7.2f} "
+                f"{report.calls_per_event(event_type, 'http'):>8.2f} {report.calls_per_event(event_type, 'discord'):>11.2f}"
+            )
+
+    width = max([len(key) for key in report.handler_ms] + [8])
+    lines += ["", f"{'handler':<{width}} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'errors':>7}", "-" * (width + 36)]
+    slowest_first = sorted(report.handler_ms.items(), key=lambda item: item[1].percentile(95), reverse=True)
+    for key, histogram in slowest_first:
+        summary = histogram.summary((50, 95))
+        errors = report.handler_errors.get(key.split(" ", 1)[1], 0)
+        lines.append(f"{key:<{width}} {summary['p50']:>8.1f} {summary['p95']:>8.1f} {summary['max']:>8.1f} {errors:>7}")
+
+    lag = {key: value / 1000 for key, value in report.loop_lag_us.summary((50, 95, 99)).items()}
+    wait = report.pool_acquire_wait_ms.summary((50, 95, 99))
+    lines += [
+        "",
+        f"Event loop lag: p50 {lag['p50']:.2f} ms, p95 {lag['p95']:.2f} ms, p99 {lag['p99']:.2f} ms, max {lag['max']:.2f} ms",
+        f"DB pool: {report.pool_peak_in_use}/{report.pool_size} connections at peak, "
+        f"acquire wait p95 {wait['p95']:.1f} ms, max {wait['max']:.1f} ms",
+    ]
+    for kind in ("db", "http", "discord"):
+        targets = report.targets.get(kind)
+        if targets:
+            top = ", ".join(f"{target} {count}" for target, count in sorted(targets.items(), key=lambda t: -t[1]))
+            lines.append(f"{kind.upper()} calls: {top}")
+    return "\n".join(lines)
+
+
+async def _run(args: argparse.Namespace) -> ReplayReport:
+    records = load_stream(args.input) if args.input else generate_stream(args.members, args.events, args.duration, args.seed)
+    async with ReplayEnvironment(http_latency=args.http_latency_ms / 1000, pool_size=args.pool_size) as env:
+        return await env.replay(records, speed=args.speed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay gateway events against the real cogs")
+    parser.add_argument("--input", type=Path, help="JSON lines stream to replay (default: synthetic stream)")
+    parser.add_argument("--generate", type=Path, help="write a synthetic stream to this file and exit")
+    parser.add_argument("--members", type=int, default=200, help="members in the synthetic stream")
+    parser.add_argument("--events", type=int, default=2000, help="records in the synthetic stream")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds the synthetic stream spans")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the synthetic stream")
+    parser.add_argument("--speed", type=float, default=0.0, help="playback speed (1 = recorded pace, 0 = flat out)")
+    parser.add_argument("--http-latency-ms", type=float, default=DEFAULT_HTTP_LATENCY_MS, help="stubbed upstream response time")
+    parser.add_argument("--pool-size", type=int, default=4, help="database connections")
+    args = parser.parse_args()
+
+    if args.generate:
+        count = save_stream(generate_stream(args.members, args.events, args.duration, args.seed), args.generate)
+        print(f"Wrote {count} events to {args.generate}")
+        return 0
+
+    # Per-event INFO logs would dominate the output
+    logging.disable(logging.INFO)
+    print(format_report(asyncio.run(_run(args))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+Benchmark scenarios for the bot's hot paths.
+
+Micro benchmarks cover pure functions (level and rank math); macro
+benchmarks drive real cogs and listeners end to end with fake Discord
+objects and in-memory repositories.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Awaitable, Callable, List
+from unittest.mock import patch
+
+from discord import app_commands
+
+from tests.benchmarks.fakes import FakeBot, FakeGuild, FakeInteraction, FakeMember, FakeRole, FakeVoiceChannel
+from tests.benchmarks.harness import BenchmarkRunner
+from tests.benchmarks.memory_repositories import (
+    InMemoryAuditRepository,
+    InMemoryCacheService,
+    InMemoryConsentRepository,
+    InMemoryUserRepository,
+    InMemoryXPRepository,
+)
+
+# Members in the voice channel for the /vc_log benchmarks
+VC_LOG_SIZES = (10, 50)
+
+
+async def bench_level_from_xp(runner: BenchmarkRunner) -> None:
+    """level_from_xp over a spread of XP totals"""
+    from services.level_service import level_from_xp
+
+    totals = itertools.cycle(range(0, 250_000, 997))
+    await runner.measure("micro.level_from_xp", lambda: level_from_xp(next(totals)), iterations=50_000, warmup=500)
+
+
+async def bench_rank_progress(runner: BenchmarkRunner) -> None:
+    """get_rank_progress across every rank of every path"""
+    from utils.rank_paths import ALL_PATHS, get_rank_progress
+
+    cases = itertools.cycle([
+        (requirement.exp_required - 1, requirement.current_rank, path_name)
+        for path_name, path in ALL_PATHS.items()
+        for requirement in path.ranks
+    ])
+
+    def operation():
+        return get_rank_progress(*next(cases))
+
+    await runner.measure("micro.get_rank_progress", operation, iterations=50_000, warmup=500)
+
+
+async def bench_xp_add(runner: BenchmarkRunner) -> None:
+    """XPService.add_xp throughput, with and without a daily limit"""
+    from services.xp_service import XPService, clear_daily_xp_cache
+
+    clear_daily_xp_cache()
+    service = XPService(xp_repo=InMemoryXPRepository())
+    user_ids = itertools.cycle(range(1, 5001))  # stays under the voice daily limit across rounds
+
+    await runner.measure(
+        "service.xp_add.voice_limited",
+        lambda: service.add_xp(next(user_ids), 5, "voice"),
+        iterations=20_000, warmup=200
+    )
+    await runner.measure(
+        "service.xp_add.unlimited",
+        lambda: service.add_xp(next(user_ids), 5, "event"),
+        iterations=20_000, warmup=200
+    )
+    clear_daily_xp_cache()
+
+
+async def bench_add_command(runner: BenchmarkRunner) -> None:
+    """/add end to end (defer, consent check, points update, embed)"""
+    from cogs import add as add_module
+
+    user_repo = InMemoryUserRepository()
+    staff = FakeMember("staff")
+    target = FakeMember("target")
+    consent_repo = InMemoryConsentRepository(consented=[target.id])
+    points_service = _points_service_factory(user_repo, consent_repo)
+
+    with patch.object(add_module, "PointsService", points_service):
+        cog = add_module.AddPointsCog(FakeBot())
+        callback = add_module.AddPointsCog.add.callback
+
+        def operation() -> Awaitable[None]:
+            return callback(cog, FakeInteraction(staff), target, 10, "benchmark")
+
+        await runner.measure("command.add", operation, iterations=2_000, warmup=50)
+
+
+async def bench_vc_log_command(runner: BenchmarkRunner) -> None:
+    """/vc_log end to end for a channel with N members"""
+    from cogs import vc_log as vc_log_module
+    from services.audit_service import AuditService
+    from services.user_service import UserService
+
+    for size in VC_LOG_SIZES:
+        user_repo = InMemoryUserRepository()
+        members = [FakeMember(f"member{i}") for i in range(size)]
+        consent_repo = InMemoryConsentRepository(consented=[m.id for m in members])
+        channel_name = vc_log_module.VOX_LINK_CHANNELS[0]
+        guild = FakeGuild([FakeVoiceChannel(channel_name, members)])
+        staff = FakeMember("staff", guild=guild)
+        choice = app_commands.Choice(name=channel_name, value=channel_name)
+
+        with ExitStack() as stack:
+            stack.enter_context(patch.object(
+                vc_log_module, "PointsService", _points_service_factory(user_repo, consent_repo)
+            ))
+            stack.enter_context(patch.object(
+                vc_log_module, "UserService",
+                functools.partial(UserService, user_repo=user_repo, cache_service=InMemoryCacheService())
+            ))
+            cog = vc_log_module.VCLogCog(FakeBot())
+            cog.audit_service = AuditService(audit_repo=InMemoryAuditRepository())
+            callback = vc_log_module.VCLogCog.vc_log.callback
+
+            def operation() -> Awaitable[None]:
+                return callback(cog, FakeInteraction(staff, guild), choice, 5, "benchmark")
+
+            await runner.measure(f"command.vc_log.{size}_members", operation, iterations=max(100, 5_000 // size), warmup=5)
+
+
+async def bench_member_update_burst(runner: BenchmarkRunner) -> None:
+    """
+    on_member_update through the role sync and Bloxlink listeners.
+
+    Mirrors a mass role toggle (e.g. a gamenight ping role handed to
+    everyone) mixed with Bloxlink re-verifies that swap rank roles the
+    database already agrees with.
+    """
+    from events.bloxlink_command_detector import BloxlinkCommandDetector
+    from events.role_sync_handler import RoleSyncHandler
+
+    bot = FakeBot()
+    role_sync = RoleSyncHandler(bot)
+    detector = BloxlinkCommandDetector(bot)
+    user_repo = InMemoryUserRepository()
+    role_sync.progression_service.user_repo = user_repo
+
+    guild = FakeGuild()
+    # Lowest two pre-induction ranks, present in both the config and the fallback map
+    old_rank, new_rank = FakeRole("Civitas Aspirant"), FakeRole("Emberbound Initiate")
+    everyone, verified, gamenight = FakeRole("@everyone"), FakeRole("Verified"), FakeRole("Gamenight")
+
+    events: List[tuple] = []
+    for i in range(500):
+        member = FakeMember(f"member{i}", roles=[everyone, verified, old_rank], guild=guild)
+        if i % 10 == 0:
+            await user_repo.update_rank(member.id, new_rank.name)
+            events.append((member, member.with_roles([everyone, verified, new_rank])))
+        else:
+            events.append((member, member.with_roles([everyone, verified, old_rank, gamenight])))
+    cycle = itertools.cycle(events)
+
+    async def operation() -> None:
+        before, after = next(cycle)
+        await role_sync.on_member_update(before, after)
+        await detector.on_member_update(before, after)
+
+    await runner.measure("event.member_update_burst", operation, iterations=20_000, warmup=200)
+
+
+async def bench_sqlite_repositories(runner: BenchmarkRunner) -> None:
+    """Real repositories on the SQLite backend (temporary WAL database file)"""
+    from repositories.user_repository import UserRepository
+    from repositories.xp_repository import XPRepository
+    from utils import database
+    from utils.db_dialect import SQLITE
+    from utils.migrator import MigrationRunner
+    from utils.sqlite_backend import create_sqlite_pool
+
+    if not any(runner.wants(name) for name in ("sqlite.user_get", "sqlite.xp_add")):
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = await create_sqlite_pool(str(Path(directory) / "bench.db"))
+        try:
+            await MigrationRunner(pool, dialect=SQLITE).run()
+            with patch.object(database, "_POOL", pool), patch.object(database, "_DIALECT", SQLITE):
+                users, xp = UserRepository(), XPRepository()
+                for user_id in range(1, 1001):
+                    await users.create_if_missing(user_id)
+                user_ids = itertools.cycle(range(1, 1001))
+
+                await runner.measure(
+                    "sqlite.user_get",
+                    lambda: users.get(next(user_ids), use_cache=False),
+                    iterations=5_000, warmup=100
+                )
+                await runner.measure(
+                    "sqlite.xp_add",
+                    lambda: xp.add_xp(next(user_ids), 5, "voice"),
+                    iterations=2_000, warmup=50
+                )
+        finally:
+            await pool.close()
+
+
+def _points_service_factory(user_repo: InMemoryUserRepository, consent_repo: InMemoryConsentRepository) -> Callable:
+    """PointsService(bot) replacement that injects in-memory repositories"""
+    from services.consent_service import ConsentService
+    from services.points_service import PointsService
+
+    consent_service = ConsentService(consent_repo=consent_repo)
+
+    def factory(bot):
+        return PointsService(bot, user_repo=user_repo, consent_service=consent_service)
+
+    return factory
+
+
+SCENARIOS: List[Callable[[BenchmarkRunner], Awaitable[None]]] = [
+    bench_level_from_xp,
+    bench_rank_progress,
+    bench_xp_add,
+    bench_add_command,
+    bench_vc_log_command,
+    bench_member_update_burst,
+    bench_sqlite_repositories,
+]
+
+
+async def run_all(runner: BenchmarkRunner) -> BenchmarkRunner:
+    """Run every scenario with the given runner"""
+    for scenario in SCENARIOS:
+        await scenario(runner)
+    return runner
@@ -0,0 +1,52 @@
+"""
+Unit tests for backup streaming
+
+Tests dump compression/checksums and streaming statement splitting.
+"""
+
+import gzip
+import sys
+import pytest
+from utils.backup import _dump_to_gzip, iter_sql_statements, verify_backup
+
+
+def test_dump_streams_to_gzip_with_checksum(tmp_path):
+    """Test command output is compressed to disk with a matching checksum sidecar"""
+    dest = tmp_path / "dump.sql.gz"
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.write('INSERT INTO t VALUES (1);\\n' * 50000)"]
+
+    checksum, raw_bytes = _dump_to_gzip(cmd, dest)
+
+    assert raw_bytes == len("INSERT INTO t VALUES (1);\n") * 50000
+    assert gzip.decompress(dest.read_bytes()).count(b"\n") == 50000
+    assert (tmp_path / "dump.sql.gz.sha256").read_text().startswith(checksum)
+    assert verify_backup(dest)
+    assert not (tmp_path / "dump.sql.gz.partial").exists()
+
+
+def test_failed_dump_leaves_no_file(tmp_path):
+    """Test a failing command raises and removes the partial output"""
+    dest = tmp_path / "dump.sql.gz"
+    cmd = [sys.executable, "-c", "import sys; print('partial'); sys.exit('access denied')"]
+
+    with pytest.raises(RuntimeError, match="access denied"):
+        _dump_to_gzip(cmd, dest)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_iter_sql_statements_splits_on_line_end():
+    """Test semicolons inside values don't split statements"""
+    dump = [
+        "-- MySQL dump\n",
+        "\n",
+        "CREATE TABLE t (\n",
+        "  id INT\n",
+        ");\n",
+        "INSERT INTO t VALUES (1,'a;b'),(2,'c');\n",
+    ]
+
+    assert list(iter_sql_statements(iter(dump))) == [
+        "CREATE TABLE t (\n  id INT\n)",
+        "INSERT INTO t VALUES (1,'a;b'),(2,'c')",
+    ]
@@ -0,0 +1,79 @@
+"""
+Smoke tests for the benchmark suite
+
+Runs every scenario with tiny iteration counts (no timing assertions),
+checks the fakes drive the real command paths and replays a short event
+stream through the real listeners.
+"""
+
+import pytest
+from unittest.mock import patch
+from cogs import add as add_module
+from tests.benchmarks.fakes import FakeBot, FakeInteraction, FakeMember
+from tests.benchmarks.harness import BenchmarkResult, BenchmarkRunner, find_regressions
+from tests.benchmarks.memory_repositories import InMemoryConsentRepository, InMemoryUserRepository
+from tests.benchmarks.replay import EVENT_TYPES, ReplayEnvironment, generate_stream, load_stream, save_stream
+from tests.benchmarks.scenarios import SCENARIOS, _points_service_factory, run_all
+
+
+@pytest.mark.asyncio
+async def test_all_scenarios_run():
+    """Test every scenario produces a result at a tiny scale"""
+    runner = await run_all(BenchmarkRunner(scale=0.001, rounds=1))
+
+    assert len(runner.results) >= len(SCENARIOS)
+    assert all(result.iterations >= 1 and result.ops_per_sec > 0 for result in runner.results)
+
+
+@pytest.mark.asyncio
+async def test_add_command_updates_points_and_dispatches():
+    """Test /add with fakes reaches the repository and dispatches points_changed"""
+    user_repo = InMemoryUserRepository()
+    target = FakeMember("target")
+    bot = FakeBot()
+    interaction = FakeInteraction(FakeMember("staff"))
+
+    with patch.object(add_module, "PointsService", _points_service_factory(user_repo, InMemoryConsentRepository([target.id]))):
+        await add_module.AddPointsCog.add.callback(add_module.AddPointsCog(bot), interaction, target, 10, "test")
+
+    assert user_repo.users[target.id]["points"] == 10
+    assert bot.dispatched == ["points_changed"]
+    assert interaction.followup.sent
+
+
+def test_find_regressions_uses_tolerance():
+    """Test only slowdowns beyond the tolerance are reported"""
+    baseline = {"op": {"ops_per_sec": 1000.0, "p50_ms": 1.0, "p95_ms": 1.0}}
+
+    def result(ops_per_sec, p95_ms):
+        return BenchmarkResult("op", 100, 0.1, ops_per_sec, 1.0, p95_ms, p95_ms)
+
+    assert find_regressions([result(900.0, 1.1)], baseline, tolerance=0.25) == []
+    assert len(find_regressions([result(500.0, 2.0)], baseline, tolerance=0.25)) == 2
+    assert find_regressions([BenchmarkResult("new", 1, 1.0, 1.0, 1.0, 1.0, 1.0)], baseline) == []
+
+
+def test_generated_stream_round_trips(tmp_path):
+    """Test streams are deterministic, time ordered and survive a save/load"""
+    records = generate_stream(members=20, events=200, seed=3)
+
+    assert records == generate_stream(members=20, events=200, seed=3)
+    assert [r["at"] for r in records] == sorted(r["at"] for r in records)
+    assert {r["event"] for r in records} == set(EVENT_TYPES)
+    save_stream(records, tmp_path / "events.jsonl")
+    assert load_stream(tmp_path / "events.jsonl") == records
+
+
+@pytest.mark.asyncio
+async def test_replay_counts_calls_per_event_type():
+    """Test a replay reaches every listener and attributes DB, HTTP and Discord calls"""
+    async with ReplayEnvironment(http_latency=0) as env:
+        report = await env.replay(generate_stream(members=20, events=200, seed=3))
+
+    assert sum(report.events.values()) >= 200
+    assert not report.handler_errors
+    assert report.calls_per_event("message", "db") > 0
+    assert report.calls_per_event("member_join", "http") > 0
+    assert report.calls["member_update"]["discord"] > 0  # nickname edits
+    assert any(key.startswith("interaction ProcessCog") for key in report.handler_ms)
+    assert 0 < report.pool_peak_in_use <= report.pool_size
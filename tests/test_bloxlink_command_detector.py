@@ -0,0 +1,83 @@
+"""
+Unit tests for BloxlinkCommandDetector gating
+
+Tests that only rank-relevant, Bloxlink-like role changes are queued.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import ANY, MagicMock
+from events.bloxlink_command_detector import BloxlinkCommandDetector, BLOXLINK_BOT_ID
+
+
+class FakeRole:
+    """Hashable stand-in for discord.Role"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+GAMENIGHT = FakeRole("Gamenight")
+LEGIONARY = FakeRole("Legionary")
+INDUCTII = FakeRole("Inductii")
+
+
+def member(roles, nick=None, member_id=1):
+    """Minimal member snapshot"""
+    return SimpleNamespace(id=member_id, roles=roles, nick=nick, guild=SimpleNamespace(id=10))
+
+
+@pytest.fixture
+def detector():
+    """Detector with a mocked work queue"""
+    cog = BloxlinkCommandDetector(MagicMock())
+    cog.work_queue = MagicMock()
+    return cog
+
+
+@pytest.mark.asyncio
+async def test_unrelated_role_change_is_ignored(detector):
+    """Test non-rank roles never reach the queue"""
+    await detector.on_member_update(member([INDUCTII]), member([INDUCTII, GAMENIGHT], nick="changed"))
+
+    detector.work_queue.put.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rank_swap_is_queued(detector):
+    """Test an atomic rank role swap is treated as a Bloxlink update"""
+    after = member([LEGIONARY])
+    await detector.on_member_update(member([INDUCTII]), after)
+
+    detector.work_queue.put.assert_called_once_with(1, (ANY, after))
+
+
+@pytest.mark.asyncio
+async def test_single_rank_change_waits_for_bloxlink_reply(detector):
+    """Test a lone rank change is only queued once a Bloxlink reply for the member arrives"""
+    after = member([INDUCTII, LEGIONARY])
+    await detector.on_member_update(member([INDUCTII]), after)
+    detector.work_queue.put.assert_not_called()
+
+    reply = SimpleNamespace(
+        author=SimpleNamespace(id=BLOXLINK_BOT_ID),
+        interaction_metadata=SimpleNamespace(user=SimpleNamespace(id=1))
+    )
+    await detector.on_message(reply)
+
+    detector.work_queue.put.assert_called_once_with(1, (ANY, after))
+
+
+@pytest.mark.asyncio
+async def test_reply_without_interaction_metadata_uses_interaction(detector):
+    """Test Bloxlink replies are matched on discord.py 2.3 (no interaction_metadata)"""
+    after = member([INDUCTII, LEGIONARY])
+    await detector.on_member_update(member([INDUCTII]), after)
+
+    reply = SimpleNamespace(
+        author=SimpleNamespace(id=BLOXLINK_BOT_ID),
+        interaction=SimpleNamespace(user=SimpleNamespace(id=1))
+    )
+    await detector.on_message(reply)
+
+    detector.work_queue.put.assert_called_once_with(1, (ANY, after))
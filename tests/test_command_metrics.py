@@ -0,0 +1,139 @@
+"""
+Unit tests for command latency telemetry
+
+Tests histogram precision, rolling windows, per-command attribution and the
+command tree hooks.
+"""
+
+import asyncio
+import discord
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from discord import app_commands
+from discord.ext import commands
+from yarl import URL
+from utils.command_metrics import (
+    CommandTelemetry,
+    InstrumentedCommandTree,
+    _qualified_name,
+    current_sample,
+    install_app_command_hooks,
+    interaction_ack_trace_config,
+    track_db_time,
+)
+from utils.health_check import HealthCheck
+from utils.histogram import LatencyHistogram, RollingHistogram
+
+
+def test_histogram_percentiles_within_bucket_precision():
+    """Test percentiles land within one sub-bucket of the exact value"""
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(float(value))
+
+    assert histogram.count == 1000
+    assert histogram.max == 1000
+    assert 500 <= histogram.percentile(50) <= 500 * 1.125
+    assert 990 <= histogram.percentile(99) <= 1000
+    assert histogram.count_above(2000) == 0
+    assert histogram.count_above(800) > 0
+
+
+def test_rolling_histogram_expires_old_slots():
+    """Test samples older than the window are not reported"""
+    rolling = RollingHistogram(window_seconds=60, slots=6)
+    rolling.record(100, now=5)
+    rolling.record(200, now=35)
+
+    assert rolling.snapshot(now=40).count == 2
+    assert rolling.snapshot(now=65).count == 1
+    assert rolling.snapshot(now=200).count == 0
+
+
+@pytest.mark.asyncio
+async def test_telemetry_attributes_db_time_and_reports_in_health(monkeypatch):
+    """Test DB time inside a command is attributed to it and shows in /health"""
+    telemetry = CommandTelemetry()
+    monkeypatch.setattr("utils.health_check.get_command_telemetry", lambda: telemetry)
+
+    async def run_command():
+        sample = telemetry.start("rank set", user_id=1, created_at=0)
+        assert current_sample() is sample
+        with track_db_time():
+            await asyncio.sleep(0.01)
+        sample.ack_ms = 2500
+        telemetry.finish(sample)
+        return sample
+
+    sample = await asyncio.create_task(run_command())
+
+    assert sample.db_ms >= 10
+    assert current_sample() is None
+    stats = telemetry.command_summaries()["rank set"]
+    assert stats["calls"] == 1
+    assert stats["near_deadline"] == 1
+
+    result = await HealthCheck().check_command_latency()
+    assert result["status"] == "warning"
+    assert result["slowest"][0]["command"] == "rank set"
+    assert _qualified_name({"name": "rank", "options": [{"type": 1, "name": "set", "options": []}]}) == "rank set"
+
+
+@pytest.fixture
+def instrumented_bot(monkeypatch):
+    """Bot with the instrumented tree and a fresh telemetry instance"""
+    telemetry = CommandTelemetry()
+    monkeypatch.setattr("utils.command_metrics.get_command_telemetry", lambda: telemetry)
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), tree_cls=InstrumentedCommandTree)
+    install_app_command_hooks(bot)
+    return bot, telemetry
+
+
+def _interaction(interaction_id=1):
+    return SimpleNamespace(
+        id=interaction_id,
+        type=discord.InteractionType.application_command,
+        data={"name": "stats"},
+        user=SimpleNamespace(id=7),
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_tree_times_commands_through_public_hooks(instrumented_bot):
+    """Test interaction_check starts a sample, the ack trace fills it and completion finishes it"""
+    bot, telemetry = instrumented_bot
+    interaction = _interaction()
+
+    assert await bot.tree.interaction_check(interaction) is True
+    params = SimpleNamespace(
+        url=URL("https://discord.com/api/v10/interactions/1/token/callback"),
+        response=SimpleNamespace(status=204)
+    )
+    await interaction_ack_trace_config().on_request_end[0](None, SimpleNamespace(), params)
+    assert current_sample().ack_ms is not None
+
+    for listener in bot.extra_events["on_app_command_completion"]:
+        await listener(interaction, None)
+
+    stats = telemetry.command_summaries()["stats"]
+    assert (stats["calls"], stats["errors"], stats["ack"]["count"]) == (1, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_registered_error_handler_still_records_failure(instrumented_bot):
+    """Test a handler set with @tree.error runs and the command is counted as failed"""
+    bot, telemetry = instrumented_bot
+    handled = []
+
+    @bot.tree.error
+    async def on_app_command_error(interaction, error):
+        handled.append(error)
+
+    interaction = _interaction(2)
+    await bot.tree.interaction_check(interaction)
+    await bot.tree.on_error(interaction, app_commands.AppCommandError("boom"))
+
+    assert len(handled) == 1
+    assert telemetry.command_summaries()["stats"]["errors"] == 1
@@ -0,0 +1,86 @@
+"""
+Unit tests for CommandSyncService
+
+Tests command tree fingerprints and fingerprint-gated sync with a mocked
+state repository.
+"""
+
+import discord
+import pytest
+from discord import app_commands
+from unittest.mock import AsyncMock
+from services.command_sync_service import CommandSyncService, tree_fingerprint
+
+
+def make_tree(*names, choices=("a", "b")):
+    """Command tree with one command per name"""
+    client = discord.Client(intents=discord.Intents.none())
+    tree = app_commands.CommandTree(client)
+    for name in names:
+        async def callback(interaction: discord.Interaction, value: str):
+            pass
+        command = app_commands.Command(name=name, description=f"{name} command", callback=callback)
+        command = app_commands.choices(value=[app_commands.Choice(name=c, value=c) for c in choices])(command)
+        tree.add_command(command)
+    return tree
+
+
+def test_fingerprint_ignores_order_and_tracks_choices():
+    """Test the hash is order-independent but changes with options/choices"""
+    assert tree_fingerprint(make_tree("rank", "help")) == tree_fingerprint(make_tree("help", "rank"))
+    assert tree_fingerprint(make_tree("rank")) != tree_fingerprint(make_tree("rank", choices=("a", "c")))
+    assert tree_fingerprint(make_tree("rank")) != tree_fingerprint(make_tree("rank", "help"))
+
+
+def test_fingerprint_supports_to_dict_without_tree():
+    """Test commands whose to_dict() takes no tree (discord.py 2.3) hash like the 2.4+ ones"""
+    class LegacyCommand(app_commands.Command):
+        def to_dict(self):
+            return super().to_dict(tree)
+
+    async def callback(interaction: discord.Interaction):
+        pass
+
+    tree = make_tree()
+    tree.add_command(app_commands.Command(name="help", description="help command", callback=callback))
+    expected = tree_fingerprint(tree)
+
+    tree = make_tree()
+    tree.add_command(LegacyCommand(name="help", description="help command", callback=callback))
+    assert tree_fingerprint(tree) == expected
+
+
+@pytest.mark.asyncio
+async def test_sync_skipped_when_fingerprint_matches():
+    """Test unchanged trees skip tree.sync unless forced"""
+    tree = make_tree("rank")
+    tree.sync = AsyncMock(return_value=["rank"])
+    state_repo = AsyncMock()
+    state_repo.get.return_value = {"hash": tree_fingerprint(tree), "application_id": tree.client.application_id}
+    service = CommandSyncService(state_repo=state_repo)
+
+    assert await service.sync(tree) is None
+    tree.sync.assert_not_awaited()
+
+    assert await service.sync(tree, force=True) == ["rank"]
+    tree.sync.assert_awaited_once_with(guild=None)
+    stored = state_repo.set.await_args.args
+    assert stored[0] == "command_sync:global"
+    assert stored[1]["hash"] == tree_fingerprint(tree)
+
+
+@pytest.mark.asyncio
+async def test_sync_runs_when_tree_changed_or_state_unreadable():
+    """Test a changed tree or unreadable state triggers a sync"""
+    tree = make_tree("rank")
+    tree.sync = AsyncMock(return_value=["rank"])
+    state_repo = AsyncMock()
+    state_repo.get.return_value = {"hash": "stale", "application_id": None}
+    service = CommandSyncService(state_repo=state_repo)
+
+    assert await service.sync(tree, guild=discord.Object(id=42)) == ["rank"]
+    assert state_repo.set.await_args.args[0] == "command_sync:guild:42"
+
+    state_repo.get.side_effect = RuntimeError("db down")
+    assert await service.sync(tree) == ["rank"]
+    assert tree.sync.await_count == 2
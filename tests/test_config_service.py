@@ -0,0 +1,97 @@
+"""
+Unit tests for ConfigService
+
+Tests snapshot publishing, atomic writes and live reload using a temp config file.
+"""
+
+import json
+import os
+import pytest
+import services.config_service as config_module
+from services.config_service import ConfigService
+
+
+CONFIG = {
+    "role_to_rank_mapping": {"Legionaries": {"Legionary": "Ashborn Legionary"}},
+    "role_priority": {"order": ["Inductii", "Legionary"]},
+}
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Temp config file used by new ConfigService instances"""
+    path = tmp_path / "roles_ranks.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    monkeypatch.setattr(config_module, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_module, "ROLES_RANKS_CONFIG", path)
+    return path
+
+
+def test_snapshot_is_precompiled_and_read_only(config_file):
+    """Test lookups come from frozen, precomputed structures"""
+    snapshot = ConfigService().snapshot
+
+    assert snapshot.version == 1
+    assert snapshot.role_to_rank["Legionary"] == "Ashborn Legionary"
+    assert snapshot.tracked_roles == frozenset({"Legionary"})
+    assert snapshot.priority_index == {"Inductii": 0, "Legionary": 1}
+    with pytest.raises(TypeError):
+        snapshot.role_to_rank["Inductii"] = "Inductii"
+
+
+@pytest.mark.asyncio
+async def test_add_mapping_writes_atomically_and_bumps_version(config_file):
+    """Test edits swap in a new snapshot and persist without leftovers"""
+    service = ConfigService()
+    old_snapshot = service.snapshot
+
+    assert await service.add_role_mapping("Inductii", "Inductii", "Legionaries") is True
+
+    assert service.version == 2
+    assert "Inductii" in service.snapshot.tracked_roles
+    assert "Inductii" not in old_snapshot.tracked_roles
+    saved = json.loads(config_file.read_text(encoding="utf-8"))
+    assert saved["role_to_rank_mapping"]["Legionaries"]["Inductii"] == "Inductii"
+    assert [p.name for p in config_file.parent.iterdir()] == ["roles_ranks.json"]
+
+
+@pytest.mark.asyncio
+async def test_external_edit_is_reloaded(config_file):
+    """Test mtime polling picks up edits made outside the bot"""
+    service = ConfigService()
+    assert await service.reload_if_changed() is False
+
+    edited = dict(CONFIG, role_to_rank_mapping={"Mortals": {"Civitas Aspirant": "Civitas Aspirant"}})
+    config_file.write_text(json.dumps(edited), encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert await service.reload_if_changed() is True
+    assert service.version == 2
+    assert service.snapshot.tracked_roles == frozenset({"Civitas Aspirant"})
+
+
+@pytest.mark.asyncio
+async def test_rank_cog_reads_live_snapshot(config_file, monkeypatch):
+    """Test RankCog sees mapping edits without a restart"""
+    from types import SimpleNamespace
+    from cogs.rank import RankCog
+
+    service = ConfigService()
+    monkeypatch.setattr(config_module, "_config_service", service)
+    cog = RankCog(bot=None)
+    member = SimpleNamespace(roles=[SimpleNamespace(name="Legionary"), SimpleNamespace(name="Inductii")])
+
+    assert cog._find_top_rank(member) == "Legionary"
+
+    edited = {
+        "role_to_rank_mapping": {"Legionaries": {"Legionary": "Ashborn Legionary", "Inductii": "Inductii"}},
+        "role_priority": {"order": ["Legionary", "Inductii"]},
+    }
+    config_file.write_text(json.dumps(edited), encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert await service.reload_if_changed() is True
+
+    assert cog._find_top_rank(member) == "Inductii"
+    assert "Inductii" in cog.tracked_roles
@@ -0,0 +1,96 @@
+"""
+Unit tests for DataErasureService and ErasureRepository
+
+Tests chunked transactional deletes and cache purging with mocked dependencies.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from repositories.erasure_repository import ErasureRepository
+from services import data_erasure_service
+from services.data_erasure_service import DataErasureService, USER_ERASURE_TABLES
+from services.data_export_service import USER_EXPORT_SECTIONS
+
+
+class FakeCursor:
+    """Cursor returning scripted rowcounts per statement"""
+
+    def __init__(self, rowcounts):
+        self.rowcounts = list(rowcounts)
+        self.rowcount = 0
+        self.statements = []
+
+    async def execute(self, query, params=None):
+        self.statements.append(query)
+        self.rowcount = self.rowcounts.pop(0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_repo(cursor):
+    """ErasureRepository over a fake connection"""
+    conn = MagicMock()
+    conn.begin = AsyncMock()
+    conn.commit = AsyncMock()
+    conn.rollback = AsyncMock()
+    conn.cursor = MagicMock(return_value=cursor)
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    repo = ErasureRepository()
+    repo._pool = MagicMock()
+    repo._pool.acquire = MagicMock(return_value=acquire)
+    return repo, conn
+
+
+@pytest.mark.asyncio
+async def test_delete_user_rows_chunks_each_table_in_one_transaction():
+    """Test each table is deleted until a short chunk, then committed once"""
+    cursor = FakeCursor([2, 2, 1, 0])
+    repo, conn = make_repo(cursor)
+
+    counts = await repo.delete_user_rows(1, [("xp_events", "user_id"), ("users", "user_id")], chunk_size=2)
+
+    assert counts == {"xp_events": 5, "users": 0}
+    assert len(cursor.statements) == 4
+    conn.begin.assert_awaited_once()
+    conn.commit.assert_awaited_once()
+    conn.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_user_rows_rolls_back_on_error():
+    """Test a failing statement rolls back the whole deletion"""
+    cursor = FakeCursor([])
+    repo, conn = make_repo(cursor)
+
+    with pytest.raises(IndexError):
+        await repo.delete_user_rows(1, [("users", "user_id")])
+
+    conn.rollback.assert_awaited_once()
+    conn.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_erase_user_purges_caches(monkeypatch):
+    """Test erasure covers every exported table and clears cached user data"""
+    assert {table for _, table, _ in USER_EXPORT_SECTIONS} <= {table for table, _ in USER_ERASURE_TABLES}
+    assert USER_ERASURE_TABLES[-1][0] == "users"
+
+    profile_service = MagicMock()
+    monkeypatch.setattr(data_erasure_service, "get_member_profile_service", lambda: profile_service)
+    forget_known = MagicMock()
+    monkeypatch.setattr(data_erasure_service, "forget_known_user", forget_known)
+    repo = MagicMock()
+    repo.delete_user_rows = AsyncMock(return_value={"users": 1})
+
+    counts = await DataErasureService(repo).erase_user(42)
+
+    assert counts == {"users": 1}
+    repo.delete_user_rows.assert_awaited_once_with(42, USER_ERASURE_TABLES, 1000)
+    forget_known.assert_called_once_with(42)
+    profile_service.invalidate.assert_called_once_with(42)
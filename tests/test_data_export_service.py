@@ -0,0 +1,68 @@
+"""
+Unit tests for DataExportService
+
+Tests streamed JSON output and attachment size handling with a fake repository.
+"""
+
+import gzip
+import json
+import pytest
+from datetime import datetime
+from services.data_export_service import DataExportService, USER_EXPORT_SECTIONS
+
+
+class FakeExportRepository:
+    """Export repository yielding canned rows in batches"""
+
+    def __init__(self, rows_by_table):
+        self.rows_by_table = rows_by_table
+        self.batch_sizes = []
+
+    async def stream_user_rows(self, table, order_column, user_id, batch_size=500):
+        rows = self.rows_by_table.get(table, [])
+        for i in range(0, len(rows), batch_size):
+            self.batch_sizes.append(len(rows[i:i + batch_size]))
+            yield rows[i:i + batch_size]
+
+
+@pytest.mark.asyncio
+async def test_export_streams_every_section_into_valid_json():
+    """Test all user-scoped tables are exported in full as one JSON document"""
+    events = [{"event_id": i, "xp_amount": 5, "timestamp": datetime(2024, 1, 1)} for i in range(7)]
+    repo = FakeExportRepository({
+        "users": [{"user_id": 1, "points": 10}],
+        "xp_events": events,
+    })
+    service = DataExportService(repo, batch_size=3)
+
+    path, counts = await service.export_user_data(1, {"user_id": "1"}, "export.json")
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    finally:
+        service.cleanup(path)
+
+    assert list(data) == ["user_id"] + [section for section, _, _ in USER_EXPORT_SECTIONS]
+    assert data["user_data"] == [{"user_id": 1, "points": 10}]
+    assert [row["event_id"] for row in data["xp_events"]] == list(range(7))
+    assert data["xp_events"][0]["timestamp"] == "2024-01-01 00:00:00"
+    assert data["audit_history"] == []
+    assert counts["xp_events"] == 7
+    assert repo.batch_sizes == [1, 3, 3, 1]
+    assert not path.parent.exists()
+
+
+@pytest.mark.asyncio
+async def test_oversized_export_is_compressed_and_split():
+    """Test exports over the size limit become gzip parts that reassemble"""
+    events = [{"event_id": i, "reason": f"noise-{i * 7919 % 100003}"} for i in range(3000)]
+    service = DataExportService(FakeExportRepository({"xp_events": events}))
+    path, _ = await service.export_user_data(1, {}, "export.json")
+    original = path.read_bytes()
+
+    try:
+        attachments = await service.prepare_attachments(path, 8 * 1024)
+        assert len(attachments) > 1
+        assert all(part.stat().st_size <= 8 * 1024 for part in attachments)
+        assert gzip.decompress(b"".join(part.read_bytes() for part in attachments)) == original
+    finally:
+        service.cleanup(path)
@@ -0,0 +1,68 @@
+"""
+Unit tests for DeadlineScheduler
+
+Tests expiry ordering, extension and cancellation.
+"""
+
+import asyncio
+import pytest
+from utils.deadline_scheduler import DeadlineScheduler
+
+
+@pytest.fixture
+def fired():
+    """List collecting expired keys"""
+    return []
+
+
+@pytest.fixture
+def scheduler(fired):
+    """Running scheduler that records expiries"""
+    async def on_expire(key):
+        fired.append(key)
+
+    sched = DeadlineScheduler(on_expire, name="test")
+    yield sched
+    sched.stop()
+
+
+@pytest.mark.asyncio
+async def test_fires_in_deadline_order(scheduler, fired):
+    """Test keys expire in deadline order, not insertion order"""
+    scheduler.start()
+    scheduler.schedule(1, 0.06)
+    scheduler.schedule(2, 0.02)
+
+    await asyncio.sleep(0.1)
+
+    assert fired == [2, 1]
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_extend_postpones_expiry(scheduler, fired):
+    """Test rescheduling to a later deadline delays expiry"""
+    scheduler.start()
+    scheduler.schedule(1, 0.03)
+    await asyncio.sleep(0.02)
+    scheduler.schedule(1, 0.05)
+
+    await asyncio.sleep(0.03)
+    assert fired == []
+    assert 1 in scheduler
+
+    await asyncio.sleep(0.05)
+    assert fired == [1]
+
+
+@pytest.mark.asyncio
+async def test_cancel_prevents_expiry(scheduler, fired):
+    """Test cancelled keys never fire"""
+    scheduler.start()
+    scheduler.schedule(1, 0.02)
+
+    assert scheduler.cancel(1) is True
+    await asyncio.sleep(0.05)
+
+    assert fired == []
+    assert scheduler.cancel(1) is False
@@ -0,0 +1,86 @@
+"""
+Unit tests for SalamandersEventPanel state
+
+Tests restoring a persisted active event and the order of state saves with
+a mocked bot and an in-memory state repository.
+"""
+
+import asyncio
+import discord
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from cogs.event_buttons import EVENT_PANEL_STATE_KEY, SalamandersEventPanel
+
+
+class MemoryStateRepository:
+    """State repository keeping the last value per key; writes can be slowed down"""
+
+    def __init__(self, delays=()):
+        self.values = {}
+        self.delays = list(delays)
+
+    async def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    async def set(self, key, value):
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        self.values[key] = value
+
+
+ACTIVE_EVENT = {"event_message_id": 1, "end_message_id": 2, "host_user_id": 3, "event_title": "Drill"}
+
+
+@pytest.fixture
+def panel():
+    """Panel cog with a persisted active event"""
+    bot = MagicMock()
+    bot.get_channel.return_value = None
+    bot.fetch_user = AsyncMock(return_value=SimpleNamespace(id=3))
+    cog = SalamandersEventPanel(bot)
+    cog.state_repo = MemoryStateRepository()
+    cog.state_repo.values[EVENT_PANEL_STATE_KEY] = {"panel_message_id": 9, "active_event": dict(ACTIVE_EVENT)}
+    return cog
+
+
+def not_found():
+    return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+
+
+@pytest.mark.asyncio
+async def test_deleted_end_message_clears_active_event(panel):
+    """Test an active event whose End message is gone is cleared and saved on restore"""
+    await panel.cog_load()
+    channel = SimpleNamespace(fetch_message=AsyncMock(side_effect=not_found()))
+
+    await panel._restore_end_view(channel)
+
+    assert not panel.is_event_active()
+    assert panel.state_repo.values[EVENT_PANEL_STATE_KEY] == {"panel_message_id": 9, "active_event": None}
+    panel.bot.add_view.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_existing_end_message_is_re_registered(panel):
+    """Test a live End message keeps the event active and gets its button back"""
+    await panel.cog_load()
+    channel = SimpleNamespace(fetch_message=AsyncMock(return_value=MagicMock()))
+
+    await panel._restore_end_view(channel)
+
+    assert panel.is_event_active()
+    panel.bot.add_view.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_set_then_clear_is_saved_in_order(panel):
+    """Test a slow first save can't overwrite a later clear"""
+    panel.state_repo.delays = [0.03, 0]
+
+    await asyncio.gather(
+        panel.set_active_event(1, 2, SimpleNamespace(id=3), "Drill"),
+        panel.clear_active_event(),
+    )
+
+    assert panel.state_repo.values[EVENT_PANEL_STATE_KEY]["active_event"] is None
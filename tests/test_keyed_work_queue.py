@@ -0,0 +1,30 @@
+"""
+Unit tests for KeyedWorkQueue
+
+Tests per-key deduplication and ordering.
+"""
+
+import asyncio
+import pytest
+from utils.keyed_work_queue import KeyedWorkQueue
+
+
+@pytest.mark.asyncio
+async def test_pending_key_keeps_latest_payload():
+    """Test re-queuing a pending key processes it once with the newest payload"""
+    processed = []
+
+    async def handler(key, payload):
+        processed.append((key, payload))
+
+    queue = KeyedWorkQueue(handler, name="test")
+    assert queue.put(1, "a") is True
+    assert queue.put(2, "b") is True
+    assert queue.put(1, "c") is False
+
+    queue.start()
+    await asyncio.sleep(0.01)
+    queue.stop()
+
+    assert processed == [(1, "c"), (2, "b")]
+    assert len(queue) == 0
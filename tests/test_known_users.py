@@ -0,0 +1,48 @@
+"""
+Unit tests for known-users tracking
+
+Tests that ensure_user_exists skips the database for known users.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+import utils.database as database
+
+
+@pytest.fixture(autouse=True)
+def known_users(monkeypatch):
+    """Start each test with a loaded known-users set"""
+    monkeypatch.setattr(database, "_KNOWN_USERS", {1})
+    return database
+
+
+@pytest.mark.asyncio
+async def test_known_user_skips_database():
+    """Test known users don't hit the repository"""
+    with patch("repositories.user_repository.UserRepository.create_if_missing", new=AsyncMock()) as create:
+        await database.ensure_user_exists(1)
+
+    create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_new_user_is_created_once():
+    """Test a new user is inserted and then remembered"""
+    async def create_if_missing(self, user_id):
+        database.mark_user_known(user_id)
+        return False
+
+    with patch("repositories.user_repository.UserRepository.create_if_missing", new=create_if_missing):
+        await database.ensure_user_exists(2)
+    assert 2 in database._KNOWN_USERS
+
+    with patch("repositories.user_repository.UserRepository.create_if_missing", new=AsyncMock()) as create:
+        await database.ensure_user_exists(2)
+    create.assert_not_called()
+
+
+def test_forget_known_user():
+    """Test deleted users are dropped from the set"""
+    database.forget_known_user(1)
+
+    assert 1 not in database._KNOWN_USERS
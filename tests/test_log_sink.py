@@ -0,0 +1,105 @@
+"""
+Unit tests for BufferedLogSink
+
+Tests batching, digest folding and overflow handling with a mocked channel.
+"""
+
+import asyncio
+import discord
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from utils.log_sink import BufferedLogSink
+
+
+@pytest.fixture
+def channel():
+    """Mock log channel"""
+    channel = MagicMock()
+    channel.send = AsyncMock()
+    return channel
+
+
+@pytest.fixture
+def sink(channel):
+    """Sink with a short window"""
+    async def get_channel():
+        return channel
+
+    return BufferedLogSink(get_channel, window=0.02, max_pending=30)
+
+
+@pytest.mark.asyncio
+async def test_small_batch_sends_full_embeds_in_one_message(sink, channel):
+    """Test a few events are sent together as full embeds after the window"""
+    for i in range(3):
+        sink.add(discord.Embed(title=f"event {i}"), f"line {i}")
+
+    channel.send.assert_not_called()
+    await asyncio.sleep(0.05)
+
+    channel.send.assert_called_once()
+    embeds = channel.send.call_args.kwargs["embeds"]
+    assert [embed.title for embed in embeds] == ["event 0", "event 1", "event 2"]
+
+
+@pytest.mark.asyncio
+async def test_burst_is_folded_into_digest(sink, channel):
+    """Test bursts become digest embeds while line-less embeds stay full"""
+    for i in range(25):
+        sink.add(discord.Embed(title=f"voice {i}"), f"line {i}")
+    sink.add(discord.Embed(title="profile"))
+
+    await sink.close()
+
+    channel.send.assert_called_once()
+    embeds = channel.send.call_args.kwargs["embeds"]
+    assert [embed.title for embed in embeds] == ["profile", "Activity Digest"]
+    assert embeds[1].description.count("\n") == 24
+
+
+@pytest.mark.asyncio
+async def test_overflow_is_dropped_and_reported(sink, channel):
+    """Test events beyond max_pending are counted in the digest"""
+    for i in range(35):
+        sink.add(discord.Embed(title=f"voice {i}"), f"line {i}")
+
+    assert len(sink) == 30
+    await sink.close()
+
+    digest = channel.send.call_args.kwargs["embeds"][-1]
+    assert "5 event(s) dropped" in digest.description
+    assert len(sink) == 0
+
+
+def _profile_embed(i):
+    """Full profile-style embed with fields (never folded into the digest)"""
+    embed = discord.Embed(title=f"Member joined {i}", description="x" * 1500)
+    for name in ("Account", "Roblox", "Rank", "Company"):
+        embed.add_field(name=name, value="y" * 200)
+    return embed
+
+
+@pytest.mark.asyncio
+async def test_large_burst_stays_within_message_limits(channel):
+    """Test a burst of hundreds of events packs into messages Discord accepts"""
+    async def get_channel():
+        return channel
+
+    sink = BufferedLogSink(get_channel, window=60, max_pending=1000)
+    for i in range(600):
+        sink.add(
+            discord.Embed(title=f"voice {i}"),
+            f"<t:1767225600:T> 🎤 <@{100000000000000000 + i}> joined 🔊 <#{200000000000000000 + i}>"
+        )
+    for i in range(12):
+        sink.add(_profile_embed(i))
+
+    await sink.close()
+
+    messages = [call.kwargs["embeds"] for call in channel.send.call_args_list]
+    for embeds in messages:
+        assert len(embeds) <= 10
+        assert sum(len(embed) for embed in embeds) <= 6000
+    digests = [embed for embeds in messages for embed in embeds if embed.title.startswith("Activity Digest")]
+    assert sum(embed.description.count("\n") + 1 for embed in digests) == 600
+    assert sum(1 for embeds in messages for embed in embeds if embed.title.startswith("Member joined")) == 12
@@ -0,0 +1,148 @@
+"""
+Unit tests for MemberProfileService
+
+Tests single-flight lookups, memoization and deadline handling with mocked services.
+"""
+
+import asyncio
+import pytest
+import time
+from unittest.mock import AsyncMock, MagicMock
+from services.member_profile_service import TIMED_OUT_PROFILE, MemberProfileService
+
+
+@pytest.fixture
+def bloxlink_service():
+    """Mock Bloxlink service"""
+    service = MagicMock()
+    service.get_roblox_link = AsyncMock(return_value={"robloxId": 42, "verifiedAt": None})
+    service.get_roblox_username = AsyncMock(return_value="Vulkan")
+    return service
+
+
+@pytest.fixture
+def groups_service():
+    """Mock Roblox groups service"""
+    service = MagicMock()
+    service.get_user_rank_in_group = AsyncMock(return_value={"rank": 5, "role": "Battle-Brother"})
+    return service
+
+
+@pytest.fixture
+def profile_service(bloxlink_service, groups_service):
+    """Service with mocked upstreams"""
+    return MemberProfileService(bloxlink_service=bloxlink_service, groups_service=groups_service)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_lookup(profile_service, bloxlink_service):
+    """Test simultaneous and later calls reuse a single upstream lookup"""
+    first, second = await asyncio.gather(
+        profile_service.get_profile(1, 10),
+        profile_service.get_profile(1, 10),
+    )
+    third = await profile_service.get_profile(1, 10)
+
+    assert first["username"] == second["username"] == third["username"] == "Vulkan"
+    assert first["partial"] is False
+    bloxlink_service.get_roblox_link.assert_called_once()
+    bloxlink_service.get_roblox_username.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_rank_request_reuses_cached_link(profile_service, bloxlink_service, groups_service):
+    """Test asking for the rank later only fetches the rank"""
+    await profile_service.get_profile(1, 10)
+    profile = await profile_service.get_profile(1, 10, include_rank=True)
+
+    assert profile["rank_info"]["rank"] == 5
+    bloxlink_service.get_roblox_link.assert_called_once()
+    groups_service.get_user_rank_in_group.assert_called_once_with(42, 6340169)
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_partial_and_fills_cache(profile_service, bloxlink_service):
+    """Test a slow username lookup yields partial data, then the full profile is cached"""
+    async def slow_username(roblox_id):
+        await asyncio.sleep(0.05)
+        return "Vulkan"
+
+    bloxlink_service.get_roblox_username = AsyncMock(side_effect=slow_username)
+
+    partial = await profile_service.get_profile(1, 10, deadline=0.01)
+    assert partial["partial"] is True
+    assert partial["username"] == "User_42"
+
+    await asyncio.sleep(0.06)
+    full = await profile_service.get_profile(1, 10, deadline=0)
+    assert full["username"] == "Vulkan"
+    bloxlink_service.get_roblox_link.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_missing_link_is_not_cached(profile_service, bloxlink_service):
+    """Test a None link (not verified or Bloxlink error) is looked up again next time"""
+    bloxlink_service.get_roblox_link = AsyncMock(side_effect=[None, {"robloxId": 42, "verifiedAt": None}])
+
+    assert await profile_service.get_profile(1, 10) is None
+    profile = await profile_service.get_profile(1, 10)
+
+    assert profile["id"] == 42
+    assert bloxlink_service.get_roblox_link.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_min_fetched_at_refetches_once_for_all_handlers(profile_service, bloxlink_service, groups_service):
+    """Test data older than a role change is refetched once, then shared by later handlers"""
+    await profile_service.get_profile(1, 10, include_rank=True)
+    changed_at = time.monotonic()
+    groups_service.get_user_rank_in_group = AsyncMock(return_value={"rank": 6, "role": "Sergeant"})
+
+    detector, role_sync = await asyncio.gather(
+        profile_service.get_profile(1, 10, include_rank=True, min_fetched_at=changed_at),
+        profile_service.get_profile(1, 10, include_rank=True, min_fetched_at=changed_at),
+    )
+    later = await profile_service.get_profile(1, 10, include_rank=True, min_fetched_at=changed_at)
+
+    assert detector["rank_info"]["rank"] == role_sync["rank_info"]["rank"] == later["rank_info"]["rank"] == 6
+    assert bloxlink_service.get_roblox_link.call_count == 2
+    groups_service.get_user_rank_in_group.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_deadline_before_link_is_reported_as_timed_out(profile_service, bloxlink_service):
+    """Test a slow link lookup is not mistaken for "not verified" """
+    async def slow_link(discord_id, guild_id):
+        await asyncio.sleep(0.05)
+        return {"robloxId": 42, "verifiedAt": None}
+
+    bloxlink_service.get_roblox_link = AsyncMock(side_effect=slow_link)
+
+    result = await profile_service.get_profile(1, 10, deadline=0.01)
+
+    assert result == TIMED_OUT_PROFILE
+    await asyncio.sleep(0.06)
+
+
+@pytest.mark.asyncio
+async def test_finished_lookup_keeps_partial_of_newer_one(profile_service, bloxlink_service):
+    """Test an older lookup finishing doesn't drop a newer lookup's partial data"""
+    release, never = asyncio.Event(), asyncio.Event()
+    gates = [release, never]
+
+    async def username(roblox_id):
+        await gates.pop(0).wait()
+        return "Vulkan"
+
+    bloxlink_service.get_roblox_username = AsyncMock(side_effect=username)
+    older = asyncio.create_task(profile_service.get_profile(1, 10))
+    await asyncio.sleep(0.01)
+    newer = asyncio.create_task(profile_service.get_profile(1, 10, deadline=0.05, min_fetched_at=time.monotonic()))
+    await asyncio.sleep(0.01)
+
+    release.set()
+    await older
+    partial = await newer
+    never.set()
+
+    assert partial["partial"] is True and partial["id"] == 42
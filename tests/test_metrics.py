@@ -0,0 +1,52 @@
+"""
+Unit tests for the metrics registry and local metrics endpoint
+
+Tests text exposition output and the aiohttp /metrics route.
+"""
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from utils.metrics import MetricsRegistry
+from utils.metrics_server import MetricsServer
+
+
+def test_registry_renders_exposition_format():
+    """Test counters, function gauges and histograms render as Prometheus text"""
+    registry = MetricsRegistry()
+    commands = registry.counter("ignis_commands_total", "Commands run", ("command", "status"))
+    commands.inc(command="rank", status="ok")
+    commands.inc(2, command="rank", status="ok")
+    registry.gauge("ignis_pool_free", "Idle connections").set_function(lambda: 4)
+    latency = registry.histogram("ignis_query_seconds", "Query time", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(7)
+
+    text = registry.render()
+
+    assert "# TYPE ignis_commands_total counter" in text
+    assert 'ignis_commands_total{command="rank",status="ok"} 3' in text
+    assert "ignis_pool_free 4" in text
+    assert 'ignis_query_seconds_bucket{le="0.1"} 1' in text
+    assert 'ignis_query_seconds_bucket{le="1"} 2' in text
+    assert 'ignis_query_seconds_bucket{le="+Inf"} 3' in text
+    assert "ignis_query_seconds_count 3" in text
+    assert registry.counter("ignis_commands_total", "Commands run", ("command", "status")) is commands
+    with pytest.raises(ValueError):
+        commands.inc(command="rank")
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_registry():
+    """Test GET /metrics returns the registry in text format"""
+    registry = MetricsRegistry()
+    registry.counter("ignis_test_total", "Test counter").inc()
+    server = MetricsServer("127.0.0.1", 0, registry=registry)
+
+    async with TestClient(TestServer(server.build_app())) as client:
+        response = await client.get("/metrics")
+        body = await response.text()
+
+    assert response.status == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert "ignis_test_total 1" in body
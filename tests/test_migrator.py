@@ -0,0 +1,108 @@
+"""
+Unit tests for the schema migration runner
+
+Tests statement splitting, file loading and the apply/skip paths with a fake
+connection.
+"""
+
+import pymysql
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from utils.migrator import MigrationError, MigrationRunner, load_migrations, split_statements
+
+
+class FakeCursor:
+    """Cursor with a scripted schema_migrations table"""
+
+    def __init__(self, applied=None, fail_with=None):
+        self.applied = applied  # None = table missing
+        self.fail_with = fail_with or {}
+        self.statements = []
+        self._result = []
+
+    async def execute(self, query, params=None):
+        self.statements.append(" ".join(query.split()))
+        if query.startswith("SELECT version, checksum"):
+            if self.applied is None:
+                raise pymysql.err.ProgrammingError(1146, "Table 'schema_migrations' doesn't exist")
+            self._result = list(self.applied.items())
+        elif query.startswith("SELECT GET_LOCK") or query.startswith("SELECT RELEASE_LOCK"):
+            self._result = [(1,)]
+        elif "CREATE TABLE IF NOT EXISTS schema_migrations" in query:
+            self.applied = self.applied or {}
+        elif query.startswith("INSERT INTO schema_migrations"):
+            self.applied[params[0]] = params[2]
+        for fragment, code in self.fail_with.items():
+            if fragment in query:
+                raise pymysql.err.OperationalError(code, "already exists")
+
+    async def fetchall(self):
+        return self._result
+
+    async def fetchone(self):
+        return self._result[0] if self._result else None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_runner(cursor, directory):
+    conn = MagicMock()
+    conn.cursor = MagicMock(return_value=cursor)
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=acquire)
+    return MigrationRunner(pool, directory)
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    (tmp_path / "001_base.sql").write_text(
+        "-- base; tables\nCREATE TABLE a (id INT);\n/* note; */ INSERT INTO a VALUES (1);\n"
+    )
+    (tmp_path / "002_index.sql").write_text("CREATE INDEX idx_id ON a(id);")
+    (tmp_path / "legacy_manual.sql").write_text("DROP TABLE a;")
+    return tmp_path
+
+
+def test_split_statements_ignores_comments_and_quoted_semicolons():
+    """Test semicolons only split at top level"""
+    sql = "-- header; comment\nINSERT INTO t VALUES ('a;b', \"c;\\\"d\");\n# hash;\nSELECT 1 /* x; */;\n"
+
+    assert split_statements(sql) == ["INSERT INTO t VALUES ('a;b', \"c;\\\"d\")", "SELECT 1"]
+
+
+@pytest.mark.asyncio
+async def test_fresh_database_applies_all_under_lock(migrations_dir):
+    """Test pending migrations run in order between GET_LOCK and RELEASE_LOCK and are recorded"""
+    cursor = FakeCursor(applied=None, fail_with={"CREATE INDEX idx_id": 1061})
+    runner = make_runner(cursor, migrations_dir)
+
+    applied = await runner.run()
+
+    assert applied == [1, 2]
+    assert [m.version for m in load_migrations(migrations_dir)] == [1, 2]
+    assert cursor.statements[1].startswith("SELECT GET_LOCK")
+    assert cursor.statements[-1].startswith("SELECT RELEASE_LOCK")
+    assert "CREATE TABLE a (id INT)" in cursor.statements
+    assert not any("DROP TABLE" in s for s in cursor.statements)
+    assert set(cursor.applied) == {1, 2}
+
+
+@pytest.mark.asyncio
+async def test_current_database_does_one_select(migrations_dir):
+    """Test a current schema costs a single SELECT and an edited migration is rejected"""
+    current = {m.version: m.checksum for m in load_migrations(migrations_dir)}
+    cursor = FakeCursor(applied=dict(current))
+
+    assert await make_runner(cursor, migrations_dir).run() == []
+    assert len(cursor.statements) == 1
+
+    (migrations_dir / "001_base.sql").write_text("CREATE TABLE a (id BIGINT);")
+    with pytest.raises(MigrationError):
+        await make_runner(FakeCursor(applied=dict(current)), migrations_dir).run()
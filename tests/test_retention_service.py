@@ -0,0 +1,98 @@
+"""
+Unit tests for RetentionService
+
+Tests chunked deletion and monthly partition management with a mocked repository.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from services.retention_service import (
+    RetentionPolicy,
+    RetentionService,
+    expired_partitions,
+    missing_partitions,
+)
+from utils.metrics import get_metrics_registry
+
+
+@pytest.fixture
+def repo():
+    """Mock retention repository for a non-partitioned table"""
+    repo = MagicMock()
+    repo.get_partition_names = AsyncMock(return_value=[])
+    repo.delete_expired_chunk = AsyncMock()
+    repo.drop_partitions = AsyncMock()
+    repo.split_max_partition = AsyncMock()
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_in_chunks_until_short_chunk(repo):
+    """Test chunks are deleted until one comes back short"""
+    repo.delete_expired_chunk.side_effect = [100, 100, 42]
+    service = RetentionService(repo, chunk_size=100, chunk_pause=0)
+    policy = RetentionPolicy("data_audit_log", "timestamp", "id", 180)
+
+    results = await service.run((policy,))
+
+    assert results == {"data_audit_log": 242}
+    assert repo.delete_expired_chunk.await_count == 3
+    assert service.stats["data_audit_log"]["chunks"] == 3
+    assert service.stats["data_audit_log"]["running"] is False
+    repo.drop_partitions.assert_not_awaited()
+
+
+def test_partition_selection():
+    """Test only fully expired months are dropped and upcoming months are added"""
+    names = ["p202401", "p202402", "p202403", "pmax"]
+
+    assert expired_partitions(names, datetime(2024, 3, 15)) == ["p202401", "p202402"]
+    assert expired_partitions(names, datetime(2024, 2, 29, 23)) == ["p202401"]
+
+    missing = missing_partitions(names, datetime(2024, 3, 10), ahead=2)
+    assert missing == [("p202404", datetime(2024, 5, 1)), ("p202405", datetime(2024, 6, 1))]
+
+
+@pytest.mark.asyncio
+async def test_partitioned_table_drops_and_creates_partitions(repo):
+    """Test partitioned tables expire whole months before the chunked delete"""
+    repo.get_partition_names.return_value = ["p202312", "p202401", "pmax"]
+    repo.delete_expired_chunk.return_value = 0
+    service = RetentionService(repo, chunk_size=100, chunk_pause=0)
+    policy = RetentionPolicy("xp_events", "timestamp", "event_id", 30, partition_function="UNIX_TIMESTAMP")
+
+    await service.purge_table(policy, now=datetime(2024, 2, 15))
+
+    repo.drop_partitions.assert_awaited_once_with("xp_events", ["p202312"])
+    created = [call.args[1] for call in repo.split_max_partition.await_args_list]
+    assert created == ["p202402", "p202403", "p202404"]
+    assert repo.split_max_partition.await_args_list[0].args[2] == "UNIX_TIMESTAMP('2024-03-01 00:00:00')"
+
+
+@pytest.mark.asyncio
+async def test_purge_results_are_exported_as_metrics(repo):
+    """Test rows, chunks, last success and failures reach the metrics registry"""
+    registry = get_metrics_registry()
+    rows = registry.counter("ignis_retention_rows_deleted_total", "", ("table",))
+    chunks = registry.counter("ignis_retention_chunks_total", "", ("table",))
+    errors = registry.counter("ignis_retention_errors_total", "", ("table",))
+    failed = registry.gauge("ignis_retention_last_run_failed", "", ("table",))
+    success = registry.gauge("ignis_retention_last_success_timestamp_seconds", "", ("table",))
+    before = rows.get(table="metrics_test"), chunks.get(table="metrics_test"), errors.get(table="metrics_test")
+    repo.delete_expired_chunk.side_effect = [100, 7, RuntimeError("lock wait timeout")]
+    service = RetentionService(repo, chunk_size=100, chunk_pause=0)
+    policy = RetentionPolicy("metrics_test", "timestamp", "id", 30)
+
+    await service.run((policy,))
+
+    assert rows.get(table="metrics_test") - before[0] == 107
+    assert chunks.get(table="metrics_test") - before[1] == 2
+    assert failed.get(table="metrics_test") == 0
+    assert success.get(table="metrics_test") > 0
+
+    await service.run((policy,))
+
+    assert errors.get(table="metrics_test") - before[2] == 1
+    assert failed.get(table="metrics_test") == 1
+    assert service.stats["metrics_test"]["last_error"] == "lock wait timeout"
@@ -0,0 +1,107 @@
+"""
+Unit tests for roadmap parser
+
+Tests that parsed documents are cached per file until that file changes.
+"""
+
+import os
+import pytest
+from utils import roadmap_parser
+
+
+CHANGELOG = """# Changelog
+
+## [Unreleased]
+
+### Update (2025-01-11)
+
+#### Added
+- Voice XP batching
+- Deadline scheduler
+"""
+
+
+ROADMAP = """# Roadmap
+
+## Próximos Passos
+- Cursor-based leaderboard pagination
+"""
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    """Point the parser at a temporary roadmap and CHANGELOG"""
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(CHANGELOG, encoding="utf-8")
+    roadmap = tmp_path / "ROADMAP.md"
+    roadmap.write_text(ROADMAP, encoding="utf-8")
+    missing = tmp_path / "missing.md"
+    monkeypatch.setattr(roadmap_parser, "ROADMAP_SOURCE_FILES", (roadmap, missing, changelog, missing))
+    monkeypatch.setattr(roadmap_parser, "CHANGELOG_FILE", changelog)
+    roadmap_parser.clear_roadmap_cache()
+    yield changelog
+    roadmap_parser.clear_roadmap_cache()
+
+
+def test_unchanged_files_are_not_reparsed(docs, monkeypatch):
+    """Test repeated calls reuse cached data without reading files"""
+    first = roadmap_parser.get_latest_roadmap_data()
+    assert first["title"] == "IgnisBot Development Update - 2025-01-11"
+    assert "Voice XP batching" in first["features"]
+
+    def fail_read(path):
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(roadmap_parser, "read_documentation_file", fail_read)
+    second = roadmap_parser.get_latest_roadmap_data()
+
+    assert second == first
+    assert second is not first
+
+
+def test_changed_file_is_reparsed(docs):
+    """Test a modified file invalidates the cached data"""
+    first = roadmap_parser.get_latest_roadmap_data()
+
+    docs.write_text(CHANGELOG.replace("- Voice XP", "- Cursor pagination\n- Voice XP"), encoding="utf-8")
+    stat = docs.stat()
+    os.utime(docs, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = roadmap_parser.get_latest_roadmap_data()
+
+    assert "Cursor pagination" in second["features"]
+    assert second["content_hash"] != first["content_hash"]
+
+
+def test_only_the_changed_file_is_reparsed(docs, monkeypatch):
+    """Test editing one document re-reads that document only"""
+    roadmap_parser.get_latest_roadmap_data()
+    read = roadmap_parser.read_documentation_file
+    reads = []
+
+    def tracking_read(path):
+        reads.append(path.name)
+        return read(path)
+
+    monkeypatch.setattr(roadmap_parser, "read_documentation_file", tracking_read)
+    docs.write_text(CHANGELOG.replace("- Voice XP", "- Retention metrics\n- Voice XP"), encoding="utf-8")
+    stat = docs.stat()
+    os.utime(docs, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    data = roadmap_parser.get_latest_roadmap_data()
+
+    assert "Retention metrics" in data["features"]
+    assert "Cursor-based leaderboard pagination" in data["upcoming"]
+    assert sorted(set(reads)) == ["CHANGELOG.md", "missing.md"]
+
+
+def test_returned_data_does_not_alias_the_cache(docs):
+    """Test callers modifying the result don't change later results"""
+    first = roadmap_parser.get_latest_roadmap_data()
+    first["features"].append("Injected")
+    first["file_times"].clear()
+
+    second = roadmap_parser.get_latest_roadmap_data()
+
+    assert "Injected" not in second["features"]
+    assert second["file_times"]
@@ -0,0 +1,67 @@
+"""
+Unit tests for RobloxAuthClient
+
+Tests the per-cookie CSRF token cache against a scripted session.
+"""
+
+import pytest
+from services.roblox_auth_client import CSRF_HEADER, RobloxAuthClient
+
+
+class _Response:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+    async def text(self):
+        return ""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class _ScriptedSession:
+    """Answers requests from a list of (status, CSRF token or None); records sent tokens"""
+
+    closed = False
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.sent_tokens = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent_tokens.append(headers.get(CSRF_HEADER))
+        status, token = self.script.pop(0)
+        return _Response(status, {CSRF_HEADER: token} if token else {})
+
+
+@pytest.mark.asyncio
+async def test_csrf_token_is_cached_and_refreshed_on_challenge():
+    """Test one retry to learn a token, then single round trips until it rotates"""
+    client = RobloxAuthClient()
+    client._session = _ScriptedSession([
+        (403, "t1"), (200, None),  # first write learns the token
+        (200, None),               # cached token: one round trip
+        (403, "t2"), (200, None),  # rotated token: one retry
+    ])
+    url = "https://groups.roblox.com/v1/groups/1/users/2"
+
+    for _ in range(3):
+        assert (await client.request("PATCH", url, "cookie", group_id=1, json={"roleId": 3})).status == 200
+
+    assert client._session.sent_tokens == [None, "t1", "t1", "t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_forbidden_without_new_token_is_not_retried():
+    """Test a 403 that doesn't hand out a new token is returned as is"""
+    client = RobloxAuthClient()
+    client._session = _ScriptedSession([(403, "t1"), (403, "t1")])
+
+    response = await client.request("POST", "https://groups.roblox.com/v1/groups/1/join-requests/users/2", "cookie")
+
+    assert response.status == 403
+    assert client._session.sent_tokens == [None, "t1"]
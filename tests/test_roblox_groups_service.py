@@ -0,0 +1,77 @@
+"""
+Unit tests for RobloxGroupsService join-request checks
+
+Runs against a stubbed Roblox API: cursor pagination with early exit, the
+single-user endpoint, and the shared in-memory requester index.
+"""
+
+import functools
+import pytest
+from urllib.parse import urlsplit
+from services import roblox_groups_service as groups_module
+from services.roblox_groups_service import RobloxGroupsService
+from tests.benchmarks.instrumentation import CallCounter, StubHTTPSession
+
+GROUP_ID = 6340169
+
+
+def _router(pages, single_user_status=404):
+    """Serve join-request pages (lists of user IDs) chained by cursors; record the requests"""
+    calls = []
+
+    def route(method, url, params):
+        path = urlsplit(url).path
+        calls.append((path, dict(params or {})))
+        if "/join-requests/users/" in path:
+            if single_user_status != 200:
+                return single_user_status, None
+            user_id = int(path.rsplit("/", 1)[1])
+            pending = any(user_id in page for page in pages)
+            return 200, {"requester": {"userId": user_id}} if pending else None
+        index = int((params or {}).get("cursor", 0))
+        return 200, {
+            "data": [{"requester": {"userId": user_id}} for user_id in pages[index]],
+            "nextPageCursor": str(index + 1) if index + 1 < len(pages) else None,
+        }
+
+    return route, calls
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Patch aiohttp sessions with a stub serving the given pages"""
+    def install(pages, single_user_status=404):
+        route, calls = _router(pages, single_user_status)
+        session = functools.partial(StubHTTPSession, router=route, counter=CallCounter())
+        monkeypatch.setattr(groups_module.aiohttp, "ClientSession", session)
+        return calls
+    return install
+
+
+@pytest.mark.asyncio
+async def test_scan_follows_cursor_and_stops_at_user(stub_api):
+    """Test a requester on page two is found without reading page three"""
+    calls = stub_api([[1, 2], [3, 4], [5]])
+    service = RobloxGroupsService()
+    service._refresh_join_request_index = lambda *args: None
+
+    result = await service.check_pending_request(GROUP_ID, 4, roblox_cookie="cookie")
+
+    assert result["has_request"] is True
+    scanned = [params.get("cursor") for path, params in calls if path.endswith("/join-requests")]
+    assert scanned == [None, "1"]
+
+
+@pytest.mark.asyncio
+async def test_index_serves_repeat_checks_from_memory(stub_api):
+    """Test a background refresh indexes every page and later hits skip the API"""
+    calls = stub_api([[1, 2], [3]], single_user_status=200)
+    service = RobloxGroupsService()
+
+    assert (await service.check_pending_request(GROUP_ID, 9, roblox_cookie="cookie"))["has_request"] is False
+    await service._refresh_join_request_index(GROUP_ID, "cookie")
+    assert service._join_request_index[GROUP_ID][1] == {1, 2, 3}
+
+    calls.clear()
+    assert (await service.check_pending_request(GROUP_ID, 3, roblox_cookie="cookie"))["has_request"] is True
+    assert calls == []
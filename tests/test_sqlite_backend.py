@@ -0,0 +1,181 @@
+"""
+Unit tests for the SQLite storage backend
+
+Runs the SQLite migrations and the real repositories against a temporary
+database file, and checks the dialect rendering for both backends.
+"""
+
+import pytest
+from utils import database
+from utils.db_dialect import MYSQL, SQLITE, Dialect, get_dialect_by_name
+from utils.migrator import SQLITE_MIGRATIONS_DIR, MigrationRunner
+from utils.sqlite_backend import create_sqlite_pool, translate_query
+from repositories.audit_repository import AuditRepository
+from repositories.consent_repository import ConsentRepository
+from repositories.erasure_repository import ErasureRepository
+from repositories.export_repository import ExportRepository
+from repositories.state_repository import StateRepository
+from repositories.user_repository import UserRepository
+from repositories.xp_repository import XPRepository
+
+
+@pytest.fixture
+async def sqlite_pool(tmp_path, monkeypatch):
+    """Migrated SQLite pool set as the active backend"""
+    pool = await create_sqlite_pool(str(tmp_path / "ignis.db"), size=2)
+    monkeypatch.setattr(database, "_POOL", pool)
+    monkeypatch.setattr(database, "_DIALECT", SQLITE)
+    assert await MigrationRunner(pool, dialect=SQLITE).run() == [1, 2, 3, 4, 5, 6, 7]
+    yield pool
+    await pool.close()
+
+
+def test_dialect_rendering():
+    """Test upserts, INSERT IGNORE and bounded deletes per backend"""
+    assert MYSQL.upsert_clause(["k"], {"n": f"n + {MYSQL.excluded('n')}"}) == "ON DUPLICATE KEY UPDATE n = n + VALUES(n)"
+    assert SQLITE.upsert_clause(["k"], {"n": f"n + {SQLITE.excluded('n')}"}) == "ON CONFLICT (k) DO UPDATE SET n = n + excluded.n"
+    assert MYSQL.delete_limited("t", "`c` = %s") == "DELETE FROM `t` WHERE `c` = %s LIMIT %s"
+    assert "rowid IN (SELECT rowid FROM `t` WHERE `c` = %s LIMIT %s)" in SQLITE.delete_limited("t", "`c` = %s")
+    assert translate_query("SELECT * FROM t WHERE a = %s AND b LIKE 'x%%'") == "SELECT * FROM t WHERE a = ? AND b LIKE 'x%'"
+    with pytest.raises(ValueError):
+        get_dialect_by_name("postgres")
+
+    class PartialDialect(Dialect):
+        def excluded(self, column):
+            return column
+
+    with pytest.raises(TypeError):
+        PartialDialect()
+
+
+@pytest.mark.asyncio
+async def test_migrations_are_recorded_once(sqlite_pool):
+    """Test a second run is a no-op and every migration is marked applied"""
+    runner = MigrationRunner(sqlite_pool, dialect=SQLITE)
+
+    assert await runner.run() == []
+    assert all(row["applied"] and row["checksum_ok"] for row in await runner.status())
+
+
+@pytest.mark.asyncio
+async def test_repositories_round_trip(sqlite_pool):
+    """Test user, consent, XP, audit and state repositories on SQLite"""
+    users, consent, xp = UserRepository(), ConsentRepository(), XPRepository()
+
+    assert await users.create_if_missing(1) is True
+    assert await users.create_if_missing(1) is False
+    await users.create(2)
+    assert await users.update_points(1, 15) == 15
+    assert (await users.get(1, use_cache=False))["points"] == 15
+
+    await consent.give_consent(1, version="1.0")
+    await consent.give_consent(1, version="2.0")
+    assert (await consent.get(1))["consent_version"] == "2.0"
+    assert await consent.get_consented_users([1, 2]) == {1}
+    assert await consent.revoke_consent(1) is True
+    assert not await consent.has_consent(1)
+
+    assert await xp.add_xp(1, 10, "voice") == 10
+    assert await xp.add_xp(1, 5, "voice") == 15
+    assert await xp.add_xp_batch({1: 5, 2: 7}, "voice") == {1: 20, 2: 7}
+    await xp.update_daily_xp_limit(1, "voice", 10)
+    assert await xp.get_daily_xp_limits([1, 2], "voice") == {1: 15, 2: 7}
+
+    audit = AuditRepository()
+    await audit.create(1, "UPDATE", "points", performed_by=9, details={"delta": 15})
+    assert (await audit.get_history(1))[0]["details"] == {"delta": 15}
+
+    state = StateRepository()
+    await state.set("panel", {"id": 1})
+    await state.set("panel", {"id": 2})
+    assert await state.get("panel") == {"id": 2}
+
+    counts = await ErasureRepository().delete_user_rows(1, [("xp_events", "user_id")], chunk_size=1)
+    assert counts == {"xp_events": 3}
+
+
+@pytest.mark.asyncio
+async def test_typed_details_round_trip(sqlite_pool):
+    """Test common details go to typed columns and history rebuilds the dict"""
+    users, xp, audit = UserRepository(), XPRepository(), AuditRepository()
+    await users.create(1)
+
+    await xp.add_xp(1, 5, "message", {"channel_id": 10, "channel_name": "general", "guild_id": 20, "message_length": 42})
+    await xp.add_xp_batch({1: 5}, "voice", {1: {"channel_id": 11, "minutes_spent": 5, "mood": "calm"}})
+    await audit.create(1, "UPDATE", "points", details={"before": 0, "after": 15, "delta": 15, "reason": "event"})
+
+    stored = await xp.execute_query(
+        "SELECT channel_id, guild_id, minutes, message_length, details FROM xp_events ORDER BY event_id",
+        fetch_all=True
+    )
+    assert [tuple(row) for row in stored] == [(10, 20, None, 42, None), (11, None, 5, None, '{"mood": "calm"}')]
+
+    history = sorted(await xp.get_xp_history(1), key=lambda row: row["event_id"])
+    assert [row["source"] for row in history] == ["message", "voice"]
+    assert history[0]["details"] == {"channel_id": 10, "guild_id": 20, "message_length": 42}
+    assert history[1]["details"] == {"channel_id": 11, "minutes_spent": 5, "mood": "calm"}
+
+    record = (await audit.get_history(1))[0]
+    assert (record["action_type"], record["data_type"]) == ("UPDATE", "points")
+    assert record["details"] == {"before": 0, "after": 15, "delta": 15, "reason": "event"}
+
+
+@pytest.mark.asyncio
+async def test_export_resolves_label_names(sqlite_pool):
+    """Test exported XP and audit rows carry source/action/data type strings, not label IDs"""
+    users, xp, audit = UserRepository(), XPRepository(), AuditRepository()
+    await users.create(1)
+    await xp.add_xp(1, 5, "message", {"channel_id": 10})
+    await xp.add_xp(1, 7, "voice")
+    await audit.create(1, "UPDATE", "points", details={"delta": 12})
+
+    export = ExportRepository()
+    events = [row async for rows in export.stream_user_rows("xp_events", "event_id", 1) for row in rows]
+    records = [row async for rows in export.stream_user_rows("data_audit_log", "id", 1) for row in rows]
+
+    assert [(row["source"], row["xp_amount"], row["channel_id"]) for row in events] == [("message", 5, 10), ("voice", 7, None)]
+    assert "source_id" not in events[0]
+    assert (records[0]["action_type"], records[0]["data_type"], records[0]["delta"]) == ("UPDATE", "points", 12)
+    assert "action_id" not in records[0] and "data_type_id" not in records[0]
+
+
+@pytest.mark.asyncio
+async def test_compact_payload_migration_backfills(tmp_path):
+    """Test migrations 005-007 move strings to labels and details to typed columns"""
+    directory = tmp_path / "migrations"
+    directory.mkdir()
+    for path in sorted(SQLITE_MIGRATIONS_DIR.glob("*.sql")):
+        if path.name < "005_":
+            (directory / path.name).write_bytes(path.read_bytes())
+
+    pool = await create_sqlite_pool(str(tmp_path / "legacy.db"), size=1)
+    try:
+        assert await MigrationRunner(pool, directory=directory, dialect=SQLITE).run() == [1, 2, 3, 4]
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("INSERT INTO users (user_id) VALUES (1)")
+                await cursor.execute(
+                    "INSERT INTO xp_events (user_id, xp_amount, source, details) VALUES (%s, %s, %s, %s)",
+                    (1, 5, "voice", '{"channel_id": 11, "channel_name": "vc", "minutes_spent": 5}')
+                )
+                await cursor.execute(
+                    "INSERT INTO data_audit_log (user_id, action_type, data_type, details) VALUES (%s, %s, %s, %s)",
+                    (1, "UPDATE", "points", '{"before": 1, "after": 3, "delta": 2, "reason": "x"}')
+                )
+            await conn.commit()
+
+        assert await MigrationRunner(pool, dialect=SQLITE).run() == [5, 6, 7]
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    "SELECT l.name, e.channel_id, e.minutes, e.details "
+                    "FROM xp_events e JOIN event_labels l ON l.label_id = e.source_id"
+                )
+                assert tuple(await cursor.fetchone()) == ("voice", 11, 5, None)
+                await cursor.execute(
+                    "SELECT a.name, d.name, before_value, after_value, delta, details FROM data_audit_log "
+                    "JOIN event_labels a ON a.label_id = action_id JOIN event_labels d ON d.label_id = data_type_id"
+                )
+                assert tuple(await cursor.fetchone()) == ("UPDATE", "points", 1, 3, 2, '{"reason":"x"}')
+    finally:
+        await pool.close()
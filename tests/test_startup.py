@@ -0,0 +1,56 @@
+"""
+Unit tests for the startup profiler
+
+Tests phase timing, concurrent phases and the ready report.
+"""
+
+import asyncio
+import time
+import pytest
+from utils.startup import StartupProfiler
+
+
+@pytest.mark.asyncio
+async def test_concurrent_phases_overlap_and_are_timed():
+    """Test independent phases run concurrently and each gets its own timing"""
+    profiler = StartupProfiler(origin=time.time())
+
+    with profiler.phase("import:core"):
+        pass
+    start = time.perf_counter()
+    await profiler.run_concurrently({
+        "cog:A": lambda: asyncio.sleep(0.05),
+        "cog:B": lambda: asyncio.sleep(0.05),
+    })
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.09
+    assert [p.name for p in profiler.phases][0] == "import:core"
+    assert {p.name for p in profiler.phases} == {"import:core", "cog:A", "cog:B"}
+    assert all(p.duration >= 0.04 for p in profiler.phases if p.name.startswith("cog:"))
+
+    assert profiler.mark_ready() is not None
+    assert profiler.mark_ready() is None
+    report = profiler.report()
+    assert report[0].startswith("Process start -> ready:")
+    assert any("cog:A" in line for line in report)
+
+
+@pytest.mark.asyncio
+async def test_failed_phase_is_reraised_after_others_finish():
+    """Test one broken cog doesn't cancel the others but still fails startup"""
+    profiler = StartupProfiler(origin=time.time())
+    loaded = []
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        loaded.append("slow")
+
+    with pytest.raises(RuntimeError):
+        await profiler.run_concurrently({"cog:Broken": broken, "cog:Slow": slow})
+
+    assert loaded == ["slow"]
+    assert [p.name for p in profiler.phases if p.failed] == ["cog:Broken"]
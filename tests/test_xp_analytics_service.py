@@ -0,0 +1,92 @@
+"""
+Unit tests for XPAnalyticsService
+
+Tests event aggregation and streaks as pure functions, and the compactor
+plus stats reads against a migrated SQLite database.
+"""
+
+import pytest
+from datetime import date, datetime
+from utils import database
+from utils.db_dialect import SQLITE
+from utils.migrator import MigrationRunner
+from utils.sqlite_backend import create_sqlite_pool
+from repositories.label_repository import XP_SOURCE, LabelRepository
+from repositories.user_repository import UserRepository
+from repositories.xp_rollup_repository import XPRollupRepository
+from services.xp_analytics_service import XPAnalyticsService, aggregate_events, compute_streaks
+
+
+def test_aggregate_events_per_user_and_guild():
+    """Test events are summed per key, day and source"""
+    events = [
+        {"user_id": 1, "xp_amount": 5, "source": "voice", "guild_id": None, "timestamp": datetime(2026, 1, 1, 10)},
+        {"user_id": 1, "xp_amount": 3, "source": "voice", "guild_id": None, "timestamp": "2026-01-01 23:59:59"},
+        {"user_id": 2, "xp_amount": 2, "source": "message", "guild_id": 7, "timestamp": datetime(2026, 1, 2)},
+    ]
+
+    user_rows, guild_rows = aggregate_events(events)
+
+    assert user_rows == [(1, date(2026, 1, 1), "voice", 8, 2), (2, date(2026, 1, 2), "message", 2, 1)]
+    assert guild_rows == [(0, date(2026, 1, 1), "voice", 8, 2), (7, date(2026, 1, 2), "message", 2, 1)]
+
+
+def test_compute_streaks():
+    """Test current streak survives until the day after the last activity"""
+    days = [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3), date(2026, 1, 9), date(2026, 1, 10)]
+
+    assert compute_streaks(days, today=date(2026, 1, 11)) == (2, 3)
+    assert compute_streaks(days, today=date(2026, 1, 12)) == (0, 3)
+    assert compute_streaks([], today=date(2026, 1, 12)) == (0, 0)
+
+
+@pytest.fixture
+async def sqlite_pool(tmp_path, monkeypatch):
+    """Migrated SQLite pool set as the active backend"""
+    pool = await create_sqlite_pool(str(tmp_path / "ignis.db"), size=2)
+    monkeypatch.setattr(database, "_POOL", pool)
+    monkeypatch.setattr(database, "_DIALECT", SQLITE)
+    await MigrationRunner(pool, dialect=SQLITE).run()
+    yield pool
+    await pool.close()
+
+
+async def _insert_events(rows):
+    labels = LabelRepository()
+    for user_id, amount, source, guild_id, timestamp in rows:
+        await labels.execute_query(
+            "INSERT INTO xp_events (user_id, xp_amount, source_id, guild_id, timestamp) VALUES (%s, %s, %s, %s, %s)",
+            (user_id, amount, await labels.get_id(XP_SOURCE, source), guild_id, timestamp)
+        )
+
+
+@pytest.mark.asyncio
+async def test_compact_and_stats_on_sqlite(sqlite_pool):
+    """Test compaction folds each event once and stats read the rollups"""
+    await UserRepository().create_if_missing(1)
+    await _insert_events([
+        (1, 10, "voice", 7, "2026-01-01 10:00:00"),
+        (1, 5, "message", 7, "2026-01-02 10:00:00"),
+        (1, 5, "message", 7, "2026-01-02 11:00:00"),
+        (1, 20, "event", 7, "2026-03-01 10:00:00"),
+    ])
+    repo = XPRollupRepository()
+    service = XPAnalyticsService(repo, batch_size=3)
+    max_event_id = await repo.get_max_event_id()
+
+    # First scheduled run only records the ceiling
+    assert await service.compact() == 0
+    assert await service.compact(up_to_event_id=max_event_id) == 4
+    assert await repo.get_watermark() == max_event_id
+    assert await service.compact(up_to_event_id=max_event_id) == 0
+
+    stats = await service.get_user_stats(1, today=date(2026, 3, 2))
+    assert stats["windows"][7] == {"xp": 20, "events": 1, "active_days": 1}
+    assert stats["windows"][90] == {"xp": 40, "events": 4, "active_days": 3}
+    assert stats["top_sources"] == [("event", 20), ("message", 10), ("voice", 10)]
+    assert (stats["current_streak"], stats["longest_streak"]) == (1, 2)
+    assert stats["last_active"] == date(2026, 3, 1)
+
+    history = await service.get_guild_history(7, days=2, today=date(2026, 1, 2))
+    assert [(entry["xp"], entry["events"]) for entry in history] == [(10, 1), (10, 2)]
+    assert history[1]["sources"] == {"message": 10}
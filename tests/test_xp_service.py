@@ -0,0 +1,78 @@
+"""
+Unit tests for XPService
+
+Tests daily limit handling with mocked repositories.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from services.xp_service import XPService, DAILY_XP_LIMITS, clear_daily_xp_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_daily_cache():
+    """Daily totals are module-level, reset between tests"""
+    clear_daily_xp_cache()
+    yield
+    clear_daily_xp_cache()
+
+
+@pytest.fixture
+def xp_repo():
+    """Mock XP repository"""
+    repo = MagicMock()
+    repo.get_daily_xp_limit = AsyncMock(return_value=0)
+    repo.get_daily_xp_limits = AsyncMock(return_value={})
+    repo.update_daily_xp_limit = AsyncMock()
+    repo.add_xp = AsyncMock(return_value=100)
+    repo.get_total_xp = AsyncMock(return_value=100)
+
+    async def add_xp_batch(awards, source, details=None):
+        return {user_id: 1000 + amount for user_id, amount in awards.items() if amount > 0}
+
+    repo.add_xp_batch = AsyncMock(side_effect=add_xp_batch)
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_add_xp_batch_caps_to_daily_limit(xp_repo):
+    """Test batch awards are capped per user with a single limit lookup"""
+    limit = DAILY_XP_LIMITS["voice"]
+    xp_repo.get_daily_xp_limits = AsyncMock(return_value={1: 0, 2: limit - 20, 3: limit})
+    service = XPService(xp_repo=xp_repo)
+
+    results = await service.add_xp_batch({1: 50, 2: 50, 3: 50}, source="voice")
+
+    xp_repo.get_daily_xp_limits.assert_called_once()
+    xp_repo.add_xp_batch.assert_called_once()
+    assert results[1] == {"added": 50, "total": 1050, "daily_limit_reached": False}
+    assert results[2] == {"added": 20, "total": 1020, "daily_limit_reached": True}
+    assert results[3] == {"added": 0, "total": None, "daily_limit_reached": True}
+
+
+@pytest.mark.asyncio
+async def test_add_xp_batch_uses_in_memory_totals(xp_repo):
+    """Test later ticks reuse in-memory daily totals instead of querying"""
+    limit = DAILY_XP_LIMITS["voice"]
+    xp_repo.get_daily_xp_limits = AsyncMock(return_value={1: limit - 60})
+    service = XPService(xp_repo=xp_repo)
+
+    first = await service.add_xp_batch({1: 50}, source="voice")
+    second = await service.add_xp_batch({1: 50}, source="voice")
+
+    xp_repo.get_daily_xp_limits.assert_called_once()
+    assert first[1]["added"] == 50
+    assert second[1]["added"] == 10
+    assert second[1]["daily_limit_reached"] is True
+
+
+@pytest.mark.asyncio
+async def test_add_xp_updates_in_memory_totals(xp_repo):
+    """Test single awards seed and update the in-memory daily total"""
+    service = XPService(xp_repo=xp_repo)
+
+    await service.add_xp(123, 10, source="message")
+    await service.add_xp(123, 10, source="message")
+
+    xp_repo.get_daily_xp_limit.assert_called_once_with(123, "message")
+    assert await service._get_daily_gained(123, "message") == 20
@@ -8,10 +8,7 @@ Records all operations performed with personal data for legal compliance.
 from __future__ import annotations
 
 from typing import Optional, Dict, Any
-from datetime import datetime
-import json
-import aiomysql
-from utils.database import get_pool
+from repositories.audit_repository import AuditRepository
 
 
 async def log_data_operation(
@@ -44,24 +41,14 @@ async def log_data_operation(
     Raises:
         RuntimeError: If database pool is not initialized
     """
-    pool = get_pool()
-    
-    details_json = json.dumps(details) if details else None
-    
-    async with pool.acquire() as conn:
-        async with conn.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO data_audit_log 
-                (user_id, action_type, data_type, performed_by, purpose, details, timestamp)
-                VALUES (%s, %s, %s, %s, %s, %s, NOW())
-            """, (
-                user_id,
-                action_type,
-                data_type,
-                performed_by,
-                purpose,
-                details_json
-            ))
+    await AuditRepository().create(
+        user_id=user_id,
+        action_type=action_type,
+        data_type=data_type,
+        performed_by=performed_by,
+        purpose=purpose,
+        details=details
+    )
 
 
 async def get_user_audit_history(
@@ -81,37 +68,7 @@ async def get_user_audit_history(
     Raises:
         RuntimeError: If database pool is not initialized
     """
-    pool = get_pool()
-    
-    async with pool.acquire() as conn:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    action_type,
-                    data_type,
-                    performed_by,
-                    purpose,
-                    timestamp,
-                    details
-                FROM data_audit_log
-                WHERE user_id = %s
-                ORDER BY timestamp DESC
-                LIMIT %s
-            """, (user_id, limit))
-            
-            results = await cursor.fetchall()
-            
-            # Parse JSON details
-            for record in results:
-                if record.get("details"):
-                    try:
-                        record["details"] = json.loads(record["details"])
-                    except (json.JSONDecodeError, TypeError):
-                        record["details"] = {}
-            
-            return results
+    return await AuditRepository().get_history(user_id, limit)
 
 
 async def delete_user_audit_logs(user_id: int) -> int:
@@ -127,14 +84,5 @@ async def delete_user_audit_logs(user_id: int) -> int:
     Raises:
         RuntimeError: If database pool is not initialized
     """
-    pool = get_pool()
-    
-    async with pool.acquire() as conn:
-        async with conn.cursor() as cursor:
-            await cursor.execute("""
-                DELETE FROM data_audit_log
-                WHERE user_id = %s
-            """, (user_id,))
-            
-            return cursor.rowcount
+    return await AuditRepository().delete_user_logs(user_id)
 
@@ -1,84 +1,206 @@
 """
 Backup System - Automated database backups.
+
+mysqldump output is streamed through gzip straight to disk in a worker
+thread, so backups run in constant memory and never block the event loop.
+Each backup gets a SHA-256 sidecar computed chunk by chunk while writing.
 """
 
 from __future__ import annotations
 
 import asyncio
-import subprocess
+import gzip
+import hashlib
 import os
-from datetime import datetime
+import shutil
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from utils.config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Backup directory
-BACKUP_DIR = Path("backups")
-BACKUP_DIR.mkdir(exist_ok=True)
+BACKUP_DIR = Path("backups")  # Created on first backup
 
 # Retention: 7 days
 BACKUP_RETENTION_DAYS = 7
 
+# Streaming settings
+CHUNK_SIZE = 1024 * 1024  # 1 MiB read/compress/hash unit
+COMPRESSION_LEVEL = 6
+RESTORE_BATCH_SIZE = 200  # Statements handed from the reader thread per batch
+
+
+def _mysqldump_command(tables: Optional[Sequence[str]] = None) -> List[str]:
+    """Build the mysqldump command (whole database or selected tables)"""
+    cmd = [
+        "mysqldump",
+        f"--host={DB_HOST}",
+        f"--user={DB_USER}",
+        f"--password={DB_PASSWORD}",
+        "--single-transaction",
+        "--routines",
+        "--triggers",
+        DB_NAME
+    ]
+    if tables:
+        cmd.extend(tables)
+    return cmd
 
-async def create_backup() -> Optional[str]:
+
+def _checksum_path(backup_path: Path) -> Path:
+    """Sidecar file holding the SHA-256 of a backup file"""
+    return backup_path.with_name(backup_path.name + ".sha256")
+
+
+def _dump_to_gzip(cmd: Sequence[str], dest: Path) -> Tuple[str, int]:
+    """
+    Run a dump command and stream its stdout through gzip into dest.
+
+    Runs in a worker thread. Output is written to a .partial file and only
+    moved into place once the command succeeded.
+
+    Args:
+        cmd: Command whose stdout is the SQL dump
+        dest: Final .sql.gz path
+
+    Returns:
+        Tuple of (sha256 hex digest of the compressed file, uncompressed bytes)
+
+    Raises:
+        RuntimeError: If the command exits with a non-zero status
+    """
+    partial = dest.with_name(dest.name + ".partial")
+    digest = hashlib.sha256()
+    raw_bytes = 0
+
+    class _HashingWriter:
+        """File wrapper that hashes compressed bytes as they are written"""
+
+        def __init__(self, f):
+            self._f = f
+
+        def write(self, data):
+            digest.update(data)
+            return self._f.write(data)
+
+        def flush(self):
+            self._f.flush()
+
+    # stderr goes to a temp file so a chatty dump can't fill the pipe and deadlock
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            with open(partial, "wb") as raw_out:
+                with gzip.GzipFile(
+                    filename=dest.name[:-3],
+                    mode="wb",
+                    fileobj=_HashingWriter(raw_out),
+                    compresslevel=COMPRESSION_LEVEL
+                ) as gz_out:
+                    while True:
+                        chunk = process.stdout.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        raw_bytes += len(chunk)
+                        gz_out.write(chunk)
+        except BaseException:
+            process.kill()
+            process.wait()
+            partial.unlink(missing_ok=True)
+            raise
+        finally:
+            process.stdout.close()
+
+        returncode = process.wait()
+        if returncode != 0:
+            partial.unlink(missing_ok=True)
+            stderr_file.seek(0)
+            message = stderr_file.read().decode(errors="replace").strip()
+            raise RuntimeError(f"exit code {returncode}: {message}")
+
+    os.replace(partial, dest)
+    checksum = digest.hexdigest()
+    _checksum_path(dest).write_text(f"{checksum}  {dest.name}\n", encoding="utf-8")
+    return checksum, raw_bytes
+
+
+async def _list_tables() -> List[str]:
+    """Get all base tables in the bot database"""
+    from utils.database import get_pool
+    pool = get_pool()
+
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(
+                """
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = %s AND table_type = 'BASE TABLE'
+                ORDER BY table_name
+                """,
+                (DB_NAME,)
+            )
+            return [row[0] for row in await cursor.fetchall()]
+
+
+async def create_backup(parallel_tables: int = 0) -> Optional[str]:
     """
     Create a database backup.
     
+    By default the whole database is dumped in one consistent transaction to
+    a single .sql.gz file. With parallel_tables > 0, each table is dumped to
+    its own file in a backup directory, up to parallel_tables at a time
+    (faster on large databases, but not a single consistent snapshot).
+
+    Args:
+        parallel_tables: Max concurrent per-table dumps (0 = single dump)
+
     Returns:
-        Path to backup file or None if failed
+        Path to backup file (or directory for per-table backups) or None if failed
     """
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"ignis_backup_{timestamp}.sql"
-        backup_path = BACKUP_DIR / backup_filename
-        
-        # Use mysqldump to create backup
-        cmd = [
-            "mysqldump",
-            f"--host={DB_HOST}",
-            f"--user={DB_USER}",
-            f"--password={DB_PASSWORD}",
-            "--single-transaction",
-            "--routines",
-            "--triggers",
-            DB_NAME
-        ]
+        BACKUP_DIR.mkdir(exist_ok=True)
         
-        # Execute mysqldump
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        if parallel_tables <= 0:
+            backup_path = BACKUP_DIR / f"ignis_backup_{timestamp}.sql.gz"
+            checksum, raw_bytes = await asyncio.to_thread(_dump_to_gzip, _mysqldump_command(), backup_path)
+            logger.info(
+                f"Backup created: {backup_path} ({raw_bytes} bytes uncompressed, "
+                f"{backup_path.stat().st_size} compressed, sha256 {checksum[:12]}...)"
+            )
+            return str(backup_path)
         
-        stdout, stderr = await process.communicate()
-        
-        if process.returncode != 0:
-            logger.error(f"Backup failed: {stderr.decode()}")
+        tables = await _list_tables()
+        if not tables:
+            logger.error("Backup failed: no tables found")
             return None
         
-        # Write backup to file
-        with open(backup_path, "wb") as f:
-            f.write(stdout)
+        backup_dir = BACKUP_DIR / f"ignis_backup_{timestamp}"
+        backup_dir.mkdir(exist_ok=True)
+        semaphore = asyncio.Semaphore(parallel_tables)
         
-        # Compress backup (optional, using gzip)
-        try:
-            import gzip
-            compressed_path = backup_path.with_suffix(".sql.gz")
-            with open(backup_path, "rb") as f_in:
-                with gzip.open(compressed_path, "wb") as f_out:
-                    f_out.writelines(f_in)
-            # Remove uncompressed file
-            backup_path.unlink()
-            backup_path = compressed_path
-        except ImportError:
-            logger.warning("gzip not available, backup not compressed")
+        async def dump_table(table: str) -> int:
+            async with semaphore:
+                _, raw_bytes = await asyncio.to_thread(
+                    _dump_to_gzip, _mysqldump_command([table]), backup_dir / f"{table}.sql.gz"
+                )
+                return raw_bytes
         
-        logger.info(f"Backup created: {backup_path}")
-        return str(backup_path)
+        results = await asyncio.gather(*(dump_table(table) for table in tables), return_exceptions=True)
+        failed = [(table, result) for table, result in zip(tables, results) if isinstance(result, BaseException)]
+        if failed:
+            for table, error in failed:
+                logger.error(f"Backup failed for table {table}: {error}")
+            shutil.rmtree(backup_dir, ignore_errors=True)
+            return None
+
+        logger.info(f"Backup created: {backup_dir} ({len(tables)} tables, {sum(results)} bytes uncompressed)")
+        return str(backup_dir)
         
     except Exception as e:
         logger.error(f"Error creating backup: {e}", exc_info=True)
@@ -90,7 +212,6 @@ async def cleanup_old_backups():
     Remove backups older than retention period.
     """
     try:
-        from datetime import timedelta
         cutoff_date = datetime.now() - timedelta(days=BACKUP_RETENTION_DAYS)
         
         deleted_count = 0
@@ -98,7 +219,10 @@ async def cleanup_old_backups():
             # Get file modification time
             mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
             if mtime < cutoff_date:
-                backup_file.unlink()
+                if backup_file.is_dir():
+                    shutil.rmtree(backup_file)
+                else:
+                    backup_file.unlink()
                 deleted_count += 1
                 logger.debug(f"Deleted old backup: {backup_file}")
         
@@ -109,35 +233,123 @@ async def cleanup_old_backups():
         logger.error(f"Error cleaning up backups: {e}", exc_info=True)
 
 
+def verify_backup(backup_file: Path) -> bool:
+    """
+    Check a backup file against its SHA-256 sidecar (streamed in chunks).
+
+    Args:
+        backup_file: Path to backup file
+
+    Returns:
+        True if the checksum matches or no sidecar exists, False on mismatch
+    """
+    sidecar = _checksum_path(backup_file)
+    if not sidecar.exists():
+        return True
+
+    expected = sidecar.read_text(encoding="utf-8").split()[0]
+    digest = hashlib.sha256()
+    with open(backup_file, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest() == expected
+
+
+def iter_sql_statements(lines: Iterator[str]) -> Iterator[str]:
+    """
+    Split a SQL dump into statements without loading it into memory.
+
+    mysqldump ends every statement with ';' at the end of a line, so
+    semicolons inside data values never split a statement. Comment-only
+    lines are skipped.
+
+    Args:
+        lines: Lines of the dump
+
+    Yields:
+        Complete SQL statements (without the trailing ';')
+    """
+    buffer: List[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if not buffer and (not stripped or stripped.startswith("--")):
+            continue
+        buffer.append(line)
+        if stripped.endswith(";"):
+            statement = "".join(buffer).strip()[:-1].strip()
+            buffer = []
+            if statement:
+                yield statement
+
+    tail = "".join(buffer).strip()
+    if tail:
+        yield tail
+
+
+def _open_backup_text(backup_file: Path):
+    """Open a .sql or .sql.gz backup for streaming text reads"""
+    if backup_file.suffix == ".gz":
+        return gzip.open(backup_file, "rt", encoding="utf-8")
+    return open(backup_file, "r", encoding="utf-8")
+
+
+def _next_batch(statements: Iterator[str]) -> List[str]:
+    """Pull the next batch of statements (runs in a worker thread)"""
+    batch = []
+    for statement in statements:
+        batch.append(statement)
+        if len(batch) >= RESTORE_BATCH_SIZE:
+            break
+    return batch
+
+
+async def _restore_file(cursor, backup_file: Path) -> int:
+    """Stream one backup file into the database, returning statements executed"""
+    executed = 0
+    f = await asyncio.to_thread(_open_backup_text, backup_file)
+    try:
+        statements = iter_sql_statements(f)
+        while True:
+            batch = await asyncio.to_thread(_next_batch, statements)
+            if not batch:
+                break
+            for statement in batch:
+                await cursor.execute(statement)
+            executed += len(batch)
+    finally:
+        await asyncio.to_thread(f.close)
+    return executed
+
+
 async def restore_backup(backup_path: str) -> bool:
     """
     Restore database from backup.
     
+    Accepts a .sql/.sql.gz file or a per-table backup directory. Files are
+    decompressed and parsed as a stream in a worker thread.
+
     Args:
-        backup_path: Path to backup file
+        backup_path: Path to backup file or directory
     
     Returns:
         True if successful, False otherwise
     """
     try:
         # Check if file exists
-        backup_file = Path(backup_path)
-        if not backup_file.exists():
+        backup = Path(backup_path)
+        if not backup.exists():
             logger.error(f"Backup file not found: {backup_path}")
             return False
         
-        # Decompress if needed
-        if backup_file.suffix == ".gz":
-            import gzip
-            decompressed_path = backup_file.with_suffix("")
-            with gzip.open(backup_file, "rb") as f_in:
-                with open(decompressed_path, "wb") as f_out:
-                    f_out.writelines(f_in)
-            backup_file = decompressed_path
+        files = sorted(backup.glob("*.sql.gz")) if backup.is_dir() else [backup]
+        if not files:
+            logger.error(f"No backup files found in: {backup_path}")
+            return False
         
-        # Read backup file
-        with open(backup_file, "r", encoding="utf-8") as f:
-            sql_content = f.read()
+        for backup_file in files:
+            if not await asyncio.to_thread(verify_backup, backup_file):
+                logger.error(f"Checksum mismatch, refusing to restore: {backup_file}")
+                return False
         
         # Execute SQL
         from utils.database import get_pool
@@ -145,14 +357,12 @@ async def restore_backup(backup_path: str) -> bool:
         
         async with pool.acquire() as conn:
             async with conn.cursor() as cursor:
-                # Split by semicolon and execute each statement
-                statements = [s.strip() for s in sql_content.split(";") if s.strip()]
-                for statement in statements:
-                    if statement:
-                        await cursor.execute(statement)
+                executed = 0
+                for backup_file in files:
+                    executed += await _restore_file(cursor, backup_file)
                 await conn.commit()
         
-        logger.info(f"Backup restored from: {backup_path}")
+        logger.info(f"Backup restored from: {backup_path} ({executed} statements)")
         return True
         
     except Exception as e:
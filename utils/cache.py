@@ -10,6 +10,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional
 from utils.logger import get_logger
+from utils.metrics import get_metrics_registry
 
 logger = get_logger(__name__)
 
@@ -27,6 +28,13 @@ _cache_warming_enabled = False
 _active_users: set[int] = set()  # Track active users for cache warming
 
 
+_metrics_registry = get_metrics_registry()
+_metrics_registry.counter("ignis_user_cache_hits_total", "User cache hits").set_function(lambda: _cache_hits)
+_metrics_registry.counter("ignis_user_cache_misses_total", "User cache misses").set_function(lambda: _cache_misses)
+_metrics_registry.counter("ignis_user_cache_evictions_total", "User cache expirations").set_function(lambda: _cache_evictions)
+_metrics_registry.gauge("ignis_user_cache_entries", "User cache entries").set_function(lambda: len(_user_cache))
+
+
 def get_cache_stats() -> dict:
     """Returns cache statistics"""
     total = _cache_hits + _cache_misses
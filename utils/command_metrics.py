@@ -0,0 +1,401 @@
+# utils/command_metrics.py
+"""
+Command Latency Telemetry
+
+Measures every slash and prefix command:
+- ack: time from the interaction's creation (snowflake time) until the first
+  response (defer, message, modal) was accepted by Discord. Discord drops
+  interactions not acknowledged within 3 seconds.
+- total: time spent running the command.
+- db / http: time spent in repository queries and upstream HTTP calls made
+  while the command ran (attributed through a context variable).
+
+Samples are aggregated per command into fixed-memory rolling histograms
+(utils.histogram) and reported by /health and /cache_stats; totals are also
+exported through the metrics registry (utils.metrics).
+
+Wiring:
+- InstrumentedCommandTree is passed as tree_cls to the bot and
+  install_app_command_hooks() finishes its samples;
+- interaction_ack_trace_config() is passed as the bot's http_trace;
+- install_prefix_command_hooks() registers before/after invoke hooks;
+- track_db_time() wraps repository queries;
+- upstream_trace_configs() is passed to aiohttp sessions.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+import aiohttp
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.histogram import LatencyHistogram, RollingHistogram
+from utils.logger import get_logger, log_command_execution
+from utils.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+# Discord's acknowledgement deadline and the threshold reported as "near" it
+ACK_DEADLINE_MS = 3000.0
+ACK_WARNING_MS = 2000.0
+
+# Window reported by /health
+TELEMETRY_WINDOW_SECONDS = 3600.0
+TELEMETRY_WINDOW_SLOTS = 6
+
+METRICS = ("ack", "total", "db", "http")
+
+_registry = get_metrics_registry()
+_COMMANDS_TOTAL = _registry.counter("ignis_commands_total", "Commands run", ("command", "status"))
+_COMMAND_SECONDS = _registry.histogram("ignis_command_duration_seconds", "Command run time", ("command",))
+_COMMAND_ACK_SECONDS = _registry.histogram("ignis_command_ack_seconds", "Time until the interaction was acknowledged", ("command",))
+_DB_QUERY_SECONDS = _registry.histogram("ignis_db_query_duration_seconds", "Repository query time")
+_DB_ERRORS = _registry.counter("ignis_db_query_errors_total", "Repository queries that raised")
+_UPSTREAM_SECONDS = _registry.histogram("ignis_upstream_request_duration_seconds", "Upstream HTTP request time", ("host",))
+_UPSTREAM_REQUESTS = _registry.counter("ignis_upstream_requests_total", "Upstream HTTP requests", ("host", "status"))
+
+
+@dataclass
+class CommandSample:
+    """Timings of one command invocation"""
+    command: str
+    user_id: int
+    created_at: float  # wall clock (interaction snowflake time or message time)
+    started: float = field(default_factory=time.perf_counter)
+    ack_ms: Optional[float] = None
+    db_ms: float = 0.0
+    http_ms: float = 0.0
+
+
+_current_sample: ContextVar[Optional[CommandSample]] = ContextVar("command_sample", default=None)
+
+
+class _CommandStats:
+    """Rolling histograms and counters for one command"""
+
+    __slots__ = ("histograms", "calls", "errors", "missed_deadline")
+
+    def __init__(self):
+        self.histograms = {
+            metric: RollingHistogram(TELEMETRY_WINDOW_SECONDS, TELEMETRY_WINDOW_SLOTS)
+            for metric in METRICS
+        }
+        self.calls = 0
+        self.errors = 0
+        self.missed_deadline = 0
+
+
+class CommandTelemetry:
+    """Per-command latency aggregation"""
+
+    def __init__(self):
+        self._stats: Dict[str, _CommandStats] = {}
+
+    def start(self, command: str, user_id: int, created_at: float) -> CommandSample:
+        """
+        Start timing a command and make it the current sample.
+
+        Args:
+            command: Qualified command name
+            user_id: Invoking user
+            created_at: Wall-clock creation time of the interaction/message
+
+        Returns:
+            The sample, to pass to finish()
+        """
+        sample = CommandSample(command, user_id, created_at)
+        _current_sample.set(sample)
+        return sample
+
+    def finish(self, sample: CommandSample, success: bool = True, error: Optional[str] = None) -> None:
+        """
+        Record a finished command.
+
+        Args:
+            sample: Sample returned by start()
+            success: Whether the command succeeded
+            error: Error message if failed
+        """
+        now = time.monotonic()
+        total_ms = (time.perf_counter() - sample.started) * 1000
+        stats = self._stats.get(sample.command)
+        if stats is None:
+            stats = self._stats[sample.command] = _CommandStats()
+
+        stats.calls += 1
+        if not success:
+            stats.errors += 1
+        if sample.ack_ms is not None:
+            stats.histograms["ack"].record(sample.ack_ms, now)
+            if sample.ack_ms > ACK_DEADLINE_MS:
+                stats.missed_deadline += 1
+        stats.histograms["total"].record(total_ms, now)
+        stats.histograms["db"].record(sample.db_ms, now)
+        stats.histograms["http"].record(sample.http_ms, now)
+
+        _COMMANDS_TOTAL.inc(command=sample.command, status="ok" if success else "error")
+        _COMMAND_SECONDS.observe(total_ms / 1000, command=sample.command)
+        if sample.ack_ms is not None:
+            _COMMAND_ACK_SECONDS.observe(sample.ack_ms / 1000, command=sample.command)
+
+        extra = {"db_ms": round(sample.db_ms, 1), "http_ms": round(sample.http_ms, 1)}
+        if sample.ack_ms is not None:
+            extra["ack_ms"] = round(sample.ack_ms, 1)
+        log_command_execution(sample.command, sample.user_id, total_ms, success=success, error=error, extra_data=extra)
+
+        if sample.ack_ms is not None and sample.ack_ms > ACK_WARNING_MS:
+            logger.warning(
+                f"Command {sample.command} acknowledged after {sample.ack_ms:.0f}ms "
+                f"(db {sample.db_ms:.0f}ms, http {sample.http_ms:.0f}ms)"
+            )
+
+    def command_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get windowed latency stats per command.
+
+        Returns:
+            Dict command -> {"calls", "errors", "missed_deadline", "near_deadline",
+            and a summary dict (count, mean, max, p50, p95, p99) per metric}
+        """
+        now = time.monotonic()
+        summaries = {}
+        for command, stats in self._stats.items():
+            snapshots = {metric: histogram.snapshot(now) for metric, histogram in stats.histograms.items()}
+            summary: Dict[str, Any] = {metric: snapshot.summary() for metric, snapshot in snapshots.items()}
+            summary["calls"] = stats.calls
+            summary["errors"] = stats.errors
+            summary["missed_deadline"] = stats.missed_deadline
+            summary["near_deadline"] = snapshots["ack"].count_above(ACK_WARNING_MS)
+            summaries[command] = summary
+        return summaries
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get windowed latency stats over all commands.
+
+        Returns:
+            Dict with "ack" and "total" summaries, counters and the slowest
+            commands by p95 acknowledgement latency
+        """
+        now = time.monotonic()
+        ack = LatencyHistogram()
+        total = LatencyHistogram()
+        for stats in self._stats.values():
+            ack.merge(stats.histograms["ack"].snapshot(now))
+            total.merge(stats.histograms["total"].snapshot(now))
+
+        per_command = self.command_summaries()
+        slowest = sorted(per_command.items(), key=lambda item: item[1]["ack"]["p95"], reverse=True)
+        return {
+            "window_seconds": int(TELEMETRY_WINDOW_SECONDS),
+            "ack": ack.summary(),
+            "total": total.summary(),
+            "near_deadline": ack.count_above(ACK_WARNING_MS),
+            "missed_deadline": sum(s["missed_deadline"] for s in per_command.values()),
+            "slowest": [
+                {"command": name, "ack_p95": s["ack"]["p95"], "total_p95": s["total"]["p95"],
+                 "db_mean": s["db"]["mean"], "http_mean": s["http"]["mean"]}
+                for name, s in slowest[:5] if s["total"]["count"]
+            ],
+        }
+
+    def reset(self) -> None:
+        """Drop all collected stats"""
+        self._stats.clear()
+
+
+def current_sample() -> Optional[CommandSample]:
+    """Get the sample of the command running in this context, if any"""
+    return _current_sample.get()
+
+
+@contextmanager
+def track_db_time() -> Iterator[None]:
+    """Record the time spent in the block as a DB query (and the current command's DB time)"""
+    sample = _current_sample.get()
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        _DB_ERRORS.inc()
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        _DB_QUERY_SECONDS.observe(elapsed)
+        if sample is not None:
+            sample.db_ms += elapsed * 1000
+
+
+async def _on_request_start(session, trace_config_ctx, params) -> None:
+    trace_config_ctx.sample = _current_sample.get()
+    trace_config_ctx.started = time.perf_counter()
+
+
+async def _on_request_end(session, trace_config_ctx, params) -> None:
+    elapsed = time.perf_counter() - trace_config_ctx.started
+    response = getattr(params, "response", None)
+    host = params.url.host or "unknown"
+    _UPSTREAM_SECONDS.observe(elapsed, host=host)
+    _UPSTREAM_REQUESTS.inc(host=host, status=str(response.status) if response is not None else "error")
+
+    sample = getattr(trace_config_ctx, "sample", None)
+    if sample is not None:
+        sample.http_ms += elapsed * 1000
+
+
+def upstream_trace_configs() -> List[aiohttp.TraceConfig]:
+    """
+    Get aiohttp trace configs attributing request time to the current command.
+
+    Returns:
+        List to pass as ClientSession(trace_configs=...)
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_request_exception.append(_on_request_end)
+    return [trace_config]
+
+
+def _is_interaction_callback(url: Any) -> bool:
+    """Whether a Discord API URL is an interaction's initial response (the acknowledgement)"""
+    parts = url.path.rstrip("/").split("/")
+    return len(parts) >= 4 and parts[-1] == "callback" and parts[-4] == "interactions"
+
+
+async def _on_discord_request_end(session, trace_config_ctx, params) -> None:
+    sample = _current_sample.get()
+    if sample is None or sample.ack_ms is not None or not _is_interaction_callback(params.url):
+        return
+    if params.response.status < 300:
+        sample.ack_ms = max(0.0, (time.time() - sample.created_at) * 1000)
+
+
+def interaction_ack_trace_config() -> aiohttp.TraceConfig:
+    """
+    Get the trace config recording when a command's interaction was acknowledged.
+
+    The initial response (defer, message, modal) is a POST to the
+    interaction's callback endpoint, made from the command's own context.
+
+    Returns:
+        TraceConfig to pass as the client's http_trace
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(_on_discord_request_end)
+    return trace_config
+
+
+class InstrumentedCommandTree(app_commands.CommandTree):
+    """
+    CommandTree timing every application command invocation.
+
+    Only public hooks are used: interaction_check starts the sample, and
+    it is finished by the app_command_completion event (see
+    install_app_command_hooks) or by the tree's error handler.
+    """
+
+    # Samples of interactions that never finish (e.g. the bot stopped) are dropped after this
+    SAMPLE_TTL_SECONDS = 900.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # interaction ID -> sample
+        self._samples: Dict[int, CommandSample] = {}
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.type is discord.InteractionType.application_command and interaction.id not in self._samples:
+            self._prune_samples()
+            self._samples[interaction.id] = get_command_telemetry().start(
+                _qualified_name(interaction.data or {}), interaction.user.id, interaction.created_at.timestamp()
+            )
+        return await super().interaction_check(interaction)
+
+    def finish_sample(self, interaction: discord.Interaction, error: Optional[BaseException] = None) -> None:
+        """Record the end of an interaction's command (no-op if it wasn't timed)"""
+        sample = self._samples.pop(interaction.id, None)
+        if sample is not None:
+            get_command_telemetry().finish(sample, success=error is None, error=str(error) if error else None)
+
+    def _prune_samples(self) -> None:
+        cutoff = time.perf_counter() - self.SAMPLE_TTL_SECONDS
+        for interaction_id in [key for key, sample in self._samples.items() if sample.started < cutoff]:
+            del self._samples[interaction_id]
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        self.finish_sample(interaction, error)
+        await super().on_error(interaction, error)
+
+    def error(self, coro):
+        # A registered handler replaces on_error, so the failure is recorded before it runs
+        super().error(coro)
+
+        async def on_error(interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+            self.finish_sample(interaction, error)
+            await coro(interaction, error)
+
+        self.on_error = on_error
+        return coro
+
+
+def _qualified_name(data: Dict[str, Any]) -> str:
+    """Build "group sub command" from interaction data"""
+    parts = [data.get("name", "unknown")]
+    options = data.get("options") or []
+    while options and options[0].get("type") in (1, 2):  # sub command / sub command group
+        parts.append(options[0]["name"])
+        options = options[0].get("options") or []
+    return " ".join(parts)
+
+
+def install_app_command_hooks(bot: commands.Bot) -> None:
+    """Finish InstrumentedCommandTree samples when a slash command completes"""
+    tree = bot.tree
+    if not isinstance(tree, InstrumentedCommandTree):
+        return
+
+    async def on_app_command_completion(interaction: discord.Interaction, command: Any) -> None:
+        tree.finish_sample(interaction)
+
+    bot.add_listener(on_app_command_completion, "on_app_command_completion")
+
+
+def install_prefix_command_hooks(bot: commands.Bot) -> None:
+    """
+    Time prefix commands with global before/after invoke hooks.
+
+    Hybrid commands invoked as slash commands are timed by
+    InstrumentedCommandTree and skipped here.
+    """
+    telemetry = get_command_telemetry()
+    samples: Dict[int, CommandSample] = {}
+
+    async def before_invoke(ctx: commands.Context) -> None:
+        if ctx.interaction is None and ctx.command is not None:
+            samples[ctx.message.id] = telemetry.start(
+                ctx.command.qualified_name, ctx.author.id, ctx.message.created_at.timestamp()
+            )
+
+    async def after_invoke(ctx: commands.Context) -> None:
+        sample = samples.pop(ctx.message.id, None)
+        if sample is not None:
+            telemetry.finish(sample, success=not ctx.command_failed)
+
+    bot.before_invoke(before_invoke)
+    bot.after_invoke(after_invoke)
+
+
+# Global telemetry instance
+_command_telemetry = CommandTelemetry()
+
+
+def get_command_telemetry() -> CommandTelemetry:
+    """Get global command telemetry instance"""
+    return _command_telemetry
@@ -60,9 +60,13 @@ GUILD_ID = int(_get_env("DISCORD_GUILD_ID", required=True))
 # ============================================
 # DATABASE CONFIGURATION
 # ============================================
+# Backend: "mysql" (padrão) ou "sqlite" (arquivo local, WAL - deploys pequenos, testes de carga, CI)
+DB_BACKEND = _get_env("DB_BACKEND", default="mysql").lower()
+SQLITE_PATH = _get_env("SQLITE_PATH", default="data/ignis.db")
+
 DB_HOST = _get_env("DB_HOST", default="localhost")
-DB_USER = _get_env("DB_USER", required=True)
-DB_PASSWORD = _get_env("DB_PASSWORD", required=True)
+DB_USER = _get_env("DB_USER", required=DB_BACKEND == "mysql")
+DB_PASSWORD = _get_env("DB_PASSWORD", required=DB_BACKEND == "mysql")
 DB_NAME = _get_env("DB_NAME", default="ignis")
 DB_PORT = int(_get_env("DB_PORT", default="3306"))
 
@@ -119,6 +123,13 @@ RATE_LIMIT_REQUESTS_PER_MINUTE = int(_get_env("RATE_LIMIT_REQUESTS_PER_MINUTE",
 # ============================================
 ROBLOX_COOKIE = _get_env("ROBLOX_COOKIE", default="", required=False)  # Required for group operations
 
+# ============================================
+# METRICS (local Prometheus-style endpoint, off by default)
+# ============================================
+METRICS_ENABLED = _get_env("METRICS_ENABLED", default="false").lower() == "true"
+METRICS_HOST = _get_env("METRICS_HOST", default="127.0.0.1")
+METRICS_PORT = int(_get_env("METRICS_PORT", default="9108"))
+
 # ============================================
 # APPLICATION
 # ============================================
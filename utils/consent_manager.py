@@ -11,7 +11,7 @@ from __future__ import annotations
 from typing import Optional, Dict
 from datetime import datetime
 import aiomysql
-from utils.database import get_pool
+from utils.database import get_dialect, get_pool
 
 # Current privacy policy version
 CURRENT_CONSENT_VERSION = "1.0"
@@ -67,21 +67,24 @@ async def give_consent(
         RuntimeError: If database pool is not initialized
     """
     pool = get_pool()
+    dialect = get_dialect()
+    upsert = dialect.upsert_clause(["user_id"], {
+        "consent_date": dialect.now,
+        "consent_version": dialect.excluded("consent_version"),
+        "base_legal": dialect.excluded("base_legal"),
+        "consent_given": "TRUE",
+        "updated_at": dialect.now,
+    })
     
     async with pool.acquire() as conn:
         async with conn.cursor() as cursor:
-            # Use INSERT ... ON DUPLICATE KEY UPDATE for upsert
-            await cursor.execute("""
+            # INSERT ... ON DUPLICATE KEY UPDATE / ON CONFLICT upsert
+            await cursor.execute(f"""
                 INSERT INTO user_consent 
                 (user_id, consent_date, consent_version, base_legal, consent_given)
-                VALUES (%s, NOW(), %s, %s, TRUE)
-                ON DUPLICATE KEY UPDATE
-                    consent_date = NOW(),
-                    consent_version = %s,
-                    base_legal = %s,
-                    consent_given = TRUE,
-                    updated_at = NOW()
-            """, (user_id, version, base_legal, version, base_legal))
+                VALUES (%s, {dialect.now}, %s, %s, TRUE)
+                {upsert}
+            """, (user_id, version, base_legal))
             
             return True
 
@@ -107,10 +110,10 @@ async def revoke_consent(user_id: int) -> bool:
     
     async with pool.acquire() as conn:
         async with conn.cursor() as cursor:
-            await cursor.execute("""
+            await cursor.execute(f"""
                 UPDATE user_consent
                 SET consent_given = FALSE,
-                    updated_at = NOW()
+                    updated_at = {get_dialect().now}
                 WHERE user_id = %s
             """, (user_id,))
             
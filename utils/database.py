@@ -3,14 +3,30 @@ from __future__ import annotations
 
 import asyncio
 import aiomysql
-from typing import Optional
-from utils.config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT, DB_POOL_MIN, DB_POOL_MAX
+from typing import Optional, Set
+from utils.config import (
+    DB_BACKEND, DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT, DB_POOL_MIN, DB_POOL_MAX, SQLITE_PATH
+)
+from utils.db_dialect import Dialect, get_dialect_by_name
 from utils.logger import get_logger
+from utils.metrics import get_metrics_registry
+from utils.migrator import MigrationRunner
 
 logger = get_logger(__name__)
 
+# aiomysql.Pool, or utils.sqlite_backend.SQLitePool when DB_BACKEND=sqlite
 _POOL: Optional[aiomysql.Pool] = None
 
+_DIALECT: Dialect = get_dialect_by_name(DB_BACKEND)
+
+_metrics_registry = get_metrics_registry()
+_metrics_registry.gauge("ignis_db_pool_size", "Open database connections").set_function(lambda: _POOL.size if _POOL else 0)
+_metrics_registry.gauge("ignis_db_pool_free", "Idle database connections").set_function(lambda: _POOL.freesize if _POOL else 0)
+
+# Known user IDs (users table), loaded at startup so existence checks skip the DB.
+# None until loaded - callers fall back to a query.
+_KNOWN_USERS: Optional[Set[int]] = None
+
 _CONN_KW = dict(
     host=DB_HOST,
     port=DB_PORT,
@@ -23,10 +39,22 @@ _CONN_KW = dict(
     # read_timeout / write_timeout are NOT supported by aiomysql
 )
 
-async def initialize_db():
-    """Create a global connection pool and ensure tables exist."""
+async def initialize_db(run_migrations: bool = True):
+    """
+    Create the global connection pool and bring the schema up to date.
+    
+    Schema changes live in migrations/ and are applied once each by
+    utils.migrator; when the schema is current this costs a single SELECT.
+    
+    Args:
+        run_migrations: Apply pending migrations (default: True)
+    """
     global _POOL
-    if _POOL is None:
+    if _POOL is None and _DIALECT.name == "sqlite":
+        # aiosqlite is only needed for this backend
+        from utils.sqlite_backend import create_sqlite_pool
+        _POOL = await create_sqlite_pool(SQLITE_PATH, size=DB_POOL_MAX)
+    elif _POOL is None:
         # OPTIMIZATION PHASE 2: Pool configurable via environment
         _POOL = await aiomysql.create_pool(
             minsize=DB_POOL_MIN,
@@ -35,148 +63,11 @@ async def initialize_db():
         )
         logger.info(f"Database pool initialized: {DB_POOL_MIN}-{DB_POOL_MAX} connections")
 
-    async with _POOL.acquire() as conn:
-        async with conn.cursor() as cursor:
-            # Main users table
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id BIGINT PRIMARY KEY,
-                    points INT DEFAULT 0,
-                    exp INT DEFAULT 0,
-                    `rank` VARCHAR(50) DEFAULT 'Civitas Aspirant',
-                    path VARCHAR(50) DEFAULT 'pre_induction',
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    INDEX idx_exp (exp DESC),
-                    INDEX idx_rank (`rank`)
-                )
-            """)
-            
-            # LGPD consent table
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_consent (
-                    user_id BIGINT PRIMARY KEY,
-                    consent_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    consent_version VARCHAR(20) DEFAULT '1.0',
-                    base_legal VARCHAR(50) DEFAULT 'consentimento',
-                    consent_given BOOLEAN DEFAULT FALSE,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """)
-            
-            # Personal data audit table (LGPD Art. 10)
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS data_audit_log (
-                    id BIGINT AUTO_INCREMENT PRIMARY KEY,
-                    user_id BIGINT NOT NULL,
-                    action_type VARCHAR(50) NOT NULL,
-                    data_type VARCHAR(100) NOT NULL,
-                    performed_by BIGINT,
-                    purpose TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    details JSON,
-                    INDEX idx_user_id (user_id),
-                    INDEX idx_timestamp (timestamp),
-                    INDEX idx_action_type (action_type)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """)
-            
-            # Gamification tables (Phase 1)
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_progression (
-                    user_id BIGINT PRIMARY KEY,
-                    total_xp BIGINT DEFAULT 0,
-                    current_level INT DEFAULT 1,
-                    prestige_level INT DEFAULT 0,
-                    last_xp_gain TIMESTAMP NULL,
-                    last_level_up TIMESTAMP NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    INDEX idx_level (current_level),
-                    INDEX idx_total_xp (total_xp),
-                    INDEX idx_prestige (prestige_level),
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """)
-            
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS xp_events (
-                    event_id BIGINT AUTO_INCREMENT PRIMARY KEY,
-                    user_id BIGINT NOT NULL,
-                    xp_amount INT NOT NULL,
-                    source VARCHAR(50) NOT NULL,
-                    details JSON NULL,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_user_id (user_id),
-                    INDEX idx_timestamp (timestamp),
-                    INDEX idx_source (source),
-                    INDEX idx_user_timestamp (user_id, timestamp),
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """)
-            
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS daily_xp_limits (
-                    user_id BIGINT NOT NULL,
-                    source VARCHAR(50) NOT NULL,
-                    date DATE NOT NULL,
-                    xp_gained INT DEFAULT 0,
-                    last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    PRIMARY KEY (user_id, source, date),
-                    INDEX idx_date (date),
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """)
-            
-            await cursor.execute("""
-                CREATE TABLE IF NOT EXISTS level_rewards (
-                    level INT PRIMARY KEY,
-                    xp_bonus INT DEFAULT 0,
-                    points_bonus INT DEFAULT 0,
-                    reward_type VARCHAR(50) NULL,
-                    reward_value VARCHAR(255) NULL,
-                    description TEXT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """)
-            
-            # Insert default level rewards
-            await cursor.execute("""
-                INSERT INTO level_rewards (level, xp_bonus, points_bonus, description) VALUES
-                (1, 0, 0, 'Starting level'),
-                (5, 50, 25, 'First milestone'),
-                (10, 100, 50, 'Double digits!'),
-                (25, 250, 125, 'Quarter century'),
-                (50, 500, 250, 'Half century milestone'),
-                (100, 1000, 500, 'Century achievement')
-                ON DUPLICATE KEY UPDATE description=VALUES(description)
-            """)
-            
-            # Index to optimize leaderboard queries (ORDER BY points DESC)
-            # Check if index already exists before creating (IF NOT EXISTS doesn't work in all MySQL versions)
-            try:
-                await cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM information_schema.statistics 
-                    WHERE table_schema = DATABASE() 
-                    AND table_name = 'users' 
-                    AND index_name = 'idx_points'
-                """)
-                result = await cursor.fetchone()
-                index_exists = result[0] > 0 if result else False
-                
-                if not index_exists:
-                    await cursor.execute("""
-                        CREATE INDEX idx_points 
-                        ON users(points DESC)
-                    """)
-                    logger.info("Index idx_points created successfully")
-                else:
-                    logger.debug("Index idx_points already exists")
-            except Exception as e:
-                # If error occurs while checking/creating index, just log and continue
-                logger.warning(f"Error creating index idx_points: {e}. Continuing without index.")
+    if not run_migrations:
+        return
+    applied = await MigrationRunner(_POOL, dialect=_DIALECT).run()
+    if applied:
+        logger.info(f"Applied {len(applied)} schema migration(s): {applied}")
 
 async def get_user(user_id: int, use_cache: bool = True):
     """
@@ -378,12 +269,89 @@ async def update_points(user_id: int, points: int, performed_by: int = None, pur
     
     return new_points
 
+async def load_known_users() -> int:
+    """
+    Load all user IDs into the in-memory known-users set.
+    
+    Streams the IDs with a server-side cursor so large tables don't
+    buffer the whole result.
+    
+    Returns:
+        Number of known users
+    
+    Raises:
+        RuntimeError: If database pool is not initialized
+    """
+    global _KNOWN_USERS
+    if _POOL is None:
+        raise RuntimeError("DB pool not initialized. Call initialize_db() first.")
+    
+    known: Set[int] = set()
+    async with _POOL.acquire() as conn:
+        async with conn.cursor(aiomysql.SSCursor) as cursor:
+            await cursor.execute("SELECT user_id FROM users")
+            while True:
+                rows = await cursor.fetchmany(10000)
+                if not rows:
+                    break
+                known.update(int(row[0]) for row in rows)
+    
+    _KNOWN_USERS = known
+    logger.info(f"Loaded {len(known)} known users")
+    return len(known)
+
+def mark_user_known(user_id: int) -> None:
+    """Record that a user row exists (no-op until known users are loaded)"""
+    if _KNOWN_USERS is not None:
+        _KNOWN_USERS.add(user_id)
+
+def forget_known_user(user_id: int) -> None:
+    """Record that a user row was deleted"""
+    if _KNOWN_USERS is not None:
+        _KNOWN_USERS.discard(user_id)
+
 async def ensure_user_exists(user_id: int):
     """Ensures user exists in database, creating if necessary"""
-    # Use cache=false to ensure accurate verification
+    if _KNOWN_USERS is not None:
+        # O(1) membership test; only genuinely new users touch the DB
+        if user_id in _KNOWN_USERS:
+            return
+        
+        from repositories.user_repository import UserRepository
+        if await UserRepository().create_if_missing(user_id):
+            try:
+                from utils.audit_log import log_data_operation
+                asyncio.create_task(log_data_operation(
+                    user_id=user_id,
+                    action_type="CREATE",
+                    data_type="user_data",
+                    purpose="New user record creation"
+                ))
+            except Exception:
+                pass
+        return
+    
+    # Known users not loaded yet - use cache=false to ensure accurate verification
     if not await get_user(user_id, use_cache=False):
         await create_user(user_id)
 
+async def close_db() -> None:
+    """Close the connection pool (SQLite connections run on threads that would keep the process alive)"""
+    global _POOL
+    if _POOL is None:
+        return
+    pool, _POOL = _POOL, None
+    if isinstance(pool, aiomysql.Pool):
+        pool.close()
+        await pool.wait_closed()
+    else:
+        await pool.close()
+    logger.info("Database pool closed")
+
+def get_dialect() -> Dialect:
+    """SQL dialect of the configured backend (DB_BACKEND)"""
+    return _DIALECT
+
 def get_pool():
     """
     Get the database connection pool.
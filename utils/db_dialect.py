@@ -0,0 +1,126 @@
+# utils/db_dialect.py
+"""
+SQL Dialects
+
+The repositories write plain SQL with ``%s`` placeholders; the few
+constructs MySQL and SQLite spell differently (upserts, INSERT IGNORE,
+current timestamp, bounded DELETE) are rendered by the active dialect.
+
+    d = self.dialect
+    upsert = d.upsert_clause(["k"], {"n": "n + " + d.excluded("n")})
+    query = f"INSERT INTO t (k, n) VALUES (%s, %s) {upsert}"
+
+Note: NOW() is the MySQL session time zone; SQLite's CURRENT_TIMESTAMP is UTC.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+
+
+class Dialect(ABC):
+    """SQL fragments for one database backend"""
+
+    name: str
+    now: str  # Current timestamp expression
+    insert_ignore: str  # INSERT variant that skips duplicate keys
+    supports_partitions: bool
+    transactional_ddl: bool  # DDL can be rolled back
+
+    @abstractmethod
+    def excluded(self, column: str) -> str:
+        """Reference to the value an upsert tried to insert for a column"""
+
+    @abstractmethod
+    def upsert_clause(self, key_columns: Iterable[str], assignments: Dict[str, str]) -> str:
+        """
+        Conflict clause appended to an INSERT ... VALUES statement.
+
+        Args:
+            key_columns: Primary/unique key columns the conflict is detected on
+            assignments: Column -> SQL expression applied to the existing row
+
+        Returns:
+            SQL fragment
+        """
+
+    @abstractmethod
+    def delete_limited(self, table: str, where: str, order_by: Optional[str] = None) -> str:
+        """
+        DELETE of at most N rows matching ``where`` (N is the last parameter).
+
+        Args:
+            table: Table name
+            where: WHERE condition (may contain %s placeholders)
+            order_by: Column deciding which rows go first
+
+        Returns:
+            SQL statement
+        """
+
+
+class MySQLDialect(Dialect):
+    """MySQL / MariaDB (aiomysql)"""
+
+    name = "mysql"
+    now = "NOW()"
+    insert_ignore = "INSERT IGNORE"
+    supports_partitions = True
+    transactional_ddl = False
+
+    def excluded(self, column: str) -> str:
+        return f"VALUES({column})"
+
+    def upsert_clause(self, key_columns: Iterable[str], assignments: Dict[str, str]) -> str:
+        updates = ", ".join(f"{column} = {expression}" for column, expression in assignments.items())
+        return f"ON DUPLICATE KEY UPDATE {updates}"
+
+    def delete_limited(self, table: str, where: str, order_by: Optional[str] = None) -> str:
+        order = f" ORDER BY `{order_by}`" if order_by else ""
+        return f"DELETE FROM `{table}` WHERE {where}{order} LIMIT %s"
+
+
+class SQLiteDialect(Dialect):
+    """SQLite 3.24+ (aiosqlite)"""
+
+    name = "sqlite"
+    now = "CURRENT_TIMESTAMP"
+    insert_ignore = "INSERT OR IGNORE"
+    supports_partitions = False
+    transactional_ddl = True
+
+    def excluded(self, column: str) -> str:
+        return f"excluded.{column}"
+
+    def upsert_clause(self, key_columns: Iterable[str], assignments: Dict[str, str]) -> str:
+        keys = ", ".join(key_columns)
+        updates = ", ".join(f"{column} = {expression}" for column, expression in assignments.items())
+        return f"ON CONFLICT ({keys}) DO UPDATE SET {updates}"
+
+    def delete_limited(self, table: str, where: str, order_by: Optional[str] = None) -> str:
+        # DELETE ... LIMIT needs a compile-time option most builds lack
+        order = f" ORDER BY `{order_by}`" if order_by else ""
+        return f"DELETE FROM `{table}` WHERE rowid IN (SELECT rowid FROM `{table}` WHERE {where}{order} LIMIT %s)"
+
+
+MYSQL = MySQLDialect()
+SQLITE = SQLiteDialect()
+
+DIALECTS: Dict[str, Dialect] = {MYSQL.name: MYSQL, SQLITE.name: SQLITE}
+
+
+def get_dialect_by_name(name: str) -> Dialect:
+    """
+    Look up a dialect.
+
+    Args:
+        name: "mysql" or "sqlite"
+
+    Raises:
+        ValueError: Unknown backend name
+    """
+    try:
+        return DIALECTS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown database backend '{name}' (expected one of: {', '.join(DIALECTS)})") from None
@@ -0,0 +1,134 @@
+# utils/deadline_scheduler.py
+"""
+Deadline Scheduler
+
+Min-heap of (deadline, key) with lazy invalidation and a single sleeper task
+that wakes exactly at the next deadline. Used for inactivity timeouts where
+deadlines are pushed back on every bit of activity.
+
+Extending a deadline is an O(1) dict write: the stale heap entry is re-pushed
+with the current deadline only when it reaches the top. Cancelled keys are
+dropped the same way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DeadlineScheduler:
+    """Run a callback for each key whose deadline expires"""
+
+    def __init__(self, on_expire: Callable[[int], Awaitable[None]], name: str = "deadline"):
+        """
+        Initialize scheduler.
+
+        Args:
+            on_expire: Coroutine function called with the key when its deadline passes
+            name: Name used in logs
+        """
+        self._on_expire = on_expire
+        self._name = name
+        self._deadlines: Dict[int, float] = {}  # key -> current deadline (loop time)
+        self._heap: List[Tuple[float, int]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._deadlines
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def keys(self) -> List[int]:
+        """Get all scheduled keys"""
+        return list(self._deadlines)
+
+    def start(self) -> None:
+        """Start the sleeper task (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the sleeper task. Scheduled deadlines are kept."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, key: int, delay: float) -> None:
+        """
+        Set (or move) the deadline for a key.
+
+        Args:
+            key: Key to schedule
+            delay: Seconds from now until expiry
+        """
+        deadline = asyncio.get_running_loop().time() + delay
+        current = self._deadlines.get(key)
+        self._deadlines[key] = deadline
+
+        # A later deadline reuses the existing heap entry (re-pushed lazily)
+        if current is not None and deadline >= current:
+            return
+
+        heapq.heappush(self._heap, (deadline, key))
+        if self._heap[0] == (deadline, key):
+            self._wakeup.set()
+
+    def cancel(self, key: int) -> bool:
+        """
+        Remove a key. Its heap entry is discarded lazily.
+
+        Returns:
+            True if the key was scheduled
+        """
+        return self._deadlines.pop(key, None) is not None
+
+    def remaining(self, key: int) -> Optional[float]:
+        """Seconds until the key expires, or None if not scheduled"""
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return None
+        return max(0.0, deadline - asyncio.get_running_loop().time())
+
+    async def _run(self) -> None:
+        """Sleep until the earliest deadline, then fire or re-queue it"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            deadline, key = self._heap[0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            current = self._deadlines.get(key)
+            if current is None:
+                continue  # Cancelled
+            if current > deadline:
+                heapq.heappush(self._heap, (current, key))  # Extended since queued
+                continue
+
+            del self._deadlines[key]
+            asyncio.create_task(self._fire(key))
+
+    async def _fire(self, key: int) -> None:
+        """Run the expiry callback without blocking the sleeper"""
+        try:
+            await self._on_expire(key)
+        except Exception as e:
+            logger.error(f"[{self._name}] Error handling expiry for {key}: {e}", exc_info=True)
@@ -0,0 +1,96 @@
+"""
+Typed storage for XP event and audit details.
+
+Callers still pass ``details`` as a free-form dict. The fields that appear
+on most rows are stored in typed columns; the JSON column only keeps what
+is left. History reads rebuild the same dict from the columns, so callers
+see no difference and common rows need no JSON parsing at all.
+
+Keep the mappings in sync with migrations/005_compact_event_payloads.sql.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+# details key -> xp_events column
+XP_DETAIL_COLUMNS: Dict[str, str] = {
+    "channel_id": "channel_id",
+    "guild_id": "guild_id",
+    "minutes_spent": "minutes",
+    "message_length": "message_length",
+}
+
+# Keys not stored for XP events (derivable from channel_id)
+XP_DROPPED_DETAILS: Tuple[str, ...] = ("channel_name",)
+
+# details key -> data_audit_log column
+AUDIT_DETAIL_COLUMNS: Dict[str, str] = {
+    "before": "before_value",
+    "after": "after_value",
+    "delta": "delta",
+    "channel_id": "channel_id",
+}
+
+
+def split_details(
+    details: Optional[Mapping[str, Any]],
+    columns: Mapping[str, str],
+    dropped: Iterable[str] = ()
+) -> Tuple[Tuple[Optional[int], ...], Optional[str]]:
+    """
+    Split a details dict into typed column values and a JSON remainder.
+
+    Only integer values go to typed columns; anything else stays in the JSON.
+
+    Args:
+        details: Details passed by the caller
+        columns: details key -> column mapping
+        dropped: Keys discarded entirely
+
+    Returns:
+        (column values in mapping order, JSON of the remaining keys or None)
+    """
+    extras = {key: value for key, value in (details or {}).items() if key not in dropped}
+    values = []
+    for key in columns:
+        value = extras.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            values.append(extras.pop(key))
+        else:
+            values.append(None)
+    return tuple(values), json.dumps(extras) if extras else None
+
+
+def merge_details(row: Dict[str, Any], columns: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Rebuild a row's details dict from its typed columns and JSON remainder.
+
+    The typed columns are removed from the row and ``row["details"]`` is
+    replaced by the merged dict.
+
+    Args:
+        row: Row dict with the typed columns and details
+        columns: details key -> column mapping
+
+    Returns:
+        The same row
+    """
+    details: Dict[str, Any] = {}
+    for key, column in columns.items():
+        value = row.pop(column, None)
+        if value is not None:
+            details[key] = value
+
+    extras = row.get("details")
+    if isinstance(extras, (str, bytes)):
+        try:
+            extras = json.loads(extras)
+        except (json.JSONDecodeError, TypeError):
+            extras = None
+    if isinstance(extras, dict):
+        details.update(extras)
+
+    row["details"] = details
+    return row
@@ -12,6 +12,8 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from utils.logger import get_logger
 from utils.cache import get_cache_stats
+from utils.metrics import get_metrics_registry
+from utils.command_metrics import ACK_DEADLINE_MS, ACK_WARNING_MS, get_command_telemetry
 
 # Try to import psutil for system information
 try:
@@ -22,6 +24,180 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Background system sampling interval (see SystemResourceSampler)
+SYSTEM_SAMPLE_INTERVAL_SECONDS = 15.0
+
+_metrics_registry = get_metrics_registry()
+_PROCESS_CPU = _metrics_registry.gauge("ignis_process_cpu_percent", "Bot process CPU usage")
+_PROCESS_MEMORY = _metrics_registry.gauge("ignis_process_resident_memory_bytes", "Bot process resident memory")
+_SYSTEM_MEMORY = _metrics_registry.gauge("ignis_system_memory_percent", "System memory usage")
+_DISK_USAGE = _metrics_registry.gauge("ignis_disk_usage_percent", "Disk usage of the root volume")
+
+
+def _collect_system_resources(process: "psutil.Process") -> Dict[str, Any]:
+    """
+    Sample CPU, memory, disk and GPU usage (blocking; run in a worker thread).
+    
+    CPU percentages are measured since the previous call (interval=None), so
+    the first sample after startup reads 0.
+    
+    Args:
+        process: Bot process handle, reused between samples
+    
+    Returns:
+        Dict with system resource information
+    """
+    # CPU Information
+    cpu_percent = process.cpu_percent(interval=None)
+    cpu_count = psutil.cpu_count(logical=True)
+    cpu_freq = psutil.cpu_freq()
+    cpu_percent_system = psutil.cpu_percent(interval=None)
+    
+    # Memory Information
+    process_memory = process.memory_info()
+    process_memory_mb = process_memory.rss / (1024 * 1024)  # Convert to MB
+    process_memory_percent = process.memory_percent()
+    
+    system_memory = psutil.virtual_memory()
+    system_memory_total_gb = system_memory.total / (1024 * 1024 * 1024)
+    system_memory_used_gb = system_memory.used / (1024 * 1024 * 1024)
+    system_memory_available_gb = system_memory.available / (1024 * 1024 * 1024)
+    system_memory_percent = system_memory.percent
+    
+    # Disk Information
+    disk = psutil.disk_usage('/')
+    if platform.system() == 'Windows':
+        disk = psutil.disk_usage('C:')
+    disk_total_gb = disk.total / (1024 * 1024 * 1024)
+    disk_used_gb = disk.used / (1024 * 1024 * 1024)
+    disk_free_gb = disk.free / (1024 * 1024 * 1024)
+    disk_percent = (disk.used / disk.total) * 100
+    
+    # GPU Information (optional, try to get if available)
+    gpu_info = None
+    try:
+        # Try NVIDIA GPU (requires nvidia-ml-py)
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            gpu_count = pynvml.nvmlDeviceGetCount()
+            if gpu_count > 0:
+                gpu_handles = []
+                gpu_data = []
+                for i in range(gpu_count):
+                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                    gpu_handles.append(handle)
+                    
+                    # Get GPU name
+                    name = pynvml.nvmlDeviceGetName(handle).decode('utf-8')
+                    
+                    # Get GPU memory
+                    mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                    mem_total_gb = mem_info.total / (1024 * 1024 * 1024)
+                    mem_used_gb = mem_info.used / (1024 * 1024 * 1024)
+                    mem_free_gb = mem_info.free / (1024 * 1024 * 1024)
+                    mem_percent = (mem_info.used / mem_info.total) * 100
+                    
+                    # Get GPU utilization
+                    util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                    gpu_util_percent = util.gpu
+                    
+                    gpu_data.append({
+                        "name": name,
+                        "memory_total_gb": round(mem_total_gb, 2),
+                        "memory_used_gb": round(mem_used_gb, 2),
+                        "memory_free_gb": round(mem_free_gb, 2),
+                        "memory_percent": round(mem_percent, 1),
+                        "utilization_percent": gpu_util_percent
+                    })
+                
+                gpu_info = {
+                    "available": True,
+                    "count": gpu_count,
+                    "gpus": gpu_data
+                }
+        except ImportError:
+            # nvidia-ml-py not installed
+            pass
+        except Exception as e:
+            logger.debug(f"GPU detection failed: {e}")
+    except Exception:
+        # GPU not available or not NVIDIA
+        pass
+    
+    # Determine status
+    status = "healthy"
+    if cpu_percent > 90 or system_memory_percent > 90 or disk_percent > 90:
+        status = "warning"
+    if cpu_percent > 95 or system_memory_percent > 95 or disk_percent > 95:
+        status = "critical"
+    
+    return {
+        "status": status,
+        "cpu": {
+            "process_percent": round(cpu_percent, 1),
+            "system_percent": round(cpu_percent_system, 1),
+            "cores": cpu_count,
+            "frequency_mhz": round(cpu_freq.current, 0) if cpu_freq else None
+        },
+        "memory": {
+            "process_mb": round(process_memory_mb, 2),
+            "process_percent": round(process_memory_percent, 2),
+            "system_total_gb": round(system_memory_total_gb, 2),
+            "system_used_gb": round(system_memory_used_gb, 2),
+            "system_available_gb": round(system_memory_available_gb, 2),
+            "system_percent": round(system_memory_percent, 1)
+        },
+        "disk": {
+            "total_gb": round(disk_total_gb, 2),
+            "used_gb": round(disk_used_gb, 2),
+            "free_gb": round(disk_free_gb, 2),
+            "percent": round(disk_percent, 1)
+        },
+        "gpu": gpu_info if gpu_info else {"available": False, "note": "GPU monitoring not available"}
+    }
+
+
+class SystemResourceSampler:
+    """Samples system resources on a background interval"""
+    
+    def __init__(self, interval: float = SYSTEM_SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.latest: Optional[Dict[str, Any]] = None
+        self._process = psutil.Process(os.getpid()) if PSUTIL_AVAILABLE else None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start background sampling (idempotent, no-op without psutil)"""
+        if PSUTIL_AVAILABLE and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+    
+    def stop(self) -> None:
+        """Stop background sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    async def sample(self) -> Dict[str, Any]:
+        """Take one sample in a worker thread and publish it"""
+        result = await asyncio.to_thread(_collect_system_resources, self._process)
+        result["sampled_at"] = datetime.utcnow().isoformat()
+        self.latest = result
+        
+        _PROCESS_CPU.set(result["cpu"]["process_percent"])
+        _PROCESS_MEMORY.set(result["memory"]["process_mb"] * 1024 * 1024)
+        _SYSTEM_MEMORY.set(result["memory"]["system_percent"])
+        _DISK_USAGE.set(result["disk"]["percent"])
+        return result
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sample()
+            except Exception as e:
+                logger.warning(f"System resource sampling failed: {e}")
+            await asyncio.sleep(self.interval)
+
 
 class HealthCheck:
     """Health check system for monitoring bot status"""
@@ -168,23 +344,34 @@ class HealthCheck:
     
     async def check_command_latency(self) -> Dict[str, Any]:
         """
-        Check average command latency.
+        Check command latency over the telemetry window.
         
         Returns:
-            Dict with latency metrics
+            Dict with latency metrics (acknowledgement and total percentiles,
+            near/missed 3s deadline counts, slowest commands)
         """
-        # This would ideally track command execution times
-        # For now, return placeholder data
+        summary = get_command_telemetry().summary()
+        ack_p95 = summary["ack"]["p95"]
+        
+        status = "healthy"
+        if ack_p95 > ACK_WARNING_MS or summary["near_deadline"]:
+            status = "warning"
+        if ack_p95 > ACK_DEADLINE_MS:
+            status = "critical"
+        
         return {
-            "status": "healthy",
-            "average_latency_ms": 0,  # Would be calculated from metrics
-            "note": "Command latency tracking not yet implemented"
+            "status": status,
+            "average_latency_ms": summary["total"]["mean"],
+            **summary
         }
     
     async def check_system_resources(self) -> Dict[str, Any]:
         """
         Check system resource usage (CPU, Memory, Disk, GPU).
         
+        Reads the latest background sample (see SystemResourceSampler) instead
+        of sampling inside the request.
+        
         Returns:
             Dict with system resource information
         """
@@ -196,118 +383,10 @@ class HealthCheck:
             }
         
         try:
-            # Get current process
-            process = psutil.Process(os.getpid())
-            
-            # CPU Information
-            cpu_percent = process.cpu_percent(interval=0.1)
-            cpu_count = psutil.cpu_count(logical=True)
-            cpu_freq = psutil.cpu_freq()
-            cpu_percent_system = psutil.cpu_percent(interval=0.1)
-            
-            # Memory Information
-            process_memory = process.memory_info()
-            process_memory_mb = process_memory.rss / (1024 * 1024)  # Convert to MB
-            process_memory_percent = process.memory_percent()
-            
-            system_memory = psutil.virtual_memory()
-            system_memory_total_gb = system_memory.total / (1024 * 1024 * 1024)
-            system_memory_used_gb = system_memory.used / (1024 * 1024 * 1024)
-            system_memory_available_gb = system_memory.available / (1024 * 1024 * 1024)
-            system_memory_percent = system_memory.percent
-            
-            # Disk Information
-            disk = psutil.disk_usage('/')
-            if platform.system() == 'Windows':
-                disk = psutil.disk_usage('C:')
-            disk_total_gb = disk.total / (1024 * 1024 * 1024)
-            disk_used_gb = disk.used / (1024 * 1024 * 1024)
-            disk_free_gb = disk.free / (1024 * 1024 * 1024)
-            disk_percent = (disk.used / disk.total) * 100
-            
-            # GPU Information (optional, try to get if available)
-            gpu_info = None
-            try:
-                # Try NVIDIA GPU (requires nvidia-ml-py)
-                try:
-                    import pynvml
-                    pynvml.nvmlInit()
-                    gpu_count = pynvml.nvmlDeviceGetCount()
-                    if gpu_count > 0:
-                        gpu_handles = []
-                        gpu_data = []
-                        for i in range(gpu_count):
-                            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                            gpu_handles.append(handle)
-                            
-                            # Get GPU name
-                            name = pynvml.nvmlDeviceGetName(handle).decode('utf-8')
-                            
-                            # Get GPU memory
-                            mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                            mem_total_gb = mem_info.total / (1024 * 1024 * 1024)
-                            mem_used_gb = mem_info.used / (1024 * 1024 * 1024)
-                            mem_free_gb = mem_info.free / (1024 * 1024 * 1024)
-                            mem_percent = (mem_info.used / mem_info.total) * 100
-                            
-                            # Get GPU utilization
-                            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                            gpu_util_percent = util.gpu
-                            
-                            gpu_data.append({
-                                "name": name,
-                                "memory_total_gb": round(mem_total_gb, 2),
-                                "memory_used_gb": round(mem_used_gb, 2),
-                                "memory_free_gb": round(mem_free_gb, 2),
-                                "memory_percent": round(mem_percent, 1),
-                                "utilization_percent": gpu_util_percent
-                            })
-                        
-                        gpu_info = {
-                            "available": True,
-                            "count": gpu_count,
-                            "gpus": gpu_data
-                        }
-                except ImportError:
-                    # nvidia-ml-py not installed
-                    pass
-                except Exception as e:
-                    logger.debug(f"GPU detection failed: {e}")
-            except Exception:
-                # GPU not available or not NVIDIA
-                pass
-            
-            # Determine status
-            status = "healthy"
-            if cpu_percent > 90 or system_memory_percent > 90 or disk_percent > 90:
-                status = "warning"
-            if cpu_percent > 95 or system_memory_percent > 95 or disk_percent > 95:
-                status = "critical"
-            
-            return {
-                "status": status,
-                "cpu": {
-                    "process_percent": round(cpu_percent, 1),
-                    "system_percent": round(cpu_percent_system, 1),
-                    "cores": cpu_count,
-                    "frequency_mhz": round(cpu_freq.current, 0) if cpu_freq else None
-                },
-                "memory": {
-                    "process_mb": round(process_memory_mb, 2),
-                    "process_percent": round(process_memory_percent, 2),
-                    "system_total_gb": round(system_memory_total_gb, 2),
-                    "system_used_gb": round(system_memory_used_gb, 2),
-                    "system_available_gb": round(system_memory_available_gb, 2),
-                    "system_percent": round(system_memory_percent, 1)
-                },
-                "disk": {
-                    "total_gb": round(disk_total_gb, 2),
-                    "used_gb": round(disk_used_gb, 2),
-                    "free_gb": round(disk_free_gb, 2),
-                    "percent": round(disk_percent, 1)
-                },
-                "gpu": gpu_info if gpu_info else {"available": False, "note": "GPU monitoring not available"}
-            }
+            sampler = get_system_sampler()
+            if sampler.latest is None:
+                await sampler.sample()
+            return dict(sampler.latest)
         except Exception as e:
             logger.error(f"System resources check failed: {e}", exc_info=True)
             return {
@@ -381,3 +460,12 @@ def get_health_check() -> HealthCheck:
     """Get global health check instance"""
     return _health_check
 
+
+# Global system sampler instance
+_system_sampler = SystemResourceSampler()
+
+
+def get_system_sampler() -> SystemResourceSampler:
+    """Get global system resource sampler instance"""
+    return _system_sampler
+
@@ -0,0 +1,156 @@
+# utils/histogram.py
+"""
+Fixed-Memory Latency Histograms
+
+HDR-style log-linear histograms: each power of two is split into a fixed
+number of linear sub-buckets, so every recorded value lands in a bucket whose
+width is at most 1/SUB_BUCKETS of its magnitude. Memory does not depend on
+the number of samples, and percentiles are exact to that relative precision.
+
+RollingHistogram keeps one histogram per time slot in a ring, so percentiles
+can be read over a recent window instead of the whole uptime.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Dict, Iterable, Optional
+
+# 8 sub-buckets per power of two -> <= 12.5% relative error
+SUB_BUCKETS = 8
+# 2^17 ms ~ 131 s; larger values go into the last bucket
+MAX_EXPONENT = 17
+BUCKET_COUNT = 1 + (MAX_EXPONENT + 1) * SUB_BUCKETS
+
+
+def bucket_index(value: float) -> int:
+    """Get the bucket for a value (bucket 0 holds everything below 1)"""
+    if value < 1:
+        return 0
+    exponent = min(int(math.log2(value)), MAX_EXPONENT)
+    sub = int((value / (1 << exponent) - 1) * SUB_BUCKETS)
+    return min(1 + exponent * SUB_BUCKETS + min(sub, SUB_BUCKETS - 1), BUCKET_COUNT - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Get the exclusive upper bound of a bucket"""
+    if index == 0:
+        return 1.0
+    exponent, sub = divmod(index - 1, SUB_BUCKETS)
+    return (1 << exponent) * (1 + (sub + 1) / SUB_BUCKETS)
+
+
+class LatencyHistogram:
+    """Log-linear histogram of non-negative values (milliseconds)"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = array("I", bytes(4 * BUCKET_COUNT))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a value"""
+        value = max(value, 0.0)
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's samples to this one"""
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            if n:
+                counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        """Drop all samples"""
+        self.counts = array("I", bytes(4 * BUCKET_COUNT))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Get a percentile (upper bound of the bucket containing it).
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Value in the histogram's unit, 0.0 if empty
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bucket_upper_bound(i), self.max)
+        return self.max
+
+    def count_above(self, threshold: float) -> int:
+        """Count samples in buckets entirely at or above a threshold"""
+        return sum(self.counts[bucket_index(threshold) + 1:])
+
+    @property
+    def mean(self) -> float:
+        """Average value, 0.0 if empty"""
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Get count, mean, max and percentiles rounded for display"""
+        result = {"count": self.count, "mean": round(self.mean, 1), "max": round(self.max, 1)}
+        for p in percentiles:
+            result[f"p{p:g}"] = round(self.percentile(p), 1)
+        return result
+
+
+class RollingHistogram:
+    """LatencyHistogram over a sliding time window, kept as a ring of slots"""
+
+    __slots__ = ("slot_seconds", "_slots", "_slot_ids")
+
+    def __init__(self, window_seconds: float = 3600.0, slots: int = 6):
+        """
+        Initialize rolling histogram.
+
+        Args:
+            window_seconds: Length of the window
+            slots: Number of slots the window is split into
+        """
+        self.slot_seconds = window_seconds / slots
+        self._slots = [LatencyHistogram() for _ in range(slots)]
+        self._slot_ids = [-1] * slots
+
+    def _slot(self, now: float) -> LatencyHistogram:
+        slot_id = int(now // self.slot_seconds)
+        i = slot_id % len(self._slots)
+        if self._slot_ids[i] != slot_id:
+            self._slots[i].reset()
+            self._slot_ids[i] = slot_id
+        return self._slots[i]
+
+    def record(self, value: float, now: Optional[float] = None) -> None:
+        """Add a value to the current slot"""
+        self._slot(time.monotonic() if now is None else now).record(value)
+
+    def snapshot(self, now: Optional[float] = None) -> LatencyHistogram:
+        """Get a histogram merging every slot still inside the window"""
+        now = time.monotonic() if now is None else now
+        current = int(now // self.slot_seconds)
+        merged = LatencyHistogram()
+        for slot_id, histogram in zip(self._slot_ids, self._slots):
+            if current - len(self._slots) < slot_id <= current:
+                merged.merge(histogram)
+        return merged
@@ -0,0 +1,90 @@
+# utils/keyed_work_queue.py
+"""
+Keyed Work Queue
+
+FIFO of keys processed by a single worker task. Queuing a key that is
+already waiting only replaces its payload, so a burst of events for the same
+key (e.g. several role updates for one member) results in one unit of work
+using the latest payload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from utils.logger import get_logger
+from utils.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+_PENDING = get_metrics_registry().gauge("ignis_work_queue_pending", "Keys waiting in a work queue", ("queue",))
+_PROCESSED = get_metrics_registry().counter("ignis_work_queue_processed_total", "Keys processed by a work queue", ("queue",))
+
+
+class KeyedWorkQueue:
+    """Deduplicated per-key work queue with one worker"""
+
+    def __init__(self, handler: Callable[[Hashable, Any], Awaitable[None]], name: str = "work"):
+        """
+        Initialize queue.
+
+        Args:
+            handler: Coroutine function called with (key, latest payload)
+            name: Name used in logs
+        """
+        self._handler = handler
+        self._name = name
+        self._pending: Dict[Hashable, Any] = {}  # key -> latest payload, in queue order
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the worker task (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the worker task. Pending keys are kept."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def put(self, key: Hashable, payload: Any = None) -> bool:
+        """
+        Queue work for a key.
+
+        Args:
+            key: Work key
+            payload: Data passed to the handler (replaces any pending payload)
+
+        Returns:
+            True if the key was newly queued, False if it was already pending
+        """
+        is_new = key not in self._pending
+        self._pending[key] = payload
+        _PENDING.set(len(self._pending), queue=self._name)
+        self._wakeup.set()
+        return is_new
+
+    async def _run(self) -> None:
+        """Process keys in the order they were first queued"""
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            key = next(iter(self._pending))
+            payload = self._pending.pop(key)
+            _PENDING.set(len(self._pending), queue=self._name)
+            _PROCESSED.inc(queue=self._name)
+            try:
+                await self._handler(key, payload)
+            except Exception as e:
+                logger.error(f"[{self._name}] Error processing {key}: {e}", exc_info=True)
@@ -0,0 +1,193 @@
+# utils/log_sink.py
+"""
+Buffered Log Sink
+
+Collects log embeds for a short window and sends them in as few messages as
+possible instead of one message per event. Small batches go out as regular
+embeds (up to 10 per message, 6000 characters of embed text); bursts are folded into compact multi-line
+digest embeds. Every event is sent at most `window` seconds after it was
+queued, and the buffer is bounded so a flood can't grow memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
+import discord
+from utils.logger import get_logger
+from utils.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+_LOG_EVENTS = get_metrics_registry().counter("ignis_log_sink_events_total", "Log events by outcome", ("sink", "outcome"))
+
+# Discord limits
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_DESCRIPTION = 4096
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class BufferedLogSink:
+    """Batch embeds for a log channel"""
+
+    def __init__(
+        self,
+        get_channel: Callable[[], Awaitable[Optional[discord.abc.Messageable]]],
+        window: float = 3.0,
+        max_pending: int = 500,
+        digest_title: str = "Activity Digest",
+        footer: str = "Activity Log",
+        name: str = "LOG_SINK"
+    ):
+        """
+        Initialize sink.
+
+        Args:
+            get_channel: Coroutine function returning the destination channel (or None)
+            window: Max seconds an event waits before being sent
+            max_pending: Max queued events; extra events are dropped and counted
+            digest_title: Title of digest embeds
+            footer: Footer text of digest embeds
+            name: Name used in logs
+        """
+        self._get_channel = get_channel
+        self.window = window
+        self.max_pending = max_pending
+        self.digest_title = digest_title
+        self.footer = footer
+        self._name = name
+        # (embed, digest line) - entries without a line are always sent as full embeds
+        self._pending: List[Tuple[discord.Embed, Optional[str]]] = []
+        self._dropped = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._send_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, embed: discord.Embed, digest_line: Optional[str] = None) -> None:
+        """
+        Queue an embed. Sent within `window` seconds.
+
+        Args:
+            embed: Full embed (used when the batch is small)
+            digest_line: One-line summary used in digest mode (None = always send full embed)
+        """
+        if len(self._pending) >= self.max_pending:
+            self._dropped += 1
+            _LOG_EVENTS.inc(sink=self._name, outcome="dropped")
+            if self._dropped == 1:
+                logger.warning(f"[{self._name}] Buffer full ({self.max_pending}), dropping events until next flush")
+            return
+
+        self._pending.append((embed, digest_line))
+        _LOG_EVENTS.inc(sink=self._name, outcome="queued")
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        """Flush once the oldest queued event reaches the latency bound"""
+        await asyncio.sleep(self.window)
+        self._timer = None  # Events queued while sending start a new window
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything queued so far"""
+        async with self._send_lock:
+            entries, self._pending = self._pending, []
+            dropped, self._dropped = self._dropped, 0
+            if not entries and not dropped:
+                return
+
+            try:
+                channel = await self._get_channel()
+            except Exception as e:
+                logger.error(f"[{self._name}] Error resolving log channel: {e}", exc_info=True)
+                return
+            if channel is None:
+                return
+
+            for embeds in self._build_messages(entries, dropped):
+                try:
+                    await channel.send(embeds=embeds)
+                except discord.HTTPException as e:
+                    logger.warning(f"[{self._name}] Failed to send {len(embeds)} log embed(s): {e}")
+
+    async def close(self) -> None:
+        """Cancel the pending window and flush immediately (call on shutdown)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+
+    def _build_messages(
+        self,
+        entries: List[Tuple[discord.Embed, Optional[str]]],
+        dropped: int
+    ) -> List[List[discord.Embed]]:
+        """
+        Pack entries into messages within Discord's per-message limits.
+
+        Small batches keep their full embeds; larger ones fold every entry
+        that has a digest line into digest embeds.
+        """
+        if len(entries) <= MAX_EMBEDS_PER_MESSAGE and not dropped:
+            return self._pack([embed for embed, _ in entries])
+
+        full = [embed for embed, line in entries if line is None]
+        lines = [line for _, line in entries if line is not None]
+        if dropped:
+            lines.append(f"⚠️ {dropped} event(s) dropped (log buffer full)")
+
+        return self._pack(full + self._build_digests(lines, len(entries) - len(full)))
+
+    @staticmethod
+    def _pack(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+        """Group embeds into messages of up to 10 embeds and 6000 characters"""
+        messages: List[List[discord.Embed]] = []
+        size = 0
+        for embed in embeds:
+            length = len(embed)
+            if (
+                not messages
+                or len(messages[-1]) >= MAX_EMBEDS_PER_MESSAGE
+                or size + length > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                messages.append([])
+                size = 0
+            messages[-1].append(embed)
+            size += length
+        return messages
+
+    def _build_digests(self, lines: List[str], event_count: int) -> List[discord.Embed]:
+        """Split digest lines into embeds that each fit a message on their own"""
+        # Title and footer count towards the message total too; reserve room
+        # for the longest title ("... (n/n)") and footer this batch can produce
+        overhead = len(self.digest_title) + len(f" ({len(lines)}/{len(lines)})")
+        overhead += len(f"{event_count} event(s) • {self.footer}")
+        budget = min(MAX_EMBED_DESCRIPTION, MAX_EMBED_CHARS_PER_MESSAGE - overhead)
+
+        chunks: List[List[str]] = []
+        size = 0
+        for line in lines:
+            line = line[:budget]
+            if not chunks or size + len(line) + 1 > budget:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(line)
+            size += len(line) + 1
+
+        now = datetime.now(timezone.utc)
+        digests = []
+        for index, chunk in enumerate(chunks, start=1):
+            title = self.digest_title if len(chunks) == 1 else f"{self.digest_title} ({index}/{len(chunks)})"
+            embed = discord.Embed(
+                title=title,
+                description="\n".join(chunk),
+                color=discord.Color.blurple(),
+                timestamp=now
+            )
+            embed.set_footer(text=f"{event_count} event(s) • {self.footer}")
+            digests.append(embed)
+        return digests
@@ -0,0 +1,77 @@
+# utils/metrics_server.py
+"""
+Local Metrics Endpoint
+
+Optional aiohttp server (METRICS_ENABLED) exposing, without a Discord round
+trip:
+- GET /metrics: the metrics registry in Prometheus text format;
+- GET /health: the full health report as JSON (same data as /health).
+
+Binds to 127.0.0.1 by default; expose it only behind something that
+restricts access.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Optional
+from aiohttp import web
+from utils.health_check import get_health_check
+from utils.logger import get_logger
+from utils.metrics import MetricsRegistry, get_metrics_registry
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """aiohttp server for the metrics and health endpoints"""
+
+    def __init__(self, host: str, port: int, registry: Optional[MetricsRegistry] = None):
+        """
+        Initialize metrics server.
+
+        Args:
+            host: Bind address
+            port: Bind port
+            registry: Metrics registry (default: global registry)
+        """
+        self.host = host
+        self.port = port
+        self.registry = registry or get_metrics_registry()
+        self._runner: Optional[web.AppRunner] = None
+
+    def build_app(self) -> web.Application:
+        """Build the aiohttp application"""
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        app.router.add_get("/health", self._handle_health)
+        return app
+
+    async def start(self) -> None:
+        """Start serving (idempotent)"""
+        if self._runner is not None:
+            return
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.registry.render().encode("utf-8"), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        report = await get_health_check().get_full_health_report()
+        status = 200 if report.get("status") == "healthy" else 503
+        return web.Response(
+            text=json.dumps(report, default=str),
+            status=status,
+            content_type="application/json"
+        )
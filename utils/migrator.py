@@ -0,0 +1,331 @@
+# utils/migrator.py
+"""
+Versioned Schema Migrations
+
+Applies the numbered files in migrations/ (``NNN_description.sql``) once each,
+in version order, recording them in ``schema_migrations`` with a checksum.
+
+Startup cost when the schema is current is a single SELECT. Pending
+migrations are applied while holding a MySQL advisory lock (GET_LOCK), so
+concurrent instances wait for each other instead of racing on DDL; the
+applied versions are re-read after the lock is taken.
+
+MySQL commits DDL implicitly, so a migration is not atomic: a failure leaves
+it unrecorded and it is re-run on the next start. Statements whose object
+already exists (tables/columns/indexes created before this runner existed)
+are skipped so existing databases adopt the baseline without manual steps.
+
+The SQLite backend keeps its own files in migrations/sqlite/ with the same
+version numbers; there DDL is transactional, so pending migrations are
+applied in one BEGIN IMMEDIATE transaction instead of under GET_LOCK.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+import aiomysql
+from utils.db_dialect import MYSQL, Dialect
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+SQLITE_MIGRATIONS_DIR = MIGRATIONS_DIR / "sqlite"
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+MIGRATION_LOCK_NAME = "ignis_schema_migrations"
+MIGRATION_LOCK_TIMEOUT_SECONDS = 120
+
+# MySQL error codes meaning "object already exists"
+ER_TABLE_EXISTS = 1050
+ER_DUP_FIELDNAME = 1060
+ER_DUP_KEYNAME = 1061
+ER_NO_SUCH_TABLE = 1146
+ALREADY_EXISTS_ERRORS = {ER_TABLE_EXISTS, ER_DUP_FIELDNAME, ER_DUP_KEYNAME}
+
+# SQLite reports the same conditions only in the message
+SQLITE_ALREADY_EXISTS_MESSAGES = ("already exists", "duplicate column name")
+
+DATABASE_ERRORS = (aiomysql.Error, sqlite3.Error)
+
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        execution_ms INT NOT NULL DEFAULT 0,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+SQLITE_SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        checksum TEXT NOT NULL,
+        execution_ms INTEGER NOT NULL DEFAULT 0,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class MigrationError(RuntimeError):
+    """Raised when migrations cannot be applied safely"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A numbered migration file"""
+    version: int
+    name: str
+    sql: str
+    checksum: str
+
+    @property
+    def statements(self) -> List[str]:
+        return split_statements(self.sql)
+
+
+def compute_checksum(sql: str) -> str:
+    """SHA-256 of the file contents, line endings normalized (Windows checkouts match)"""
+    return hashlib.sha256(sql.replace("\r\n", "\n").encode("utf-8")).hexdigest()
+
+
+def split_statements(sql: str) -> List[str]:
+    """
+    Split a SQL script into statements on top-level semicolons.
+
+    Comments (``--``, ``#``, ``/* */``) are dropped and semicolons inside
+    quoted strings or identifiers are kept.
+
+    Args:
+        sql: Script contents
+
+    Returns:
+        Non-empty statements without trailing semicolons
+    """
+    statements: List[str] = []
+    current: List[str] = []
+    i, length = 0, len(sql)
+    quote: Optional[str] = None
+
+    while i < length:
+        char = sql[i]
+        if quote:
+            current.append(char)
+            if char == "\\" and quote != "`" and i + 1 < length:
+                current.append(sql[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in ("'", '"', "`"):
+            quote = char
+            current.append(char)
+        elif sql.startswith("--", i) or char == "#":
+            end = sql.find("\n", i)
+            i = length if end == -1 else end
+            continue
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+            current.append(" ")
+            continue
+        elif char == ";":
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(char)
+        i += 1
+
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    Load numbered migration files in version order.
+
+    Files that don't match ``NNN_description.sql`` (e.g. legacy manual
+    scripts) are ignored.
+
+    Raises:
+        MigrationError: If two files share a version
+    """
+    migrations: Dict[int, Migration] = {}
+    for path in sorted(Path(directory).glob("*.sql")):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}: {migrations[version].name} and {path.name}")
+        sql = path.read_text(encoding="utf-8")
+        migrations[version] = Migration(version, path.name, sql, compute_checksum(sql))
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def _error_code(error: Exception) -> Optional[int]:
+    return error.args[0] if error.args and isinstance(error.args[0], int) else None
+
+
+def _is_missing_table(error: Exception) -> bool:
+    if isinstance(error, sqlite3.Error):
+        return "no such table" in str(error)
+    return _error_code(error) == ER_NO_SUCH_TABLE
+
+
+def _is_already_exists(error: Exception) -> bool:
+    if isinstance(error, sqlite3.Error):
+        return any(message in str(error) for message in SQLITE_ALREADY_EXISTS_MESSAGES)
+    return _error_code(error) in ALREADY_EXISTS_ERRORS
+
+
+class MigrationRunner:
+    """Applies pending migrations to the database behind a pool"""
+
+    def __init__(self, pool: aiomysql.Pool, directory: Optional[Path] = None, dialect: Dialect = MYSQL):
+        """
+        Initialize migration runner.
+
+        Args:
+            pool: Database connection pool
+            directory: Directory holding the numbered .sql files (default: per dialect)
+            dialect: SQL dialect of the pool
+        """
+        self.pool = pool
+        self.dialect = dialect
+        if directory is None:
+            directory = SQLITE_MIGRATIONS_DIR if dialect.name == "sqlite" else MIGRATIONS_DIR
+        self.directory = Path(directory)
+
+    async def _applied(self, cursor) -> Dict[int, str]:
+        """Applied version -> checksum ({} if the table doesn't exist yet)"""
+        try:
+            await cursor.execute("SELECT version, checksum FROM schema_migrations")
+        except DATABASE_ERRORS as e:
+            if _is_missing_table(e):
+                return {}
+            raise
+        return {int(version): checksum for version, checksum in await cursor.fetchall()}
+
+    def _pending(self, migrations: List[Migration], applied: Dict[int, str]) -> List[Migration]:
+        """Verify checksums of applied migrations and return the rest"""
+        known = {migration.version for migration in migrations}
+        unknown = sorted(set(applied) - known)
+        if unknown:
+            logger.warning(f"Database has migrations this build doesn't know about: {unknown}")
+
+        for migration in migrations:
+            checksum = applied.get(migration.version)
+            if checksum is not None and checksum != migration.checksum:
+                raise MigrationError(
+                    f"Checksum mismatch for applied migration {migration.name}; "
+                    f"add a new migration instead of editing an applied one"
+                )
+        return [migration for migration in migrations if migration.version not in applied]
+
+    async def status(self) -> List[Dict[str, object]]:
+        """Each migration file with whether it has been applied"""
+        migrations = load_migrations(self.directory)
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                applied = await self._applied(cursor)
+        return [
+            {
+                "version": migration.version,
+                "name": migration.name,
+                "applied": migration.version in applied,
+                "checksum_ok": applied.get(migration.version, migration.checksum) == migration.checksum
+            }
+            for migration in migrations
+        ]
+
+    async def run(self) -> List[int]:
+        """
+        Apply pending migrations.
+
+        Returns:
+            Versions applied by this call (empty when already current)
+
+        Raises:
+            MigrationError: On checksum mismatch or lock timeout
+        """
+        migrations = load_migrations(self.directory)
+
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                # Fast path: one SELECT, no DDL
+                if not self._pending(migrations, await self._applied(cursor)):
+                    logger.info(f"Database schema is current ({len(migrations)} migrations)")
+                    return []
+
+                if self.dialect.transactional_ddl:
+                    return await self._run_in_transaction(conn, cursor, migrations)
+
+                await cursor.execute(
+                    "SELECT GET_LOCK(%s, %s)",
+                    (MIGRATION_LOCK_NAME, MIGRATION_LOCK_TIMEOUT_SECONDS)
+                )
+                row = await cursor.fetchone()
+                if not row or row[0] != 1:
+                    raise MigrationError(
+                        f"Timed out after {MIGRATION_LOCK_TIMEOUT_SECONDS}s waiting for the migration lock"
+                    )
+
+                try:
+                    await cursor.execute(SCHEMA_MIGRATIONS_DDL)
+                    return await self._apply_pending(cursor, migrations)
+                finally:
+                    await cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK_NAME,))
+                    await cursor.fetchone()
+
+    async def _run_in_transaction(self, conn, cursor, migrations: List[Migration]) -> List[int]:
+        """Apply all pending migrations atomically (backends with transactional DDL)"""
+        await conn.begin()
+        try:
+            await cursor.execute(SQLITE_SCHEMA_MIGRATIONS_DDL)
+            applied_now = await self._apply_pending(cursor, migrations)
+            await conn.commit()
+            return applied_now
+        except Exception:
+            await conn.rollback()
+            raise
+
+    async def _apply_pending(self, cursor, migrations: List[Migration]) -> List[int]:
+        """Apply what is still pending once the lock is held"""
+        # Another instance may have applied some while we waited
+        pending = self._pending(migrations, await self._applied(cursor))
+        applied_now = []
+        for migration in pending:
+            await self._apply(cursor, migration)
+            applied_now.append(migration.version)
+        return applied_now
+
+    async def _apply(self, cursor, migration: Migration) -> None:
+        """Execute one migration and record it"""
+        logger.info(f"Applying migration {migration.name}")
+        start = time.perf_counter()
+        for statement in migration.statements:
+            try:
+                await cursor.execute(statement)
+            except DATABASE_ERRORS as e:
+                if not _is_already_exists(e):
+                    raise MigrationError(f"Migration {migration.name} failed: {e}") from e
+                logger.info(f"{migration.name}: skipping statement, object already exists ({e})")
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+
+        await cursor.execute(
+            "INSERT INTO schema_migrations (version, name, checksum, execution_ms) VALUES (%s, %s, %s, %s)",
+            (migration.version, migration.name, migration.checksum, elapsed_ms)
+        )
+        logger.info(f"Applied migration {migration.name} in {elapsed_ms}ms")
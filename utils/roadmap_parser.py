@@ -3,14 +3,26 @@ Roadmap Parser - Extract roadmap information from documentation files.
 
 Reads development documentation and extracts information about
 recent implementations, improvements, and upcoming features.
+
+Parsing is cached per file: the sections extracted from each document are
+memoized on path + (mtime, size), so editing one file only re-parses that
+file, and the merged roadmap data is reused until any signature changes.
+Periodic roadmap checks cost a few stat() calls when nothing changed. Use
+get_latest_roadmap_data_async() from the event loop.
 """
 
 from __future__ import annotations
 
-import os
+import asyncio
+import copy
+import hashlib
 import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Tuple
 from datetime import datetime
 from utils.logger import get_logger
 
@@ -23,6 +35,80 @@ IMPLEMENTACOES_FILE = DOCS_ROOT / "02_ARQUITETURA" / "IMPLEMENTACOES_COMPLETAS.m
 CHANGELOG_FILE = Path("CHANGELOG.md")
 STATUS_FILE = DOCS_ROOT / "02_ARQUITETURA" / "STATUS_PROJETO.md"
 
+ROADMAP_SOURCE_FILES = (ROADMAP_FILE, IMPLEMENTACOES_FILE, CHANGELOG_FILE, STATUS_FILE)
+
+# Section titles searched in the combined documentation
+FEATURE_SECTION_TITLES = (
+    "New Features",
+    "Features",
+    "Funcionalidades",
+    "Implementações",
+    "Implementações Completas",
+    "Completed Features",
+)
+FIX_SECTION_TITLES = (
+    "Fixes",
+    "Bug Fixes",
+    "Correções",
+    "Improvements",
+    "Melhorias",
+    "Optimizations",
+    "Otimizações",
+)
+UPCOMING_SECTION_TITLES = (
+    "Upcoming",
+    "Próximos Passos",
+    "Next Steps",
+    "Roadmap",
+    "Planned Features",
+    "Features Planejadas",
+)
+
+# Precompiled patterns
+_BOLD_ITEM_RE = re.compile(r"[-*]\s+\*\*(.+?)\*\*", re.MULTILINE)
+_REGULAR_ITEM_RE = re.compile(r"^[-*]\s+(?!\*\*)(.+?)(?=\n|$)", re.MULTILINE)
+_NUMBERED_ITEM_RE = re.compile(r"^\d+\.\s+(.+?)$", re.MULTILINE)
+_CHECKBOX_RE = re.compile(r"- \[x\]\s+(.+?)(?=\n|$)", re.MULTILINE | re.IGNORECASE)
+_UNRELEASED_DATE_RE = re.compile(r"###\s+.*?\((\d{4}-\d{2}-\d{2})\)")
+_RELEASE_DATE_RE = re.compile(r"##\s+\[?(\d{4}-\d{2}-\d{2})\]?")
+_UNRELEASED_SECTION_RE = re.compile(r"##\s+\[Unreleased\].*?(?=##\s+\[|\Z)", re.DOTALL | re.IGNORECASE)
+_ADDED_RE = re.compile(r"#### Added\s*\n(.*?)(?=#### |### |## |\Z)", re.DOTALL | re.IGNORECASE)
+_CHANGED_RE = re.compile(r"#### Changed\s*\n(.*?)(?=#### |### |## |\Z)", re.DOTALL | re.IGNORECASE)
+_CHANGELOG_ITEM_RE = re.compile(r"[-*]\s+(.+?)(?=\n[-*]|\n\n|\Z)", re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_CODE_RE = re.compile(r'`(.+?)`')
+_LINK_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+_LEADING_MARKS_RE = re.compile(r'^[✅❌🔧✨📋🎯🚀\s]+')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+ALL_SECTION_TITLES = FEATURE_SECTION_TITLES + FIX_SECTION_TITLES + UPCOMING_SECTION_TITLES
+
+
+@dataclass(frozen=True)
+class ParsedDocument:
+    """Everything extracted from one documentation file"""
+    content: str
+    sections: Mapping[str, Tuple[str, ...]]  # section title -> items, only for sections present
+    checked: Tuple[str, ...]
+    changelog: Optional[Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]] = None
+
+
+# Cache: path -> ((mtime_ns, size), parsed document) and merged roadmap data keyed on all signatures
+FileSignature = Optional[Tuple[int, int]]
+_document_cache: Dict[Path, Tuple[FileSignature, ParsedDocument]] = {}
+_roadmap_cache: Optional[Tuple[Tuple[FileSignature, ...], Dict[str, Any]]] = None
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=64)
+def _section_pattern(section_title: str) -> Pattern[str]:
+    """Compiled pattern for a section title (compiled once per title)"""
+    return re.compile(
+        rf"##?\s*{re.escape(section_title)}.*?\n(.*?)(?=\n##|\Z)",
+        re.IGNORECASE | re.DOTALL
+    )
+
 
 def parse_markdown_section(content: str, section_title: str) -> List[str]:
     """
@@ -35,46 +121,30 @@ def parse_markdown_section(content: str, section_title: str) -> List[str]:
     Returns:
         List of items found in the section
     """
+    match = _section_pattern(section_title).search(content)
+    return _section_items(match.group(1)) if match else []
+
+
+def _section_items(section_content: str) -> List[str]:
+    """Extract the list items of one section body"""
     items = []
     
-    # Pattern to find section and its content
-    pattern = rf"##?\s*{re.escape(section_title)}.*?\n(.*?)(?=\n##|\Z)"
-    match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+    # First, extract main items with bold titles (e.g., "- **Title**")
+    # This captures the main feature/fix titles
+    bold_items = _BOLD_ITEM_RE.findall(section_content)
+    items.extend([item.strip() for item in bold_items if item.strip()])
     
-    if match:
-        section_content = match.group(1)
-        
-        # First, extract main items with bold titles (e.g., "- **Title**")
-        # This captures the main feature/fix titles
-        bold_item_pattern = r"[-*]\s+\*\*(.+?)\*\*"
-        bold_items = re.findall(bold_item_pattern, section_content, re.MULTILINE)
-        items.extend([item.strip() for item in bold_items if item.strip()])
-        
-        # Then extract regular list items (lines starting with -, *)
-        # But skip items that are sub-items (indented with spaces)
-        item_pattern = r"^[-*]\s+(?!\*\*)(.+?)(?=\n|$)"
-        regular_items = re.findall(item_pattern, section_content, re.MULTILINE)
-        # Filter out items that are sub-items (have leading spaces before - or *)
-        for item in regular_items:
-            # Check if this line is indented (sub-item)
-            line_match = re.search(rf"^[-*]\s+{re.escape(item)}", section_content, re.MULTILINE)
-            if line_match:
-                line_start = line_match.start()
-                # Check if there are spaces before the - or *
-                before_match = section_content[:line_start]
-                if before_match and before_match[-1] not in ['\n', '\r']:
-                    # This is likely a continuation, skip
-                    continue
-                # Check if line starts with spaces (indented)
-                line_before = section_content[max(0, line_start-10):line_start]
-                if not line_before.strip() or line_before.strip() == '':
-                    # This is a top-level item
-                    items.append(item.strip())
-        
-        # Also try numbered lists
-        numbered_pattern = r"^\d+\.\s+(.+?)$"
-        numbered_items = re.findall(numbered_pattern, section_content, re.MULTILINE)
-        items.extend([item.strip() for item in numbered_items if item.strip()])
+    # Then extract regular list items (lines starting with -, *)
+    # Only top-level items: the text just before the bullet must be blank
+    for item_match in _REGULAR_ITEM_RE.finditer(section_content):
+        line_start = item_match.start()
+        line_before = section_content[max(0, line_start-10):line_start]
+        if not line_before.strip():
+            items.append(item_match.group(1).strip())
+    
+    # Also try numbered lists
+    numbered_items = _NUMBERED_ITEM_RE.findall(section_content)
+    items.extend([item.strip() for item in numbered_items if item.strip()])
     
     # Clean items and remove duplicates
     cleaned_items = []
@@ -92,23 +162,12 @@ def extract_features(content: str) -> List[str]:
     """Extract new features from documentation."""
     features = []
     
-    # Look for various section titles
-    section_titles = [
-        "New Features",
-        "Features",
-        "Funcionalidades",
-        "Implementações",
-        "Implementações Completas",
-        "Completed Features"
-    ]
-    
-    for title in section_titles:
+    for title in FEATURE_SECTION_TITLES:
         items = parse_markdown_section(content, title)
         features.extend(items)
     
     # Also look for checkbox items that are checked
-    checkbox_pattern = r"- \[x\]\s+(.+?)(?=\n|$)"
-    checked_items = re.findall(checkbox_pattern, content, re.MULTILINE | re.IGNORECASE)
+    checked_items = _CHECKBOX_RE.findall(content)
     features.extend([item.strip() for item in checked_items])
     
     return list(set(features))  # Remove duplicates
@@ -118,17 +177,7 @@ def extract_fixes(content: str) -> List[str]:
     """Extract bug fixes and improvements from documentation."""
     fixes = []
     
-    section_titles = [
-        "Fixes",
-        "Bug Fixes",
-        "Correções",
-        "Improvements",
-        "Melhorias",
-        "Optimizations",
-        "Otimizações"
-    ]
-    
-    for title in section_titles:
+    for title in FIX_SECTION_TITLES:
         items = parse_markdown_section(content, title)
         fixes.extend(items)
     
@@ -139,16 +188,7 @@ def extract_upcoming(content: str) -> List[str]:
     """Extract upcoming features from documentation."""
     upcoming = []
     
-    section_titles = [
-        "Upcoming",
-        "Próximos Passos",
-        "Next Steps",
-        "Roadmap",
-        "Planned Features",
-        "Features Planejadas"
-    ]
-    
-    for title in section_titles:
+    for title in UPCOMING_SECTION_TITLES:
         items = parse_markdown_section(content, title)
         upcoming.extend(items)
     
@@ -179,34 +219,173 @@ def get_file_modification_time(file_path: Path) -> Optional[datetime]:
     return None
 
 
-def get_latest_roadmap_data() -> Dict[str, any]:
+def _file_signature(file_path: Path) -> FileSignature:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def parse_document(file_path: Path, content: str) -> ParsedDocument:
     """
-    Extract roadmap data from all documentation files.
-    Prioritizes most recently modified files and latest entries.
+    Extract the roadmap sections of one documentation file.
+    
+    Args:
+        file_path: Path of the file (CHANGELOG_FILE also gets its Unreleased entries parsed)
+        content: File content
     
     Returns:
-        Dictionary with title, description, features, fixes, and upcoming
+        Read-only parsed document
     """
-    all_content = []
-    file_times = {}
+    sections = {}
+    for title in ALL_SECTION_TITLES:
+        match = _section_pattern(title).search(content)
+        if match:
+            sections[title] = tuple(_section_items(match.group(1)))
+    
+    changelog = None
+    if file_path == CHANGELOG_FILE:
+        latest_date, added, changed = _parse_changelog(content)
+        changelog = (latest_date, tuple(added), tuple(changed))
+    
+    return ParsedDocument(
+        content=content,
+        sections=MappingProxyType(sections),
+        checked=tuple(item.strip() for item in _CHECKBOX_RE.findall(content)),
+        changelog=changelog
+    )
+
+
+def _parse_cached(file_path: Path, signature: FileSignature) -> Optional[ParsedDocument]:
+    """Parse a documentation file, reusing the cached result if it did not change"""
+    if signature is None:
+        _document_cache.pop(file_path, None)
+        content = read_documentation_file(file_path)
+        return parse_document(file_path, content) if content else None
     
-    # Read all relevant documentation files with timestamps
-    files_to_read = [
-        ROADMAP_FILE,
-        IMPLEMENTACOES_FILE,
-        CHANGELOG_FILE,
-        STATUS_FILE
-    ]
+    cached = _document_cache.get(file_path)
+    if cached and cached[0] == signature:
+        return cached[1]
     
-    for file_path in files_to_read:
-        content = read_documentation_file(file_path)
-        if content:
-            all_content.append(content)
-            mod_time = get_file_modification_time(file_path)
-            if mod_time:
-                file_times[file_path.name] = mod_time
+    content = read_documentation_file(file_path)
+    if not content:
+        _document_cache.pop(file_path, None)
+        return None
+    document = parse_document(file_path, content)
+    _document_cache[file_path] = (signature, document)
+    return document
+
+
+def clear_roadmap_cache() -> None:
+    """Drop cached documentation and parsed roadmap data"""
+    global _roadmap_cache
+    with _cache_lock:
+        _document_cache.clear()
+        _roadmap_cache = None
+
+
+def _clean_item(item: str) -> str:
+    """Clean markdown formatting from items."""
+    # Remove bold markers
+    item = _BOLD_RE.sub(r'\1', item)
+    # Remove code blocks
+    item = _CODE_RE.sub(r'\1', item)
+    # Remove links [text](url) -> text
+    item = _LINK_RE.sub(r'\1', item)
+    # Remove checkmarks and emojis at start
+    item = _LEADING_MARKS_RE.sub('', item)
+    # Clean whitespace
+    return item.strip()
+
+
+def _normalize_for_dedup(text: str) -> str:
+    """Normalize text for duplicate detection."""
+    # Remove special chars, lowercase, strip
+    normalized = _NON_WORD_RE.sub('', text.lower().strip())
+    # Remove extra spaces
+    return _WHITESPACE_RE.sub(' ', normalized)
+
+
+def _clean_and_dedup(items: List[str]) -> List[str]:
+    """Clean items and remove duplicates while preserving order (case-insensitive, normalized)"""
+    unique_items = []
+    seen = set()
+    for item in items:
+        item = _clean_item(item)
+        if not item:
+            continue
+        norm = _normalize_for_dedup(item)
+        if norm and norm not in seen and len(norm) > 3:  # Minimum length
+            seen.add(norm)
+            unique_items.append(item)
+    return unique_items
+
+
+def _parse_changelog(changelog_content: str) -> Tuple[Optional[str], List[str], List[str]]:
+    """
+    Extract the latest date and the Unreleased Added/Changed items from CHANGELOG.
     
-    if not all_content:
+    Returns:
+        Tuple of (latest_date, added_items, changed_items)
+    """
+    latest_date = None
+    added: List[str] = []
+    changed: List[str] = []
+    
+    if "[Unreleased]" in changelog_content:
+        # Look for date in Unreleased section (e.g., "### 🚀 Title (2025-01-11)")
+        unreleased_dates = _UNRELEASED_DATE_RE.findall(changelog_content)
+        if unreleased_dates:
+            latest_date = unreleased_dates[0]  # Most recent date in Unreleased
+        
+        # Unreleased section is always most recent
+        unreleased_match = _UNRELEASED_SECTION_RE.search(changelog_content)
+        if unreleased_match:
+            unreleased_content = unreleased_match.group(0)
+            added_match = _ADDED_RE.search(unreleased_content)
+            if added_match:
+                added_items = _CHANGELOG_ITEM_RE.findall(added_match.group(1))
+                added = [item.strip() for item in added_items if item.strip()]
+            
+            changed_match = _CHANGED_RE.search(unreleased_content)
+            if changed_match:
+                changed_items = _CHANGELOG_ITEM_RE.findall(changed_match.group(1))
+                changed = [item.strip() for item in changed_items if item.strip()]
+    else:
+        # Look for date patterns - get the FIRST (most recent) date
+        dates = _RELEASE_DATE_RE.findall(changelog_content)
+        if dates:
+            latest_date = dates[0]  # First date is most recent
+    
+    return latest_date, added, changed
+
+
+def _merge_sections(documents: List[ParsedDocument], titles: Tuple[str, ...]) -> List[str]:
+    """Items of each section title, taken from the first document containing it"""
+    items = []
+    for title in titles:
+        for document in documents:
+            if title in document.sections:
+                items.extend(document.sections[title])
+                break
+    return items
+
+
+def _build_roadmap_data(signatures: Tuple[FileSignature, ...]) -> Dict[str, Any]:
+    """Merge the (per-file cached) parsed documents into roadmap data (cache miss path)."""
+    documents: List[ParsedDocument] = []
+    file_times = {}
+    
+    for file_path, signature in zip(ROADMAP_SOURCE_FILES, signatures):
+        document = _parse_cached(file_path, signature)
+        if document is not None:
+            documents.append(document)
+            if signature is not None:
+                file_times[file_path.name] = datetime.fromtimestamp(signature[0] / 1e9)
+    
+    if not documents:
         logger.warning("No documentation files found")
         return {
             "title": "Roadmap Update",
@@ -218,110 +397,25 @@ def get_latest_roadmap_data() -> Dict[str, any]:
         }
     
     # Combine all content
-    combined_content = "\n\n".join(all_content)
+    combined_content = "\n\n".join(document.content for document in documents)
     
-    # Extract information
-    features = extract_features(combined_content)
-    fixes = extract_fixes(combined_content)
-    upcoming = extract_upcoming(combined_content)
+    # Extract information - like searching the combined docs, the first file with a section wins
+    features = _merge_sections(documents, FEATURE_SECTION_TITLES)
+    features.extend(item for document in documents for item in document.checked)
+    fixes = _merge_sections(documents, FIX_SECTION_TITLES)
+    upcoming = _merge_sections(documents, UPCOMING_SECTION_TITLES)
     
     # Get the most recent date from CHANGELOG (prioritize latest entries)
     latest_date = None
-    if CHANGELOG_FILE.exists():
-        changelog_content = read_documentation_file(CHANGELOG_FILE)
-        if changelog_content:
-            # First check for "Unreleased" section
-            if "[Unreleased]" in changelog_content:
-                # Look for date in Unreleased section (e.g., "### 🚀 Title (2025-01-11)")
-                unreleased_date_pattern = r"###\s+.*?\((\d{4}-\d{2}-\d{2})\)"
-                unreleased_dates = re.findall(unreleased_date_pattern, changelog_content)
-                if unreleased_dates:
-                    latest_date = unreleased_dates[0]  # Most recent date in Unreleased
-            else:
-                # Look for date patterns - get the FIRST (most recent) date
-                date_pattern = r"##\s+\[?(\d{4}-\d{2}-\d{2})\]?"
-                dates = re.findall(date_pattern, changelog_content)
-                if dates:
-                    latest_date = dates[0]  # First date is most recent
-    
-    # Also check for "Unreleased" section which is always most recent
-    if CHANGELOG_FILE.exists():
-        changelog_content = read_documentation_file(CHANGELOG_FILE)
-        if changelog_content and "[Unreleased]" in changelog_content:
-            # Extract items from Unreleased section
-            unreleased_pattern = r"##\s+\[Unreleased\].*?(?=##\s+\[|\Z)"
-            unreleased_match = re.search(unreleased_pattern, changelog_content, re.DOTALL | re.IGNORECASE)
-            if unreleased_match:
-                unreleased_content = unreleased_match.group(0)
-                # Extract Added items from Unreleased
-                added_pattern = r"#### Added\s*\n(.*?)(?=#### |### |## |\Z)"
-                added_match = re.search(added_pattern, unreleased_content, re.DOTALL | re.IGNORECASE)
-                if added_match:
-                    added_items = re.findall(r"[-*]\s+(.+?)(?=\n[-*]|\n\n|\Z)", added_match.group(1), re.MULTILINE)
-                    features.extend([item.strip() for item in added_items if item.strip()])
-                
-                # Extract Changed items from Unreleased
-                changed_pattern = r"#### Changed\s*\n(.*?)(?=#### |### |## |\Z)"
-                changed_match = re.search(changed_pattern, unreleased_content, re.DOTALL | re.IGNORECASE)
-                if changed_match:
-                    changed_items = re.findall(r"[-*]\s+(.+?)(?=\n[-*]|\n\n|\Z)", changed_match.group(1), re.MULTILINE)
-                    fixes.extend([item.strip() for item in changed_items if item.strip()])
-    
-    # Clean and remove duplicates while preserving order
-    def clean_item(item: str) -> str:
-        """Clean markdown formatting from items."""
-        # Remove bold markers
-        item = re.sub(r'\*\*(.+?)\*\*', r'\1', item)
-        # Remove code blocks
-        item = re.sub(r'`(.+?)`', r'\1', item)
-        # Remove links [text](url) -> text
-        item = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', item)
-        # Remove checkmarks and emojis at start
-        item = re.sub(r'^[✅❌🔧✨📋🎯🚀\s]+', '', item)
-        # Clean whitespace
-        item = item.strip()
-        return item
-    
-    # Clean all items first
-    features = [clean_item(item) for item in features if clean_item(item)]
-    fixes = [clean_item(item) for item in fixes if clean_item(item)]
-    upcoming = [clean_item(item) for item in upcoming if clean_item(item)]
-    
-    # Remove duplicates while preserving order (case-insensitive, normalized)
-    def normalize_for_dedup(text: str) -> str:
-        """Normalize text for duplicate detection."""
-        # Remove special chars, lowercase, strip
-        normalized = re.sub(r'[^\w\s]', '', text.lower().strip())
-        # Remove extra spaces
-        normalized = re.sub(r'\s+', ' ', normalized)
-        return normalized
-    
-    seen_features = set()
-    unique_features = []
-    for item in features:
-        norm = normalize_for_dedup(item)
-        if norm and norm not in seen_features and len(norm) > 3:  # Minimum length
-            seen_features.add(norm)
-            unique_features.append(item)
-    features = unique_features
-    
-    seen_fixes = set()
-    unique_fixes = []
-    for item in fixes:
-        norm = normalize_for_dedup(item)
-        if norm and norm not in seen_fixes and len(norm) > 3:  # Minimum length
-            seen_fixes.add(norm)
-            unique_fixes.append(item)
-    fixes = unique_fixes
-    
-    seen_upcoming = set()
-    unique_upcoming = []
-    for item in upcoming:
-        norm = normalize_for_dedup(item)
-        if norm and norm not in seen_upcoming and len(norm) > 3:  # Minimum length
-            seen_upcoming.add(norm)
-            unique_upcoming.append(item)
-    upcoming = unique_upcoming
+    changelog = next((document.changelog for document in documents if document.changelog), None)
+    if changelog:
+        latest_date, added, changed = changelog
+        features.extend(added)
+        fixes.extend(changed)
+    
+    features = _clean_and_dedup(features)
+    fixes = _clean_and_dedup(fixes)
+    upcoming = _clean_and_dedup(upcoming)
     
     # Generate title (always in English)
     if latest_date:
@@ -351,8 +445,7 @@ def get_latest_roadmap_data() -> Dict[str, any]:
     # Create comprehensive hash for change detection
     # Include content, file modification times, and counts
     hash_content = f"{combined_content[:5000]}{str(file_times)}{len(features)}{len(fixes)}{len(upcoming)}"
-    import hashlib as _hashlib
-    content_hash = _hashlib.md5(hash_content.encode()).hexdigest()
+    content_hash = hashlib.md5(hash_content.encode()).hexdigest()
     
     logger.info(f"[ROADMAP] Extracted {len(features)} features, {len(fixes)} fixes, {len(upcoming)} upcoming items")
     
@@ -367,6 +460,188 @@ def get_latest_roadmap_data() -> Dict[str, any]:
     }
 
 
+def get_latest_roadmap_data() -> Dict[str, Any]:
+    """
+    Extract roadmap data from all documentation files.
+    Prioritizes most recently modified files and latest entries.
+    
+    Parsed files are memoized on path + mtime + size, so repeated calls only
+    stat the files and a changed file is the only one parsed again.
+    
+    Returns:
+        Dictionary with title, description, features, fixes, and upcoming
+        (a fresh copy; callers may modify it)
+    """
+    global _roadmap_cache
+    signatures = tuple(_file_signature(path) for path in ROADMAP_SOURCE_FILES)
+    
+    with _cache_lock:
+        if _roadmap_cache is not None and _roadmap_cache[0] == signatures:
+            logger.debug("[ROADMAP] Documentation unchanged, using cached roadmap data")
+            return copy.deepcopy(_roadmap_cache[1])
+        
+        data = _build_roadmap_data(signatures)
+        _roadmap_cache = (signatures, data)
+        return copy.deepcopy(data)
+
+
+async def get_latest_roadmap_data_async() -> Dict[str, Any]:
+    """Async wrapper for get_latest_roadmap_data() that keeps file I/O off the event loop."""
+    return await asyncio.to_thread(get_latest_roadmap_data)
+
+
+# Portuguese indicators used to decide whether an item needs translation
+_PORTUGUESE_INDICATORS = (
+    'monitoramento', 'validação', 'correções', 'implementar', 'melhorar',
+    'sistema', 'logs', 'comandos', 'cache', 'sincronização', 'métricas',
+    'performance', 'alertas', 'dashboard', 'níveis', 'contexto', 'estruturado',
+    'integração', 'ferramentas'
+)
+
+# Common phrase translations
+_PHRASE_TRANSLATIONS = {
+    # Upcoming features specific translations
+    "Monitoramento e Validação das Correções": "Monitoring and Validation of Fixes",
+    "Monitorar logs por 24-48 horas para confirmar ausência de erros": "Monitor logs for 24-48 hours to confirm absence of errors",
+    "Testar comandos que usam cache em diferentes cenários": "Test commands that use cache in different scenarios",
+    "Validar que sincronização de comandos continua funcionando": "Validate that command synchronization continues working",
+    "Implementar Health Check System Avançado": "Implement Advanced Health Check System",
+    "Métricas de performance (tempo de resposta, taxa de erro)": "Performance metrics (response time, error rate)",
+    "Alertas automáticos para problemas críticos": "Automatic alerts for critical issues",
+    "Dashboard de monitoramento": "Monitoring dashboard",
+    "Melhorar Sistema de Logging": "Improve Logging System",
+    "Implementar níveis de log mais granulares": "Implement more granular log levels",
+    "Adicionar contexto estruturado (user_id, command_name, duration)": "Add structured context (user_id, command_name, duration)",
+    "Criar dashboard de logs ou integração com ferramentas de monitoramento": "Create log dashboard or integration with monitoring tools",
+    # Common phrases
+    "Documentação de agendamento": "Scheduling documentation",
+    "Sistema de": "System for",
+    "Comando de": "Command for",
+    "Botão de": "Button for",
+    "Canal de": "Channel for",
+    "Melhorias no": "Improvements to",
+    "Correções no": "Fixes to",
+    "Implementação de": "Implementation of",
+    # Common words
+    "monitoramento": "monitoring",
+    "Monitoramento": "Monitoring",
+    "validação": "validation",
+    "Validação": "Validation",
+    "correções": "fixes",
+    "Correções": "Fixes",
+    "implementar": "implement",
+    "Implementar": "Implement",
+    "melhorar": "improve",
+    "Melhorar": "Improve",
+    "sistema": "system",
+    "Sistema": "System",
+    "logs": "logs",
+    "Logs": "Logs",
+    "comandos": "commands",
+    "Comandos": "Commands",
+    "cache": "cache",
+    "Cache": "Cache",
+    "sincronização": "synchronization",
+    "Sincronização": "Synchronization",
+    "métricas": "metrics",
+    "Métricas": "Metrics",
+    "performance": "performance",
+    "Performance": "Performance",
+    "alertas": "alerts",
+    "Alertas": "Alerts",
+    "dashboard": "dashboard",
+    "Dashboard": "Dashboard",
+    "níveis": "levels",
+    "Níveis": "Levels",
+    "contexto": "context",
+    "Contexto": "Context",
+    "estruturado": "structured",
+    "Estruturado": "Structured",
+    "integração": "integration",
+    "Integração": "Integration",
+    "ferramentas": "tools",
+    "Ferramentas": "Tools",
+    "documentação": "documentation",
+    "Documentação": "Documentation",
+    "agendamento": "scheduling",
+    "Agendamento": "Scheduling",
+    "implementação": "implementation",
+    "Implementação": "Implementation",
+    "melhorias": "improvements",
+    "Melhorias": "Improvements",
+    "funcionalidades": "features",
+    "Funcionalidades": "Features",
+    "comando": "command",
+    "Comando": "Command",
+    "botão": "button",
+    "Botão": "Button",
+    "canal": "channel",
+    "Canal": "Channel",
+    "atualização": "update",
+    "Atualização": "Update",
+    "desenvolvimento": "development",
+    "Desenvolvimento": "Development",
+    "de": "of",
+    "De": "Of",
+    "para": "for",
+    "Para": "For",
+    "com": "with",
+    "Com": "With",
+    "sem": "without",
+    "Sem": "Without",
+    "automação": "automation",
+    "Automação": "Automation",
+    "configuração": "configuration",
+    "Configuração": "Configuration",
+    "otimização": "optimization",
+    "Otimização": "Optimization",
+    "gerenciamento": "management",
+    "Gerenciamento": "Management",
+    "criado": "created",
+    "Criado": "Created",
+    "adicionado": "added",
+    "Adicionado": "Added",
+    "atualizado": "updated",
+    "Atualizado": "Updated",
+    "corrigido": "fixed",
+    "Corrigido": "Fixed",
+    "melhorado": "improved",
+    "Melhorado": "Improved",
+    "implementado": "implemented",
+    "Implementado": "Implemented",
+}
+# Longer phrases first to avoid partial matches (sorted once at import)
+_SORTED_PHRASE_TRANSLATIONS = sorted(_PHRASE_TRANSLATIONS.items(), key=lambda x: len(x[0]), reverse=True)
+
+# Word-by-word fallback for remaining Portuguese words (word boundaries, case-insensitive)
+_WORD_TRANSLATIONS = {
+    "monitoramento": "monitoring",
+    "validação": "validation",
+    "correções": "fixes",
+    "implementar": "implement",
+    "melhorar": "improve",
+    "sistema": "system",
+    "logs": "logs",
+    "comandos": "commands",
+    "cache": "cache",
+    "sincronização": "synchronization",
+    "métricas": "metrics",
+    "performance": "performance",
+    "alertas": "alerts",
+    "dashboard": "dashboard",
+    "níveis": "levels",
+    "contexto": "context",
+    "estruturado": "structured",
+    "integração": "integration",
+    "ferramentas": "tools",
+}
+_WORD_TRANSLATION_PATTERNS = [
+    (re.compile(r'\b' + re.escape(pt) + r'\b', re.IGNORECASE), en)
+    for pt, en in _WORD_TRANSLATIONS.items()
+]
+_FALLBACK_TRIGGERS = ('monitoramento', 'validação', 'correções', 'implementar', 'melhorar')
+
+
 def translate_to_english(text: str) -> str:
     """
     Translate Portuguese text to English for roadmap items.
@@ -374,175 +649,29 @@ def translate_to_english(text: str) -> str:
     """
     # First, check if text is already in English (simple heuristic)
     # If text contains common Portuguese words, translate it
-    portuguese_indicators = [
-        'monitoramento', 'validação', 'correções', 'implementar', 'melhorar',
-        'sistema', 'logs', 'comandos', 'cache', 'sincronização', 'métricas',
-        'performance', 'alertas', 'dashboard', 'níveis', 'contexto', 'estruturado',
-        'integração', 'ferramentas', 'Monitoramento', 'Validação', 'Correções',
-        'Implementar', 'Melhorar', 'Sistema', 'Logs', 'Comandos', 'Cache',
-        'Sincronização', 'Métricas', 'Performance', 'Alertas', 'Dashboard',
-        'Níveis', 'Contexto', 'Estruturado', 'Integração', 'Ferramentas'
-    ]
-    
-    # Check if text contains Portuguese indicators
-    has_portuguese = any(indicator.lower() in text.lower() for indicator in portuguese_indicators)
+    text_lower = text.lower()
+    has_portuguese = any(indicator in text_lower for indicator in _PORTUGUESE_INDICATORS)
     
     # If no Portuguese indicators found and text looks like English, return as-is
     if not has_portuguese and any(word.isalpha() and word[0].isupper() for word in text.split()[:3]):
         # Likely already in English
         return text
     
-    # Common phrase translations (order matters - longer phrases first)
-    phrase_translations = {
-        # Upcoming features specific translations
-        "Monitoramento e Validação das Correções": "Monitoring and Validation of Fixes",
-        "Monitorar logs por 24-48 horas para confirmar ausência de erros": "Monitor logs for 24-48 hours to confirm absence of errors",
-        "Testar comandos que usam cache em diferentes cenários": "Test commands that use cache in different scenarios",
-        "Validar que sincronização de comandos continua funcionando": "Validate that command synchronization continues working",
-        "Implementar Health Check System Avançado": "Implement Advanced Health Check System",
-        "Métricas de performance (tempo de resposta, taxa de erro)": "Performance metrics (response time, error rate)",
-        "Alertas automáticos para problemas críticos": "Automatic alerts for critical issues",
-        "Dashboard de monitoramento": "Monitoring dashboard",
-        "Melhorar Sistema de Logging": "Improve Logging System",
-        "Implementar níveis de log mais granulares": "Implement more granular log levels",
-        "Adicionar contexto estruturado (user_id, command_name, duration)": "Add structured context (user_id, command_name, duration)",
-        "Criar dashboard de logs ou integração com ferramentas de monitoramento": "Create log dashboard or integration with monitoring tools",
-        # Common phrases
-        "Documentação de agendamento": "Scheduling documentation",
-        "Sistema de": "System for",
-        "Comando de": "Command for",
-        "Botão de": "Button for",
-        "Canal de": "Channel for",
-        "Melhorias no": "Improvements to",
-        "Correções no": "Fixes to",
-        "Implementação de": "Implementation of",
-        # Common words
-        "monitoramento": "monitoring",
-        "Monitoramento": "Monitoring",
-        "validação": "validation",
-        "Validação": "Validation",
-        "correções": "fixes",
-        "Correções": "Fixes",
-        "implementar": "implement",
-        "Implementar": "Implement",
-        "melhorar": "improve",
-        "Melhorar": "Improve",
-        "sistema": "system",
-        "Sistema": "System",
-        "logs": "logs",
-        "Logs": "Logs",
-        "comandos": "commands",
-        "Comandos": "Commands",
-        "cache": "cache",
-        "Cache": "Cache",
-        "sincronização": "synchronization",
-        "Sincronização": "Synchronization",
-        "métricas": "metrics",
-        "Métricas": "Metrics",
-        "performance": "performance",
-        "Performance": "Performance",
-        "alertas": "alerts",
-        "Alertas": "Alerts",
-        "dashboard": "dashboard",
-        "Dashboard": "Dashboard",
-        "níveis": "levels",
-        "Níveis": "Levels",
-        "contexto": "context",
-        "Contexto": "Context",
-        "estruturado": "structured",
-        "Estruturado": "Structured",
-        "integração": "integration",
-        "Integração": "Integration",
-        "ferramentas": "tools",
-        "Ferramentas": "Tools",
-        "documentação": "documentation",
-        "Documentação": "Documentation",
-        "agendamento": "scheduling",
-        "Agendamento": "Scheduling",
-        "implementação": "implementation",
-        "Implementação": "Implementation",
-        "melhorias": "improvements",
-        "Melhorias": "Improvements",
-        "funcionalidades": "features",
-        "Funcionalidades": "Features",
-        "comando": "command",
-        "Comando": "Command",
-        "botão": "button",
-        "Botão": "Button",
-        "canal": "channel",
-        "Canal": "Channel",
-        "atualização": "update",
-        "Atualização": "Update",
-        "desenvolvimento": "development",
-        "Desenvolvimento": "Development",
-        "de": "of",
-        "De": "Of",
-        "para": "for",
-        "Para": "For",
-        "com": "with",
-        "Com": "With",
-        "sem": "without",
-        "Sem": "Without",
-        "automação": "automation",
-        "Automação": "Automation",
-        "configuração": "configuration",
-        "Configuração": "Configuration",
-        "otimização": "optimization",
-        "Otimização": "Optimization",
-        "gerenciamento": "management",
-        "Gerenciamento": "Management",
-        "criado": "created",
-        "Criado": "Created",
-        "adicionado": "added",
-        "Adicionado": "Added",
-        "atualizado": "updated",
-        "Atualizado": "Updated",
-        "corrigido": "fixed",
-        "Corrigido": "Fixed",
-        "melhorado": "improved",
-        "Melhorado": "Improved",
-        "implementado": "implemented",
-        "Implementado": "Implemented",
-    }
-    
     # Simple word replacement (basic approach)
     # Replace longer phrases first, then individual words
     result = text
     
     # Replace common phrases (longer first to avoid partial matches)
-    for pt_phrase, en_phrase in sorted(phrase_translations.items(), key=lambda x: len(x[0]), reverse=True):
+    for pt_phrase, en_phrase in _SORTED_PHRASE_TRANSLATIONS:
         if pt_phrase in result:
             result = result.replace(pt_phrase, en_phrase)
     
     # If still contains Portuguese words, try word-by-word replacement
     # Only if the result still looks like Portuguese
-    if any(word in result.lower() for word in ['monitoramento', 'validação', 'correções', 'implementar', 'melhorar']):
-        # Try individual word replacement for remaining words
-        word_translations = {
-            "monitoramento": "monitoring",
-            "validação": "validation",
-            "correções": "fixes",
-            "implementar": "implement",
-            "melhorar": "improve",
-            "sistema": "system",
-            "logs": "logs",
-            "comandos": "commands",
-            "cache": "cache",
-            "sincronização": "synchronization",
-            "métricas": "metrics",
-            "performance": "performance",
-            "alertas": "alerts",
-            "dashboard": "dashboard",
-            "níveis": "levels",
-            "contexto": "context",
-            "estruturado": "structured",
-            "integração": "integration",
-            "ferramentas": "tools",
-        }
-        
-        for pt, en in word_translations.items():
-            # Use word boundaries to avoid partial replacements
-            result = re.sub(r'\b' + re.escape(pt) + r'\b', en, result, flags=re.IGNORECASE)
+    result_lower = result.lower()
+    if any(word in result_lower for word in _FALLBACK_TRIGGERS):
+        for pattern, en in _WORD_TRANSLATION_PATTERNS:
+            result = pattern.sub(en, result)
     
     return result
 
@@ -556,9 +685,9 @@ def format_roadmap_items(items: List[str]) -> str:
     formatted = []
     for item in items:
         # Clean up markdown formatting first
-        item = re.sub(r'\*\*(.+?)\*\*', r'\1', item)  # Remove bold
-        item = re.sub(r'`(.+?)`', r'\1', item)  # Remove code blocks
-        item = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', item)  # Remove links [text](url) -> text
+        item = _BOLD_RE.sub(r'\1', item)  # Remove bold
+        item = _CODE_RE.sub(r'\1', item)  # Remove code blocks
+        item = _LINK_RE.sub(r'\1', item)  # Remove links [text](url) -> text
         item = item.strip()
         
         # Translate to English if needed (ALWAYS translate to ensure English)
@@ -575,4 +704,3 @@ def format_roadmap_items(items: List[str]) -> str:
         result = result[:1000] + "\n... (more in documentation)"
     
     return result
-
@@ -0,0 +1,219 @@
+# utils/sqlite_backend.py
+"""
+SQLite Storage Backend
+
+An aiosqlite connection pool exposing the subset of the aiomysql pool API
+the repositories use (``pool.acquire()``, ``conn.cursor(cursor_type)``,
+``begin/commit/rollback``, ``execute/executemany/fetch*``, ``rowcount``),
+so the same repositories run against a local database file.
+
+Connections run in autocommit mode like the MySQL pool and use WAL, so
+readers never wait for the writer; concurrent writers queue on the file
+lock (busy_timeout). ``%s`` placeholders are translated to ``?``.
+Meant for single-process deployments, local load testing and CI.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence, Tuple
+import aiomysql
+import aiosqlite
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+_PLACEHOLDER = re.compile(r"%([s%])")
+
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}",
+    "PRAGMA foreign_keys = ON",
+)
+
+
+def translate_query(query: str) -> str:
+    """Convert a pyformat (%s) query to qmark (?) style"""
+    return _PLACEHOLDER.sub(lambda match: "?" if match.group(1) == "s" else "%", query)
+
+
+def _adapt(value: Any) -> Any:
+    """Store dates the way MySQL prints them (sqlite3's default adapters are deprecated)"""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _adapt_params(params: Optional[Sequence[Any]]) -> Tuple[Any, ...]:
+    return tuple(_adapt(value) for value in params or ())
+
+
+class SQLiteCursor:
+    """aiomysql-style cursor over an aiosqlite connection"""
+
+    def __init__(self, connection: aiosqlite.Connection, as_dict: bool = False):
+        self._connection = connection
+        self._cursor: Optional[aiosqlite.Cursor] = None
+        self.as_dict = as_dict
+        self.rowcount = -1
+        self.lastrowid: Optional[int] = None
+
+    async def __aenter__(self) -> "SQLiteCursor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._cursor is not None:
+            await self._cursor.close()
+            self._cursor = None
+
+    async def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> int:
+        await self.close()
+        self._cursor = await self._connection.execute(translate_query(query), _adapt_params(params))
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+        return self.rowcount
+
+    async def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> int:
+        await self.close()
+        self._cursor = await self._connection.executemany(
+            translate_query(query), [_adapt_params(row) for row in rows]
+        )
+        self.rowcount = self._cursor.rowcount
+        return self.rowcount
+
+    def _shape(self, row: Optional[Tuple[Any, ...]]) -> Any:
+        if row is None or not self.as_dict:
+            return row
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+    async def fetchone(self) -> Any:
+        if self._cursor is None:
+            return None
+        return self._shape(await self._cursor.fetchone())
+
+    async def fetchmany(self, size: int) -> List[Any]:
+        if self._cursor is None:
+            return []
+        return [self._shape(row) for row in await self._cursor.fetchmany(size)]
+
+    async def fetchall(self) -> List[Any]:
+        if self._cursor is None:
+            return []
+        return [self._shape(row) for row in await self._cursor.fetchall()]
+
+
+class SQLiteConnection:
+    """aiomysql-style connection wrapper"""
+
+    def __init__(self, connection: aiosqlite.Connection):
+        self._connection = connection
+
+    def cursor(self, cursor_type: Optional[type] = None) -> SQLiteCursor:
+        """New cursor; aiomysql dict cursor types return rows as dicts"""
+        as_dict = cursor_type is not None and issubclass(cursor_type, (aiomysql.DictCursor, aiomysql.SSDictCursor))
+        return SQLiteCursor(self._connection, as_dict=as_dict)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._connection.in_transaction
+
+    async def begin(self) -> None:
+        # IMMEDIATE takes the write lock up front instead of failing on upgrade
+        await self._connection.execute("BEGIN IMMEDIATE")
+
+    async def commit(self) -> None:
+        if self._connection.in_transaction:
+            await self._connection.commit()
+
+    async def rollback(self) -> None:
+        if self._connection.in_transaction:
+            await self._connection.rollback()
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+
+class SQLitePool:
+    """Fixed-size pool of WAL-mode aiosqlite connections"""
+
+    def __init__(self, path: str, size: int = 4):
+        """
+        Initialize SQLite pool (call open() before use).
+
+        Args:
+            path: Database file (":memory:" forces a single connection)
+            size: Number of connections
+        """
+        self.path = path
+        self.maxsize = 1 if path == ":memory:" else max(1, size)
+        self._connections: List[SQLiteConnection] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def size(self) -> int:
+        return len(self._connections)
+
+    @property
+    def freesize(self) -> int:
+        return self._idle.qsize()
+
+    async def open(self) -> "SQLitePool":
+        """Open the connections and apply the pragmas"""
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(self.maxsize - self.size):
+            raw = await aiosqlite.connect(self.path, isolation_level=None)
+            for pragma in _PRAGMAS:
+                await raw.execute(pragma)
+            connection = SQLiteConnection(raw)
+            self._connections.append(connection)
+            self._idle.put_nowait(connection)
+        return self
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[SQLiteConnection]:
+        """Borrow a connection; an unfinished transaction is rolled back on release"""
+        connection = await self._idle.get()
+        try:
+            yield connection
+        finally:
+            try:
+                await connection.rollback()
+            except Exception as e:
+                logger.warning(f"Rollback on SQLite connection release failed: {e}")
+            self._idle.put_nowait(connection)
+
+    async def close(self) -> None:
+        """Close every connection"""
+        for connection in self._connections:
+            await connection.close()
+        self._connections.clear()
+        self._idle = asyncio.Queue()
+
+
+async def create_sqlite_pool(path: str, size: int = 4) -> SQLitePool:
+    """
+    Open a SQLite pool.
+
+    Args:
+        path: Database file
+        size: Number of connections
+
+    Returns:
+        Open pool
+    """
+    pool = await SQLitePool(path, size).open()
+    logger.info(f"SQLite pool opened: {path} ({pool.size} connections, WAL)")
+    return pool
@@ -0,0 +1,159 @@
+# utils/startup.py
+"""
+Startup Profiler
+
+Times each startup phase (imports, DB init, every cog, every listener setup)
+and the total time from process start to the first gateway READY. Phases
+that don't depend on each other can be run concurrently with
+run_concurrently(). The report is logged once the bot is ready and exported
+as ignis_startup_* gauges.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+from utils.logger import get_logger
+from utils.metrics import get_metrics_registry
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Fallback origin when the process start time is unavailable
+_MODULE_LOADED_AT = time.time()
+
+
+def process_start_time() -> float:
+    """Epoch time the process started (psutil), or when this module was imported"""
+    if PSUTIL_AVAILABLE:
+        try:
+            return psutil.Process(os.getpid()).create_time()
+        except Exception:
+            pass
+    return _MODULE_LOADED_AT
+
+
+@dataclass
+class PhaseTiming:
+    """One timed startup phase"""
+    name: str
+    started_at: float  # Seconds since process start
+    duration: float  # Seconds
+    failed: bool = False
+
+
+class StartupProfiler:
+    """Records startup phase timings relative to process start"""
+
+    def __init__(self, origin: Optional[float] = None):
+        """
+        Initialize startup profiler.
+
+        Args:
+            origin: Epoch time to measure from (default: process start)
+        """
+        self.origin = origin if origin is not None else process_start_time()
+        self.phases: List[PhaseTiming] = []
+        self.ready_after: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block (usable around awaits too)"""
+        started_at = time.time() - self.origin
+        start = time.perf_counter()
+        timing = PhaseTiming(name, started_at, 0.0)
+        try:
+            yield
+        except BaseException:
+            timing.failed = True
+            raise
+        finally:
+            timing.duration = time.perf_counter() - start
+            self.phases.append(timing)
+
+    async def run_concurrently(self, phases: Dict[str, Callable[[], Awaitable[object]]]) -> None:
+        """
+        Run independent phases concurrently, timing each one.
+
+        Every phase runs to completion; the first failure is then re-raised
+        so startup still fails loudly on a broken cog.
+
+        Args:
+            phases: Phase name -> zero-argument coroutine function
+        """
+        async def timed(name: str, factory: Callable[[], Awaitable[object]]) -> None:
+            with self.phase(name):
+                await factory()
+
+        results = await asyncio.gather(
+            *(timed(name, factory) for name, factory in phases.items()),
+            return_exceptions=True
+        )
+        errors = [(name, result) for name, result in zip(phases, results) if isinstance(result, BaseException)]
+        for name, error in errors:
+            logger.error(f"Startup phase '{name}' failed: {error}", exc_info=error)
+        if errors:
+            raise errors[0][1]
+
+    def mark_ready(self) -> Optional[float]:
+        """
+        Record the first gateway READY.
+
+        Returns:
+            Seconds from process start to ready, or None if already recorded
+        """
+        if self.ready_after is not None:
+            return None
+        self.ready_after = time.time() - self.origin
+        return self.ready_after
+
+    def report(self, limit: int = 10) -> List[str]:
+        """
+        Human-readable report: totals plus the slowest phases.
+
+        Args:
+            limit: Number of slowest phases to list
+        """
+        lines = []
+        if self.ready_after is not None:
+            lines.append(f"Process start -> ready: {self.ready_after:.2f}s")
+        if self.phases:
+            setup_end = max(p.started_at + p.duration for p in self.phases)
+            lines.append(f"Process start -> last startup phase: {setup_end:.2f}s ({len(self.phases)} phases)")
+        for timing in sorted(self.phases, key=lambda p: p.duration, reverse=True)[:limit]:
+            status = " (failed)" if timing.failed else ""
+            lines.append(f"  {timing.name:<40} {timing.duration * 1000:8.1f}ms  @ {timing.started_at:6.2f}s{status}")
+        return lines
+
+    def log_report(self) -> None:
+        """Log the report at INFO"""
+        for line in self.report():
+            logger.info(f"[startup] {line}")
+
+
+# Global profiler instance
+_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get global startup profiler instance"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        registry = get_metrics_registry()
+        registry.gauge(
+            "ignis_startup_phase_seconds", "Duration of each startup phase", ("phase",)
+        ).set_function(lambda: {(p.name,): p.duration for p in _profiler.phases})
+        registry.gauge(
+            "ignis_startup_ready_seconds", "Seconds from process start to first gateway READY"
+        ).set_function(lambda: _profiler.ready_after or 0.0)
+    return _profiler